@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_json
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measures JSON conversion of nested objects.
+    Run with: python benchmark/benchmark_json.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import datetime
+import timeit
+
+from pip_services4_commons.convert import JsonConverter, TypeCode
+
+
+class ItemDto:
+    def __init__(self, index: int):
+        self.id = str(index)
+        self.name = f'Item {index}'
+        self.time = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        self.tags = {'a', 'b'}
+        self.details = {'price': index * 1.5, 'count': index}
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<40} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+if __name__ == '__main__':
+    page = {'total': 1000, 'data': [ItemDto(i) for i in range(1000)]}
+    text = JsonConverter.to_json(page)
+
+    run('JsonConverter.to_json (1000 items)', lambda: JsonConverter.to_json(page), 50)
+    run('JsonConverter.to_json_bytes (1000 items)', lambda: JsonConverter.to_json_bytes(page), 50)
+    run('JsonConverter.from_json (1000 items)', lambda: JsonConverter.from_json(TypeCode.Map, text), 50)
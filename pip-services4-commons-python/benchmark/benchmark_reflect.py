@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_reflect
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measures reflection over nested DTOs.
+    Run with: python benchmark/benchmark_reflect.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+
+from pip_services4_commons.reflect import ObjectReader, PropertyReflector, RecursiveObjectReader, \
+    RecursiveObjectWriter
+
+
+class AddressDto:
+    def __init__(self):
+        self.street = 'Main St'
+        self.city = 'Springfield'
+        self.zip = '12345'
+
+
+class CustomerDto:
+    def __init__(self):
+        self.id = '1'
+        self.name = 'John'
+        self.email = 'john@example.com'
+        self.address = AddressDto()
+        self.tags = ['a', 'b', 'c']
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<40} {number:>8} ops  {elapsed * 1e6 / number:8.2f} us/op')
+
+
+if __name__ == '__main__':
+    obj = CustomerDto()
+    map = {'id': '1', 'Name': 'John', 'email': 'john@example.com'}
+
+    run('PropertyReflector.get_property', lambda: PropertyReflector.get_property(obj, 'Email'), 100000)
+    run('PropertyReflector.has_property (miss)', lambda: PropertyReflector.has_property(obj, 'phone'), 100000)
+    run('PropertyReflector.get_properties', lambda: PropertyReflector.get_properties(obj), 20000)
+    run('ObjectReader.get_property (map)', lambda: ObjectReader.get_property(map, 'email'), 100000)
+    run('RecursiveObjectReader.get_property', lambda: RecursiveObjectReader.get_property(obj, 'address.city'), 50000)
+    run('RecursiveObjectReader.get_properties', lambda: RecursiveObjectReader.get_properties(obj), 10000)
+
+    path = RecursiveObjectReader.compile_path('address.city')
+    run('PropertyPath.get', lambda: path.get(obj), 50000)
+
+    # Bulk flattening and unflattening of a large nested map
+    tree = {f'group{i}': {f'item{j}': {'value': j, 'name': f'n{j}'} for j in range(50)} for i in range(50)}
+    flat = RecursiveObjectReader.get_properties(tree)
+    run(f'RecursiveObjectReader.get_properties ({len(flat)} keys)', lambda: RecursiveObjectReader.get_properties(tree), 10)
+    run(f'RecursiveObjectWriter.set_properties ({len(flat)} keys)', lambda: RecursiveObjectWriter.set_properties({}, flat), 10)
@@ -11,18 +11,34 @@
 
 import json
 import re
+import weakref
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ..convert.TypeCode import TypeCode
+from .DateTimeConverter import DateTimeConverter
 from .MapConverter import MapConverter
 from .TypeConverter import TypeConverter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 
 class JsonConverter:
     """
     Converts arbitrary values from and to JSON (JavaScript Object Notation) strings.
 
+    Objects that are not natively supported by JSON are converted through encoders
+    selected once per class and cached. When `orjson` or `ujson` is installed
+    it is used to parse JSON and to produce compact output in :func:`to_json_bytes`.
+
     Example:
 
     .. code-block:: python
@@ -31,11 +47,19 @@ class JsonConverter:
         value2 = JsonConverter.to_map({ key: 123}) // Result: "{\"key\":123}"
     """
 
+    __date_pattern = re.compile(
+        r"\d{4}-[01]\d-[0-3]\d[Tt][0-2]\d:[0-5]\d:[0-5]\d(\.\d+)?([+-][0-2]\d:?[0-5]\d|[Zz])?")
+
+    # Classes created on the fly, like records with dynamic fields, must not be kept alive by the cache
+    __encoders: 'weakref.WeakKeyDictionary[type, Callable[[Any], Any]]' = weakref.WeakKeyDictionary()
+
     @staticmethod
     def from_json(typ: TypeCode, value: str) -> Any:
         """
         Converts JSON string into a args.
 
+        String fields in ISO 8601 date-time format are converted into dates.
+
         :param typ: the TypeCode for the data type into which 'args' is to be converted.
 
         :param value: the JSON string to convert.
@@ -45,7 +69,9 @@ class JsonConverter:
         if value is None:
             return None
 
-        value = json.loads(value, object_hook=JsonConverter.__from_json)
+        value = JsonConverter.__loads(value)
+        if isinstance(value, (dict, list)):
+            value = JsonConverter.__from_json(value)
         return TypeConverter.to_type(typ, value)
 
     @staticmethod
@@ -66,62 +92,111 @@ class JsonConverter:
         return json.dumps(value, default=JsonConverter.__to_json)
 
     @staticmethod
-    def __from_json(obj):
-        if not isinstance(obj, dict):
-            for k, v in obj.items():
-                if isinstance(obj[k], list):
-                    index = 0
-                    for el in obj[k]:
-                        obj[k][index] = JsonConverter.__from_json(el)
-                        index += 1
-
-                elif isinstance(obj[k], str) and re.match(
-                        r"\d{4}-[01]\d-[0-3]\dT[0-2]\d:[0-5]\d:[0-5]\d\.\d+([+-][0-2]\d:[0-5]\d|Z)?", obj[k]):
-
-                    if obj[k][-1].lower() == 'z':
-                        obj[k] = obj[k][:-1]
-                    obj[k] = datetime.strptime(obj[k], "%Y-%m-%dT%H:%M:%S.%f")
+    def to_json_bytes(value: Any) -> Optional[bytes]:
+        """
+        Converts args into compact UTF-8 encoded JSON.
 
-        return obj
+        Uses `orjson` or `ujson` when they are installed and the standard json module otherwise.
 
-    @staticmethod
-    def __to_json(obj):
-        if obj is None:
+        :param value: the args to convert.
+
+        :return: JSON bytes or null when args is None.
+        """
+        if value is None:
             return None
 
-        if isinstance(obj, set):
-            obj = list(obj)
-        if isinstance(obj, list):
-            result = []
-            for item in obj:
-                item = JsonConverter.__to_json(item)
-                result.append(item)
-            return result
-
-        if isinstance(obj, dict):
-            result = {}
-            for (k, v) in obj.items():
-                v = JsonConverter.__to_json(v)
-                result[k] = v
-            return result
-
-        if isinstance(obj, datetime):
-            return JsonConverter.to_json(obj)
-
-        if hasattr(obj, 'to_json'):
-            return obj.to_json()
-        if hasattr(obj, '__dict__'):
-            attribs = dict(obj.__dict__)
-            dict_obj = {}
-
-            for key in attribs.keys():
-                if not (key.endswith('__') and key.startswith('__')):
-                    dict_obj[key] = attribs[key]
-
-            return JsonConverter.__to_json(dict_obj)
+        if isinstance(value, datetime):
+            return value.isoformat().encode('utf-8')
+
+        if orjson is not None:
+            try:
+                return orjson.dumps(value, default=JsonConverter.__to_json, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # Values out of orjson range, like very large integers, are handled by the standard encoder
+                pass
+        elif ujson is not None:
+            try:
+                return ujson.dumps(value, default=JsonConverter.__to_json, ensure_ascii=False).encode('utf-8')
+            except (TypeError, OverflowError):
+                pass
+
+        return json.dumps(value, default=JsonConverter.__to_json, separators=(',', ':'),
+                          ensure_ascii=False).encode('utf-8')
+
+    @staticmethod
+    def __loads(value: Any) -> Any:
+        if orjson is not None:
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json (e.g. NaN, big integers), so retry with the standard parser
+                pass
+        elif ujson is not None:
+            try:
+                return ujson.loads(value)
+            except ValueError:
+                pass
+
+        return json.loads(value)
+
+    @staticmethod
+    def __parse_date(value: str) -> Any:
+        try:
+            # Native parser is much faster, but older Python versions
+            # do not accept all ISO 8601 forms, like "Z" suffix
+            return DateTimeConverter.to_utc_datetime(datetime.fromisoformat(value))
+        except ValueError:
+            return DateTimeConverter.to_nullable_datetime(value) or value
+
+    @staticmethod
+    def __from_json(obj: Any) -> Any:
+        # Parsed JSON contains only plain dicts and lists, so the tree is walked
+        # iteratively with exact type checks to keep per-field overhead low
+        pattern = JsonConverter.__date_pattern
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            items = node.items() if type(node) is dict else enumerate(node)
+            for (key, value) in items:
+                typ = type(value)
+                if typ is str:
+                    # Cheap check before matching the full date pattern
+                    if len(value) >= 19 and value[4] == '-' and value[10] in 'Tt' and pattern.fullmatch(value):
+                        node[key] = JsonConverter.__parse_date(value)
+                elif typ is dict or typ is list:
+                    stack.append(value)
 
         return obj
 
+    @staticmethod
+    def __encode_object(obj: Any) -> Any:
+        if not hasattr(obj, '__dict__'):
+            return obj
+
+        return {key: value for (key, value) in obj.__dict__.items()
+                if not (key.endswith('__') and key.startswith('__'))}
+
+    @staticmethod
+    def __get_encoder(typ: type) -> Callable[[Any], Any]:
+        if issubclass(typ, (set, frozenset)):
+            return list
+        if issubclass(typ, datetime):
+            return JsonConverter.to_json
+        if callable(getattr(typ, 'to_json', None)):
+            return lambda obj: obj.to_json()
+        return JsonConverter.__encode_object
+
+    @staticmethod
+    def __to_json(obj: Any) -> Any:
+        # Nested values are returned as they are and converted lazily
+        # when the encoder reaches them, so object trees are not copied
+        typ = type(obj)
+        encoder = JsonConverter.__encoders.get(typ)
+        if encoder is None:
+            encoder = JsonConverter.__get_encoder(typ)
+            JsonConverter.__encoders[typ] = encoder
+        return encoder(obj)
+
     @staticmethod
     def to_nullable_map(value: str) -> Any:
         """
@@ -136,7 +211,7 @@ class JsonConverter:
 
         # Parse JSON
         try:
-            value = json.loads(value)
+            value = JsonConverter.__loads(value)
             return MapConverter.to_nullable_map(value)
         except:
             return None
@@ -63,10 +63,7 @@ class StringValueMap(dict):
 
         :return: a list with all map keys.
         """
-        names = []
-        for (k, _) in self.items():
-            names.append(k)
-        return names
+        return list(self.keys())
 
     def get(self, key: str) -> str:
         """
@@ -86,7 +83,8 @@ class StringValueMap(dict):
 
         :param value: a new args for map element.
         """
-        self[key] = StringConverter.to_nullable_string(value)
+        # Strings are stored as they are, without conversion
+        self[key] = value if type(value) is str else StringConverter.to_nullable_string(value)
 
     def remove(self, key: str):
         """
@@ -119,11 +117,7 @@ class StringValueMap(dict):
 
         :return: the number of elements in this map.
         """
-        count = 0
-        for key in self.keys():
-            if key in self.keys():
-                count += 1
-        return count
+        return len(self)
 
     def get_as_object(self, key: str = None) -> Any:
         """
@@ -661,7 +655,7 @@ class StringValueMap(dict):
 
         for map in maps:
             for (k, v) in map.items():
-                key = StringConverter.to_string(k)
+                key = k if type(k) is str else StringConverter.to_string(k)
                 result.put(key, v)
 
         return result
@@ -13,6 +13,8 @@ from typing import Any, List
 from .PropertyReflector import PropertyReflector
 from ..convert.IntegerConverter import IntegerConverter
 
+_MISSING = object()
+
 
 class ObjectReader:
     """
@@ -63,6 +65,20 @@ class ObjectReader:
         # Todo: just a blank implementation for compatibility
         return obj
 
+    @staticmethod
+    def _find_key(map: dict, name: str) -> Any:
+        # Exact and lower-case keys are resolved by hash lookup,
+        # other casings fall back to a case-insensitive scan
+        if name in map:
+            return name
+        lower_name = name.lower()
+        if lower_name in map:
+            return lower_name
+        for key in map.keys():
+            if lower_name == str(key).lower():
+                return key
+        return _MISSING
+
     @staticmethod
     def has_property(obj: Any, name: str) -> bool:
         """
@@ -80,14 +96,12 @@ class ObjectReader:
         if obj is None or name is None:
             return False
 
+        if isinstance(obj, dict):
+            return ObjectReader._find_key(obj, name) is not _MISSING
+
         name = name.lower()
 
-        if isinstance(obj, dict):
-            for (key, value) in obj.items():
-                if name == str(key).lower():
-                    return True
-            return False
-        elif isinstance(obj, list) or isinstance(obj, tuple) or isinstance(obj, set):
+        if isinstance(obj, list) or isinstance(obj, tuple) or isinstance(obj, set):
             index = IntegerConverter.to_nullable_integer(name)
             return index is not None and 0 <= index < len(obj)
         else:
@@ -110,14 +124,13 @@ class ObjectReader:
         if obj is None or name is None:
             return False
 
+        if isinstance(obj, dict):
+            key = ObjectReader._find_key(obj, name)
+            return obj[key] if key is not _MISSING else None
+
         name = name.lower()
 
-        if isinstance(obj, dict):
-            for (key, value) in obj.items():
-                if name == str(key).lower():
-                    return value
-            return None
-        elif isinstance(obj, list) or isinstance(obj, tuple) or isinstance(obj, set):
+        if isinstance(obj, list) or isinstance(obj, tuple) or isinstance(obj, set):
             index = IntegerConverter.to_nullable_integer(name)
             if index is not None and 0 <= index < len(obj):
                 return list(obj)[index]
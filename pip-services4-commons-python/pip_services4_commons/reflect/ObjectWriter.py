@@ -10,6 +10,7 @@
 """
 from typing import Any
 
+from .ObjectReader import ObjectReader, _MISSING
 from .PropertyReflector import PropertyReflector
 from ..convert.IntegerConverter import IntegerConverter
 
@@ -65,14 +66,13 @@ class ObjectWriter:
         if name is None:
             raise Exception("Property name cannot be null")
 
+        if isinstance(obj, dict):
+            key = ObjectReader._find_key(obj, name)
+            obj[key if key is not _MISSING else name.lower()] = value
+            return
+
         name = name.lower()
 
-        if isinstance(obj, dict):
-            for key in obj.keys():
-                if name == str(key).lower():
-                    obj[key] = value
-                    return
-            obj[name] = value
         if isinstance(obj, set):
             obj = list(obj)
         if isinstance(obj, list) or isinstance(obj, tuple):
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_commons.reflect.PropertyPath
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compiled property path implementation
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import threading
+from typing import Any, Dict, Tuple
+
+from .ObjectReader import ObjectReader
+from .ObjectWriter import ObjectWriter
+
+
+class PropertyPath:
+    """
+    Compiled accessor for a nested property defined using dot notation as "object.subobject.property".
+
+    The path is split once and then reused to read, check and write properties
+    through the entire object graph. The object can be a user defined object, map or array.
+
+    Compiled paths are immutable and cached, so the same instance is returned
+    for the same path string.
+
+    Example:
+
+    .. code-block:: python
+
+        path = PropertyPath.compile("address.city")
+
+        path.get(customer)                  # Result: "Springfield"
+        path.set(customer, "Shelbyville")
+        path.has(customer)                  # Result: True
+    """
+
+    __MAX_CACHE_SIZE = 10000
+    __cache: Dict[str, 'PropertyPath'] = {}
+    __lock = threading.Lock()
+
+    __slots__ = ['__path', '__names']
+
+    def __init__(self, path: str):
+        """
+        Creates a new compiled path. Use :func:`compile` to get a cached instance.
+
+        :param path: a property path in dot notation.
+        """
+        self.__path = path
+        self.__names: Tuple[str, ...] = tuple(path.split("."))
+
+    @property
+    def path(self) -> str:
+        """
+        Gets the original property path.
+
+        :return: the property path in dot notation.
+        """
+        return self.__path
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """
+        Gets the property names along the path.
+
+        :return: a tuple of property names.
+        """
+        return self.__names
+
+    def has(self, obj: Any) -> bool:
+        """
+        Checks if object or its subobjects has the property at this path.
+
+        :param obj: an object to introspect.
+
+        :return: true if the object has the property and false if it doesn't.
+        """
+        if obj is None:
+            return False
+
+        names = self.__names
+        last = len(names) - 1
+        for index in range(last):
+            obj = ObjectReader.get_property(obj, names[index])
+            if obj is None:
+                return False
+
+        return ObjectReader.has_property(obj, names[last])
+
+    def get(self, obj: Any) -> Any:
+        """
+        Gets value of the property at this path.
+
+        :param obj: an object to read property from.
+
+        :return: the property value or None if property doesn't exist or introspection failed.
+        """
+        if obj is None:
+            return None
+
+        for name in self.__names:
+            obj = ObjectReader.get_property(obj, name)
+            if obj is None:
+                return None
+
+        return obj
+
+    def set(self, obj: Any, value: Any):
+        """
+        Sets value of the property at this path.
+        Missing intermediate objects are created as maps.
+
+        If the property does not exist or introspection fails
+        this method doesn't do anything and doesn't any throw errors.
+
+        :param obj: an object to write property to.
+
+        :param value: a new value for the property to set.
+        """
+        if obj is None:
+            return
+
+        names = self.__names
+        last = len(names) - 1
+        for index in range(last):
+            sub_obj = ObjectReader.get_property(obj, names[index])
+            if sub_obj is None:
+                sub_obj = {}
+                ObjectWriter.set_property(obj, names[index], sub_obj)
+            obj = sub_obj
+
+        ObjectWriter.set_property(obj, names[last], value)
+
+    def __str__(self) -> str:
+        return self.__path
+
+    @staticmethod
+    def compile(path: str) -> 'PropertyPath':
+        """
+        Compiles a property path or gets a previously compiled one from the cache.
+
+        :param path: a property path in dot notation.
+
+        :return: a compiled property path.
+        """
+        compiled = PropertyPath.__cache.get(path)
+        if compiled is None:
+            compiled = PropertyPath(path)
+            with PropertyPath.__lock:
+                if len(PropertyPath.__cache) >= PropertyPath.__MAX_CACHE_SIZE:
+                    PropertyPath.__cache.clear()
+                PropertyPath.__cache[path] = compiled
+        return compiled
@@ -8,7 +8,11 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Any, List
+from typing import Any, List, Optional
+
+from .TypeMetadata import TypeMetadata
+
+_MISSING = object()
 
 
 class PropertyReflector:
@@ -21,6 +25,9 @@ class PropertyReflector:
     Because all languages have different casing and case sensitivity __rules,
     this PropertyReflector treats all property names as case insensitive.
 
+    Member names of regular objects are resolved through :class:`TypeMetadata <pip_services4_commons.reflect.TypeMetadata.TypeMetadata>`
+    cached per class. Classes modified at runtime shall be reset with :func:`TypeMetadata.clear_cache`.
+
     Example:
 
     .. code-block:: python
@@ -58,6 +65,42 @@ class PropertyReflector:
 
         return field_name.lower() == expected_name
 
+    @staticmethod
+    def __find_names(obj: Any, metadata: TypeMetadata, name: str) -> List[str]:
+        names = metadata.find_names(name)
+        instance = getattr(obj, '__dict__', None)
+        # Instances of one class may use different casing, so names learned from other instances
+        # are not enough when none of them is set on this instance
+        if instance and not any(property_name in instance for property_name in names):
+            metadata.learn_names(list(instance.keys()))
+            names = metadata.find_names(name)
+        return names
+
+    @staticmethod
+    def __get_cached_property(obj: Any, metadata: TypeMetadata, property_name: str) -> Any:
+        if metadata.is_method(property_name):
+            instance = getattr(obj, '__dict__', None)
+            if instance is None or property_name not in instance:
+                return _MISSING
+
+        property = getattr(obj, property_name, _MISSING)
+        if property is _MISSING or not PropertyReflector._is_property(property, property_name):
+            return _MISSING
+        return property
+
+    @staticmethod
+    def __get_property_names(obj: Any, metadata: Optional[TypeMetadata]) -> List[str]:
+        if metadata is None:
+            return dir(obj)
+
+        instance = getattr(obj, '__dict__', None)
+        if not instance:
+            return metadata.get_candidate_names()
+
+        names = set(metadata.get_candidate_names())
+        names.update(instance.keys())
+        return sorted(names)
+
     @staticmethod
     def has_property(obj: Any, name: str) -> bool:
         """
@@ -76,6 +119,14 @@ class PropertyReflector:
 
         name = name.lower()
 
+        metadata = TypeMetadata.get_for(obj)
+        if metadata is not None:
+            for property_name in PropertyReflector.__find_names(obj, metadata, name):
+                property = PropertyReflector.__get_cached_property(obj, metadata, property_name)
+                if property is not _MISSING:
+                    return True
+            return False
+
         for property_name in dir(obj):
             if property_name.lower() != name:
                 continue
@@ -107,6 +158,14 @@ class PropertyReflector:
         name = name.lower()
 
         try:
+            metadata = TypeMetadata.get_for(obj)
+            if metadata is not None:
+                for property_name in PropertyReflector.__find_names(obj, metadata, name):
+                    property = PropertyReflector.__get_cached_property(obj, metadata, property_name)
+                    if property is not _MISSING:
+                        return property
+                return None
+
             for property_name in dir(obj):
                 if property_name.lower() != name:
                     continue
@@ -131,10 +190,14 @@ class PropertyReflector:
         :return: a list with property names.
         """
         property_names = []
+        metadata = TypeMetadata.get_for(obj)
 
-        for property_name in dir(obj):
+        for property_name in PropertyReflector.__get_property_names(obj, metadata):
 
-            if hasattr(obj, property_name):
+            if metadata is not None:
+                if PropertyReflector.__get_cached_property(obj, metadata, property_name) is not _MISSING:
+                    property_names.append(property_name)
+            elif hasattr(obj, property_name):
                 property = getattr(obj, property_name, None)
 
                 if PropertyReflector._is_property(property, property_name):
@@ -152,23 +215,30 @@ class PropertyReflector:
         :return: a map, containing the names of the object's properties and their values.
         """
         properties = {}
+        metadata = TypeMetadata.get_for(obj)
 
-        for property_name in dir(obj):
+        for property_name in PropertyReflector.__get_property_names(obj, metadata):
 
-            if hasattr(obj, property_name):
+            if metadata is not None:
+                property = PropertyReflector.__get_cached_property(obj, metadata, property_name)
+                is_property = property is not _MISSING
+            elif hasattr(obj, property_name):
                 property = getattr(obj, property_name, None)
+                is_property = PropertyReflector._is_property(property, property_name)
+            else:
+                is_property = False
 
-                if PropertyReflector._is_property(property, property_name):
+            if is_property:
 
-                    # Prepare private fields
-                    if property_name.startswith('_') and len(property_name.split('__')) > 1:
-                        property_name = '__' + property_name.split('__')[-1]
+                # Prepare private fields
+                if property_name.startswith('_') and len(property_name.split('__')) > 1:
+                    property_name = '__' + property_name.split('__')[-1]
 
-                    # Prepare protected fields
-                    # elif property_name.startswith('_'):
-                    #     property_name = property_name[1:]
+                # Prepare protected fields
+                # elif property_name.startswith('_'):
+                #     property_name = property_name[1:]
 
-                    properties[property_name] = property
+                properties[property_name] = property
 
         return properties
 
@@ -194,6 +264,14 @@ class PropertyReflector:
         name = name.lower()
 
         try:
+            metadata = TypeMetadata.get_for(obj)
+            if metadata is not None:
+                for property_name in PropertyReflector.__find_names(obj, metadata, name):
+                    property = PropertyReflector.__get_cached_property(obj, metadata, property_name)
+                    if property is not _MISSING:
+                        setattr(obj, property_name, value)
+                return
+
             for property_name in dir(obj):
                 if property_name.lower() != name:
                     continue
@@ -8,9 +8,10 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Set
 
 from .ObjectReader import ObjectReader
+from .PropertyPath import PropertyPath
 from ..convert.TypeCode import TypeCode
 from ..convert.TypeConverter import TypeConverter
 
@@ -22,18 +23,21 @@ class RecursiveObjectReader:
     It is similar to :class:`ObjectReader <pip_services4_commons.reflect.ObjectReader.ObjectReader>` but reads properties recursively
     through the entire object graph. Nested property names are defined
     using dot notation as "object.subobject.property"
+
+    Property paths are compiled once and cached, see :func:`compile_path`.
     """
 
     @staticmethod
-    def __perform_has_property(obj: Any, names: List[str], name_index: int) -> bool:
-        if name_index < len(names) - 1:
-            value = ObjectReader.get_property(obj, names[name_index])
-            if not (value is None):
-                return RecursiveObjectReader.__perform_has_property(value, names, name_index + 1)
-            else:
-                return False
-        else:
-            return ObjectReader.has_property(obj, names[name_index])
+    def compile_path(name: str) -> PropertyPath:
+        """
+        Compiles a property path in dot notation into a cached accessor
+        that can be reused to read the property from many objects without parsing the path again.
+
+        :param name: a name of the property in dot notation.
+
+        :return: a compiled :class:`PropertyPath <pip_services4_commons.reflect.PropertyPath.PropertyPath>`.
+        """
+        return PropertyPath.compile(name)
 
     @staticmethod
     def has_property(obj: Any, name: str) -> bool:
@@ -52,22 +56,7 @@ class RecursiveObjectReader:
         if obj is None or name is None:
             return False
 
-        names = name.split(".")
-        if names is None or len(names) == 0:
-            return False
-
-        return RecursiveObjectReader.__perform_has_property(obj, names, 0)
-
-    @staticmethod
-    def __perform_get_property(obj: Any, names: List[str], name_index: int) -> Any:
-        if name_index < len(names) - 1:
-            value = ObjectReader.get_property(obj, names[name_index])
-            if not (value is None):
-                return RecursiveObjectReader.__perform_get_property(value, names, name_index + 1)
-            else:
-                return None
-        else:
-            return ObjectReader.get_property(obj, names[name_index])
+        return PropertyPath.compile(name).has(obj)
 
     @staticmethod
     def get_property(obj: Any, name: str) -> Any:
@@ -86,11 +75,7 @@ class RecursiveObjectReader:
         if obj is None or name is None:
             return None
 
-        names = name.split(".")
-        if names is None or len(names) == 0:
-            return None
-
-        return RecursiveObjectReader.__perform_get_property(obj, names, 0)
+        return PropertyPath.compile(name).get(obj)
 
     @staticmethod
     def __is_simple_value(value: Any) -> bool:
@@ -98,15 +83,15 @@ class RecursiveObjectReader:
         return code != TypeCode.Array and code != TypeCode.Map and code != TypeCode.Object
 
     @staticmethod
-    def __perform_get_property_names(obj: Any, path: Optional[str], result: List[str], cycle_detect: Any):
+    def __perform_get_property_names(obj: Any, path: Optional[str], result: List[str], cycle_detect: Set[int]):
         map = ObjectReader.get_properties(obj)
 
         if len(map) != 0 and len(cycle_detect) < 100:
-            cycle_detect.append(obj)
+            cycle_detect.add(id(obj))
             try:
                 for (key, value) in map.items():
                     # Prevent cycles 
-                    if value in cycle_detect:
+                    if id(value) in cycle_detect:
                         continue
 
                     key = path + "." + key if not (path is None) else key
@@ -118,7 +103,7 @@ class RecursiveObjectReader:
                     else:
                         RecursiveObjectReader.__perform_get_property_names(value, key, result, cycle_detect)
             finally:
-                cycle_detect.remove(obj)
+                cycle_detect.discard(id(obj))
         else:
             if not (path is None):
                 result.append(path)
@@ -138,21 +123,21 @@ class RecursiveObjectReader:
         property_names = []
 
         if not (obj is None):
-            cycle_detect = []
+            cycle_detect = set()
             RecursiveObjectReader.__perform_get_property_names(obj, None, property_names, cycle_detect)
 
         return property_names
 
     @staticmethod
-    def __perform_get_properties(obj: Any, path: Optional[str], result: Any, cycle_detect: List[Any]):
+    def __perform_get_properties(obj: Any, path: Optional[str], result: Any, cycle_detect: Set[int]):
         map = ObjectReader.get_properties(obj)
 
         if len(map) != 0 and len(cycle_detect) < 100:
-            cycle_detect.append(obj)
+            cycle_detect.add(id(obj))
             try:
                 for (key, value) in map.items():
                     # Prevent cycles 
-                    if value in cycle_detect:
+                    if id(value) in cycle_detect:
                         continue
 
                     key = str(path) + "." + str(key) if path is not None else key
@@ -164,7 +149,7 @@ class RecursiveObjectReader:
                     else:
                         RecursiveObjectReader.__perform_get_properties(value, key, result, cycle_detect)
             finally:
-                cycle_detect.remove(obj)
+                cycle_detect.discard(id(obj))
         else:
             if not (path is None):
                 result[path] = obj
@@ -184,7 +169,7 @@ class RecursiveObjectReader:
         properties = {}
 
         if not (obj is None):
-            cycle_detect = []
+            cycle_detect = set()
             RecursiveObjectReader.__perform_get_properties(obj, None, properties, cycle_detect)
 
         return properties
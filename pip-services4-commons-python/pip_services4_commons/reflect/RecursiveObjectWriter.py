@@ -8,10 +8,9 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Any, List
+from typing import Any
 
-from .ObjectReader import ObjectReader
-from .ObjectWriter import ObjectWriter
+from .PropertyPath import PropertyPath
 from .RecursiveObjectReader import RecursiveObjectReader
 
 
@@ -25,22 +24,16 @@ class RecursiveObjectWriter:
     """
 
     @staticmethod
-    def __create_property(obj: Any, name: str):
-        return {}
+    def compile_path(name: str) -> PropertyPath:
+        """
+        Compiles a property path in dot notation into a cached accessor
+        that can be reused to write the property to many objects without parsing the path again.
 
-    @staticmethod
-    def __perform_set_property(obj: Any, names: List[str], name_index: int, value: Any) -> Any:
-        if name_index < len(names) - 1:
-            sub_obj = ObjectReader.get_property(obj, names[name_index])
-            if not (sub_obj is None):
-                RecursiveObjectWriter.__perform_set_property(sub_obj, names, name_index + 1, value)
-            else:
-                sub_obj = RecursiveObjectWriter.__create_property(obj, names[name_index])
-                if not (sub_obj is None):
-                    RecursiveObjectWriter.__perform_set_property(sub_obj, names, name_index + 1, value)
-                    ObjectWriter.set_property(obj, names[name_index], sub_obj)
-        else:
-            ObjectWriter.set_property(obj, names[name_index], value)
+        :param name: a name of the property in dot notation.
+
+        :return: a compiled :class:`PropertyPath <pip_services4_commons.reflect.PropertyPath.PropertyPath>`.
+        """
+        return PropertyPath.compile(name)
 
     @staticmethod
     def set_property(obj: Any, name: str, value: Any):
@@ -62,11 +55,7 @@ class RecursiveObjectWriter:
         if obj is None or name is None:
             return
 
-        names = name.split(".")
-        if names is None or len(names) == 0:
-            return
-
-        RecursiveObjectWriter.__perform_set_property(obj, names, 0, value)
+        PropertyPath.compile(name).set(obj, value)
 
     @staticmethod
     def set_properties(obj: Any, values: Any):
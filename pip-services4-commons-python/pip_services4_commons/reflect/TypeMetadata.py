@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_commons.reflect.TypeMetadata
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Cached per-type reflection metadata
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import threading
+import types
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TypeMetadata:
+    """
+    Reflection metadata collected once per class and reused by
+    :class:`PropertyReflector <pip_services4_commons.reflect.PropertyReflector.PropertyReflector>`
+    and :class:`ObjectReader <pip_services4_commons.reflect.ObjectReader.ObjectReader>`.
+
+    The metadata maps lower-cased member names to real attribute names and
+    classifies class members into methods (never properties) and property candidates,
+    so case-insensitive lookups do not call `dir()` on every access.
+
+    Instance attributes are not visible on the class. They are learned the first time
+    they are seen on an instance, which makes lookups on DTOs with a stable shape O(1).
+
+    Metadata is held weakly, so it does not keep dynamically created classes alive.
+    When a class is modified at runtime (attributes added or removed) its cached
+    metadata must be dropped with :func:`clear_cache`.
+
+    Example:
+
+    .. code-block:: python
+
+        metadata = TypeMetadata.get(MyObject)
+        metadata.find_names("myProperty")   # ('my_property',) if declared as my_property
+
+        TypeMetadata.clear_cache(MyObject)
+    """
+
+    __cache: 'weakref.WeakKeyDictionary[type, TypeMetadata]' = weakref.WeakKeyDictionary()
+    __cache_lock = threading.Lock()
+
+    def __init__(self, obj_type: type):
+        """
+        Creates metadata for the specified class.
+
+        :param obj_type: a class to introspect.
+        """
+        self.__lock = threading.Lock()
+        self.__names: Dict[str, Tuple[str, ...]] = {}
+        self.__known = set()
+        self.__methods = set()
+        self.__candidates: List[str] = []
+
+        for name in dir(obj_type):
+            self.__add_name(name)
+            if TypeMetadata.is_excluded_name(name):
+                continue
+            if TypeMetadata.__is_method_member(obj_type, name):
+                self.__methods.add(name)
+            else:
+                self.__candidates.append(name)
+
+        self.__candidates = tuple(self.__candidates)
+
+    @staticmethod
+    def is_excluded_name(name: str) -> bool:
+        """
+        Checks if the member name is a magic name or a base abstract class member,
+        that is never treated as a property.
+
+        :param name: a member name to check.
+
+        :return: true if the name is excluded from properties.
+        """
+        return name.startswith("__") and name.endswith('__') or name == '_abc_impl'
+
+    @staticmethod
+    def __is_method_member(obj_type: type, name: str) -> bool:
+        for base in obj_type.__mro__:
+            if name in base.__dict__:
+                member = base.__dict__[name]
+                return isinstance(member, (types.FunctionType, staticmethod, classmethod, type))
+        return False
+
+    def __add_name(self, name: str):
+        self.__known.add(name)
+        key = name.lower()
+        names = self.__names.get(key)
+        if names is None:
+            self.__names[key] = (name,)
+        elif name not in names:
+            self.__names[key] = tuple(sorted(names + (name,)))
+
+    def find_names(self, name: str) -> Tuple[str, ...]:
+        """
+        Finds real member names that match the lower-cased name.
+
+        :param name: a lower-cased member name.
+
+        :return: a tuple of matching real names sorted as `dir()` would return them.
+        """
+        return self.__names.get(name, ())
+
+    def learn_names(self, names: Any):
+        """
+        Registers instance attribute names that are not declared on the class.
+
+        :param names: a collection of attribute names.
+        """
+        unknown = [name for name in names if name not in self.__known]
+        if len(unknown) == 0:
+            return
+
+        with self.__lock:
+            for name in unknown:
+                self.__add_name(name)
+
+    def is_method(self, name: str) -> bool:
+        """
+        Checks if the class member with the specified name is a method, static method, class method
+        or a nested class. Such members are never properties unless shadowed by an instance attribute.
+
+        :param name: a real member name.
+
+        :return: true if the member is a method.
+        """
+        return name in self.__methods
+
+    def get_candidate_names(self) -> Tuple[str, ...]:
+        """
+        Gets names of class members that may be properties.
+
+        :return: a tuple of member names sorted as `dir()` would return them.
+        """
+        return self.__candidates
+
+    @staticmethod
+    def get(obj_type: type) -> 'TypeMetadata':
+        """
+        Gets cached metadata for the specified class, collecting it on the first call.
+
+        :param obj_type: a class to get metadata for.
+
+        :return: the class metadata.
+        """
+        metadata = TypeMetadata.__cache.get(obj_type)
+        if metadata is None:
+            metadata = TypeMetadata(obj_type)
+            with TypeMetadata.__cache_lock:
+                TypeMetadata.__cache[obj_type] = metadata
+        return metadata
+
+    @staticmethod
+    def get_for(obj: Any) -> Optional['TypeMetadata']:
+        """
+        Gets cached metadata for the class of the specified object.
+
+        Classes passed as objects and objects that customize `__dir__`
+        are not cached and return None, so callers fall back to plain `dir()` introspection.
+
+        :param obj: an object to get metadata for.
+
+        :return: the class metadata or None if the object cannot be cached.
+        """
+        obj_type = type(obj)
+        if isinstance(obj, type) or obj_type.__dir__ is not object.__dir__:
+            return None
+        return TypeMetadata.get(obj_type)
+
+    @staticmethod
+    def clear_cache(obj_type: type = None):
+        """
+        Drops cached metadata. Shall be called when classes are modified at runtime.
+
+        :param obj_type: (optional) a class to drop metadata for. When omitted the entire cache is cleared.
+        """
+        with TypeMetadata.__cache_lock:
+            if obj_type is None:
+                TypeMetadata.__cache.clear()
+            else:
+                TypeMetadata.__cache.pop(obj_type, None)
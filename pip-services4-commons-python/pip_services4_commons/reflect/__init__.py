@@ -18,15 +18,18 @@ __all__ = [
     'TypeDescriptor', 'TypeReflector', 'MethodReflector',
     'PropertyReflector', 'TypeMatcher',
     'ObjectReader', 'ObjectWriter',
-    'RecursiveObjectReader', 'RecursiveObjectWriter'
+    'RecursiveObjectReader', 'RecursiveObjectWriter',
+    'TypeMetadata', 'PropertyPath'
 ]
 
 from .MethodReflector import MethodReflector
 from .ObjectReader import ObjectReader
 from .ObjectWriter import ObjectWriter
+from .PropertyPath import PropertyPath
 from .PropertyReflector import PropertyReflector
 from .RecursiveObjectReader import RecursiveObjectReader
 from .RecursiveObjectWriter import RecursiveObjectWriter
 from .TypeDescriptor import TypeDescriptor
 from .TypeMatcher import TypeMatcher
+from .TypeMetadata import TypeMetadata
 from .TypeReflector import TypeReflector
@@ -7,9 +7,21 @@
     :license: MIT, see LICENSE for more details.
 """
 
+import datetime
+import gc
+import json
+import weakref
+
 from pip_services4_commons.convert import JsonConverter, DateTimeConverter, TypeCode
 
 
+class DummyJsonObject:
+    def __init__(self, key, content, tags=None):
+        self.key = key
+        self.content = content
+        self.tags = tags
+
+
 class TestJsonConverter:
 
     def test_to_json(self):
@@ -29,6 +41,28 @@ class TestJsonConverter:
         json_date = JsonConverter.to_json(date)
         assert "\"1975-04-08T00:00:00.000Z\"", json_date
 
+    def test_object_to_json(self):
+        obj = DummyJsonObject('1', DummyJsonObject('2', 'ABC'), {'A'})
+        value = json.loads(JsonConverter.to_json(obj))
+        assert {'key': '1', 'content': {'key': '2', 'content': 'ABC', 'tags': None}, 'tags': ['A']} == value
+
+        value = json.loads(JsonConverter.to_json_bytes([obj]))
+        assert {'key': '2', 'content': 'ABC', 'tags': None} == value[0]['content']
+
+        assert b'{"key1":123}' == JsonConverter.to_json_bytes({'key1': 123})
+
+    def test_dynamic_classes_are_released(self):
+        # Classes created per record must not be kept alive by cached encoders
+        record_type = type('object', (object,), {})
+        record = record_type()
+        record.key = '1'
+        assert '{"key": "1"}' == JsonConverter.to_json(record)
+
+        reference = weakref.ref(record_type)
+        del record, record_type
+        gc.collect()
+        assert reference() is None
+
     def test_from_json(self):
         assert 123 == JsonConverter.from_json(TypeCode.Integer, '123')
         assert 'ABC' == JsonConverter.from_json(TypeCode.String, '"ABC"')
@@ -43,6 +77,13 @@ class TestJsonConverter:
         json_date = JsonConverter.from_json(TypeCode.DateTime, "\"1975-04-08T00:00Z\"")
         assert date.timestamp() == json_date.timestamp()
 
+        value = JsonConverter.from_json(TypeCode.Map, '{"time": "1975-04-08T00:00:00.000Z", "name": "1975-04-08", '
+                                                      '"items": [{"time": "1975-04-08T00:00:00Z"}]}')
+        assert isinstance(value['time'], datetime.datetime)
+        assert date.timestamp() == value['time'].timestamp()
+        assert "1975-04-08" == value['name']
+        assert date.timestamp() == value['items'][0]['time'].timestamp()
+
     def test_json_to_map(self):
         # Handling simple objects
         value = '{ "value1":123, "value2":234 }'
@@ -12,6 +12,10 @@ from pip_services4_commons.reflect import PropertyReflector
 from .StubClass import StubClass
 
 
+class DynamicClass:
+    pass
+
+
 class TestPropertyReflector:
 
     def test_get_property(self):
@@ -37,3 +41,17 @@ class TestPropertyReflector:
         # assert 2 == len(map)
         assert "ABC" == map["public_field"]
         assert None is not map["public_prop"]
+
+    def test_get_property_with_different_casing(self):
+        obj1 = DynamicClass()
+        obj1.Name = 'x'
+        obj2 = DynamicClass()
+        obj2.name = 'y'
+
+        assert 'x' == PropertyReflector.get_property(obj1, 'name')
+        assert 'y' == PropertyReflector.get_property(obj2, 'name')
+        assert PropertyReflector.has_property(obj2, 'NAME')
+
+        PropertyReflector.set_property(obj2, 'Name', 'z')
+        assert 'z' == obj2.name
+        assert 'x' == PropertyReflector.get_property(obj1, 'name')
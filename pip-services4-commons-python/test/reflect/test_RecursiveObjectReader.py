@@ -130,3 +130,28 @@ class TestRecursiveObjectReader:
         assert 222 == values["value2.value22"]
         assert 444 == values["value3.0"]
         assert 555 == values["value3.1.value311"]
+
+    def test_compile_path(self):
+        obj = JsonConverter.to_map(
+            "{ \"value1\": 123, \"value2\": { \"value21\": 111, \"value22\": 222 } }"
+        )
+
+        path = RecursiveObjectReader.compile_path("value2.value21")
+        assert path is RecursiveObjectReader.compile_path("value2.value21")
+        assert 111 == path.get(obj)
+        assert path.has(obj)
+
+        path = RecursiveObjectReader.compile_path("value2.value31")
+        assert None is path.get(obj)
+        assert not path.has(obj)
+
+    def test_get_properties_with_cycles(self):
+        obj = {"value1": 123, "value2": {"value21": 111}}
+        obj["value2"]["parent"] = obj
+        obj["value3"] = {"value21": 111}
+
+        values = RecursiveObjectReader.get_properties(obj)
+        assert 3 == len(values)
+        assert 123 == values["value1"]
+        assert 111 == values["value2.value21"]
+        assert 111 == values["value3.value21"]
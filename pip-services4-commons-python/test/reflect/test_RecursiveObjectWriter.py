@@ -64,3 +64,13 @@ class TestRecursiveObjectWriter:
         assert None is values["value3.2"]
         assert "DDD" == values["value3.3"]
         assert "EEE" == values["value4.1"]
+
+    def test_compile_path(self):
+        obj = {"value1": 123}
+
+        path = RecursiveObjectWriter.compile_path("value2.value21")
+        path.set(obj, "AAA")
+        path.set({}, "BBB")
+
+        assert "AAA" == obj["value2"]["value21"]
+        assert "AAA" == RecursiveObjectReader.get_property(obj, "value2.value21")
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.refer.test_TypeMetadata
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: (c) Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from pip_services4_commons.reflect import PropertyReflector, TypeMetadata
+
+from .StubClass import StubClass
+
+
+class DummyDto:
+    def __init__(self, id=None, name=None):
+        self.id = id
+        self.Name = name
+
+
+class TestTypeMetadata:
+
+    def test_class_members(self):
+        metadata = TypeMetadata.get(StubClass)
+
+        assert ('public_field',) == metadata.find_names('public_field')
+        assert metadata.is_method('public_method')
+        assert not metadata.is_method('public_prop')
+        assert 'public_prop' in metadata.get_candidate_names()
+        assert '__init__' not in metadata.get_candidate_names()
+
+    def test_instance_members(self):
+        TypeMetadata.clear_cache(DummyDto)
+        obj = DummyDto('1', 'ABC')
+
+        assert 'ABC' == PropertyReflector.get_property(obj, 'name')
+        assert ('Name',) == TypeMetadata.get(DummyDto).find_names('name')
+
+        PropertyReflector.set_property(obj, 'NAME', 'XYZ')
+        assert 'XYZ' == obj.Name
+
+        assert PropertyReflector.has_property(obj, 'id')
+        assert not PropertyReflector.has_property(obj, 'ttl')
+        assert ['Name', 'id'] == PropertyReflector.get_property_names(obj)
+
+    def test_clear_cache(self):
+        class Dynamic:
+            pass
+
+        obj = Dynamic()
+        assert not PropertyReflector.has_property(obj, 'key')
+
+        Dynamic.key = 'ABC'
+        TypeMetadata.clear_cache(Dynamic)
+        assert 'ABC' == PropertyReflector.get_property(obj, 'key')
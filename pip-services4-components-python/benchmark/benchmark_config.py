@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_config
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measures slicing of large configurations into sections.
+    Run with: python benchmark/benchmark_config.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+
+from pip_services4_components.config import ConfigParams
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+def configure_all(config: ConfigParams):
+    for name in config.get_section_names():
+        component = config.get_section(name)
+        component.get_section('connection')
+        component.get_section('options')
+
+
+if __name__ == '__main__':
+    tuples = []
+    for index in range(500):
+        tuples.extend([
+            f'component{index}.descriptor', f'service:component:default:component{index}:1.0',
+            f'component{index}.connection.host', 'localhost',
+            f'component{index}.connection.port', 8080 + index,
+            f'component{index}.options.timeout', 10000,
+            f'component{index}.options.retries', 3,
+        ])
+    config = ConfigParams.from_tuples(*tuples)
+    defaults = ConfigParams.from_tuples('options.timeout', 5000, 'options.debug', False)
+    section = config.get_section('component0')
+
+    run('ConfigParams.get_section_names (2500 keys)', lambda: config.get_section_names(), 100)
+    run('Slice all sections (500 components)', lambda: configure_all(config), 10)
+    run('ConfigParams.set_defaults', lambda: section.set_defaults(defaults), 10000)
+    run('ConfigParams.length (2500 keys)', lambda: config.length(), 10000)
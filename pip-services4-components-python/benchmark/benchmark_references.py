@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_references
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measures component lookups in large reference maps.
+    Run with: python benchmark/benchmark_references.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import time
+
+from pip_services4_components.refer import Descriptor, References
+
+
+def run(count: int):
+    references = References()
+    start = time.perf_counter()
+
+    # Simulates container startup: each component is added and then resolves a few dependencies
+    for index in range(count):
+        references.put(Descriptor("group" + str(index % 10), "service", "default", "svc" + str(index), "1.0"), object())
+        references.get_optional(Descriptor("group" + str(index % 10), "service", "*", "svc" + str(index // 2), "1.0"))
+        references.get_optional(Descriptor("*", "logger", "*", "*", "1.0"))
+        references.get_optional(Descriptor("*", "counters", "*", "*", "1.0"))
+
+    elapsed = time.perf_counter() - start
+    print(f'{count:>6} components  {elapsed * 1000:10.2f} ms')
+
+
+if __name__ == '__main__':
+    for count in (500, 1000, 2000, 4000):
+        run(count)
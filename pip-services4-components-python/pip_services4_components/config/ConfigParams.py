@@ -8,7 +8,7 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Any, List
+from typing import Any, List, Dict, Optional, Tuple
 
 from pip_services4_commons.data import StringValueMap
 from pip_services4_commons.reflect import RecursiveObjectReader
@@ -47,6 +47,9 @@ class ConfigParams(StringValueMap):
         section1.__str__() # Result: key1=AAA;key2=123
     """
 
+    # Parameters grouped by the 1st level section, built on demand and dropped on any change
+    __sections: Optional[Dict[str, List[Tuple[str, str]]]] = None
+
     def __init__(self, values: Any = None):
         """
         Creates a new :class:`ConfigParams` and fills it with values.
@@ -55,30 +58,69 @@ class ConfigParams(StringValueMap):
         """
         super().__init__(values)
 
+    def __setitem__(self, key: str, value: Any):
+        self.__sections = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str):
+        self.__sections = None
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> 'ConfigParams':
+        self.__sections = None
+        return super().__ior__(other)
+
+    def update(self, *args: Any, **kwargs: Any):
+        self.__sections = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.__sections = None
+        return super().setdefault(key, default)
+
+    def pop(self, key: str, *args: Any) -> Any:
+        self.__sections = None
+        return super().pop(key, *args)
+
+    def popitem(self) -> Tuple[str, Any]:
+        self.__sections = None
+        return super().popitem()
+
+    def clear(self):
+        self.__sections = None
+        super().clear()
+
+    def __get_sections(self) -> Dict[str, List[Tuple[str, str]]]:
+        sections = self.__sections
+        if sections is None:
+            sections = {}
+            for (key, value) in self.items():
+                pos = key.find('.')
+                if pos >= 0:
+                    section = sections.get(key[0: pos])
+                    if section is None:
+                        section = sections[key[0: pos]] = []
+                    section.append((key[pos + 1:], value))
+            self.__sections = sections
+        return sections
+
     def get_section_names(self) -> List[str]:
         """
         Gets a list with all 1st level section names.
 
         :return: a list of section names stored in this ConfigMap.
         """
-        sections = []
+        sections = {}
 
-        for (key, value) in self.items():
+        for key in self.keys():
             pos = key.find('.')
             if pos > 0:
                 key = key[0: pos]
 
             # Perform case sensitive search
-            found = False
-            for section in sections:
-                if section == key:
-                    found = True
-                    break
+            sections[key] = None
 
-            if not found:
-                sections.append(key)
-
-        return sections
+        return list(sections)
 
     def get_section(self, section: str) -> 'ConfigParams':
         """
@@ -90,18 +132,21 @@ class ConfigParams(StringValueMap):
         :return: all configuration parameters that belong to the section named 'section'.
         """
         result = ConfigParams()
-        prefix = section + "."
 
-        for (key, value) in self.items():
-            # Prevents error on the next line
-            if len(key) < len(prefix):
-                continue
+        # Parameters are looked up by the 1st level section and then filtered by the subsection
+        pos = section.find('.')
+        name = section if pos < 0 else section[0: pos]
+        entries = self.__get_sections().get(name)
+        if entries is None:
+            return result
 
+        if pos < 0:
+            dict.update(result, entries)
+        else:
             # Perform case sensitive match
-            key_prefix = key[: len(prefix)]
-            if key_prefix == prefix:
-                key = key[len(prefix):]
-                result[key] = value
+            prefix = section[pos + 1:] + "."
+            length = len(prefix)
+            dict.update(result, ((key[length:], value) for (key, value) in entries if key.startswith(prefix)))
 
         return result
 
@@ -124,6 +124,14 @@ class DependencyResolver(IReconfigurable, IReferenceable):
         """
         self.__dependencies[name] = locator
 
+    def get_locators(self) -> List[Any]:
+        """
+        Gets locators of all dependencies registered in this resolver.
+
+        :return: a list with dependency locators.
+        """
+        return list(self.__dependencies.values())
+
     def __locate(self, name: str) -> Any:
         """
         Gets a dependency locator by its name.
@@ -42,6 +42,8 @@ class Descriptor:
         locator1.exact_match(locator2);	// Result: false
     """
 
+    __slots__ = ('__group', '__type', '__kind', '__name', '__version')
+
     def __init__(self, group: Optional[str], type: Optional[str], kind: Optional[str], name: Optional[str],
                  version: Optional[str]):
         """
@@ -109,11 +111,6 @@ class Descriptor:
         """
         return self.__version
 
-    def __match_field(self, field1: str, field2: str) -> bool:
-        return field1 is None \
-               or field2 is None \
-               or field1 == field2
-
     def match(self, descriptor: 'Descriptor') -> bool:
         """
         Partially matches this descriptor to another descriptor.
@@ -123,11 +120,22 @@ class Descriptor:
 
         :return: true if descriptors match and false otherwise
         """
-        return self.__match_field(self.__group, descriptor.get_group()) \
-               and self.__match_field(self.__type, descriptor.get_type()) \
-               and self.__match_field(self.__kind, descriptor.get_kind()) \
-               and self.__match_field(self.__name, descriptor.get_name()) \
-               and self.__match_field(self.__version, descriptor.get_version())
+        # Fields are compared inline, because descriptors are matched very often
+        # while resolving references
+        field1, field2 = self.__group, descriptor.__group
+        if not (field1 is None or field2 is None or field1 == field2):
+            return False
+        field1, field2 = self.__type, descriptor.__type
+        if not (field1 is None or field2 is None or field1 == field2):
+            return False
+        field1, field2 = self.__kind, descriptor.__kind
+        if not (field1 is None or field2 is None or field1 == field2):
+            return False
+        field1, field2 = self.__name, descriptor.__name
+        if not (field1 is None or field2 is None or field1 == field2):
+            return False
+        field1, field2 = self.__version, descriptor.__version
+        return field1 is None or field2 is None or field1 == field2
 
     def __exact_match_field(self, field1: str, field2: str) -> bool:
         if field1 is None and field2 is None:
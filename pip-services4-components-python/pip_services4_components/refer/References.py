@@ -10,8 +10,9 @@
 """
 
 import threading
-from typing import List, Any, Sequence
+from typing import List, Any, Sequence, Dict, Optional
 
+from .Descriptor import Descriptor
 from .IReferences import IReferences
 from .Reference import Reference
 from .ReferenceException import ReferenceException
@@ -39,7 +40,10 @@ class References(IReferences):
 
         controller.set_references(references)
 
-
+    To keep lookups fast in containers with many components, references located by
+    :class:`Descriptor <pip_services4_components.refer.Descriptor.Descriptor>` are indexed by their
+    group, type, kind and name, and results of :func:`find` are cached per locator
+    until references are added or removed.
     """
 
     __lock = None
@@ -54,6 +58,13 @@ class References(IReferences):
         self._references: List[Reference] = []
         self.__lock = threading.Lock()
 
+        self.__sequence = 0
+        self.__positions: Dict[Reference, int] = {}
+        self.__field_index: List[Dict[str, List[Reference]]] = [{}, {}, {}, {}]
+        self.__wildcard_index: List[List[Reference]] = [[], [], [], []]
+        self.__unindexed: List[Reference] = []
+        self.__cache: Dict[Any, List[Any]] = {}
+
         if not (tuples is None):
             index = 0
             while index < len(tuples):
@@ -62,6 +73,86 @@ class References(IReferences):
                 self.put(tuples[index], tuples[index + 1])
                 index = index + 2
 
+    @staticmethod
+    def __get_descriptor_fields(descriptor: Descriptor) -> tuple:
+        return descriptor.get_group(), descriptor.get_type(), descriptor.get_kind(), descriptor.get_name()
+
+    @staticmethod
+    def __may_equal_descriptor(component: Any) -> bool:
+        # Plain objects and built-in values never compare equal to descriptors,
+        # other components have to be checked on every lookup
+        if isinstance(component, Descriptor):
+            return True
+        if isinstance(component, (str, int, float, bytes, tuple, list, dict, set)):
+            return False
+        return type(component).__eq__ is not object.__eq__
+
+    def __index_reference(self, reference: Reference):
+        self.__sequence += 1
+        self.__positions[reference] = self.__sequence
+
+        locator = reference.get_locator()
+        if not isinstance(locator, Descriptor) or References.__may_equal_descriptor(reference.get_component()):
+            self.__unindexed.append(reference)
+            return
+
+        for (index, value) in enumerate(References.__get_descriptor_fields(locator)):
+            if value is None:
+                self.__wildcard_index[index].append(reference)
+            else:
+                self.__field_index[index].setdefault(value, []).append(reference)
+
+    def __unindex_reference(self, reference: Reference):
+        # Positions of other references keep their order, so they are not renumbered
+        del self.__positions[reference]
+
+        locator = reference.get_locator()
+        if not isinstance(locator, Descriptor) or References.__may_equal_descriptor(reference.get_component()):
+            self.__unindexed.remove(reference)
+            return
+
+        for (index, value) in enumerate(References.__get_descriptor_fields(locator)):
+            if value is None:
+                self.__wildcard_index[index].remove(reference)
+            else:
+                bucket = self.__field_index[index][value]
+                bucket.remove(reference)
+                if len(bucket) == 0:
+                    del self.__field_index[index][value]
+
+    def __get_candidates(self, locator: Any) -> Sequence[Reference]:
+        if not isinstance(locator, Descriptor):
+            return list(reversed(self._references))
+
+        # Pick the most selective concrete field of the locator
+        selected = None
+        for (index, value) in enumerate(References.__get_descriptor_fields(locator)):
+            if value is None:
+                continue
+            bucket = self.__field_index[index].get(value, [])
+            wildcards = self.__wildcard_index[index]
+            if selected is None or len(bucket) + len(wildcards) < len(selected[0]) + len(selected[1]):
+                selected = (bucket, wildcards)
+
+        if selected is None:
+            return list(reversed(self._references))
+
+        candidates = selected[0] + selected[1] + self.__unindexed
+        candidates.sort(key=self.__positions.__getitem__, reverse=True)
+        return candidates
+
+    @staticmethod
+    def __get_cache_key(locator: Any) -> Optional[Any]:
+        if isinstance(locator, Descriptor):
+            # Descriptors compare by partial match, so the key shall use exact field values
+            return Descriptor, locator.get_group(), locator.get_type(), locator.get_kind(), \
+                   locator.get_name(), locator.get_version()
+        try:
+            hash(locator)
+            return type(locator), locator
+        except TypeError:
+            return None
+
     def put(self, locator: Any = None, component: Any = None):
         """
         Puts a new reference into this reference map.
@@ -75,7 +166,10 @@ class References(IReferences):
 
         self.__lock.acquire()
         try:
-            self._references.append(Reference(locator, component))
+            reference = Reference(locator, component)
+            self._references.append(reference)
+            self.__index_reference(reference)
+            self.__cache = {}
         finally:
             self.__lock.release()
 
@@ -97,6 +191,8 @@ class References(IReferences):
             for reference in reversed(self._references):
                 if reference.match(locator):
                     self._references.remove(reference)
+                    self.__unindex_reference(reference)
+                    self.__cache = {}
                     return reference.get_component()
         finally:
             self.__lock.release()
@@ -121,7 +217,11 @@ class References(IReferences):
             for reference in reversed(self._references):
                 if reference.match(locator):
                     self._references.remove(reference)
+                    self.__unindex_reference(reference)
                     components.append(reference.get_component())
+
+            if len(components) > 0:
+                self.__cache = {}
         finally:
             self.__lock.release()
 
@@ -229,25 +329,27 @@ class References(IReferences):
         if locator is None:
             raise Exception("Locator cannot be null")
 
-        components = []
+        key = References.__get_cache_key(locator)
 
         self.__lock.acquire()
         try:
-            index = len(self._references) - 1
+            components = self.__cache.get(key) if key is not None else None
 
-            while index >= 0:
-                reference = self._references[index]
-                if reference.match(locator):
-                    component = reference.get_component()
-                    components.append(component)
-                index = index - 1
+            if components is None:
+                components = []
+                for reference in self.__get_candidates(locator):
+                    if reference.match(locator):
+                        components.append(reference.get_component())
+
+                if key is not None:
+                    self.__cache[key] = components
 
             if len(components) == 0 and required:
                 raise ReferenceException(None, locator)
         finally:
             self.__lock.release()
 
-        return components
+        return list(components)
 
     @staticmethod
     def from_tuples(*tuples: Any) -> 'References':
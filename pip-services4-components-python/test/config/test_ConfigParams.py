@@ -77,4 +77,43 @@ class TestConfigParams:
             'connection.host', 'localhost',
             'connection.port', 3000
         )
-        default = config
\ No newline at end of file
+        default = config
+
+    def test_nested_sections(self):
+        config = ConfigParams.from_tuples(
+            "Section1.Subsection1.Key1", "Value1",
+            "Section1.Subsection1.Key2", "Value2",
+            "Section1.Subsection2.Key1", "Value3",
+            "Section1.Key1", "Value4",
+            "Section2.Key1", "Value5"
+        )
+
+        subsection = config.get_section("Section1.Subsection1")
+        assert 2 == len(subsection)
+        assert "Value1" == subsection.get("Key1")
+        assert "Value2" == subsection.get("Key2")
+
+        section = config.get_section("Section1")
+        assert 4 == len(section)
+        assert ["Subsection1", "Subsection2", "Key1"] == section.get_section_names()
+
+        assert 0 == len(config.get_section("Section3"))
+        assert 0 == len(config.get_section("Section1.Subsection3"))
+
+    def test_section_after_changes(self):
+        config = ConfigParams.from_tuples(
+            "Section1.Key1", "Value1",
+            "Section2.Key1", "Value2"
+        )
+        assert 1 == len(config.get_section("Section1"))
+
+        config.put("Section1.Key2", "Value3")
+        config.remove("Section2.Key1")
+        assert 2 == len(config.get_section("Section1"))
+        assert 0 == len(config.get_section("Section2"))
+
+        config.update({"Section2.Key2": "Value4"})
+        assert "Value4" == config.get_section("Section2").get("Key2")
+
+        config.clear()
+        assert 0 == len(config.get_section("Section1"))
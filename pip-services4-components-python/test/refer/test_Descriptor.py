@@ -60,3 +60,8 @@ class TestDescriptor:
 
         with pytest.raises(ConfigException) as ex:
             Descriptor.from_string('xxx')
+
+    def test_not_hashable(self):
+        # Descriptors are equal by partial match, so no hash can be consistent with equality
+        with pytest.raises(TypeError):
+            hash(Descriptor("pip-dummies", "controller", "default", "default", "1.0"))
@@ -6,7 +6,7 @@
     :copyright: (c) Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from pip_services4_components.refer import References
+from pip_services4_components.refer import Descriptor, References
 
 
 class TestReferences:
@@ -39,3 +39,50 @@ class TestReferences:
 
         items = refs.get_required(333)
         assert 1 == len(items)
+
+    def test_find_by_descriptor(self):
+        refs = References.from_tuples(
+            Descriptor("pip-services", "logger", "console", "default", "1.0"), "AAA",
+            Descriptor("pip-services", "counters", "log", "default", "1.0"), "BBB",
+            Descriptor("pip-services", "logger", "*", "*", "1.0"), "CCC",
+            "logger", "DDD"
+        )
+
+        items = refs.get_optional(Descriptor(None, "logger", None, None, None))
+        assert ["CCC", "AAA"] == items
+
+        items = refs.get_optional(Descriptor(None, None, "console", None, None))
+        assert ["CCC", "AAA"] == items
+
+        items = refs.get_optional(Descriptor("pip-services", "counters", "*", "*", "*"))
+        assert ["BBB"] == items
+
+        # Results are invalidated when references change
+        refs.put(Descriptor("pip-services", "logger", "log", "default", "1.0"), "EEE")
+        items = refs.get_optional(Descriptor(None, "logger", None, None, None))
+        assert ["EEE", "CCC", "AAA"] == items
+
+        refs.remove(Descriptor("pip-services", "logger", "*", "*", "1.0"))
+        items = refs.get_optional(Descriptor(None, "logger", None, None, None))
+        assert ["CCC", "AAA"] == items
+
+        assert "DDD" == refs.get_one_required("logger")
+
+    def test_remove(self):
+        refs = References.from_tuples(
+            Descriptor("pip-services", "logger", "console", "default", "1.0"), "AAA",
+            Descriptor("pip-services", "logger", "*", "*", "1.0"), "BBB",
+            Descriptor("pip-services", "counters", "log", "default", "1.0"), "CCC",
+            "logger", "DDD"
+        )
+
+        assert ["CCC"] == refs.remove_all(Descriptor(None, "counters", None, None, None))
+        assert [] == refs.get_optional(Descriptor("pip-services", "counters", None, None, None))
+
+        assert "BBB" == refs.remove(Descriptor(None, "logger", None, None, None))
+        assert ["AAA"] == refs.get_optional(Descriptor("pip-services", None, None, "default", None))
+
+        assert "DDD" == refs.remove("logger")
+        refs.put(Descriptor("pip-services", "logger", "log", "default", "1.0"), "EEE")
+        assert ["EEE", "AAA"] == refs.get_optional(Descriptor(None, "logger", None, None, None))
+        assert ["EEE", "AAA"] == refs.get_all()[::-1]
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_config_reader
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measures repeated reading of parameterized configuration files.
+    Run with: python benchmark/benchmark_config_reader.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import os
+import tempfile
+import timeit
+
+from pip_services4_components.config import ConfigParams
+
+from pip_services4_config.config import YamlConfigReader, JsonConfigReader
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as folder:
+        yaml_path = os.path.join(folder, 'config.yaml')
+        json_path = os.path.join(folder, 'config.json')
+
+        with open(yaml_path, 'w') as file:
+            for index in range(200):
+                file.write(f'- descriptor: "service:component:default:component{index}:1.0"\n')
+                file.write(f'  connection:\n    host: "{{{{HOST}}}}"\n    port: {8080 + index}\n')
+
+        with open(json_path, 'w') as file:
+            file.write('[' + ','.join(
+                f'{{"descriptor": "service:component:default:component{index}:1.0", '
+                f'"connection": {{"host": "{{{{HOST}}}}", "port": {8080 + index}}}}}'
+                for index in range(200)
+            ) + ']')
+
+        parameters = ConfigParams.from_tuples('HOST', 'localhost')
+
+        run('YamlConfigReader.read_config (200 components)',
+            lambda: YamlConfigReader.read_config(None, yaml_path, parameters), 50)
+        run('JsonConfigReader.read_config (200 components)',
+            lambda: JsonConfigReader.read_config(None, json_path, parameters), 50)
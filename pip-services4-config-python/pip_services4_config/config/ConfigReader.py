@@ -8,12 +8,13 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
+import threading
 from abc import abstractmethod
-from typing import Optional
+from typing import Optional, Dict, List
 
 from pip_services4_components.config import ConfigParams, IConfigurable
 from pip_services4_components.context import IContext
-from pip_services4_components.exec import INotifiable
+from pip_services4_components.exec import INotifiable, Parameters
 from pip_services4_expressions.mustache import MustacheTemplate
 
 from .IConfigReader import IConfigReader
@@ -26,13 +27,20 @@ class ConfigReader(IConfigReader, IConfigurable):
     ### Configuration parameters ###
     parameters:            this entire section is used as template parameters
         - ...
+
+    Configuration templates are compiled once and reused for the same template text.
     """
 
+    __MAX_TEMPLATES = 100
+    __templates: Dict[str, MustacheTemplate] = {}
+    __templates_lock = threading.Lock()
+
     def __init__(self):
         """
         Creates a new instance of the config reader.
         """
         self.__parameters: ConfigParams = ConfigParams()
+        self.__listeners: List[INotifiable] = []
 
     def configure(self, config: ConfigParams):
         """
@@ -67,18 +75,41 @@ class ConfigReader(IConfigReader, IConfigurable):
 
         :return: a parameterized configuration string.
         """
-        parameters = self.__parameters.override(parameters)
-        template = MustacheTemplate(config)
+        parameters = self._get_parameters(parameters)
+        template = ConfigReader.__get_template(config)
 
         return template.evaluate_with_variables(parameters)
 
+    def _get_parameters(self, parameters: ConfigParams) -> ConfigParams:
+        """
+        Gets parameters to parameterize the configuration with.
+        The given values override parameters configured for this reader.
+
+        :param parameters: dynamic parameters to inject into the template
+
+        :return: the combined parameters.
+        """
+        return self.__parameters.override(parameters)
+
+    @staticmethod
+    def __get_template(config: str) -> MustacheTemplate:
+        template = ConfigReader.__templates.get(config)
+        if template is None:
+            template = MustacheTemplate(config)
+            with ConfigReader.__templates_lock:
+                if len(ConfigReader.__templates) >= ConfigReader.__MAX_TEMPLATES:
+                    ConfigReader.__templates.clear()
+                ConfigReader.__templates[config] = template
+        return template
+
     def add_change_listener(self, listener: INotifiable):
         """
         Adds a listener that will be notified when configuration is changed
 
         :param listener: a listener to be added.
         """
-        # Do nothing...
+        if listener is not None and listener not in self.__listeners:
+            self.__listeners.append(listener)
 
     def remove_change_listener(self, listener: INotifiable):
         """
@@ -86,4 +117,25 @@ class ConfigReader(IConfigReader, IConfigurable):
 
         :param listener: a listener to be removed.
         """
-        # Do nothing...
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+
+    def _get_change_listeners(self) -> List[INotifiable]:
+        """
+        Gets listeners that are notified when configuration is changed.
+
+        :return: a list of change listeners.
+        """
+        return list(self.__listeners)
+
+    def _send_change_notification(self, context: Optional[IContext], args: Parameters = None):
+        """
+        Notifies all change listeners that configuration has been changed.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param args: (optional) notification arguments.
+        """
+        args = args or Parameters()
+        for listener in self._get_change_listeners():
+            listener.notify(context, args)
@@ -8,9 +8,15 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
+import os
+import threading
 from abc import ABC
+from typing import Any, Callable, Dict, Optional, Tuple
 
+from pip_services4_commons.errors import ConfigException, FileException
 from pip_services4_components.config import ConfigParams
+from pip_services4_components.context import IContext, ContextResolver
+from pip_services4_components.exec import INotifiable, Parameters
 
 from .ConfigReader import ConfigReader
 
@@ -21,12 +27,23 @@ class FileConfigReader(ConfigReader, ABC):
     Child classes add support for config files in their specific format
     like JSON, YAML or property files.
 
+    Parsed configurations are cached by file path, modification time and parameters,
+    so the file is read and parsed again only when it is changed.
+
+    When change listeners are added, the reader polls the file and notifies
+    the listeners when the file is changed.
+
     ### Configuration parameters ###
-        - path:          path to configuration file
-        - parameters:    this entire section is used as template parameters
+        - path:            path to configuration file
+        - watch_interval:  interval in milliseconds to check the file for changes (default: 1000)
+        - parameters:      this entire section is used as template parameters
         - ...
     """
 
+    __MAX_CACHE_SIZE = 100
+    __cache: Dict[Tuple, Any] = {}
+    __cache_lock = threading.Lock()
+
     def __init__(self, path: str = None):
         """
         Creates a new instance of the config reader.
@@ -35,6 +52,9 @@ class FileConfigReader(ConfigReader, ABC):
         """
         super(FileConfigReader, self).__init__()
         self.__path: str = path
+        self.__watch_interval: int = 1000
+        self.__watch_event: Optional[threading.Event] = None
+        self.__lock = threading.Lock()
 
     def get_path(self) -> str:
         """
@@ -60,3 +80,120 @@ class FileConfigReader(ConfigReader, ABC):
         """
         super(FileConfigReader, self).configure(config)
         self.__path = config.get_as_string_with_default("path", self.__path)
+        self.__watch_interval = config.get_as_integer_with_default("watch_interval", self.__watch_interval)
+
+    def _read_parsed(self, context: Optional[IContext], parameters: ConfigParams,
+                     parse: Callable[[str], Any]) -> Any:
+        """
+        Reads configuration file, parameterizes its content and parses it.
+        The result is reused until the file or the parameters are changed,
+        so it is shared between calls and must not be modified.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param parameters: values to parameters the configuration.
+
+        :param parse: a function that parses the parameterized configuration.
+
+        :return: the parsed configuration.
+        """
+        path = self.get_path()
+
+        if path is None:
+            raise ConfigException(ContextResolver.get_trace_id(context), "NO_PATH", "Missing config file path")
+
+        if not os.path.isfile(path):
+            raise FileException(ContextResolver.get_trace_id(context), 'FILE_NOT_FOUND',
+                                'Config file was not found at ' + path)
+
+        try:
+            stat = os.stat(path)
+            parameters = self._get_parameters(parameters)
+            try:
+                key = (type(self), os.path.abspath(path), stat.st_mtime_ns, stat.st_size,
+                       frozenset(parameters.items()))
+                hash(key)
+            except TypeError:
+                # Parameters with values that cannot be hashed are not cached
+                key = None
+
+            if key is not None and key in FileConfigReader.__cache:
+                return FileConfigReader.__cache[key]
+
+            with open(path, 'r') as file:
+                config = file.read()
+                config = self._parameterize(config, parameters)
+                value = parse(config)
+
+            if key is not None:
+                with FileConfigReader.__cache_lock:
+                    if len(FileConfigReader.__cache) >= FileConfigReader.__MAX_CACHE_SIZE:
+                        FileConfigReader.__cache.clear()
+                    FileConfigReader.__cache[key] = value
+
+            return value
+        except Exception as ex:
+            raise FileException(
+                ContextResolver.get_trace_id(context),
+                "READ_FAILED",
+                "Failed reading configuration " + path + ": " + str(ex)
+            ).with_details("path", path).with_cause(ex)
+
+    def add_change_listener(self, listener: INotifiable):
+        """
+        Adds a listener that will be notified when configuration file is changed.
+        The file is watched while there are change listeners.
+
+        :param listener: a listener to be added.
+        """
+        super(FileConfigReader, self).add_change_listener(listener)
+        if len(self._get_change_listeners()) > 0:
+            self.__start_watching()
+
+    def remove_change_listener(self, listener: INotifiable):
+        """
+        Remove a previously added change listener.
+        The file is no longer watched when the last listener is removed.
+
+        :param listener: a listener to be removed.
+        """
+        super(FileConfigReader, self).remove_change_listener(listener)
+        if len(self._get_change_listeners()) == 0:
+            self.__stop_watching()
+
+    def __get_file_state(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.__path)
+            return stat.st_mtime_ns, stat.st_size
+        except (OSError, TypeError):
+            return None
+
+    def __start_watching(self):
+        with self.__lock:
+            if self.__watch_event is not None:
+                return
+
+            self.__watch_event = threading.Event()
+            watcher = threading.Thread(target=self.__watch, args=(self.__watch_event,), daemon=True)
+            watcher.start()
+
+    def __stop_watching(self):
+        with self.__lock:
+            if self.__watch_event is not None:
+                self.__watch_event.set()
+                self.__watch_event = None
+
+    def __watch(self, stop_event: threading.Event):
+        state = self.__get_file_state()
+
+        while not stop_event.wait(max(self.__watch_interval, 1) / 1000):
+            new_state = self.__get_file_state()
+            if new_state == state:
+                continue
+
+            state = new_state
+            try:
+                self._send_change_notification(None, Parameters.from_tuples("path", self.__path))
+            except Exception:
+                # Listener errors shall not stop watching
+                pass
@@ -10,14 +10,11 @@
 """
 
 import json
-import os.path
+import copy
 from typing import Optional, Any
 
-from pip_services4_commons.errors.ConfigException import ConfigException
-from pip_services4_commons.errors.FileException import FileException
 from pip_services4_components.config import ConfigParams
 from pip_services4_components.context import IContext
-from pip_services4_components.context.ContextResolver import ContextResolver
 
 from .FileConfigReader import FileConfigReader
 
@@ -57,6 +54,10 @@ class JsonConfigReader(FileConfigReader):
         """
         super(JsonConfigReader, self).__init__(path)
 
+    @staticmethod
+    def __parse(config: str) -> Any:
+        return json.loads(config)
+
     def read_object_(self, context: Optional[IContext], parameters: ConfigParams) -> Any:
         """
         Reads configuration file, parameterizes its content and converts it into JSON object.
@@ -67,24 +68,8 @@ class JsonConfigReader(FileConfigReader):
 
         :return: a JSON object with configuration.
         """
-        path = self.get_path()
-        if path is None:
-            raise ConfigException(ContextResolver.get_trace_id(context), "NO_PATH", "Missing config file path")
-
-        if not os.path.isfile(path):
-            raise FileException(ContextResolver.get_trace_id(context), 'FILE_NOT_FOUND', 'Config file was not found at ' + path)
-
-        try:
-            with open(path, 'r') as file:
-                config = file.read()
-                config = self._parameterize(config, parameters)
-                return json.loads(config)
-        except Exception as ex:
-            raise FileException(
-                context,
-                "READ_FAILED",
-                "Failed reading configuration " + path + ": " + str(ex)
-            ).with_details("path", path).with_cause(ex)
+        value = self._read_parsed(context, parameters, self.__parse)
+        return copy.deepcopy(value)
 
     def read_config_(self, context: Optional[IContext], parameters: ConfigParams) -> ConfigParams:
         """
@@ -96,6 +81,7 @@ class JsonConfigReader(FileConfigReader):
 
         :return: ConfigParams configuration.
         """
+        # The object is read through the overridable method, which takes parsed files from the cache
         value = self.read_object_(context, parameters)
         return ConfigParams.from_value(value)
 
@@ -127,5 +113,4 @@ class JsonConfigReader(FileConfigReader):
 
         :return: ConfigParams configuration.
         """
-        value = JsonConfigReader(path).read_object_(context, parameters)
-        return ConfigParams.from_value(value)
+        return JsonConfigReader(path).read_config_(context, parameters)
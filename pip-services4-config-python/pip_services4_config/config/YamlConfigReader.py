@@ -9,15 +9,12 @@
     :license: MIT, see LICENSE for more details.
 """
 
-import os.path
+import copy
 from typing import Any, Optional
 
 import yaml
-from pip_services4_commons.errors.ConfigException import ConfigException
-from pip_services4_commons.errors.FileException import FileException
 from pip_services4_components.config import ConfigParams
 from pip_services4_components.context import IContext
-from pip_services4_components.context.ContextResolver import ContextResolver
 
 from .FileConfigReader import FileConfigReader
 
@@ -56,6 +53,10 @@ class YamlConfigReader(FileConfigReader):
         """
         super(YamlConfigReader, self).__init__(path)
 
+    @staticmethod
+    def __parse(config: str) -> Any:
+        return yaml.load(config, Loader=yaml.FullLoader)
+
     def _read_object(self, context: Optional[IContext], parameters: ConfigParams) -> Any:
         """
         Reads configuration file, parameterizes its content and converts it into YAML object.
@@ -66,25 +67,8 @@ class YamlConfigReader(FileConfigReader):
 
         :return: a YAML object with configuration.
         """
-        path = self.get_path()
-
-        if path is None:
-            raise ConfigException(ContextResolver.get_trace_id(context), "NO_PATH", "Missing config file path")
-
-        if not os.path.isfile(path):
-            raise FileException(ContextResolver.get_trace_id(context), 'FILE_NOT_FOUND', 'Config file was not found at ' + path)
-
-        try:
-            with open(path, 'r') as file:
-                config = file.read()
-                config = self._parameterize(config, parameters)
-                return yaml.load(config, Loader=yaml.FullLoader)
-        except Exception as ex:
-            raise FileException(
-                ContextResolver.get_trace_id(context),
-                "READ_FAILED",
-                "Failed reading configuration " + path + ": " + str(ex)
-            ).with_details("path", path).with_cause(ex)
+        value = self._read_parsed(context, parameters, self.__parse)
+        return copy.deepcopy(value)
 
     def read_config_(self, context: Optional[IContext], parameters: ConfigParams) -> ConfigParams:
         """
@@ -96,6 +80,7 @@ class YamlConfigReader(FileConfigReader):
 
         :return: ConfigParams configuration.
         """
+        # The object is read through the overridable method, which takes parsed files from the cache
         value = self._read_object(context, parameters)
         return ConfigParams.from_value(value)
 
@@ -127,5 +112,4 @@ class YamlConfigReader(FileConfigReader):
 
         :return: ConfigParams configuration.
         """
-        value = YamlConfigReader(path)._read_object(context, parameters)
-        return ConfigParams.from_value(value)
+        return YamlConfigReader(path).read_config_(context, parameters)
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_config.connect.ConnectionBalancer
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Connection balancer implementation
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+from pip_services4_commons.errors import ConfigException
+from pip_services4_components.config import ConfigParams, IConfigurable
+
+from .ConnectionParams import ConnectionParams
+
+
+class ConnectionBalancer(IConfigurable):
+    """
+    Helper class that spreads calls across several resolved connections on the client side.
+
+    Before each call a client acquires a connection from the balancer and releases it afterwards
+    reporting if the call succeeded. Connections that fail several times in a row are ejected
+    from balancing for a period of time. When all connections are ejected, all of them are used again.
+
+    Supported strategies:
+        - round_robin:      connections are used one after another
+        - least_requests:   a connection with the least number of outstanding calls is used
+        - power_of_two:     a connection with less outstanding calls is chosen from two random connections
+
+    ### Configuration parameters ###
+        - strategy:                 balancing strategy: round_robin, least_requests or power_of_two (default: round_robin)
+        - max_failures:             number of consecutive failures to eject a connection (default: 3)
+        - ejection_timeout:         time in milliseconds an ejected connection is excluded from balancing (default: 30000)
+
+    Example:
+
+    .. code-block:: python
+
+        balancer = ConnectionBalancer(connection_resolver.resolve_all(Context.from_trace_id("123")), 'least_requests')
+
+        connection = balancer.acquire()
+        try:
+            # call the service...
+            balancer.release(connection, True)
+        except Exception as ex:
+            balancer.release(connection, False)
+            raise ex
+    """
+
+    RoundRobin = 'round_robin'
+    LeastRequests = 'least_requests'
+    PowerOfTwo = 'power_of_two'
+
+    __strategies = (RoundRobin, LeastRequests, PowerOfTwo)
+
+    def __init__(self, connections: List[ConnectionParams] = None, strategy: str = RoundRobin):
+        """
+        Creates a new instance of the balancer.
+
+        :param connections: (optional) a list of connections to balance.
+
+        :param strategy: (optional) a balancing strategy. Default: round_robin
+        """
+        self.__lock = threading.Lock()
+        self.__strategy: str = ConnectionBalancer.RoundRobin
+        self.__max_failures: int = 3
+        self.__ejection_timeout: int = 30000
+        self.__next: int = 0
+
+        self.__connections: List[ConnectionParams] = []
+        self.__indexes: Dict[int, int] = {}
+        self.__outstanding: List[int] = []
+        self.__failures: List[int] = []
+        self.__ejected_until: List[float] = []
+
+        self.set_strategy(strategy)
+        self.set_connections(connections or [])
+
+    def configure(self, config: ConfigParams):
+        """
+        Configures component by passing configuration parameters.
+
+        :param config: configuration parameters to be set.
+        """
+        self.set_strategy(config.get_as_string_with_default("strategy", self.__strategy))
+        self.__max_failures = config.get_as_integer_with_default("max_failures", self.__max_failures)
+        self.__ejection_timeout = config.get_as_integer_with_default("ejection_timeout", self.__ejection_timeout)
+
+    def get_strategy(self) -> str:
+        """
+        Gets the balancing strategy.
+
+        :return: the balancing strategy.
+        """
+        return self.__strategy
+
+    def set_strategy(self, strategy: str):
+        """
+        Sets the balancing strategy.
+
+        :param strategy: a balancing strategy: round_robin, least_requests or power_of_two.
+        """
+        strategy = (strategy or ConnectionBalancer.RoundRobin).lower()
+        if strategy not in ConnectionBalancer.__strategies:
+            raise ConfigException(
+                None, "WRONG_STRATEGY", "Balancing strategy " + strategy + " is not supported"
+            ).with_details("strategy", strategy)
+        self.__strategy = strategy
+
+    def get_connections(self) -> List[ConnectionParams]:
+        """
+        Gets all balanced connections.
+
+        :return: a list of connections.
+        """
+        return list(self.__connections)
+
+    def set_connections(self, connections: List[ConnectionParams]):
+        """
+        Sets connections to balance and resets collected statistics.
+
+        :param connections: a list of connections.
+        """
+        with self.__lock:
+            self.__connections = list(connections)
+            self.__indexes = {id(connection): index for (index, connection) in enumerate(self.__connections)}
+            self.__outstanding = [0] * len(self.__connections)
+            self.__failures = [0] * len(self.__connections)
+            self.__ejected_until = [0.0] * len(self.__connections)
+            self.__next = 0
+
+    def is_ejected(self, connection: ConnectionParams) -> bool:
+        """
+        Checks if the connection is ejected from balancing because of failures.
+
+        :param connection: a connection to check.
+
+        :return: true if the connection is ejected and false otherwise.
+        """
+        index = self.__indexes.get(id(connection))
+        return index is not None and self.__ejected_until[index] > time.monotonic()
+
+    def get_outstanding(self, connection: ConnectionParams) -> int:
+        """
+        Gets number of calls that acquired the connection and have not released it yet.
+
+        :param connection: a connection to check.
+
+        :return: the number of outstanding calls.
+        """
+        index = self.__indexes.get(id(connection))
+        return 0 if index is None else self.__outstanding[index]
+
+    def __choose(self) -> int:
+        now = time.monotonic()
+        candidates = [index for index in range(len(self.__connections)) if self.__ejected_until[index] <= now]
+
+        # Fail open when all connections are ejected
+        if len(candidates) == 0:
+            candidates = list(range(len(self.__connections)))
+
+        if self.__strategy == ConnectionBalancer.LeastRequests:
+            offset = self.__next % len(candidates)
+            self.__next += 1
+            candidates = candidates[offset:] + candidates[:offset]
+            return min(candidates, key=lambda index: self.__outstanding[index])
+
+        if self.__strategy == ConnectionBalancer.PowerOfTwo and len(candidates) > 1:
+            (first, second) = random.sample(candidates, 2)
+            return first if self.__outstanding[first] <= self.__outstanding[second] else second
+
+        index = candidates[self.__next % len(candidates)]
+        self.__next += 1
+        return index
+
+    def acquire(self) -> Optional[ConnectionParams]:
+        """
+        Chooses a connection for the next call. The connection must be released after the call.
+
+        :return: a chosen connection or None if there are no connections.
+        """
+        with self.__lock:
+            if len(self.__connections) == 0:
+                return None
+
+            index = self.__choose()
+            self.__outstanding[index] += 1
+            return self.__connections[index]
+
+    def release(self, connection: ConnectionParams, success: bool = True):
+        """
+        Releases a previously acquired connection and records the result of the call.
+
+        :param connection: an acquired connection.
+
+        :param success: true if the call succeeded and false if it failed.
+        """
+        with self.__lock:
+            index = self.__indexes.get(id(connection))
+            if index is None:
+                return
+
+            self.__outstanding[index] = max(0, self.__outstanding[index] - 1)
+
+            if success:
+                self.__failures[index] = 0
+                return
+
+            self.__failures[index] += 1
+            if self.__failures[index] >= self.__max_failures:
+                self.__failures[index] = 0
+                self.__ejected_until[index] = time.monotonic() + self.__ejection_timeout / 1000
@@ -8,7 +8,7 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pip_services4_commons.errors import ConfigException
 from pip_services4_components.config import ConfigParams, IConfigurable
@@ -41,6 +41,10 @@ class ConnectionResolver(IConfigurable, IReferenceable):
     ### References ###
         - `*:discovery:*:*:1.0`    (optional) IDiscovery services to resolve connections
 
+    Connections resolved in discovery services that report their version with `get_version()`,
+    like :class:`MemoryDiscovery <pip_services4_config.connect.MemoryDiscovery.MemoryDiscovery>`,
+    are cached until the version changes. Other discovery services are queried on every call.
+
     Example:
 
     .. code-block:: python
@@ -64,6 +68,7 @@ class ConnectionResolver(IConfigurable, IReferenceable):
         """
         self.__references: IReferences = None
         self.__connections = []
+        self.__cache: Dict[Tuple[str, bool], Tuple[Any, List[ConnectionParams]]] = {}
 
         if not (config is None):
             self.configure(config)
@@ -77,6 +82,24 @@ class ConnectionResolver(IConfigurable, IReferenceable):
         :param references: references to locate the component dependencies.
         """
         self.__references = references
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Clears connections cached after resolution in discovery services.
+        """
+        self.__cache = {}
+
+    @staticmethod
+    def __get_discovery_version(components: List[Any]) -> Optional[Tuple]:
+        # Resolutions can be cached only when every discovery service reports its version
+        versions = []
+        for component in components:
+            get_version = getattr(component, 'get_version', None)
+            if not callable(get_version):
+                return None
+            versions.append((id(component), get_version()))
+        return tuple(versions)
 
     def configure(self, config: ConfigParams):
         """
@@ -148,13 +171,23 @@ class ConnectionResolver(IConfigurable, IReferenceable):
         if len(components) == 0:
             raise ConfigException(context, "CANNOT_RESOLVE", "Discovery wasn't found to make resolution")
 
+        version = ConnectionResolver.__get_discovery_version(components)
+        cached = self.__cache.get((key, False))
+        if version is not None and cached is not None and cached[0] == version:
+            return cached[1][0] if len(cached[1]) > 0 else None
+
+        result = []
         for component in components:
             if isinstance(component, IDiscovery):
                 resolved_connection = component.resolve_one(context, key)
                 if not (resolved_connection is None):
-                    return resolved_connection
+                    result.append(resolved_connection)
+                    break
 
-        return None
+        if version is not None:
+            self.__cache[(key, False)] = (version, result)
+
+        return result[0] if len(result) > 0 else None
 
     def resolve(self, context: Optional[IContext]) -> Optional[ConnectionParams]:
         """
@@ -196,6 +229,11 @@ class ConnectionResolver(IConfigurable, IReferenceable):
         if len(components) == 0:
             raise ConfigException(ContextResolver.get_trace_id(context), "CANNOT_RESOLVE", "Discovery wasn't found to make resolution")
 
+        version = ConnectionResolver.__get_discovery_version(components)
+        cached = self.__cache.get((key, True))
+        if version is not None and cached is not None and cached[0] == version:
+            return list(cached[1])
+
         for component in components:
             if isinstance(component, IDiscovery):
                 resolved_connections = component.resolve_all(context, key)
@@ -203,6 +241,9 @@ class ConnectionResolver(IConfigurable, IReferenceable):
                     for connection in resolved_connections:
                         result.append(connection)
 
+        if version is not None:
+            self.__cache[(key, True)] = (version, list(result))
+
         return result
 
     def resolve_all(self, context: Optional[IContext]) -> List[ConnectionParams]:
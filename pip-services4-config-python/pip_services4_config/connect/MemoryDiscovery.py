@@ -8,7 +8,9 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional
 
 from pip_services4_components.config import IReconfigurable, ConfigParams
 from pip_services4_components.context import IContext
@@ -23,12 +25,18 @@ class DiscoveryItem:
     """
     key: str = None
     connection: ConnectionParams = None
+    expire_time: Optional[float] = None
 
 
 class MemoryDiscovery(IDiscovery, IReconfigurable):
     """
     Discovery service that keeps connections in memory.
 
+    Connections are indexed by their keys. Registering the same connection under the same key
+    again does not create a duplicate, but extends its lifetime. When time to live is set,
+    registered connections expire unless they are registered again before the timeout (heartbeat).
+    Configured connections never expire.
+
     ### Configuration parameters ###
         - [connection key 1]:
         - ...                          connection parameters for key 1
@@ -53,13 +61,20 @@ class MemoryDiscovery(IDiscovery, IReconfigurable):
         # Result: host=10.1.1.100;port=8080
     """
 
-    def __init__(self, config: ConfigParams = None):
+    def __init__(self, config: ConfigParams = None, ttl: int = 0):
         """
         Creates a new instance of discovery service.
 
         :param config: (optional) configuration with connection parameters.
+
+        :param ttl: (optional) time to live of registered connections in milliseconds. 0 means no expiration.
         """
-        self.__items: List[DiscoveryItem] = []
+        self.__lock = threading.Lock()
+        self.__items: Dict[str, List[DiscoveryItem]] = {}
+        self.__ttl: int = ttl
+        self.__version: int = 0
+        self.__next_expire_time: Optional[float] = None
+
         if not (config is None):
             self.configure(config)
 
@@ -71,6 +86,34 @@ class MemoryDiscovery(IDiscovery, IReconfigurable):
         """
         self.read_connections(config)
 
+    def get_ttl(self) -> int:
+        """
+        Gets time to live of registered connections.
+
+        :return: the time to live in milliseconds. 0 means no expiration.
+        """
+        return self.__ttl
+
+    def set_ttl(self, value: int):
+        """
+        Sets time to live of registered connections.
+        It applies to connections registered after the change.
+
+        :param value: the time to live in milliseconds. 0 means no expiration.
+        """
+        self.__ttl = value
+
+    def get_version(self) -> int:
+        """
+        Gets version of the registry that changes every time connections are added, removed or expired.
+        It allows clients to cache resolved connections.
+
+        :return: the registry version.
+        """
+        with self.__lock:
+            self.__remove_expired()
+            return self.__version
+
     def read_connections(self, connections: ConfigParams):
         """
         Reads connections from configuration parameters.
@@ -78,7 +121,7 @@ class MemoryDiscovery(IDiscovery, IReconfigurable):
 
         :param connections: configuration parameters to be read
         """
-        self.__items = []
+        items = {}
 
         if len(connections) > 0:
             connection_sections = connections.get_section_names()
@@ -88,11 +131,43 @@ class MemoryDiscovery(IDiscovery, IReconfigurable):
                 item = DiscoveryItem()
                 item.key = key
                 item.connection = ConnectionParams(value)
-                self.__items.append(item)
+                items.setdefault(key, []).append(item)
+
+        with self.__lock:
+            self.__items = items
+            self.__next_expire_time = None
+            self.__version += 1
+
+    def __remove_expired(self):
+        if self.__next_expire_time is None or time.monotonic() < self.__next_expire_time:
+            return
+
+        now = time.monotonic()
+        next_expire_time = None
+        removed = False
+
+        for key in list(self.__items.keys()):
+            items = [item for item in self.__items[key] if item.expire_time is None or item.expire_time > now]
+            removed = removed or len(items) < len(self.__items[key])
+            for item in items:
+                if item.expire_time is not None:
+                    next_expire_time = item.expire_time if next_expire_time is None \
+                        else min(next_expire_time, item.expire_time)
+
+            if len(items) == 0:
+                del self.__items[key]
+            else:
+                self.__items[key] = items
+
+        self.__next_expire_time = next_expire_time
+        # Extended registrations leave earlier expiration times behind, so sweeps may remove nothing
+        if removed:
+            self.__version += 1
 
     def register(self, context: Optional[IContext], key: str, connection: ConnectionParams) -> ConnectionParams:
         """
         Registers connection parameters into the discovery service.
+        When the same connection is already registered under the key, its lifetime is extended.
 
         :param context: (optional) transaction id to trace execution through call chain.
 
@@ -102,12 +177,55 @@ class MemoryDiscovery(IDiscovery, IReconfigurable):
 
         :returns: the registered connection parameters.
         """
-        item = DiscoveryItem()
-        item.key = key
-        item.connection = connection
-        self.__items.append(item)
+        expire_time = time.monotonic() + self.__ttl / 1000 if self.__ttl > 0 else None
+
+        with self.__lock:
+            self.__remove_expired()
+
+            items = self.__items.setdefault(key, [])
+            item = next((item for item in items if item.connection == connection), None)
+
+            if item is None:
+                item = DiscoveryItem()
+                item.key = key
+                item.connection = connection
+                items.append(item)
+                self.__version += 1
+            elif item.expire_time is None:
+                # Permanent connections do not expire
+                expire_time = None
+
+            item.expire_time = expire_time
+            if expire_time is not None and (self.__next_expire_time is None
+                                            or expire_time < self.__next_expire_time):
+                self.__next_expire_time = expire_time
+
         return connection
 
+    def unregister(self, context: Optional[IContext], key: str, connection: ConnectionParams = None):
+        """
+        Removes connection parameters from the discovery service.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param key: a key of the connection parameters.
+
+        :param connection: (optional) a connection to be removed. When omitted all connections with the key are removed.
+        """
+        with self.__lock:
+            items = self.__items.get(key)
+            if items is None:
+                return
+
+            count = len(items)
+            items = [] if connection is None else [item for item in items if item.connection != connection]
+            if len(items) == 0:
+                del self.__items[key]
+            else:
+                self.__items[key] = items
+            if len(items) < count:
+                self.__version += 1
+
     def resolve_one(self, context: Optional[IContext], key: str) -> ConnectionParams:
         """
         Resolves a single connection parameters by its key.
@@ -118,12 +236,12 @@ class MemoryDiscovery(IDiscovery, IReconfigurable):
 
         :return: a resolved connection.
         """
-        connection = None
-        for item in self.__items:
-            if item.key == key and not (item.connection is None):
-                connection = item.connection
-                break
-        return connection
+        with self.__lock:
+            self.__remove_expired()
+            for item in self.__items.get(key, []):
+                if not (item.connection is None):
+                    return item.connection
+        return None
 
     def resolve_all(self, context: Optional[IContext], key: str) -> List[ConnectionParams]:
         """
@@ -135,8 +253,6 @@ class MemoryDiscovery(IDiscovery, IReconfigurable):
 
         :return: a list with resolved connections.
         """
-        connections = []
-        for item in self.__items:
-            if item.key == key and not (item.connection is None):
-                connections.append(item.connection)
-        return connections
+        with self.__lock:
+            self.__remove_expired()
+            return [item.connection for item in self.__items.get(key, []) if not (item.connection is None)]
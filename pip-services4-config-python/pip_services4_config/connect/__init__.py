@@ -36,10 +36,11 @@
 """
 
 __all__ = ['CompositeConnectionResolver', 'ConnectionParams',
-           'IDiscovery', 'ConnectionResolver',
+           'IDiscovery', 'ConnectionResolver', 'ConnectionBalancer',
            'ConnectionUtils', 'MemoryDiscovery', 'DefaultDiscoveryFactory']
 
 from .CompositeConnectionResolver import CompositeConnectionResolver
+from .ConnectionBalancer import ConnectionBalancer
 from .ConnectionParams import ConnectionParams
 from .ConnectionResolver import ConnectionResolver
 from .ConnectionUtils import ConnectionUtils
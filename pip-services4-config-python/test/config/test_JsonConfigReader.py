@@ -11,6 +11,14 @@ from pip_services4_components.config import ConfigParams
 from pip_services4_config.config import JsonConfigReader
 
 
+class ExtendedJsonConfigReader(JsonConfigReader):
+
+    def read_object_(self, context, parameters):
+        value = super().read_object_(context, parameters)
+        value['field6'] = 'Extended'
+        return value
+
+
 class TestJsonConfigReader:
 
     def test_read_config(self):
@@ -32,3 +40,11 @@ class TestJsonConfigReader:
         assert "Test Param 1" == config.get_as_string("field4")
         assert "Test Param 2" == config.get_as_string("field5")
 
+    def test_read_extended_config(self):
+        # Configurations are read through the overridable method even when files are cached
+        JsonConfigReader.read_config(None, "./data/config.json", ConfigParams())
+        config = ExtendedJsonConfigReader("./data/config.json").read_config_(None, ConfigParams())
+        assert "Extended" == config.get_as_string("field6")
+
+        config = JsonConfigReader.read_config(None, "./data/config.json", ConfigParams())
+        assert config.get_as_nullable_string("field6") is None
@@ -6,11 +6,32 @@
     :copyright: (c) Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
+import os
+import tempfile
+import time
+
 from pip_services4_components.config import ConfigParams
+from pip_services4_components.exec import INotifiable
 
 from pip_services4_config.config import YamlConfigReader
 
 
+class ChangeListener(INotifiable):
+    def __init__(self):
+        self.notifications = []
+
+    def notify(self, context, args):
+        self.notifications.append(args.get_as_string("path"))
+
+
+class ExtendedYamlConfigReader(YamlConfigReader):
+
+    def _read_object(self, context, parameters):
+        value = super()._read_object(context, parameters)
+        value['field6'] = 'Extended'
+        return value
+
+
 class TestYamlConfigReader:
 
     def test_read_config(self):
@@ -30,3 +51,62 @@ class TestYamlConfigReader:
         assert True == config.get_as_boolean("field3")
         assert "Test Param 1" == config.get_as_string("field4")
         assert "Test Param 2" == config.get_as_string("field5")
+
+    def test_read_changed_config(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "config.yaml")
+            with open(path, 'w') as file:
+                file.write("field1: {{param1}}\n")
+
+            parameters = ConfigParams.from_tuples("param1", "ABC")
+            config = YamlConfigReader.read_config(None, path, parameters)
+            assert "ABC" == config.get_as_string("field1")
+
+            config = YamlConfigReader.read_config(None, path, ConfigParams.from_tuples("param1", "XYZ"))
+            assert "XYZ" == config.get_as_string("field1")
+
+            with open(path, 'w') as file:
+                file.write("field1: {{param1}}\nfield2: 123\n")
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+            config = YamlConfigReader.read_config(None, path, parameters)
+            assert 2 == len(config)
+            assert 123 == config.get_as_integer("field2")
+
+    def test_change_listener(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "config.yaml")
+            with open(path, 'w') as file:
+                file.write("field1: 123\n")
+
+            reader = YamlConfigReader()
+            reader.configure(ConfigParams.from_tuples("path", path, "watch_interval", 10))
+
+            listener = ChangeListener()
+            reader.add_change_listener(listener)
+            try:
+                time.sleep(0.05)
+                with open(path, 'w') as file:
+                    file.write("field1: 456\n")
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+                for _ in range(100):
+                    if len(listener.notifications) > 0:
+                        break
+                    time.sleep(0.01)
+
+                assert [path] == listener.notifications[:1]
+                assert 456 == reader.read_config_(None, ConfigParams()).get_as_integer("field1")
+            finally:
+                reader.remove_change_listener(listener)
+
+    def test_read_extended_config(self):
+        # Configurations are read through the overridable method even when files are cached
+        YamlConfigReader.read_config(None, "./data/config.yaml", ConfigParams())
+        config = ExtendedYamlConfigReader("./data/config.yaml").read_config_(None, ConfigParams())
+        assert "Extended" == config.get_as_string("field6")
+
+        config = YamlConfigReader.read_config(None, "./data/config.yaml", ConfigParams())
+        assert config.get_as_nullable_string("field6") is None
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.connect.test_ConnectionBalancer
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: (c) Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import time
+
+import pytest
+from pip_services4_commons.errors import ConfigException
+from pip_services4_components.config import ConfigParams
+
+from pip_services4_config.connect import ConnectionBalancer, ConnectionParams
+
+
+def create_connections(count):
+    return [ConnectionParams.from_tuples("host", "host" + str(index), "port", 8080) for index in range(count)]
+
+
+class TestConnectionBalancer:
+
+    def test_round_robin(self):
+        connections = create_connections(3)
+        balancer = ConnectionBalancer(connections)
+
+        chosen = []
+        for _ in range(6):
+            connection = balancer.acquire()
+            chosen.append(connection)
+            balancer.release(connection)
+
+        assert connections + connections == chosen
+
+    def test_least_requests(self):
+        connections = create_connections(3)
+        balancer = ConnectionBalancer(connections, ConnectionBalancer.LeastRequests)
+
+        first = balancer.acquire()
+        second = balancer.acquire()
+        third = balancer.acquire()
+        assert 3 == len({id(first), id(second), id(third)})
+
+        balancer.release(second)
+        assert second is balancer.acquire()
+        assert 1 == balancer.get_outstanding(second)
+
+    def test_power_of_two(self):
+        connections = create_connections(2)
+        balancer = ConnectionBalancer(connections, ConnectionBalancer.PowerOfTwo)
+
+        busy = balancer.acquire()
+        for _ in range(10):
+            connection = balancer.acquire()
+            assert connection is not busy
+            balancer.release(connection)
+
+    def test_ejection(self):
+        connections = create_connections(2)
+        balancer = ConnectionBalancer()
+        balancer.configure(ConfigParams.from_tuples(
+            "strategy", "round_robin",
+            "max_failures", 2,
+            "ejection_timeout", 50
+        ))
+        balancer.set_connections(connections)
+
+        for _ in range(2):
+            balancer.release(connections[0], False)
+        assert balancer.is_ejected(connections[0])
+
+        for _ in range(4):
+            connection = balancer.acquire()
+            assert connection is connections[1]
+            balancer.release(connection)
+
+        time.sleep(0.1)
+        assert not balancer.is_ejected(connections[0])
+
+    def test_all_ejected(self):
+        connections = create_connections(2)
+        balancer = ConnectionBalancer(connections)
+        balancer.configure(ConfigParams.from_tuples("max_failures", 1))
+
+        for connection in connections:
+            balancer.release(connection, False)
+
+        assert balancer.acquire() is not None
+        assert ConnectionBalancer().acquire() is None
+
+    def test_wrong_strategy(self):
+        with pytest.raises(ConfigException):
+            ConnectionBalancer(strategy="random")
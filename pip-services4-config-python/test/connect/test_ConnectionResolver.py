@@ -8,9 +8,9 @@
 """
 from pip_services4_components.config import ConfigParams
 from pip_services4_components.context import Context
-from pip_services4_components.refer import References
+from pip_services4_components.refer import References, Descriptor
 
-from pip_services4_config.connect import ConnectionResolver, ConnectionParams
+from pip_services4_config.connect import ConnectionResolver, ConnectionParams, MemoryDiscovery
 
 RestConfig = ConfigParams.from_tuples(
     "connection.protocol", "http",
@@ -70,3 +70,21 @@ class TestConnectionResolver:
             connection_params = connection_resolver.resolve(Context.from_trace_id("trace_id"))
         except Exception as ex:
             assert "Discovery wasn't found to make resolution" == ex.message
+
+    def test_resolve_cached_in_discovery(self):
+        discovery = MemoryDiscovery(ConfigParams.from_tuples("key1.host", "10.1.1.100", "key1.port", 8080))
+        references = References.from_tuples(
+            Descriptor("pip-services", "discovery", "memory", "default", "1.0"), discovery
+        )
+        connection_resolver = ConnectionResolver(
+            ConfigParams.from_tuples("connection.discovery_key", "key1"), references
+        )
+
+        connections = connection_resolver.resolve_all(None)
+        assert 1 == len(connections)
+        assert "10.1.1.100" == connection_resolver.resolve(None).get_host()
+
+        discovery.register(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.101", "port", 8080))
+        connections = connection_resolver.resolve_all(None)
+        assert 2 == len(connections)
+        assert "10.1.1.101" == connections[1].get_host()
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import time
+
 from pip_services4_components.config import ConfigParams
 
 from pip_services4_config.connect import MemoryDiscovery, ConnectionParams
@@ -32,3 +34,59 @@ class TestMemoryDiscovery:
         connections = discovery.resolve_all("123", "key1")
 
         assert len(connections) > 1
+
+    def test_register_without_duplicates(self):
+        discovery = MemoryDiscovery()
+        version = discovery.get_version()
+
+        discovery.register(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.100"))
+        discovery.register(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.100"))
+        discovery.register(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.101"))
+
+        assert 2 == len(discovery.resolve_all(None, "key1"))
+        assert "10.1.1.100" == discovery.resolve_one(None, "key1").get_host()
+        assert version < discovery.get_version()
+
+        discovery.unregister(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.100"))
+        assert "10.1.1.101" == discovery.resolve_one(None, "key1").get_host()
+
+        discovery.unregister(None, "key1")
+        assert discovery.resolve_one(None, "key1") is None
+        assert 0 == len(discovery.resolve_all(None, "key1"))
+
+    def test_expire_registrations(self):
+        discovery = MemoryDiscovery(ConfigParams.from_tuples("key1.host", "10.1.1.100"), 200)
+
+        discovery.register(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.101"))
+        discovery.register(None, "key2", ConnectionParams.from_tuples("host", "10.1.1.102"))
+        assert 2 == len(discovery.resolve_all(None, "key1"))
+        version = discovery.get_version()
+
+        time.sleep(0.12)
+        # Heartbeat extends the registration
+        discovery.register(None, "key2", ConnectionParams.from_tuples("host", "10.1.1.102"))
+        time.sleep(0.12)
+
+        assert 1 == len(discovery.resolve_all(None, "key1"))
+        assert "10.1.1.100" == discovery.resolve_one(None, "key1").get_host()
+        assert "10.1.1.102" == discovery.resolve_one(None, "key2").get_host()
+        assert version < discovery.get_version()
+
+        time.sleep(0.2)
+        assert discovery.resolve_one(None, "key2") is None
+
+    def test_keep_version_without_changes(self):
+        discovery = MemoryDiscovery(None, 200)
+
+        discovery.register(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.100"))
+        time.sleep(0.1)
+        discovery.register(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.100"))
+        version = discovery.get_version()
+
+        # The first expiration time passes, but the extended registration is kept
+        time.sleep(0.15)
+        assert "10.1.1.100" == discovery.resolve_one(None, "key1").get_host()
+        assert version == discovery.get_version()
+
+        discovery.unregister(None, "key1", ConnectionParams.from_tuples("host", "10.1.1.101"))
+        assert version == discovery.get_version()
@@ -10,7 +10,7 @@
 """
 
 import traceback
-from typing import Optional
+from typing import Optional, List
 
 from pip_services4_commons.errors import InvalidStateException
 from pip_services4_components.build import IFactory
@@ -24,6 +24,7 @@ from pip_services4_observability.log import ILogger, NullLogger, CompositeLogger
 from pip_services4_container.build.DefaultContainerFactory import DefaultContainerFactory
 from pip_services4_container.config.ContainerConfig import ContainerConfig
 from pip_services4_container.config.ContainerConfigReader import ContainerConfigReader
+from pip_services4_container.refer.ComponentTiming import ComponentTiming
 from pip_services4_container.refer.ContainerReferences import ContainerReferences
 
 
@@ -100,6 +101,8 @@ class Container(IConfigurable, IReferenceable, IUnreferenceable, IOpenable):
         self._logger: ILogger = NullLogger()
         self._info: ContextInfo = ContextInfo(name, description)
         self._factories: DefaultContainerFactory = DefaultContainerFactory()
+        self._parallel_open_threads: int = 0
+        self._startup_timeline: List[ComponentTiming] = []
 
     def configure(self, config: ConfigParams):
         """
@@ -154,6 +157,27 @@ class Container(IConfigurable, IReferenceable, IUnreferenceable, IOpenable):
         """
         self._factories.add(factory)
 
+    def set_parallel_open(self, max_threads: int):
+        """
+        Enables concurrent open of independent components. Components are opened after
+        components they depend on through their :class:`DependencyResolver <pip_services4_components.refer.DependencyResolver.DependencyResolver>`.
+
+        Must be called before the container is opened.
+
+        :param max_threads: maximum number of components opened at the same time.
+                            0 or less keeps sequential open (default).
+        """
+        self._parallel_open_threads = max_threads
+
+    def get_startup_timeline(self) -> List[ComponentTiming]:
+        """
+        Gets start time and duration of each component open during the last container startup.
+        The timeline is only recorded when parallel open is enabled.
+
+        :return: a list of component timings.
+        """
+        return self._startup_timeline
+
     def is_open(self) -> bool:
         """
         Checks if the component is opened.
@@ -176,6 +200,7 @@ class Container(IConfigurable, IReferenceable, IUnreferenceable, IOpenable):
 
             # Create references with configured components
             self._references = ContainerReferences()
+            self._references.set_parallel_open(self._parallel_open_threads)
             self.__init_references(self._references)
             self._references.put_from_config(self._config)
             self.set_references(self._references)
@@ -189,6 +214,11 @@ class Container(IConfigurable, IReferenceable, IUnreferenceable, IOpenable):
 
             # Get component to logger
             self._logger = CompositeLogger(self._references)
+
+            self._startup_timeline = self._references.get_open_timeline()
+            for timing in self._startup_timeline:
+                self._logger.debug(context, "Opened component %s", timing)
+
             self._logger.info(context, "Container " + self._info.name + " started.")
         except Exception as ex:
             self._logger.fatal(context, ex, "Failed to start container")
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_container.refer.ComponentTiming
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Component timing implementation.
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+from typing import Any
+
+
+class ComponentTiming:
+    """
+    Timing of a single component open or close operation,
+    recorded by :class:`ParallelOpener <pip_services4_container.refer.ParallelOpener.ParallelOpener>`
+    to build a startup timeline.
+    """
+
+    def __init__(self, locator: Any, component: Any, start: float, duration: float):
+        """
+        Creates a new instance of component timing.
+
+        :param locator: a locator of the component.
+
+        :param component: the timed component.
+
+        :param start: start time in milliseconds since the beginning of the operation.
+
+        :param duration: duration of the component operation in milliseconds.
+        """
+        self.locator: Any = locator
+        self.component: Any = component
+        self.start: float = start
+        self.duration: float = duration
+
+    def __str__(self) -> str:
+        return '{}: +{:.1f}ms, {:.1f}ms'.format(self.locator, self.start, self.duration)
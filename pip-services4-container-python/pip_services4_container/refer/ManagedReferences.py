@@ -8,14 +8,16 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Sequence, Any, Optional
+from typing import Sequence, Any, Optional, List
 
 from pip_services4_components.refer import References
 from pip_services4_components.run import IOpenable
 from pip_services4_components.context.IContext import IContext
 
 from .BuildReferencesDecorator import BuildReferencesDecorator
+from .ComponentTiming import ComponentTiming
 from .LinkReferencesDecorator import LinkReferencesDecorator
+from .ParallelOpener import ParallelOpener
 from .ReferencesDecorator import ReferencesDecorator
 from .RunReferencesDecorator import RunReferencesDecorator
 
@@ -52,6 +54,24 @@ class ManagedReferences(ReferencesDecorator, IOpenable):
         """
         return self._linker.is_open() and self._runner.is_open()
 
+    def set_parallel_open(self, max_threads: int):
+        """
+        Enables concurrent open and close of independent components.
+
+        :param max_threads: maximum number of components opened at the same time.
+                            0 or less restores sequential open.
+        """
+        self._runner.set_parallel_opener(ParallelOpener(max_threads) if max_threads > 0 else None)
+
+    def get_open_timeline(self) -> List[ComponentTiming]:
+        """
+        Gets timings of the last concurrent open or close of components.
+
+        :return: a list of component timings or empty list if components are opened sequentially.
+        """
+        opener = self._runner.get_parallel_opener()
+        return opener.get_timeline() if opener is not None else []
+
     def open(self, context: Optional[IContext]):
         """
         Opens the component.
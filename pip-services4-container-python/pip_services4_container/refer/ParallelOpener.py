@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_container.refer.ParallelOpener
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Parallel opener implementation.
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from pip_services4_components.context.IContext import IContext
+from pip_services4_components.refer import DependencyResolver, References
+from pip_services4_components.run import IOpenable, IClosable
+
+from .ComponentTiming import ComponentTiming
+
+
+class ParallelOpener:
+    """
+    Opens and closes components concurrently while honoring dependencies between them.
+
+    Dependencies are derived from :class:`DependencyResolver <pip_services4_components.refer.DependencyResolver.DependencyResolver>`
+    instances held by components: a component is opened only after all components matching its
+    dependency locators are opened, and closed before them. Independent components are processed
+    in parallel, so startup takes as long as the longest dependency chain instead of the sum of all opens.
+
+    Only resolvers stored directly in component attributes are inspected. Dependencies located
+    in other ways, e.g. by calling `references.get_one_required` in `set_references`, are not seen,
+    so such components may be opened at the same time as their dependencies.
+    Components that need them opened first shall declare them with a dependency resolver.
+
+    When dependencies form a cycle, the remaining components are processed sequentially
+    in their registration order.
+
+    Every operation records a timeline with the start time and duration of each component.
+
+    Example:
+
+    .. code-block:: python
+
+        opener = ParallelOpener(10)
+        opener.open(Context.from_trace_id("123"), references.get_all_locators(), references.get_all())
+
+        for timing in opener.get_timeline():
+            print(timing)
+    """
+
+    def __init__(self, max_threads: int = 10):
+        """
+        Creates a new instance of the opener.
+
+        :param max_threads: maximum number of components processed at the same time.
+        """
+        self.__max_threads: int = max(1, max_threads)
+        self.__timeline: List[ComponentTiming] = []
+        self.__lock = threading.Lock()
+
+    def get_max_threads(self) -> int:
+        """
+        Gets maximum number of components processed at the same time.
+
+        :return: the maximum number of threads.
+        """
+        return self.__max_threads
+
+    def get_timeline(self) -> List[ComponentTiming]:
+        """
+        Gets timings recorded by the last open or close operation ordered by start time.
+
+        :return: a list of component timings.
+        """
+        with self.__lock:
+            return sorted(self.__timeline, key=lambda timing: timing.start)
+
+    @staticmethod
+    def __get_dependency_locators(component: Any) -> List[Any]:
+        locators = []
+        for value in list(getattr(component, '__dict__', {}).values()):
+            if isinstance(value, DependencyResolver):
+                locators.extend(value.get_locators())
+        return locators
+
+    @staticmethod
+    def get_dependencies(locators: Sequence[Any], components: Sequence[Any]) -> List[Set[int]]:
+        """
+        Builds a dependency graph between components.
+
+        :param locators: locators of the components in the same order as components.
+
+        :param components: a list of components.
+
+        :return: a list where each element holds indexes of the components the corresponding component depends on.
+        """
+        # References index locators by their fields, so dependencies are matched
+        # against a few candidates instead of all components
+        references = References()
+        indexes: Dict[int, List[int]] = {}
+        for (index, component) in enumerate(components):
+            references.put(locators[index] if index < len(locators) else None, component)
+            indexes.setdefault(id(component), []).append(index)
+
+        dependencies = []
+        for (index, component) in enumerate(components):
+            required = set()
+            for dependency in ParallelOpener.__get_dependency_locators(component):
+                for other in references.find(dependency, False):
+                    required.update(other_index for other_index in indexes[id(other)] if other_index != index)
+            dependencies.append(required)
+        return dependencies
+
+    def __run(self, locators: Sequence[Any], components: Sequence[Any], dependencies: List[Set[int]],
+              action: Callable[[Any], None]):
+        with self.__lock:
+            self.__timeline = []
+        start_time = time.perf_counter()
+
+        def execute(index: int):
+            started = time.perf_counter()
+            action(components[index])
+            finished = time.perf_counter()
+            timing = ComponentTiming(
+                locators[index] if index < len(locators) else None, components[index],
+                (started - start_time) * 1000, (finished - started) * 1000
+            )
+            with self.__lock:
+                self.__timeline.append(timing)
+
+        pending = set(range(len(components)))
+        completed = set()
+
+        with ThreadPoolExecutor(max_workers=self.__max_threads) as executor:
+            running: Dict[Any, int] = {}
+            error: Optional[Exception] = None
+
+            while len(pending) > 0 or len(running) > 0:
+                if error is None:
+                    ready = sorted(index for index in pending if dependencies[index] <= completed)
+
+                    # Break dependency cycles by falling back to the registration order
+                    if len(ready) == 0 and len(running) == 0:
+                        ready = [min(pending)]
+
+                    for index in ready:
+                        pending.remove(index)
+                        running[executor.submit(execute, index)] = index
+
+                if len(running) == 0:
+                    break
+
+                done, _ = wait(list(running.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                    else:
+                        completed.add(index)
+
+            if error is not None:
+                raise error
+
+    def open(self, context: Optional[IContext], locators: Sequence[Any], components: Sequence[Any]):
+        """
+        Opens components concurrently. Components are opened after the components they depend on.
+
+        To be opened components must implement :class:`IOpenable <pip_services4_components.run.IOpenable.IOpenable>` interface.
+        Other components are skipped.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param locators: locators of the components in the same order as components.
+
+        :param components: the list of components that are to be opened.
+        """
+        if components is None:
+            return
+
+        locators = list(locators or [])
+        components = list(components)
+        dependencies = ParallelOpener.get_dependencies(locators, components)
+
+        def open_one(component: Any):
+            if isinstance(component, IOpenable):
+                component.open(context)
+
+        self.__run(locators, components, dependencies, open_one)
+
+    def close(self, context: Optional[IContext], locators: Sequence[Any], components: Sequence[Any]):
+        """
+        Closes components concurrently. Components are closed before the components they depend on.
+
+        To be closed components must implement :class:`IClosable <pip_services4_components.run.IClosable.IClosable>` interface.
+        Other components are skipped.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param locators: locators of the components in the same order as components.
+
+        :param components: the list of components that are to be closed.
+        """
+        if components is None:
+            return
+
+        locators = list(locators or [])
+        components = list(components)
+
+        # Reverse the graph: a component can be closed when all its dependents are closed
+        dependencies = ParallelOpener.get_dependencies(locators, components)
+        dependents = [set() for _ in components]
+        for (index, required) in enumerate(dependencies):
+            for dependency in required:
+                dependents[dependency].add(index)
+
+        def close_one(component: Any):
+            if isinstance(component, IClosable):
+                component.close(context)
+
+        self.__run(locators, components, dependents, close_one)
@@ -14,6 +14,7 @@ from pip_services4_components.refer import IReferences
 from pip_services4_components.run import IOpenable, Opener, Closer
 from pip_services4_components.context.IContext import IContext
 
+from .ParallelOpener import ParallelOpener
 from .ReferencesDecorator import ReferencesDecorator
 
 
@@ -21,6 +22,9 @@ class RunReferencesDecorator(ReferencesDecorator, IOpenable):
     """
     References decorator that automatically opens to newly added components
     that implement :class:`IOpenable <pip_services4_commons.run.IOpenable.IOpenable>` interface and closes removed components that implement :class:`IClosable <pip_services4_commons.run.IClosable.IClosable>` interface.
+
+    By default components are opened and closed sequentially. When a :class:`ParallelOpener <pip_services4_container.refer.ParallelOpener.ParallelOpener>`
+    is set, independent components are opened and closed concurrently.
     """
 
     def __init__(self, next_references: IReferences, top_references: IReferences):
@@ -33,6 +37,23 @@ class RunReferencesDecorator(ReferencesDecorator, IOpenable):
         """
         super(RunReferencesDecorator, self).__init__(next_references, top_references)
         self._opened = False
+        self._parallel_opener: Optional[ParallelOpener] = None
+
+    def get_parallel_opener(self) -> Optional[ParallelOpener]:
+        """
+        Gets the opener used to open and close components concurrently.
+
+        :return: the parallel opener or None if components are opened sequentially.
+        """
+        return self._parallel_opener
+
+    def set_parallel_opener(self, opener: Optional[ParallelOpener]):
+        """
+        Sets the opener used to open and close components concurrently.
+
+        :param opener: a parallel opener or None to open components sequentially.
+        """
+        self._parallel_opener = opener
 
     def is_open(self) -> bool:
         """
@@ -50,7 +71,10 @@ class RunReferencesDecorator(ReferencesDecorator, IOpenable):
         """
         if not self._opened:
             components = self.get_all()
-            Opener.open(context, components)
+            if self._parallel_opener is not None:
+                self._parallel_opener.open(context, self.get_all_locators(), components)
+            else:
+                Opener.open(context, components)
             self._opened = True
 
     def close(self, context: Optional[IContext]):
@@ -61,7 +85,10 @@ class RunReferencesDecorator(ReferencesDecorator, IOpenable):
         """
         if self._opened:
             components = self.get_all()
-            Closer.close(context, components)
+            if self._parallel_opener is not None:
+                self._parallel_opener.close(context, self.get_all_locators(), components)
+            else:
+                Closer.close(context, components)
             self._opened = False
 
     def put(self, locator: Any = None, component: Any = None):
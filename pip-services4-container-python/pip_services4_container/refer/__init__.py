@@ -25,11 +25,14 @@
 """
 
 __all__ = ['ReferencesDecorator', 'RunReferencesDecorator', 'LinkReferencesDecorator',
-           'BuildReferencesDecorator', 'ManagedReferences', 'ContainerReferences']
+           'BuildReferencesDecorator', 'ManagedReferences', 'ContainerReferences',
+           'ParallelOpener', 'ComponentTiming']
 
 from .BuildReferencesDecorator import BuildReferencesDecorator
+from .ComponentTiming import ComponentTiming
 from .ContainerReferences import ContainerReferences
 from .LinkReferencesDecorator import LinkReferencesDecorator
 from .ManagedReferences import ManagedReferences
+from .ParallelOpener import ParallelOpener
 from .ReferencesDecorator import ReferencesDecorator
 from .RunReferencesDecorator import RunReferencesDecorator
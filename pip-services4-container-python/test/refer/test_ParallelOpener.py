@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+    test.refer.test_ParallelOpener
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Tests for parallel opener
+
+    :copyright: Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import threading
+import time
+from typing import Optional
+
+from pip_services4_components.context import IContext
+from pip_services4_components.refer import Descriptor, DependencyResolver
+from pip_services4_components.run import IOpenable
+
+from pip_services4_container.refer import ManagedReferences, ParallelOpener
+
+
+class SlowComponent(IOpenable):
+    lock = threading.Lock()
+    events = []
+
+    def __init__(self, name: str, *dependencies: str):
+        self.name = name
+        self._dependency_resolver = DependencyResolver()
+        for dependency in dependencies:
+            self._dependency_resolver.put(dependency, Descriptor("test", "component", "*", dependency, "1.0"))
+        self._opened = False
+
+    def is_open(self) -> bool:
+        return self._opened
+
+    def open(self, context: Optional[IContext]):
+        with SlowComponent.lock:
+            SlowComponent.events.append('open ' + self.name)
+        time.sleep(0.1)
+        self._opened = True
+
+    def close(self, context: Optional[IContext]):
+        with SlowComponent.lock:
+            SlowComponent.events.append('close ' + self.name)
+        self._opened = False
+
+
+class TestParallelOpener:
+
+    def test_open_with_dependencies(self):
+        SlowComponent.events = []
+        refs = ManagedReferences()
+        refs.set_parallel_open(10)
+
+        refs.put(Descriptor("test", "component", "default", "service", "1.0"),
+                 SlowComponent("service", "connection1", "connection2"))
+        refs.put(Descriptor("test", "component", "default", "connection1", "1.0"), SlowComponent("connection1"))
+        refs.put(Descriptor("test", "component", "default", "connection2", "1.0"), SlowComponent("connection2"))
+
+        refs.open(None)
+        assert 'open service' == SlowComponent.events[-1]
+
+        timeline = refs.get_open_timeline()
+        assert 3 == len(timeline)
+        (connection1, connection2, service) = timeline
+        assert 'service' == service.locator.get_name()
+
+        # Connections are opened concurrently before the service
+        assert connection1.start < connection2.start + connection2.duration
+        assert connection2.start < connection1.start + connection1.duration
+        assert service.start >= connection1.start + connection1.duration
+        assert service.start >= connection2.start + connection2.duration
+
+        SlowComponent.events = []
+        refs.close(None)
+        assert 'close service' == SlowComponent.events[0]
+
+    def test_open_cycle(self):
+        SlowComponent.events = []
+        components = [SlowComponent("component1", "component2"), SlowComponent("component2", "component1")]
+        locators = [Descriptor("test", "component", "default", "component1", "1.0"),
+                    Descriptor("test", "component", "default", "component2", "1.0")]
+
+        ParallelOpener(4).open(None, locators, components)
+
+        assert ['open component1', 'open component2'] == SlowComponent.events
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_id_generator
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compares id generator modes and bulk generation.
+    Run with: python benchmark/benchmark_id_generator.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+import uuid
+
+from pip_services4_data.keys import IdGenerator
+
+COUNT = 10000
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+if __name__ == '__main__':
+    run('str(uuid4()).replace', lambda: str(uuid.uuid4()).replace("-", ""), 100000)
+    run('IdGenerator.next_long', IdGenerator.next_long, 100000)
+    run('IdGenerator.next_ordered', IdGenerator.next_ordered, 100000)
+    run('IdGenerator.next_sequence', IdGenerator.next_sequence, 100000)
+
+    for mode in [IdGenerator.Random, IdGenerator.Ordered, IdGenerator.Sequence]:
+        run(f'IdGenerator.next_many({COUNT}, {mode})', lambda: IdGenerator.next_many(COUNT, mode), 100)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_random
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compares bulk random generators and tag processing with per-value loops.
+    Run with: python benchmark/benchmark_random.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+
+from pip_services4_data.process import TagsProcessor
+from pip_services4_data.random import RandomInteger, RandomFloat, RandomText
+
+COUNT = 10000
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+if __name__ == '__main__':
+    run(f'RandomInteger.next_integer x {COUNT}', lambda: [RandomInteger.next_integer(0, 1000) for _ in range(COUNT)],
+        100)
+    run(f'RandomInteger.array({COUNT})', lambda: RandomInteger.array(COUNT, 0, 1000), 100)
+
+    run(f'RandomFloat.next_float x {COUNT}', lambda: [RandomFloat.next_float(0, 1000) for _ in range(COUNT)], 100)
+    run(f'RandomFloat.array({COUNT})', lambda: RandomFloat.array(COUNT, 0, 1000), 100)
+
+    run(f'RandomText.word x {COUNT}', lambda: [RandomText.word() for _ in range(COUNT)], 100)
+    run(f'RandomText.word_list({COUNT})', lambda: RandomText.word_list(COUNT), 100)
+
+    tag_lists = [','.join(RandomText.word_list(20)) for _ in range(1000)]
+    run('TagsProcessor.compress_tag_list x 1000', lambda: [TagsProcessor.compress_tag_list(t) for t in tag_lists], 20)
+    run('TagsProcessor.compress_tags_bulk(1000)', lambda: TagsProcessor.compress_tags_bulk(tag_lists), 20)
+
+    text = ' '.join('#' + word for word in RandomText.word_list(2000))
+    run('TagsProcessor.extract_hash_tags(2000 tags)', lambda: TagsProcessor.extract_hash_tags(text), 100)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_schema
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measures validation of nested objects with array and map schemas.
+    Run with: python benchmark/benchmark_schema.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+
+from pip_services4_commons.convert import TypeCode
+
+from pip_services4_data.validate import ObjectSchema, ArraySchema, MapSchema
+
+
+class ItemDto:
+    def __init__(self, index: int):
+        self.id = str(index)
+        self.name = f'Item {index}'
+        self.price = index * 1.5
+        self.tags = ['a', 'b', 'c']
+        self.attributes = {'color': 'red', 'size': 'XL'}
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+if __name__ == '__main__':
+    item_schema = ObjectSchema() \
+        .with_required_property('id', TypeCode.String) \
+        .with_required_property('name', TypeCode.String) \
+        .with_optional_property('price', TypeCode.Float) \
+        .with_optional_property('tags', ArraySchema(TypeCode.String)) \
+        .with_optional_property('attributes', MapSchema(TypeCode.String, TypeCode.String))
+
+    schema = ObjectSchema() \
+        .with_required_property('trace_id', TypeCode.String) \
+        .with_required_property('items', ArraySchema(item_schema))
+
+    maps = {'trace_id': '123', 'items': [
+        {'id': str(i), 'name': f'Item {i}', 'price': i * 1.5, 'tags': ['a', 'b', 'c'],
+         'attributes': {'color': 'red', 'size': 'XL'}}
+        for i in range(100)
+    ]}
+    objects = {'trace_id': '123', 'items': [ItemDto(i) for i in range(100)]}
+
+    validator = schema.compile()
+
+    run('Schema.validate (100 maps)', lambda: schema.validate(maps), 200)
+    run('Schema.compile() validator (100 maps)', lambda: validator(maps), 200)
+    run('Schema.validate (100 objects)', lambda: schema.validate(objects), 200)
+    run('Schema.compile() validator (100 objects)', lambda: validator(objects), 200)
+    run('Schema.compile()', lambda: schema.compile(), 2000)
@@ -71,6 +71,11 @@ class TagsProcessor:
         """
         return list(map(TagsProcessor.normalize_tag, tags))
 
+    @staticmethod
+    def __split_tag_list(tag_list: str) -> List[str]:
+        # The split regex has a group, so separators are returned at odd positions
+        return re.split(TagsProcessor.__SPLIT_REGEX, tag_list)[::2]
+
     @staticmethod
     def normalize_tag_list(tag_list: str) -> List[str]:
         """
@@ -79,10 +84,7 @@ class TagsProcessor:
         :param tag_list: a comma-separated list of tags to normalize.
         :return: a list with normalized tags.
         """
-        tags = re.split(TagsProcessor.__SPLIT_REGEX, tag_list)
-        # Remove separators
-        for index in range(len(tags)):
-            tags = tags[:index + 1] + tags[index + 2:]
+        tags = TagsProcessor.__split_tag_list(tag_list)
 
         return TagsProcessor.normalize_tags(tags)
 
@@ -104,12 +106,34 @@ class TagsProcessor:
         :param tag_list: a comma-separated list of tags to compress.
         :return: a list with compressed tags.
         """
-        tags = re.split(TagsProcessor.__SPLIT_REGEX, tag_list)
-        # Remove separators
-        for index in range(len(tags)):
-            tags = tags[:index + 1] + tags[index + 2:]
+        tags = TagsProcessor.__split_tag_list(tag_list)
         return TagsProcessor.compress_tags(tags)
 
+    @staticmethod
+    def compress_tags_bulk(tag_lists: List[str]) -> List[List[str]]:
+        """
+        Compresses many comma-separated lists of tags at once.
+        Each distinct tag is compressed only once, so large batches
+        with repeated tags are processed faster than with separate calls.
+
+        :param tag_lists: a list of comma-separated lists of tags to compress.
+        :return: a list with lists of compressed tags in the same order.
+        """
+        compressed = {}
+        result = []
+
+        for tag_list in tag_lists:
+            tags = []
+            for tag in TagsProcessor.__split_tag_list(tag_list):
+                value = compressed.get(tag)
+                if value is None and tag not in compressed:
+                    value = TagsProcessor.compress_tag(tag)
+                    compressed[tag] = value
+                tags.append(value)
+            result.append(tags)
+
+        return result
+
     @staticmethod
     def extract_hash_tags(text: str) -> List[str]:
         """
@@ -124,13 +148,8 @@ class TagsProcessor:
             hash_tags = re.findall(TagsProcessor.__HASHTAG_REGEX, text)
             tags = TagsProcessor.compress_tags(hash_tags)
 
-        # del duplicates
-        unique_tags = []
-        for i in tags:
-            if i not in unique_tags:
-                unique_tags.append(i)
-
-        return unique_tags
+        # del duplicates preserving the order
+        return list(dict.fromkeys(tags))
 
     @staticmethod
     def __extract_string(field: Any) -> str:
@@ -166,12 +185,7 @@ class TagsProcessor:
             text = TagsProcessor.__extract_string(eval('obj.' + field))
             if text != '':
                 hash_tags = re.findall(TagsProcessor.__HASHTAG_REGEX, text)
-                tags = tags + TagsProcessor.compress_tags(hash_tags)
-
-        # del duplicates
-        unique_tags = []
-        for i in tags:
-            if i not in unique_tags:
-                unique_tags.append(i)
+                tags.extend(TagsProcessor.compress_tags(hash_tags))
 
-        return unique_tags
+        # del duplicates preserving the order
+        return list(dict.fromkeys(tags))
@@ -10,6 +10,12 @@
 """
 
 import random
+from typing import List
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class RandomFloat:
@@ -23,6 +29,7 @@ class RandomFloat:
         value1 = RandomFloat.next_float(5, 10)     # Possible result: 7.3
         value2 = RandomFloat.next_float(10)        # Possible result: 3.7
         value3 = RandomFloat.update_float(10, 3)   # Possible result: 9.2
+        values = RandomFloat.array(3, 5, 10)       # Possible result: [7.3, 5.1, 9.8]
     """
 
     @staticmethod
@@ -53,3 +60,36 @@ class RandomFloat:
         min = value - range
         max = value + range
         return RandomFloat.next_float(min, max)
+
+    @staticmethod
+    def array(count: int, min: float, max: float = None) -> List[float]:
+        """
+        Generates a list of random floats in the range ['min', 'max'] at once.
+        If 'max' is omitted, then the range will be set to [0, 'min'].
+        When NumPy is installed the values are generated by its vectorized random generator.
+
+        :param count: a number of floats to generate.
+
+        :param min: minimum args of the floats that will be generated.
+                   If 'max' is omitted, then 'max' is set to 'min' and 'min' is set to 0.
+
+        :param max: (optional) maximum args of the floats that will be generated. Defaults to 'min' if omitted.
+
+        :return: generated list of random floats.
+        """
+        if max is None:
+            max = min
+            min = 0
+
+        if count <= 0:
+            return []
+
+        if max - min <= 0:
+            return [min] * count
+
+        if numpy is not None:
+            return numpy.random.uniform(min, max, size=count).tolist()
+
+        rnd = random.random
+        size = max - min
+        return [min + rnd() * size for _ in range(count)]
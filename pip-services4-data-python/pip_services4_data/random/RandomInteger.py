@@ -12,6 +12,11 @@ from typing import List
 
 import random
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class RandomInteger:
     """
@@ -24,6 +29,7 @@ class RandomInteger:
         value1 = RandomInteger.next_integer(5, 10)     # Possible result: 7
         value2 = RandomInteger.next_integer(10)        # Possible result: 3
         value3 = RandomInteger.update_integer(10, 3)   # Possible result: 9
+        values = RandomInteger.array(3, 5, 10)         # Possible result: [8, 5, 6]
     """
 
     @staticmethod
@@ -80,3 +86,36 @@ class RandomInteger:
         max = max if max is not None else min
         count = RandomInteger.next_integer(min, max)
         return list(range(count))
+
+    @staticmethod
+    def array(count: int, min: int, max: int = None) -> List[int]:
+        """
+        Generates a list of random integers in the range ['min', 'max'] at once.
+        If 'max' is omitted, then the range will be set to [0, 'min'].
+        When NumPy is installed the values are generated by its vectorized random generator.
+
+        :param count: a number of integers to generate.
+
+        :param min: minimum args of the integers that will be generated.
+                   If 'max' is omitted, then 'max' is set to 'min' and 'min' is set to 0.
+
+        :param max: (optional) maximum args of the integers that will be generated. Defaults to 'min' if omitted.
+
+        :return: generated list of random integers.
+        """
+        if max is None:
+            max = min
+            min = 0
+
+        if count <= 0:
+            return []
+
+        if max - min <= 0:
+            return [min] * count
+
+        if numpy is not None:
+            return numpy.random.randint(min, max, size=count).tolist()
+
+        rnd = random.random
+        size = max - min
+        return [min + int(rnd() * size) for _ in range(count)]
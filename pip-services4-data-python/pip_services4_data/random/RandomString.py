@@ -101,11 +101,9 @@ class RandomString(object):
 
         :return: a random string.
         """
-        result = ''
-
         max_size = max_size if max_size != None else min_size
         length = RandomInteger.next_integer(min_size, max_size)
-        for i in range(length):
-            result += random.choice(_chars)
+        if length <= 0:
+            return ''
 
-        return result
+        return ''.join(random.choices(_chars, k=length))
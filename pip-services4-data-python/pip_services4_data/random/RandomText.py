@@ -9,6 +9,8 @@
     :license: MIT, see LICENSE for more details.
 """
 import random
+from typing import List
+
 from ..random import RandomString
 from .RandomBoolean import RandomBoolean
 from .RandomInteger import RandomInteger
@@ -116,6 +118,7 @@ class RandomText:
         value1 = RandomText.name()      # Possible result: "Sergio"
         value2 = RandomText.verb()      # Possible result: "Run"
         value3 = RandomText.text(50)    # Possible result: "Run jorge. Red high scream?"
+        values = RandomText.word_list(3)  # Possible result: ["Car", "Fuzzy", "John"]
     """
 
     @staticmethod
@@ -249,13 +252,25 @@ class RandomText:
         :return: a random text.
         """
         max_size = max_size if max_size is not None else min_size
-        result = ""
-
         count = RandomInteger.next_integer(min_size, max_size)
-        for i in range(count):
-            result += random.choice(_all_words)
+        if count <= 0:
+            return ""
 
-        return result
+        return "".join(random.choices(_all_words, k=count))
+
+    @staticmethod
+    def word_list(count: int) -> List[str]:
+        """
+        Generates a list of random words at once.
+
+        :param count: a number of words to generate.
+
+        :return: a list of random words.
+        """
+        if count <= 0:
+            return []
+
+        return random.choices(_all_words, k=count)
 
     @staticmethod
     def phone() -> str:
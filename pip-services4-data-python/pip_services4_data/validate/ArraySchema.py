@@ -9,7 +9,7 @@
     :license: MIT, see LICENSE for more details.
 """
 
-from typing import Any, List, Sequence
+from typing import Any, List, Sequence, Callable
 
 from pip_services4_commons.convert import TypeCode, TypeConverter
 from pip_services4_commons.reflect import ObjectReader
@@ -99,3 +99,43 @@ class ArraySchema(Schema):
                     TypeConverter.to_type_code(value)
                 )
             )
+
+    def _compile_validation(self) -> Callable[[Any, Any, List[ValidationResult]], None]:
+        """
+        Compiles validation of this schema into a function that takes a path, a value and a list of results.
+
+        :return: a validation function.
+        """
+        if type(self)._perform_validation is not ArraySchema._perform_validation:
+            return super(ArraySchema, self)._compile_validation()
+
+        validate_rules = self._compile_rules_validation()
+        validate_type = self._compile_type_validation(self.get_value_type())
+
+        def validate(path: Any, value: Any, results: List[ValidationResult]):
+            if validate_rules is not None:
+                validate_rules(path, value, results)
+
+            if value is None:
+                return
+
+            if isinstance(value, (set, list, tuple)):
+                if validate_type is not None:
+                    index = 0
+                    for element in value:
+                        validate_type((path, str(index)), element, results)
+                        index += 1
+            else:
+                path = Schema._path_to_string(path)
+                results.append(
+                    ValidationResult(
+                        path,
+                        ValidationResultType.Error,
+                        "VALUE_ISNOT_ARRAY",
+                        (path or "args") + " type must be List or Array",
+                        TypeCode.Array,
+                        TypeConverter.to_type_code(value)
+                    )
+                )
+
+        return validate
@@ -8,7 +8,7 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Any, List
+from typing import Any, List, Callable
 
 from pip_services4_commons.convert import TypeConverter, TypeCode, StringConverter
 from pip_services4_commons.reflect import ObjectReader
@@ -122,3 +122,55 @@ class MapSchema(Schema):
                     map
                 )
             )
+
+    def _compile_validation(self) -> Callable[[Any, Any, List[ValidationResult]], None]:
+        """
+        Compiles validation of this schema into a function that takes a path, a value and a list of results.
+
+        :return: a validation function.
+        """
+        if type(self)._perform_validation is not MapSchema._perform_validation:
+            return super(MapSchema, self)._compile_validation()
+
+        validate_rules = self._compile_rules_validation()
+        validate_key = self._compile_type_validation(self.get_key_type())
+        validate_value = self._compile_type_validation(self.get_value_type())
+
+        def validate(path: Any, value: Any, results: List[ValidationResult]):
+            if validate_rules is not None:
+                validate_rules(path, value, results)
+
+            if value is None:
+                return
+
+            if isinstance(value, dict):
+                if validate_key is None and validate_value is None:
+                    return
+
+                for (key, element) in value.items():
+                    if not isinstance(key, str):
+                        # Keep conversion of non-string keys consistent with _perform_validation
+                        parent_path = Schema._path_to_string(path)
+                        element_path = (None, StringConverter.to_string(key) if len(parent_path) == 0
+                                        else parent_path + "." + key)
+                    else:
+                        element_path = (path, key)
+
+                    if validate_key is not None:
+                        validate_key(element_path, key, results)
+                    if validate_value is not None:
+                        validate_value(element_path, element, results)
+            else:
+                path = Schema._path_to_string(path)
+                results.append(
+                    ValidationResult(
+                        path,
+                        ValidationResultType.Error,
+                        "VALUE_ISNOT_MAP",
+                        (path or "args") + " type must be Map",
+                        TypeCode.Map,
+                        None
+                    )
+                )
+
+        return validate
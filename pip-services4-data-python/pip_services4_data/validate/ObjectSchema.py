@@ -8,7 +8,7 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Callable
 
 from pip_services4_commons.reflect import ObjectReader
 
@@ -197,3 +197,59 @@ class ObjectSchema(Schema):
                         key
                     )
                 )
+
+    def _compile_validation(self) -> Callable[[Any, Any, List[ValidationResult]], None]:
+        """
+        Compiles validation of this schema into a function that takes a path, a value and a list of results.
+
+        :return: a validation function.
+        """
+        if type(self)._perform_validation is not ObjectSchema._perform_validation:
+            return super(ObjectSchema, self)._compile_validation()
+
+        validate_rules = self._compile_rules_validation()
+        allow_undefined = self.__allow_undefined
+
+        # Properties are matched by name, a repeated name matches only once
+        names = set()
+        properties_validation = []
+        for property_schema in self.__properties or []:
+            name = property_schema.get_name()
+            properties_validation.append((name, name in names, property_schema._compile_validation()))
+            names.add(name)
+
+        def validate(path: Any, value: Any, results: List[ValidationResult]):
+            if validate_rules is not None:
+                validate_rules(path, value, results)
+
+            if value is None:
+                return
+
+            properties = value if isinstance(value, dict) else ObjectReader.get_properties(value)
+
+            # Process defined properties
+            for (name, repeated, validate_property) in properties_validation:
+                validate_property(path, None if repeated else dict.get(properties, name), results)
+
+            # Process unexpected properties
+            if not allow_undefined:
+                parent_path = None
+                for key in properties:
+                    if key in names:
+                        continue
+
+                    if parent_path is None:
+                        parent_path = Schema._path_to_string(path)
+
+                    results.append(
+                        ValidationResult(
+                            key if len(parent_path) == 0 else parent_path + "." + key,
+                            ValidationResultType.Warning,
+                            "UNEXPECTED_PROPERTY",
+                            (parent_path or "args") + " contains unexpected property " + str(key),
+                            None,
+                            key
+                        )
+                    )
+
+        return validate
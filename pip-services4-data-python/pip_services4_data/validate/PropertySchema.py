@@ -8,7 +8,7 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import List, Any
+from typing import List, Any, Callable
 
 from ..validate import IValidationRule, ValidationResult
 from .Schema import Schema
@@ -90,3 +90,25 @@ class PropertySchema(Schema):
         super(PropertySchema, self)._perform_validation(path, value, results)
 
         super(PropertySchema, self)._perform_type_validation(path, self.get_type(), value, results)
+
+    def _compile_validation(self) -> Callable[[Any, Any, List[ValidationResult]], None]:
+        """
+        Compiles validation of this schema into a function that takes a path, a value and a list of results.
+
+        :return: a validation function.
+        """
+        if type(self)._perform_validation is not PropertySchema._perform_validation:
+            return super(PropertySchema, self)._compile_validation()
+
+        name = self.get_name()
+        validate_rules = self._compile_rules_validation()
+        validate_type = self._compile_type_validation(self.get_type())
+
+        def validate(path: Any, value: Any, results: List[ValidationResult]):
+            path = (path, name)
+            if validate_rules is not None:
+                validate_rules(path, value, results)
+            if validate_type is not None:
+                validate_type(path, value, results)
+
+        return validate
@@ -30,3 +30,47 @@ class TestIdGenerator:
         assert id2 != None
         assert len(id2) == 32
         assert id1 != id2
+
+    def test_next_ordered(self):
+        ids = [IdGenerator.next_ordered() for _ in range(1000)]
+        for id in ids:
+            assert len(id) == 32
+            assert id[12] == '7'
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_next_sequence(self):
+        node_id = IdGenerator.get_node_id()
+        IdGenerator.set_node_id(0xabc)
+        try:
+            id1 = IdGenerator.next_sequence()
+            id2 = IdGenerator.next_sequence()
+            assert len(id1) == 32
+            assert id1.endswith('000000000abc')
+            assert id1 < id2
+        finally:
+            IdGenerator.set_node_id(node_id)
+
+    def test_next_many(self):
+        for mode in [IdGenerator.Random, IdGenerator.Ordered, IdGenerator.Sequence]:
+            ids = IdGenerator.next_many(100, mode)
+            assert len(ids) == 100
+            assert len(set(ids)) == 100
+            for id in ids:
+                assert len(id) == 32
+
+        ids = IdGenerator.next_many(100, IdGenerator.Ordered)
+        assert ids == sorted(ids)
+        assert IdGenerator.next_ordered() > ids[-1]
+
+        assert IdGenerator.next_many(0) == []
+
+    def test_get_generator(self):
+        assert IdGenerator.get_generator() == IdGenerator.next_long
+        assert IdGenerator.get_generator('Ordered') == IdGenerator.next_ordered
+
+        try:
+            IdGenerator.get_generator('unknown')
+            assert False
+        except Exception as err:
+            assert err.code == 'WRONG_ID_GENERATOR'
@@ -32,6 +32,13 @@ class TestTagsProcessor:
         assert 'abc' == tags[0]
         assert 'def' == tags[1]
 
+    def test_compress_tags_bulk(self):
+        tags = TagsProcessor.compress_tags_bulk(['  A_b#c ,d__E f;;', 'd__E f', 'ABC;x_Y'])
+        assert len(tags) == 3
+        assert ['abc', 'def', None] == tags[0]
+        assert ['def'] == tags[1]
+        assert ['abc', 'xy'] == tags[2]
+
     def test_extract_hash_tags(self):
         tags = TagsProcessor.extract_hash_tags('  #Tag_1  #TAG2#tag3 ')
         assert len(tags) == 3
@@ -39,6 +46,9 @@ class TestTagsProcessor:
         assert 'tag2' == tags[1]
         assert 'tag3' == tags[2]
 
+        tags = TagsProcessor.extract_hash_tags('#tag2 #Tag1 #TAG_2 #tag1')
+        assert ['tag2', 'tag1'] == tags
+
     def test_extract_hash_tags_from_value(self):
         tags = TagsProcessor.extract_hash_tags_from_value(
             {
@@ -22,3 +22,12 @@ class TestRandomFloat:
         value = RandomFloat.update_float(0, 5)
 
         assert 5 >= value >= -5
+
+    def test_array(self):
+        values = RandomFloat.array(100, 2, 5)
+        assert len(values) == 100
+        for value in values:
+            assert 5 >= value >= 2
+
+        assert RandomFloat.array(2, 3, 3) == [3, 3]
+        assert RandomFloat.array(0, 5) == []
@@ -42,3 +42,17 @@ class TestRandomInteger:
 
         seq = RandomInteger.sequence(5)
         assert len(seq) == 5
+
+    def test_array(self):
+        values = RandomInteger.array(100, 2, 5)
+        assert len(values) == 100
+        for value in values:
+            assert 5 >= value >= 2
+
+        values = RandomInteger.array(10, 5)
+        assert len(values) == 10
+        for value in values:
+            assert 5 >= value >= 0
+
+        assert RandomInteger.array(3, 4, 4) == [4, 4, 4]
+        assert RandomInteger.array(0, 5) == []
@@ -36,3 +36,11 @@ class TestRandomText:
         text = RandomText.email()
         assert text.find("@") > 0
         assert text.find(".com") > 0
+
+    def test_word_list(self):
+        words = RandomText.word_list(10)
+        assert len(words) == 10
+        for word in words:
+            assert len(word) > 0
+
+        assert RandomText.word_list(0) == []
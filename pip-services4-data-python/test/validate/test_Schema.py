@@ -142,3 +142,59 @@ class TestSchema:
         obj = ObjectTest()
         results = schema.validate(obj)
         assert 0 == len(results)
+
+    def test_compiled_schema(self):
+        sub_schema = ObjectSchema() \
+            .with_required_property("id", TypeCode.String) \
+            .with_required_property("float_field", TypeCode.Double) \
+            .with_optional_property("null_property", TypeCode.Map)
+
+        schema = ObjectSchema() \
+            .with_required_property("int_field", TypeCode.Long) \
+            .with_required_property("string_property", TypeCode.String) \
+            .with_optional_property("null_property", TypeCode.Object) \
+            .with_required_property("int_array_property", ArraySchema(TypeCode.Long)) \
+            .with_required_property("map_property", MapSchema(TypeCode.String, TypeCode.Long)) \
+            .with_required_property("sub_array_property", ArraySchema(sub_schema))
+
+        validator = schema.compile()
+
+        values = [
+            None,
+            ObjectTest(),
+            {
+                "int_field": "ABC",
+                "int_array_property": [1, "2"],
+                "map_property": {"Key1": 1, "Key2": "XYZ"},
+                "sub_array_property": [{"id": 1, "float_field": 1}, None, "ABC"],
+                "unexpected_property": 1
+            },
+            "ABC"
+        ]
+
+        for value in values:
+            expected = schema.validate(value)
+            results = validator(value)
+
+            assert len(expected) == len(results)
+            for (result, expected_result) in zip(results, expected):
+                assert expected_result.get_path() == result.get_path()
+                assert expected_result.get_type() == result.get_type()
+                assert expected_result.get_code() == result.get_code()
+                assert expected_result.get_message() == result.get_message()
+                assert expected_result.get_expected() == result.get_expected()
+                assert expected_result.get_actual() == result.get_actual()
+
+    def test_compiled_schema_paths(self):
+        schema = ObjectSchema() \
+            .with_required_property("items", ArraySchema(
+                ObjectSchema().with_required_property("values", MapSchema(TypeCode.String, TypeCode.Integer))
+            ))
+
+        results = schema.compile()({"items": [{"values": {"a": 1, "b": "XYZ"}}, {}]})
+
+        assert 2 == len(results)
+        assert "items.0.values.b" == results[0].get_path()
+        assert "TYPE_MISMATCH" == results[0].get_code()
+        assert "items.1.values" == results[1].get_path()
+        assert "VALUE_IS_NULL" == results[1].get_code()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_calculator
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compares interpreted, compiled and columnar evaluation of expressions.
+    Run with: python benchmark/benchmark_calculator.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+
+from pip_services4_expressions.calculator import ExpressionCalculator
+from pip_services4_expressions.variants import Variant
+
+EXPRESSION = "A + B * 2 > Max(C, 10) AND D IN ARRAY(1, 2, 3)"
+NUMERIC_EXPRESSION = "A + B * 2 > Max(C, 10) AND D % 2 = 1"
+COUNT = 1000
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+if __name__ == '__main__':
+    rows = [{'a': index, 'b': index % 7, 'c': index % 13, 'd': index % 5} for index in range(COUNT)]
+
+    calculator = ExpressionCalculator(EXPRESSION)
+    variables = calculator.default_variables
+
+    def interpret():
+        for row in rows:
+            for (name, value) in row.items():
+                variables.find_by_name(name).value = Variant(value)
+            calculator.evaluate()
+
+    expression = calculator.compile()
+
+    def evaluate_compiled():
+        for row in rows:
+            for (name, value) in row.items():
+                variables.find_by_name(name).value = Variant(value)
+            expression.evaluate(variables)
+
+    run(f'evaluate x {COUNT}', interpret, 20)
+    run(f'compiled evaluate x {COUNT}', evaluate_compiled, 20)
+    run(f'compiled evaluate_many({COUNT})', lambda: expression.evaluate_many(rows), 20)
+    run('compile', lambda: calculator.compile(), 1000)
+
+    numeric_calculator = ExpressionCalculator(NUMERIC_EXPRESSION)
+    numeric_expression = numeric_calculator.compile()
+    columnar_expression = numeric_calculator.compile_columns()
+    columns = {name: [row[name] for row in rows] for name in rows[0]}
+
+    run(f'numeric evaluate_many({COUNT})', lambda: numeric_expression.evaluate_many(rows), 20)
+    run(f'numeric columnar evaluate({COUNT})', lambda: columnar_expression.evaluate(columns), 20)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_mustache
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compares interpreted and compiled rendering of mustache templates.
+    Run with: python benchmark/benchmark_mustache.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+
+from pip_services4_expressions.mustache import MustacheTemplate, MustacheTemplateRegistry
+
+TEMPLATE = "Dear {{name}},{{#if vip}} our valued customer,{{/if}} your order {{order}} " \
+           "for {{{amount}}} will be shipped to {{{address}}} on {{date}}.{{^vip}} Join our club!{{/vip}}"
+HEADER = "From: {{sender}}. "
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+if __name__ == '__main__':
+    variables = {'Name': 'Alex', 'VIP': True, 'Order': '123', 'Amount': '$10', 'Address': 'Main St. 1',
+                 'Date': 'Monday', 'Sender': 'Shop'}
+    for index in range(50):
+        variables[f'Extra{index}'] = index
+
+    template = MustacheTemplate(TEMPLATE)
+    compiled = template.compile()
+
+    run('interpreted evaluate_tokens', lambda: template.evaluate_tokens(template.result_tokens, variables), 10000)
+    run('evaluate_with_variables', lambda: template.evaluate_with_variables(variables), 10000)
+    run('compiled render', lambda: compiled.render(variables), 10000)
+    run('compile', lambda: template.compile(), 10000)
+
+    registry = MustacheTemplateRegistry()
+    registry.register('header', HEADER)
+    registry.register('letter', '{{> header}}' + TEMPLATE)
+    run('registry render with partial', lambda: registry.render('letter', variables), 10000)
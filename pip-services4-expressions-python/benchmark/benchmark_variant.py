@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_variant
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measures variant creation and operations used by the calculator.
+    Run with: python benchmark/benchmark_variant.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+
+from pip_services4_expressions.calculator import ExpressionCalculator
+from pip_services4_expressions.variants import TypeSafeVariantOperations, TypeUnsafeVariantOperations, Variant
+
+EXPRESSIONS = [
+    "2 + 3 * 4",
+    "A + B * 2 > 10",
+    "Max(1, 2, 3) + Min(4, 5)",
+    "'abc' + 'def' = 'abcdef'",
+    "A IN ARRAY(1, 2, 3)",
+]
+VALUES = {'A': 1, 'B': 7}
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e6 / number:10.2f} us/op')
+
+
+if __name__ == '__main__':
+    a = Variant(123)
+    b = Variant(2.5)
+    s = Variant('abc')
+
+    run('Variant(int)', lambda: Variant(123), 100000)
+    run('Variant(str)', lambda: Variant('abc'), 100000)
+    run('Variant.from_integer', lambda: Variant.from_integer(123), 100000)
+
+    for operations in [TypeSafeVariantOperations(), TypeUnsafeVariantOperations()]:
+        prefix = type(operations).__name__
+        run(f'{prefix}.add(int, int)', lambda: operations.add(a, a), 100000)
+        run(f'{prefix}.mul(int, int)', lambda: operations.mul(a, a), 100000)
+        run(f'{prefix}.less(int, int)', lambda: operations.less(a, a), 100000)
+        run(f'{prefix}.equal(str, str)', lambda: operations.equal(s, s), 100000)
+    run('TypeSafeVariantOperations.add(float, int)', lambda: TypeSafeVariantOperations().add(b, a), 100000)
+
+    for expression in EXPRESSIONS:
+        calculator = ExpressionCalculator(expression)
+        for (name, value) in VALUES.items():
+            variable = calculator.default_variables.find_by_name(name)
+            if variable is not None:
+                variable.value = Variant(value)
+        run(f'evaluate "{expression}"', calculator.evaluate, 10000)
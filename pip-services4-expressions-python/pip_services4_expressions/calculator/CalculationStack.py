@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from typing import List
+from typing import Callable, List
 
 from pip_services4_expressions.variants.Variant import Variant
 
@@ -31,3 +31,25 @@ class CalculationStack:
         if len(self.__values) == 0:
             raise Exception('Stack is empty.')
         return self.__values[-1]
+
+    def apply_unary(self, operation: Callable[[Variant], Variant]):
+        """
+        Replaces the value on top of the stack with the result of the operation on it.
+
+        :param operation: The operation to perform.
+        """
+        if len(self.__values) == 0:
+            raise Exception('Stack is empty.')
+        self.__values[-1] = operation(self.__values[-1])
+
+    def apply_binary(self, operation: Callable[[Variant, Variant], Variant]):
+        """
+        Replaces two values on top of the stack with the result of the operation on them.
+        The value on top of the stack is used as the second operand.
+
+        :param operation: The operation to perform.
+        """
+        if len(self.__values) < 2:
+            raise Exception('Stack is empty.')
+        value2 = self.__values.pop()
+        self.__values[-1] = operation(self.__values[-1], value2)
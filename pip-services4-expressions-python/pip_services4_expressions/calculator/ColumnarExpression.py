@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+import math
+import operator
+from functools import reduce
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from pip_services4_expressions.calculator.CompiledExpression import CompiledExpression
+from pip_services4_expressions.calculator.functions.DefaultFunctionCollection import DefaultFunctionCollection
+from pip_services4_expressions.calculator.functions.IFunctionCollection import IFunctionCollection
+from pip_services4_expressions.calculator.parsers.ExpressionToken import ExpressionToken
+from pip_services4_expressions.calculator.parsers.ExpressionTokenType import ExpressionTokenType
+from pip_services4_expressions.variants.IVariantOperations import IVariantOperations
+from pip_services4_expressions.variants.VariantType import VariantType
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Kinds of values produced by columnar nodes
+_INTEGER = 'integer'
+_FLOAT = 'float'
+_BOOLEAN = 'boolean'
+_NUMBERS = (_INTEGER, _FLOAT)
+
+
+class _UnsupportedOperation(Exception):
+    pass
+
+
+class ColumnarExpression:
+    """
+    Implements an expression that is evaluated column-wise over a batch of rows.
+
+    Variables are passed as columns (lists or NumPy arrays) of equal length. Arithmetic, comparison
+    and logical operators as well as numeric functions from :class:`DefaultFunctionCollection`
+    are executed over entire columns. When NumPy is installed columns are processed as NumPy arrays,
+    otherwise as Python lists.
+
+    Columnar evaluation gives the same results as row evaluation. Like variant operations it keeps
+    the type of the left operand, so integer division is truncated and a float operand on the right side
+    of an integer one is not vectorized, as well as other operations whose result type differs by row.
+    Logical operators require boolean operands. Expressions or columns that are not supported
+    (mixed integer and float operands, strings, dates, nulls, element access, IN operators, other functions)
+    are evaluated row by row with :class:`CompiledExpression`.
+
+    Example:
+
+    .. code-block:: python
+
+        calculator = ExpressionCalculator("A * 2 > Max(B, 10)")
+        expression = calculator.compile_columns()
+
+        expression.evaluate({'a': [1, 5, 10], 'b': [3, 4, 30]})     # Result: [False, False, False]
+    """
+
+    # Operand kinds (any if None), result kind (kind of the left operand if None),
+    # Python function and NumPy function name
+    __binary_operations = {
+        ExpressionTokenType.Plus: (_NUMBERS, None, operator.add, 'add'),
+        ExpressionTokenType.Minus: (_NUMBERS, None, operator.sub, 'subtract'),
+        ExpressionTokenType.Star: (_NUMBERS, None, operator.mul, 'multiply'),
+        ExpressionTokenType.Percent: ((_INTEGER,), None, operator.mod, 'mod'),
+        ExpressionTokenType.More: (_NUMBERS, _BOOLEAN, operator.gt, 'greater'),
+        ExpressionTokenType.Less: (_NUMBERS, _BOOLEAN, operator.lt, 'less'),
+        ExpressionTokenType.EqualMore: (_NUMBERS, _BOOLEAN, operator.ge, 'greater_equal'),
+        ExpressionTokenType.EqualLess: (_NUMBERS, _BOOLEAN, operator.le, 'less_equal'),
+        ExpressionTokenType.Equal: (None, _BOOLEAN, operator.eq, 'equal'),
+        ExpressionTokenType.NotEqual: (None, _BOOLEAN, operator.ne, 'not_equal'),
+        ExpressionTokenType.And: ((_BOOLEAN,), _BOOLEAN, operator.and_, 'logical_and'),
+        ExpressionTokenType.Or: ((_BOOLEAN,), _BOOLEAN, operator.or_, 'logical_or'),
+        ExpressionTokenType.Xor: ((_BOOLEAN,), _BOOLEAN, operator.xor, 'logical_xor'),
+    }
+
+    # Functions with float results
+    __unary_functions = {
+        'ACOS': (math.acos, 'arccos'),
+        'ASIN': (math.asin, 'arcsin'),
+        'ATAN': (math.atan, 'arctan'),
+        'EXP': (math.exp, 'exp'),
+        'LOG': (math.log, 'log'),
+        'LN': (math.log, 'log'),
+        'LOG10': (math.log10, 'log10'),
+        'COS': (math.cos, 'cos'),
+        'SIN': (math.sin, 'sin'),
+        'TAN': (math.tan, 'tan'),
+        'SQR': (math.sqrt, 'sqrt'),
+        'SQRT': (math.sqrt, 'sqrt'),
+    }
+
+    # Functions with integer results
+    __integer_functions = {
+        'CEIL': (math.ceil, 'ceil'),
+        'CEILING': (math.ceil, 'ceil'),
+        'FLOOR': (math.floor, 'floor'),
+        'ROUND': (round, 'round'),
+        'TRUNC': (math.trunc, 'trunc'),
+        'TRUNCATE': (math.trunc, 'trunc'),
+    }
+
+    __aggregate_functions = {
+        'MIN': (min, 'minimum'),
+        'MAX': (max, 'maximum'),
+        'SUM': (sum, 'add'),
+    }
+
+    __constant_functions = {
+        'E': math.e,
+        'PI': math.pi,
+    }
+
+    def __init__(self, tokens: List[ExpressionToken], functions: IFunctionCollection,
+                 variant_operations: IVariantOperations):
+        """
+        Compiles the list of processed expression tokens.
+
+        :param tokens: The list of processed expression tokens in postfix notation.
+        :param functions: The list of functions.
+        :param variant_operations: The manager for operations on variant values.
+        """
+        self.__compiled = CompiledExpression(tokens, functions, variant_operations)
+        self.__slots: Dict[str, int] = {name.upper(): slot
+                                        for (slot, name) in enumerate(self.__compiled.variable_names)}
+        self.__use_numpy: bool = numpy is not None
+
+        # Only functions from the default collection have known column-wise implementations
+        try:
+            self.__root = self.__build(tokens, isinstance(functions, DefaultFunctionCollection))
+        except _UnsupportedOperation:
+            self.__root = None
+
+    @property
+    def variable_names(self) -> List[str]:
+        """
+        The names of variables used in the expression.
+        """
+        return self.__compiled.variable_names
+
+    @property
+    def is_vectorized(self) -> bool:
+        """
+        Checks if the expression can be evaluated column-wise.
+        Expressions that cannot be vectorized are always evaluated row by row.
+        """
+        return self.__root is not None
+
+    def __build(self, tokens: List[ExpressionToken], default_functions: bool) -> tuple:
+        stack = []
+
+        for token in tokens:
+            token_type = token.type
+
+            if token_type == ExpressionTokenType.Constant:
+                value = token.value
+                if value.type in (VariantType.Integer, VariantType.Long):
+                    stack.append(('constant', _INTEGER, value.as_object))
+                elif value.type == VariantType.Float:
+                    stack.append(('constant', _FLOAT, value.as_object))
+                elif value.type == VariantType.Boolean:
+                    stack.append(('constant', _BOOLEAN, value.as_boolean))
+                else:
+                    raise _UnsupportedOperation()
+
+            elif token_type == ExpressionTokenType.Variable:
+                stack.append(('variable', self.__slots[token.value.as_string.upper()]))
+
+            elif token_type == ExpressionTokenType.Function:
+                count_node = stack.pop()
+                if count_node[0] != 'constant':
+                    raise _UnsupportedOperation()
+                param_count = count_node[2]
+                params = stack[len(stack) - param_count:]
+                del stack[len(stack) - param_count:]
+
+                name = token.value.as_string.upper()
+                if not default_functions:
+                    raise _UnsupportedOperation()
+                if name in ColumnarExpression.__constant_functions and param_count == 0:
+                    stack.append(('constant', _FLOAT, ColumnarExpression.__constant_functions[name]))
+                elif name in ColumnarExpression.__aggregate_functions and param_count >= 2 \
+                        or (name in ColumnarExpression.__unary_functions
+                            or name in ColumnarExpression.__integer_functions or name == 'ABS') and param_count == 1 \
+                        or name == 'IF' and param_count == 3:
+                    stack.append(('function', name, params))
+                else:
+                    raise _UnsupportedOperation()
+
+            elif token_type in ColumnarExpression.__binary_operations or token_type == ExpressionTokenType.Slash:
+                value2 = stack.pop()
+                value1 = stack.pop()
+                stack.append(('binary', token_type, value1, value2))
+
+            elif token_type in (ExpressionTokenType.Unary, ExpressionTokenType.Not,
+                                ExpressionTokenType.IsNull, ExpressionTokenType.IsNotNull):
+                stack.append(('unary', token_type, stack.pop()))
+
+            else:
+                raise _UnsupportedOperation()
+
+        return stack[0]
+
+    def __get_columns(self, columns: Dict[str, Sequence[Any]]) -> List[Any]:
+        result = []
+        for name in self.__compiled.variable_names:
+            if name in columns:
+                result.append(columns[name])
+                continue
+
+            # Fall back to case insensitive search like in variable collections
+            key = name.upper()
+            for column_name in columns:
+                if column_name.upper() == key:
+                    result.append(columns[column_name])
+                    break
+            else:
+                raise _UnsupportedOperation()
+
+        return result
+
+    def __get_kind(self, column: Any) -> str:
+        if self.__use_numpy:
+            kind = column.dtype.kind
+            if kind == 'b':
+                return _BOOLEAN
+            if kind in 'iu':
+                return _INTEGER
+            if kind == 'f':
+                return _FLOAT
+            raise _UnsupportedOperation()
+
+        # Columns that mix integers and floats have different result types by row
+        types = set(map(type, column))
+        if types <= {bool}:
+            return _BOOLEAN
+        if types <= {int}:
+            return _INTEGER
+        if types <= {float}:
+            return _FLOAT
+        raise _UnsupportedOperation()
+
+    def __map(self, func: Callable, *values: Any) -> Any:
+        length = None
+        for value in values:
+            if isinstance(value, list):
+                length = len(value)
+                break
+
+        if length is None:
+            return func(*values)
+
+        columns = [value if isinstance(value, list) else [value] * length for value in values]
+        return list(map(func, *columns))
+
+    @staticmethod
+    def __divide(value1: Any, value2: Any) -> Any:
+        # Division by zero raises an error in row evaluation
+        if value2 == 0:
+            raise _UnsupportedOperation()
+        if type(value1) is int and type(value2) is int:
+            return int(value1 / value2)
+        return value1 / value2
+
+    def __numpy_divide(self, kind: str, value1: Any, value2: Any) -> Any:
+        # Division by zero raises an error in row evaluation
+        if numpy.any(numpy.asarray(value2) == 0):
+            raise _UnsupportedOperation()
+        if kind == _INTEGER:
+            return numpy.trunc(numpy.true_divide(value1, value2)).astype(numpy.int64)
+        return numpy.true_divide(value1, value2)
+
+    @staticmethod
+    def __get_result_kind(kind1: str, kind2: str) -> str:
+        # Like variant operations the right operand is converted to the type of the left one.
+        # Floats converted to integers lose their fractions, so such operations are not vectorized
+        if kind1 == kind2 or kind1 == _FLOAT and kind2 == _INTEGER:
+            return kind1
+        raise _UnsupportedOperation()
+
+    def __evaluate_function(self, name: str, params: List[Tuple[str, Any]]) -> Tuple[str, Any]:
+        if name == 'IF':
+            ((_, condition), (kind1, value1), (kind2, value2)) = params
+            if kind1 != kind2:
+                raise _UnsupportedOperation()
+            if self.__use_numpy:
+                return kind1, numpy.where(condition, value1, value2)
+            return kind1, self.__map(lambda c, x, y: x if c else y, condition, value1, value2)
+
+        kinds = [kind for (kind, _) in params]
+        if any(kind not in _NUMBERS for kind in kinds):
+            raise _UnsupportedOperation()
+        values = [value for (_, value) in params]
+
+        if name in ColumnarExpression.__aggregate_functions:
+            # Results of mixed values have the type of the selected value, which differs by row
+            if any(kind != kinds[0] for kind in kinds):
+                raise _UnsupportedOperation()
+            (func, numpy_func) = ColumnarExpression.__aggregate_functions[name]
+            if self.__use_numpy:
+                return kinds[0], reduce(getattr(numpy, numpy_func), values)
+            return kinds[0], self.__map(lambda *args: func(args), *values)
+
+        if name in ColumnarExpression.__integer_functions:
+            (func, numpy_func) = ColumnarExpression.__integer_functions[name]
+            if self.__use_numpy:
+                return _INTEGER, getattr(numpy, numpy_func)(values[0]).astype(numpy.int64)
+            return _INTEGER, self.__map(func, values[0])
+
+        if name == 'ABS':
+            # Absolute values of floats are returned with the integer type
+            if kinds[0] != _INTEGER:
+                raise _UnsupportedOperation()
+            return _INTEGER, numpy.abs(values[0]) if self.__use_numpy else self.__map(abs, values[0])
+
+        (func, numpy_func) = ColumnarExpression.__unary_functions[name]
+        if self.__use_numpy:
+            return _FLOAT, getattr(numpy, numpy_func)(values[0])
+        return _FLOAT, self.__map(func, values[0])
+
+    def __evaluate_node(self, node: tuple, columns: List[Any], kinds: List[str]) -> Tuple[str, Any]:
+        node_type = node[0]
+
+        if node_type == 'constant':
+            return node[1], node[2]
+
+        if node_type == 'variable':
+            return kinds[node[1]], columns[node[1]]
+
+        if node_type == 'function':
+            return self.__evaluate_function(node[1], [self.__evaluate_node(param, columns, kinds)
+                                                      for param in node[2]])
+
+        if node_type == 'binary':
+            (kind1, value1) = self.__evaluate_node(node[2], columns, kinds)
+            (kind2, value2) = self.__evaluate_node(node[3], columns, kinds)
+
+            if node[1] == ExpressionTokenType.Slash:
+                if kind1 not in _NUMBERS or kind2 not in _NUMBERS:
+                    raise _UnsupportedOperation()
+                kind = self.__get_result_kind(kind1, kind2)
+                if self.__use_numpy:
+                    return kind, self.__numpy_divide(kind, value1, value2)
+                return kind, self.__map(ColumnarExpression.__divide, value1, value2)
+
+            (operand_kinds, result_kind, func, numpy_func) = ColumnarExpression.__binary_operations[node[1]]
+            if operand_kinds is not None and (kind1 not in operand_kinds or kind2 not in operand_kinds):
+                raise _UnsupportedOperation()
+            kind = self.__get_result_kind(kind1, kind2)
+            result_kind = result_kind or kind
+
+            if self.__use_numpy:
+                return result_kind, getattr(numpy, numpy_func)(value1, value2)
+            return result_kind, self.__map(func, value1, value2)
+
+        if node_type == 'unary':
+            (kind, value) = self.__evaluate_node(node[2], columns, kinds)
+
+            if node[1] == ExpressionTokenType.Unary:
+                if kind not in _NUMBERS:
+                    raise _UnsupportedOperation()
+                return kind, numpy.negative(value) if self.__use_numpy else self.__map(operator.neg, value)
+
+            if node[1] == ExpressionTokenType.Not:
+                if kind != _BOOLEAN:
+                    raise _UnsupportedOperation()
+                return _BOOLEAN, numpy.logical_not(value) if self.__use_numpy else self.__map(operator.not_, value)
+
+            # Numeric and boolean columns never contain nulls
+            return _BOOLEAN, node[1] == ExpressionTokenType.IsNotNull
+
+        raise _UnsupportedOperation()
+
+    def __evaluate_rows(self, columns: Dict[str, Sequence[Any]], length: int) -> List[Any]:
+        names = list(columns.keys())
+        values = [list(columns[name]) for name in names]
+        rows = [{names[index]: values[index][row] for index in range(len(names))} for row in range(length)]
+        return [value.as_object for value in self.__compiled.evaluate_many(rows)]
+
+    def evaluate(self, columns: Dict[str, Sequence[Any]]) -> Sequence[Any]:
+        """
+        Evaluates this expression over columns with variable values.
+        Variable names are matched case insensitive.
+
+        :param columns: The map with columns of variable values. All columns must have the same length.
+        :return: The column with evaluated values. It is a NumPy array when NumPy is installed or a list otherwise.
+        """
+        length = 1
+        for column in columns.values():
+            length = len(column)
+            break
+
+        if self.__root is not None:
+            try:
+                values = self.__get_columns(columns)
+                if self.__use_numpy:
+                    values = [numpy.asarray(value) for value in values]
+                else:
+                    values = [value if isinstance(value, list) else list(value) for value in values]
+                kinds = [self.__get_kind(value) for value in values]
+
+                (_, result) = self.__evaluate_node(self.__root, values, kinds)
+
+                if self.__use_numpy:
+                    result = numpy.asarray(result)
+                    return numpy.full(length, result) if result.ndim == 0 else result
+                return result if isinstance(result, list) else [result] * length
+            except _UnsupportedOperation:
+                pass
+
+        # Convert NumPy values into Python values understood by variants
+        if self.__use_numpy:
+            columns = {name: numpy.asarray(column).tolist() for (name, column) in columns.items()}
+
+        result = self.__evaluate_rows(columns, length)
+        return numpy.array(result) if self.__use_numpy else result
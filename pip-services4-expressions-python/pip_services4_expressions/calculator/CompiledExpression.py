@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pip_services4_expressions.calculator.ExpressionException import ExpressionException
+from pip_services4_expressions.calculator.functions.IFunctionCollection import IFunctionCollection
+from pip_services4_expressions.calculator.parsers.ExpressionToken import ExpressionToken
+from pip_services4_expressions.calculator.parsers.ExpressionTokenType import ExpressionTokenType
+from pip_services4_expressions.calculator.variables.IVariableCollection import IVariableCollection
+from pip_services4_expressions.variants.IVariantOperations import IVariantOperations
+from pip_services4_expressions.variants.Variant import Variant
+
+# A compiled node calculates its value from the list of variable values
+Node = Callable[[List[Variant]], Variant]
+
+
+class CompiledExpression:
+    """
+    Implements an expression compiled from the list of processed expression tokens into a tree of closures.
+
+    Functions are bound once during compilation and variables are kept in slots
+    that are resolved by name once per evaluation. Compiled expressions are created
+    by :func:`ExpressionCalculator.compile` and can be evaluated many times with different variables.
+
+    Example:
+
+    .. code-block:: python
+
+        calculator = ExpressionCalculator("A + B * 2")
+        expression = calculator.compile()
+
+        expression.evaluate_with_values({'a': 1, 'b': 2})                  # Result: Variant(5)
+        expression.evaluate_many([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}])     # Result: [Variant(5), Variant(11)]
+    """
+
+    __binary_operations = {
+        ExpressionTokenType.And: 'and_',
+        ExpressionTokenType.Or: 'or_',
+        ExpressionTokenType.Xor: 'xor',
+        ExpressionTokenType.Plus: 'add',
+        ExpressionTokenType.Minus: 'sub',
+        ExpressionTokenType.Star: 'mul',
+        ExpressionTokenType.Slash: 'div',
+        ExpressionTokenType.Percent: 'mod',
+        ExpressionTokenType.Power: 'pow',
+        ExpressionTokenType.ShiftLeft: 'lsh',
+        ExpressionTokenType.ShiftRight: 'rsh',
+        ExpressionTokenType.Equal: 'equal',
+        ExpressionTokenType.NotEqual: 'not_equal',
+        ExpressionTokenType.More: 'more',
+        ExpressionTokenType.Less: 'less',
+        ExpressionTokenType.EqualMore: 'more_equal',
+        ExpressionTokenType.EqualLess: 'less_equal',
+        ExpressionTokenType.Element: 'get_element',
+    }
+
+    __unary_operations = {
+        ExpressionTokenType.Not: 'not_',
+        ExpressionTokenType.Unary: 'negative',
+    }
+
+    def __init__(self, tokens: List[ExpressionToken], functions: IFunctionCollection,
+                 variant_operations: IVariantOperations):
+        """
+        Compiles the list of processed expression tokens.
+
+        :param tokens: The list of processed expression tokens in postfix notation.
+        :param functions: The list of functions to bind.
+        :param variant_operations: The manager for operations on variant values.
+        """
+        self.__variant_operations = variant_operations
+        self.__slots: Dict[str, int] = {}
+        self.__variables: List[Tuple[str, ExpressionToken]] = []
+        self.__root: Node = self.__compile(tokens, functions)
+
+    @property
+    def variable_names(self) -> List[str]:
+        """
+        The names of variables used in the expression in order of their slots.
+        """
+        return [name for (name, _) in self.__variables]
+
+    def __compile(self, tokens: List[ExpressionToken], functions: IFunctionCollection) -> Node:
+        operations = self.__variant_operations
+
+        # Each stack element holds a compiled node and a constant value for constant nodes
+        stack: List[Tuple[Node, Optional[Variant]]] = []
+
+        def pop() -> Node:
+            if len(stack) == 0:
+                raise ExpressionException(None, "INTERNAL", "Internal error", 0, 0)
+            return stack.pop()[0]
+
+        for token in tokens:
+            token_type = token.type
+
+            if token_type == ExpressionTokenType.Constant:
+                stack.append((CompiledExpression.__constant_node(token.value), token.value))
+
+            elif token_type == ExpressionTokenType.Variable:
+                stack.append((self.__variable_node(token), None))
+
+            elif token_type == ExpressionTokenType.Function:
+                func = functions.find_by_name(token.value.as_string)
+                if func is None:
+                    raise ExpressionException(None, "FUNC_NOT_FOUND",
+                                              "Function " + token.value.as_string + " was not found.")
+
+                if len(stack) == 0 or stack[-1][1] is None:
+                    raise ExpressionException(None, "INTERNAL", "Internal error", token.line, token.column)
+                param_count = stack.pop()[1].as_integer
+
+                params = [pop() for _ in range(param_count)]
+                params.reverse()
+                stack.append((CompiledExpression.__function_node(func.calculate, params, operations), None))
+
+            elif token_type in CompiledExpression.__binary_operations:
+                value2 = pop()
+                value1 = pop()
+                operation = getattr(operations, CompiledExpression.__binary_operations[token_type])
+                stack.append((CompiledExpression.__binary_node(operation, value1, value2), None))
+
+            elif token_type in CompiledExpression.__unary_operations:
+                operation = getattr(operations, CompiledExpression.__unary_operations[token_type])
+                stack.append((CompiledExpression.__unary_node(operation, pop()), None))
+
+            elif token_type in (ExpressionTokenType.In, ExpressionTokenType.NotIn):
+                value2 = pop()
+                value1 = pop()
+                stack.append((CompiledExpression.__in_node(operations.in_, value1, value2,
+                                                           token_type == ExpressionTokenType.NotIn), None))
+
+            elif token_type in (ExpressionTokenType.IsNull, ExpressionTokenType.IsNotNull):
+                stack.append((CompiledExpression.__is_null_node(pop(), token_type == ExpressionTokenType.IsNotNull),
+                              None))
+
+            else:
+                raise ExpressionException(None, "INTERNAL", "Internal error", token.line, token.column)
+
+        if len(stack) != 1:
+            raise ExpressionException(None, "INTERNAL", "Internal error", 0, 0)
+
+        return stack[0][0]
+
+    def __variable_node(self, token: ExpressionToken) -> Node:
+        name = token.value.as_string
+        key = name.upper()
+        slot = self.__slots.get(key)
+        if slot is None:
+            slot = len(self.__variables)
+            self.__slots[key] = slot
+            self.__variables.append((name, token))
+
+        return lambda values: values[slot]
+
+    @staticmethod
+    def __constant_node(value: Variant) -> Node:
+        return lambda values: value
+
+    @staticmethod
+    def __function_node(calculate: Callable, params: List[Node], operations: IVariantOperations) -> Node:
+        return lambda values: calculate([param(values) for param in params], operations)
+
+    @staticmethod
+    def __binary_node(operation: Callable, value1: Node, value2: Node) -> Node:
+        return lambda values: operation(value1(values), value2(values))
+
+    @staticmethod
+    def __unary_node(operation: Callable, value: Node) -> Node:
+        return lambda values: operation(value(values))
+
+    @staticmethod
+    def __in_node(operation: Callable, value1: Node, value2: Node, negate: bool) -> Node:
+        if negate:
+            def not_in(values: List[Variant]) -> Variant:
+                value = value1(values)
+                return Variant.from_boolean(not operation(value2(values), value).as_boolean)
+
+            return not_in
+
+        def in_(values: List[Variant]) -> Variant:
+            value = value1(values)
+            return operation(value2(values), value)
+
+        return in_
+
+    @staticmethod
+    def __is_null_node(value: Node, negate: bool) -> Node:
+        if negate:
+            return lambda values: Variant(not value(values).is_null())
+        return lambda values: Variant(value(values).is_null())
+
+    def __variable_not_found(self, slot: int) -> ExpressionException:
+        (name, token) = self.__variables[slot]
+        return ExpressionException(None, "VAR_NOT_FOUND", "Variable " + name + " was not found.",
+                                   token.line, token.column)
+
+    def evaluate(self, variables: IVariableCollection) -> Variant:
+        """
+        Evaluates this expression using specified variables.
+
+        :param variables: The list of variables
+        """
+        values = []
+        for slot in range(len(self.__variables)):
+            variable = variables.find_by_name(self.__variables[slot][0])
+            if variable is None:
+                raise self.__variable_not_found(slot)
+            values.append(variable.value)
+
+        return self.__root(values)
+
+    def __get_values(self, row: Dict[str, Any]) -> List[Variant]:
+        values = []
+        for slot in range(len(self.__variables)):
+            name = self.__variables[slot][0]
+            if name in row:
+                value = row[name]
+            else:
+                # Fall back to case insensitive search like in variable collections
+                key = name.upper()
+                for row_name in row:
+                    if row_name.upper() == key:
+                        value = row[row_name]
+                        break
+                else:
+                    raise self.__variable_not_found(slot)
+
+            values.append(value if isinstance(value, Variant) else Variant(value))
+
+        return values
+
+    def evaluate_with_values(self, row: Dict[str, Any]) -> Variant:
+        """
+        Evaluates this expression using variable values from a map.
+        Variable names are matched case insensitive and values that are not variants are wrapped into variants.
+
+        :param row: The map with variable values
+        """
+        return self.__root(self.__get_values(row))
+
+    def evaluate_many(self, rows: List[Dict[str, Any]]) -> List[Variant]:
+        """
+        Evaluates this expression for each map with variable values.
+
+        :param rows: The list of maps with variable values
+        :return: The list of evaluated values in the same order.
+        """
+        root = self.__root
+        get_values = self.__get_values
+        return [root(get_values(row)) for row in rows]
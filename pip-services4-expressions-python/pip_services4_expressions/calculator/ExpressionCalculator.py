@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from pip_services4_expressions.calculator.CalculationStack import CalculationStack
+from pip_services4_expressions.calculator.ColumnarExpression import ColumnarExpression
+from pip_services4_expressions.calculator.CompiledExpression import CompiledExpression
 from pip_services4_expressions.calculator.ExpressionException import ExpressionException
 from pip_services4_expressions.calculator.functions.DefaultFunctionCollection import DefaultFunctionCollection
 from pip_services4_expressions.calculator.functions.IFunctionCollection import IFunctionCollection
@@ -180,6 +182,51 @@ class ExpressionCalculator:
 
         return stack.pop()
 
+    def compile(self, functions: Optional[IFunctionCollection] = None) -> CompiledExpression:
+        """
+        Compiles this expression into a tree of closures that can be evaluated many times
+        without walking the expression tokens. Functions are bound during compilation,
+        so later changes in the function list do not affect the compiled expression.
+
+        :param functions: (optional) The list of functions. Default functions are used when omitted.
+        :return: the compiled expression.
+        """
+        functions = functions or self.__default_functions
+        return CompiledExpression(self.result_tokens, functions, self.__variant_operations)
+
+    def evaluate_many(self, rows: List[Dict[str, Any]],
+                      functions: Optional[IFunctionCollection] = None) -> List[Variant]:
+        """
+        Compiles this expression once and evaluates it for each map with variable values.
+
+        :param rows: The list of maps with variable values
+        :param functions: (optional) The list of functions. Default functions are used when omitted.
+        :return: The list of evaluated values in the same order.
+        """
+        return self.compile(functions).evaluate_many(rows)
+
+    def compile_columns(self, functions: Optional[IFunctionCollection] = None) -> ColumnarExpression:
+        """
+        Compiles this expression for column-wise evaluation over batches of rows.
+
+        :param functions: (optional) The list of functions. Default functions are used when omitted.
+        :return: the compiled columnar expression.
+        """
+        functions = functions or self.__default_functions
+        return ColumnarExpression(self.result_tokens, functions, self.__variant_operations)
+
+    def evaluate_columns(self, columns: Dict[str, Sequence[Any]],
+                         functions: Optional[IFunctionCollection] = None) -> Sequence[Any]:
+        """
+        Evaluates this expression column-wise using columns (lists or NumPy arrays) as variable values.
+        Unsupported expressions and columns are evaluated row by row.
+
+        :param columns: The map with columns of variable values. All columns must have the same length.
+        :param functions: (optional) The list of functions. Default functions are used when omitted.
+        :return: The column with evaluated values. It is a NumPy array when NumPy is installed or a list otherwise.
+        """
+        return self.compile_columns(functions).evaluate(columns)
+
     def __evaluate_constant(self, token: ExpressionToken, stack: CalculationStack) -> bool:
         if token.type != ExpressionTokenType.Constant:
             return False
@@ -224,22 +271,16 @@ class ExpressionCalculator:
     def __evaluate_logical(self, token: ExpressionToken, stack: CalculationStack) -> bool:
 
         if token.type == ExpressionTokenType.And:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.add(value1, value2))
+            stack.apply_binary(self.__variant_operations.and_)
             return True
         elif token.type == ExpressionTokenType.Or:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.or_(value1, value2))
+            stack.apply_binary(self.__variant_operations.or_)
             return True
         elif token.type == ExpressionTokenType.Xor:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.xor(value1, value2))
+            stack.apply_binary(self.__variant_operations.xor)
             return True
         elif token.type == ExpressionTokenType.Not:
-            stack.push(self.__variant_operations.not_(stack.pop()))
+            stack.apply_unary(self.__variant_operations.not_)
             return True
         else:
             return False
@@ -247,81 +288,53 @@ class ExpressionCalculator:
     def __evaluate_arithmetical(self, token: ExpressionToken, stack: CalculationStack) -> bool:
 
         if token.type == ExpressionTokenType.Plus:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.add(value1, value2))
+            stack.apply_binary(self.__variant_operations.add)
             return True
         elif token.type == ExpressionTokenType.Minus:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.sub(value1, value2))
+            stack.apply_binary(self.__variant_operations.sub)
             return True
         elif token.type == ExpressionTokenType.Star:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.mul(value1, value2))
+            stack.apply_binary(self.__variant_operations.mul)
             return True
         elif token.type == ExpressionTokenType.Slash:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.div(value1, value2))
+            stack.apply_binary(self.__variant_operations.div)
             return True
         elif token.type == ExpressionTokenType.Percent:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.mod(value1, value2))
+            stack.apply_binary(self.__variant_operations.mod)
             return True
         elif token.type == ExpressionTokenType.Power:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.pow(value1, value2))
+            stack.apply_binary(self.__variant_operations.pow)
             return True
         elif token.type == ExpressionTokenType.Unary:
-            stack.push(self.__variant_operations.negative(stack.pop()))
+            stack.apply_unary(self.__variant_operations.negative)
             return True
         elif token.type == ExpressionTokenType.ShiftLeft:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.lsh(value1, value2))
+            stack.apply_binary(self.__variant_operations.lsh)
             return True
         elif token.type == ExpressionTokenType.ShiftRight:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.rsh(value1, value2))
+            stack.apply_binary(self.__variant_operations.rsh)
             return True
         else:
             return False
 
     def __evaluate_boolean(self, token: ExpressionToken, stack: CalculationStack) -> bool:
         if token.type == ExpressionTokenType.Equal:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.equal(value1, value2))
+            stack.apply_binary(self.__variant_operations.equal)
             return True
         elif token.type == ExpressionTokenType.NotEqual:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.not_equal(value1, value2))
+            stack.apply_binary(self.__variant_operations.not_equal)
             return True
         elif token.type == ExpressionTokenType.More:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.more(value1, value2))
+            stack.apply_binary(self.__variant_operations.more)
             return True
         elif token.type == ExpressionTokenType.Less:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.less(value1, value2))
+            stack.apply_binary(self.__variant_operations.less)
             return True
         elif token.type == ExpressionTokenType.EqualMore:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.more_equal(value1, value2))
+            stack.apply_binary(self.__variant_operations.more_equal)
             return True
         elif token.type == ExpressionTokenType.EqualLess:
-            value2 = stack.pop()
-            value1 = stack.pop()
-            stack.push(self.__variant_operations.less_equal(value1, value2))
+            stack.apply_binary(self.__variant_operations.less_equal)
             return True
         else:
             return False
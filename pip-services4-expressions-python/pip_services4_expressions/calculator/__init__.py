@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
 __all__ = [
-    'CalculationStack', 'ExpressionCalculator', 'ExpressionException',
-    'SyntaxException'
+    'CalculationStack', 'ColumnarExpression', 'CompiledExpression',
+    'ExpressionCalculator', 'ExpressionException', 'SyntaxException'
 ]
 
 from .CalculationStack import CalculationStack
+from .ColumnarExpression import ColumnarExpression
+from .CompiledExpression import CompiledExpression
 from .ExpressionCalculator import ExpressionCalculator
 from .ExpressionException import ExpressionException
 from .SyntaxErrorCode import SyntaxErrorCode
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import copy
-from typing import List
+from typing import Dict, List
 
 from pip_services4_expressions.calculator.functions.IFunction import IFunction
 from pip_services4_expressions.calculator.functions.IFunctionCollection import IFunctionCollection
@@ -15,6 +15,7 @@ class FunctionCollection(IFunctionCollection):
     def __init__(self):
         super(FunctionCollection, self).__init__()
         self.__functions: List[IFunction] = []
+        self.__indexes: Dict[str, int] = {}
 
     def add(self, func: IFunction):
         """
@@ -24,6 +25,7 @@ class FunctionCollection(IFunctionCollection):
         """
         if func is None:
             raise Exception('Func cannot be None')
+        self.__indexes.setdefault(func.name.upper(), len(self.__functions))
         self.__functions.append(func)
 
     @property
@@ -53,6 +55,11 @@ class FunctionCollection(IFunctionCollection):
         result = copy.deepcopy(self.__functions)
         return result
 
+    def __update_indexes(self):
+        self.__indexes = {}
+        for (index, item) in enumerate(self.__functions):
+            self.__indexes.setdefault(item.name.upper(), index)
+
     def find_index_by_name(self, name: str) -> int:
         """
         Finds function index in the list by it's name.
@@ -60,12 +67,7 @@ class FunctionCollection(IFunctionCollection):
         :param name: The function name to be found.
         :return: Function index in the list or **-1** if function was not found.
         """
-        name = name.upper()
-        for i in range(len(self.__functions)):
-            var_name = self.__functions[i].name.upper()
-            if var_name == name:
-                return i
-        return -1
+        return self.__indexes.get(name.upper(), -1)
 
     def find_by_name(self, name: str) -> IFunction:
         """
@@ -84,6 +86,7 @@ class FunctionCollection(IFunctionCollection):
         :param index: a index of the function to be removed.
         """
         self.__functions.pop(index)
+        self.__update_indexes()
 
     def remove_by_name(self, name: str):
         """
@@ -100,3 +103,4 @@ class FunctionCollection(IFunctionCollection):
         Clears the collection.
         """
         self.__functions = []
+        self.__indexes = {}
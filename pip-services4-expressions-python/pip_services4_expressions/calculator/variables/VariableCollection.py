@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import copy
-from typing import List
+from typing import Dict, List
 
 from pip_services4_expressions.calculator.variables.IVariable import IVariable
 from pip_services4_expressions.calculator.variables.IVariableCollection import IVariableCollection
@@ -16,6 +16,7 @@ class VariableCollection(IVariableCollection):
     def __init__(self):
         super(VariableCollection, self).__init__()
         self.__variables: List[IVariable] = []
+        self.__indexes: Dict[str, int] = {}
 
     def add(self, variable: IVariable):
         """
@@ -25,6 +26,7 @@ class VariableCollection(IVariableCollection):
         """
         if variable is None:
             raise Exception("Variable cannot be null")
+        self.__indexes.setdefault(variable.name.upper(), len(self.__variables))
         self.__variables.append(variable)
 
     @property
@@ -54,6 +56,11 @@ class VariableCollection(IVariableCollection):
         result = copy.deepcopy(self.__variables)
         return result
 
+    def __update_indexes(self):
+        self.__indexes = {}
+        for (index, item) in enumerate(self.__variables):
+            self.__indexes.setdefault(item.name.upper(), index)
+
     def find_index_by_name(self, name: str) -> int:
         """
         Finds variable index in the list by it's name.
@@ -61,12 +68,7 @@ class VariableCollection(IVariableCollection):
         :param name: The variable name to be found.
         :return: Variable index in the list or **-1** if variable was not found.
         """
-        name = name.upper()
-        for i in range(len(self.__variables)):
-            var_name = self.__variables[i].name.upper()
-            if var_name == name:
-                return i
-        return -1
+        return self.__indexes.get(name.upper(), -1)
 
     def find_by_name(self, name: str) -> IVariable:
         """
@@ -99,6 +101,7 @@ class VariableCollection(IVariableCollection):
         :param index: a index of the variable to be removed.
         """
         self.__variables.pop(index)
+        self.__update_indexes()
 
     def remove_by_name(self, name: str):
         """
@@ -115,6 +118,7 @@ class VariableCollection(IVariableCollection):
         Clears the collection.
         """
         self.__variables = []
+        self.__indexes = {}
 
     def clear_values(self):
         """
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Callable, Dict, List, Optional
+
+from pip_services4_expressions.mustache.MustacheException import MustacheException
+from pip_services4_expressions.mustache.parsers.MustacheErrorCode import MustacheErrorCode
+from pip_services4_expressions.mustache.parsers.MustacheToken import MustacheToken
+from pip_services4_expressions.mustache.parsers.MustacheTokenType import MustacheTokenType
+
+# A compiled step appends its output to the list of string parts using the index of variables
+Step = Callable[[Dict[str, Any], List[str]], None]
+
+
+class CompiledMustacheTemplate:
+    """
+    Implements a mustache template compiled from the list of parsed mustache tokens into a list of render steps.
+
+    Variable names are lower-cased once during compilation, variables are indexed by lower-cased names
+    once per rendering and the output is collected into a list of parts joined at the end.
+    Partials are resolved by name in a :class:`MustacheTemplateRegistry <pip_services4_expressions.mustache.MustacheTemplateRegistry.MustacheTemplateRegistry>`.
+
+    Example:
+
+    .. code-block:: python
+
+        template = MustacheTemplate("Hello, {{name}}{{#exclamation}}!{{/exclamation}}")
+        compiled = template.compile()
+
+        compiled.render({'NAME': 'Alex', 'EXCLAMATION': True})    # Result: "Hello, Alex!"
+    """
+
+    def __init__(self, tokens: List[MustacheToken], partials: Optional['MustacheTemplateRegistry'] = None):
+        """
+        Compiles the list of parsed mustache tokens.
+
+        :param tokens: The list of parsed mustache tokens.
+        :param partials: (optional) The registry of templates to resolve partials.
+        """
+        self.__partials = partials
+        self.__steps: List[Step] = self.__compile(tokens or [])
+
+    def __compile(self, tokens: List[MustacheToken]) -> List[Step]:
+        steps = []
+        for token in tokens:
+            if token.type == MustacheTokenType.Comment:
+                continue
+            elif token.type == MustacheTokenType.Value:
+                steps.append(CompiledMustacheTemplate.__value_step(token.value or ""))
+            elif token.type == MustacheTokenType.Variable:
+                steps.append(CompiledMustacheTemplate.__variable_step(token.value.lower()))
+            elif token.type == MustacheTokenType.EscapedVariable:
+                steps.append(CompiledMustacheTemplate.__escaped_variable_step(token.value.lower()))
+            elif token.type == MustacheTokenType.Section:
+                steps.append(CompiledMustacheTemplate.__section_step(
+                    token.value.lower(), self.__compile(token.tokens or []), False))
+            elif token.type == MustacheTokenType.InvertedSection:
+                steps.append(CompiledMustacheTemplate.__section_step(
+                    token.value.lower(), self.__compile(token.tokens or []), True))
+            elif token.type == MustacheTokenType.Partial:
+                steps.append(self.__partial_step(token))
+            else:
+                raise MustacheException(None, MustacheErrorCode.INTERNAL, "Internal error", token.line, token.column)
+        return steps
+
+    @staticmethod
+    def __value_step(value: str) -> Step:
+        return lambda index, result: result.append(value)
+
+    @staticmethod
+    def __variable_step(name: str) -> Step:
+        return lambda index, result: result.append(index.get(name) or "")
+
+    @staticmethod
+    def __escaped_variable_step(name: str) -> Step:
+        def escaped_variable(index: Dict[str, Any], result: List[str]):
+            value = index.get(name)
+            result.append(CompiledMustacheTemplate.escape_string(value) if value else "")
+
+        return escaped_variable
+
+    @staticmethod
+    def __section_step(name: str, steps: List[Step], inverted: bool) -> Step:
+        def section(index: Dict[str, Any], result: List[str]):
+            if CompiledMustacheTemplate.is_defined(index.get(name)) != inverted:
+                for step in steps:
+                    step(index, result)
+
+        return section
+
+    def __partial_step(self, token: MustacheToken) -> Step:
+        if self.__partials is None:
+            raise MustacheException(None, "PARTIALS_NOT_SUPPORTED", "Partials are not supported",
+                                    token.line, token.column)
+
+        partials = self.__partials
+        name = token.value
+
+        def partial(index: Dict[str, Any], result: List[str]):
+            # Partials are resolved during rendering to allow registering them in any order
+            template = partials.get(name)
+            if template is None:
+                raise MustacheException(None, "PARTIAL_NOT_FOUND", "Partial " + name + " was not found",
+                                        token.line, token.column)
+            template.render_to(index, result)
+
+        return partial
+
+    @staticmethod
+    def is_defined(value: Any) -> bool:
+        """
+        Checks if a variable value turns on a section.
+
+        :param value: a variable value.
+        :return: **True** if the value is not empty.
+        """
+        return value is not None and value != "" and value != 0 and value is not False
+
+    @staticmethod
+    def escape_string(value: str) -> str:
+        """
+        Escapes special characters in a variable value.
+
+        :param value: a value to escape.
+        :return: the escaped value.
+        """
+        return value.replace('\\', '\\\\') \
+            .replace('"', '\\\"') \
+            .replace('/', '\\/') \
+            .replace('\b', '\\b') \
+            .replace('\f', '\\f') \
+            .replace('\n', '\\n') \
+            .replace('\r', '\\r') \
+            .replace('\t', '\\t')
+
+    @staticmethod
+    def index_variables(variables: Any) -> Dict[str, Any]:
+        """
+        Indexes variables by lower-cased names.
+        When several names differ only by case, the first not empty value is used.
+
+        :param variables: a collection of variables.
+        :return: a map of variable values by lower-cased names.
+        """
+        index = {}
+        if variables is not None:
+            for name in variables:
+                key = name.lower()
+                index[key] = index.get(key) or variables[name]
+        return index
+
+    def render_to(self, index: Dict[str, Any], result: List[str]):
+        """
+        Renders this template into the list of string parts.
+
+        :param index: The map of variable values by lower-cased names.
+        :param result: The list to append rendered parts to.
+        """
+        for step in self.__steps:
+            step(index, result)
+
+    def render(self, variables: Any) -> str:
+        """
+        Renders this template using specified variables.
+
+        :param variables: The collection of variables.
+        :return: the rendered template.
+        """
+        result = []
+        self.render_to(CompiledMustacheTemplate.index_variables(variables), result)
+        return "".join(result)
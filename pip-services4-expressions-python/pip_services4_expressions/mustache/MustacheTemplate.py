@@ -2,7 +2,9 @@
 
 from typing import List, Optional, Any
 
+from pip_services4_expressions.mustache.CompiledMustacheTemplate import CompiledMustacheTemplate
 from pip_services4_expressions.mustache.MustacheException import MustacheException
+from pip_services4_expressions.mustache.MustacheTemplateRegistry import MustacheTemplateRegistry
 from pip_services4_expressions.mustache.parsers.MustacheParser import MustacheParser
 from pip_services4_expressions.mustache.parsers.MustacheToken import MustacheToken
 from pip_services4_expressions.mustache.parsers.MustacheTokenType import MustacheTokenType
@@ -12,6 +14,9 @@ from pip_services4_expressions.tokenizers.Token import Token
 class MustacheTemplate:
     """
     Implements an mustache template class.
+
+    The template is compiled on the first evaluation and the compiled form is reused until the template changes.
+    Partials (``{{> name}}``) are resolved in the registry of templates set in :func:`partials`.
     """
 
     def __init__(self, template: Optional[str] = None):
@@ -23,6 +28,8 @@ class MustacheTemplate:
         self.__default_variables = {}
         self.__parser: MustacheParser = MustacheParser()
         self.__auto_variables: bool = True
+        self.__partials: Optional[MustacheTemplateRegistry] = None
+        self.__compiled: Optional[CompiledMustacheTemplate] = None
 
         if self.template is not None:
             self.template = template
@@ -40,6 +47,7 @@ class MustacheTemplate:
         The mustache template.
         """
         self.__parser.template = value
+        self.__compiled = None
         if self.__auto_variables:
             self.create_variables(self.__default_variables)
 
@@ -50,6 +58,7 @@ class MustacheTemplate:
     @original_tokens.setter
     def original_tokens(self, value: List[Token]):
         self.__parser.original_tokens = value
+        self.__compiled = None
         if self.__auto_variables:
             self.create_variables(self.__default_variables)
 
@@ -81,6 +90,21 @@ class MustacheTemplate:
         """
         self.__default_variables = value
 
+    @property
+    def partials(self) -> Optional[MustacheTemplateRegistry]:
+        """
+        The registry of templates to resolve partials.
+        """
+        return self.__partials
+
+    @partials.setter
+    def partials(self, value: Optional[MustacheTemplateRegistry]):
+        """
+        Sets the registry of templates to resolve partials.
+        """
+        self.__partials = value
+        self.__compiled = None
+
     @property
     def initial_tokens(self) -> List[MustacheToken]:
         """
@@ -133,6 +157,15 @@ class MustacheTemplate:
         """
         self.__parser.clear()
         self.__default_variables = {}
+        self.__compiled = None
+
+    def compile(self) -> CompiledMustacheTemplate:
+        """
+        Compiles this template into a render function that can be called many times with different variables.
+
+        :return: the compiled template.
+        """
+        return CompiledMustacheTemplate(self.__parser.result_tokens, self.__partials)
 
     def evaluate(self) -> str:
         """
@@ -151,23 +184,21 @@ class MustacheTemplate:
         """
         variables = variables or self.__default_variables
 
-        return self.evaluate_tokens(self.__parser.result_tokens, variables)
+        if self.__compiled is None:
+            self.__compiled = self.compile()
+        return self.__compiled.render(variables)
 
     def __is__defined_variable(self, variables: Any, name: str) -> bool:
-        value = self.get_variables(variables, name)
-        return value is not None and value != "" and value != 0 and value is not False
-
-    def __escape_string(self, value: str) -> str:
-        return value.replace('\\', '\\\\') \
-            .replace('"', '\\\"') \
-            .replace('/', '\\/') \
-            .replace('\b', '\\b') \
-            .replace('\f', '\\f') \
-            .replace('\n', '\\n') \
-            .replace('\r', '\\r') \
-            .replace('\t', '\\t')
+        return CompiledMustacheTemplate.is_defined(self.get_variables(variables, name))
 
     def evaluate_tokens(self, tokens: List[MustacheToken], variables: Any) -> Optional[str]:
+        """
+        Evaluates the list of mustache tokens without compiling them.
+
+        :param tokens: The list of mustache tokens.
+        :param variables: The collection of variables
+        :return: the evaluated tokens
+        """
         if tokens is None:
             return None
 
@@ -187,8 +218,7 @@ class MustacheTemplate:
 
             elif token.type == MustacheTokenType.EscapedVariable:
                 value2 = self.get_variables(variables, token.value)
-                value2 = self.__escape_string(value2)
-                result += value2 or ""
+                result += CompiledMustacheTemplate.escape_string(value2) if value2 else ""
 
             elif token.type == MustacheTokenType.Section:
                 defined1 = self.__is__defined_variable(variables, token.value)
@@ -201,8 +231,14 @@ class MustacheTemplate:
                     result += self.evaluate_tokens(token.tokens, variables)
 
             elif token.type == MustacheTokenType.Partial:
-                raise MustacheException(None, "PARTIALS_NOT_SUPPORTED", "Partials are not supported", token.line,
-                                        token.column)
+                if self.__partials is None:
+                    raise MustacheException(None, "PARTIALS_NOT_SUPPORTED", "Partials are not supported",
+                                            token.line, token.column)
+                partial = self.__partials.get(token.value)
+                if partial is None:
+                    raise MustacheException(None, "PARTIAL_NOT_FOUND", "Partial " + token.value + " was not found",
+                                            token.line, token.column)
+                result += partial.render(variables)
             else:
                 raise MustacheException(None, "INTERNAL", "Internal error", token.line, token.column)
 
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import threading
+from typing import Any, Dict, List, Optional
+
+from pip_services4_expressions.mustache.CompiledMustacheTemplate import CompiledMustacheTemplate
+from pip_services4_expressions.mustache.MustacheException import MustacheException
+from pip_services4_expressions.mustache.parsers.MustacheParser import MustacheParser
+
+
+class MustacheTemplateRegistry:
+    """
+    Keeps named mustache templates and compiles each of them once on the first use.
+
+    The registry resolves partials (``{{> name}}``) in templates that use it.
+    Template names are case insensitive.
+
+    Example:
+
+    .. code-block:: python
+
+        registry = MustacheTemplateRegistry()
+        registry.register("greeting", "Hello, {{name}}")
+        registry.register("letter", "{{> greeting}}! Your order {{order}} is ready.")
+
+        registry.render("letter", {'name': 'Alex', 'order': '123'})    # Result: "Hello, Alex! Your order 123 is ready."
+    """
+
+    def __init__(self):
+        self.__templates: Dict[str, str] = {}
+        self.__compiled: Dict[str, CompiledMustacheTemplate] = {}
+        self.__lock = threading.Lock()
+
+    def get_names(self) -> List[str]:
+        """
+        Gets names of all registered templates.
+
+        :return: a list of template names.
+        """
+        with self.__lock:
+            return list(self.__templates.keys())
+
+    def register(self, name: str, template: str):
+        """
+        Registers a template under the specified name. A previously registered template is replaced.
+
+        :param name: a name of the template.
+        :param template: a mustache template.
+        """
+        name = name.lower()
+        with self.__lock:
+            self.__templates[name] = template
+            self.__compiled.pop(name, None)
+
+    def unregister(self, name: str):
+        """
+        Removes a template with the specified name.
+
+        :param name: a name of the template.
+        """
+        name = name.lower()
+        with self.__lock:
+            self.__templates.pop(name, None)
+            self.__compiled.pop(name, None)
+
+    def get(self, name: str) -> Optional[CompiledMustacheTemplate]:
+        """
+        Gets a compiled template by its name. The template is compiled on the first call.
+
+        :param name: a name of the template.
+        :return: a compiled template or **None** if the template is not registered.
+        """
+        name = name.lower()
+        compiled = self.__compiled.get(name)
+        if compiled is not None:
+            return compiled
+
+        with self.__lock:
+            template = self.__templates.get(name)
+        if template is None:
+            return None
+
+        parser = MustacheParser()
+        parser.template = template
+        compiled = CompiledMustacheTemplate(parser.result_tokens, self)
+
+        with self.__lock:
+            # Do not cache a template that was replaced while compiling
+            if self.__templates.get(name) is template:
+                self.__compiled[name] = compiled
+        return compiled
+
+    def render(self, name: str, variables: Any) -> str:
+        """
+        Renders a template with the specified name.
+
+        :param name: a name of the template.
+        :param variables: the collection of variables.
+        :return: the rendered template.
+        """
+        compiled = self.get(name)
+        if compiled is None:
+            raise MustacheException(None, "TEMPLATE_NOT_FOUND", "Template " + name + " was not found")
+        return compiled.render(variables)
+
+    def clear(self):
+        """
+        Removes all registered templates.
+        """
+        with self.__lock:
+            self.__templates = {}
+            self.__compiled = {}
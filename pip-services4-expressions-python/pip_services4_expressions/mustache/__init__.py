@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
 __all__ = [
-    'MustacheTemplate', 'MustacheException'
+    'MustacheTemplate', 'MustacheException', 'CompiledMustacheTemplate', 'MustacheTemplateRegistry'
 ]
 
 from .MustacheTemplate import MustacheTemplate
 from .MustacheException import MustacheException
+from .CompiledMustacheTemplate import CompiledMustacheTemplate
+from .MustacheTemplateRegistry import MustacheTemplateRegistry
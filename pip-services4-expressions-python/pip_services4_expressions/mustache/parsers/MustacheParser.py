@@ -215,6 +215,10 @@ class MustacheParser:
                     operator1 = token.value
                     state = MustacheLexicalState.Operator2
                     continue
+                if state == MustacheLexicalState.Operator1 and token.value == '>':
+                    operator1 = token.value
+                    state = MustacheLexicalState.Variable
+                    continue
                 if state == MustacheLexicalState.Variable and (token.value == "}}" or token.value == "}}}"):
                     if operator1 != '/':
                         variable = operator2
@@ -244,6 +248,10 @@ class MustacheParser:
                         token_type = MustacheTokenType.SectionEnd
                         token_value = variable
 
+                    if operator1 == ">":
+                        token_type = MustacheTokenType.Partial
+                        token_value = variable
+
                     if operator1 is None:
                         token_type = MustacheTokenType.Variable if closing_bracket == "}}" else MustacheTokenType.EscapedVariable
                         token_value = variable
@@ -343,7 +351,8 @@ class MustacheParser:
 
         self.__variable_names = []
         for token in self.__initial_tokens:
-            if token.type not in [MustacheTokenType.Value, MustacheTokenType.Comment] and token.value is not None:
+            if token.type not in [MustacheTokenType.Value, MustacheTokenType.Comment, MustacheTokenType.Partial] \
+                    and token.value is not None:
                 variable_name = token.value.lower()
                 found = len(list(filter(lambda v: v.lower() == variable_name, self.__variable_names))) > 0
                 if not found:
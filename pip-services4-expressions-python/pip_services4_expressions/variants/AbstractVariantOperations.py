@@ -1,17 +1,182 @@
 # -*- coding: utf-8 -*-
 
+import operator
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Tuple
 
 from .IVariantOperations import IVariantOperations
 from .Variant import Variant
 from .VariantType import VariantType
 
+# Maps a variant type to a result type and a function to calculate the result value
+Operations = Dict[VariantType, Tuple[VariantType, Callable[..., Any]]]
+
 
 class AbstractVariantOperations(IVariantOperations, ABC):
     """
     Implements an abstract variant operations manager object.
+
+    Operations are dispatched by the type of the first operand through tables
+    that map the type to the type of the result and a function that calculates its value.
     """
 
+    _add_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.add),
+        VariantType.Long: (VariantType.Long, operator.add),
+        VariantType.Float: (VariantType.Float, operator.add),
+        VariantType.Double: (VariantType.Double, operator.add),
+        VariantType.String: (VariantType.String, lambda value1, value2: str(value1) + str(value2)),
+        VariantType.TimeSpan: (VariantType.TimeSpan, operator.add),
+    }
+
+    _sub_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.sub),
+        VariantType.Long: (VariantType.Long, operator.sub),
+        VariantType.Float: (VariantType.Float, operator.sub),
+        VariantType.Double: (VariantType.Double, operator.sub),
+        VariantType.DateTime: (VariantType.String, operator.sub),
+        VariantType.TimeSpan: (VariantType.TimeSpan, operator.sub),
+    }
+
+    _mul_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.mul),
+        VariantType.Long: (VariantType.Long, operator.mul),
+        VariantType.Float: (VariantType.Float, operator.mul),
+        VariantType.Double: (VariantType.Double, operator.mul),
+    }
+
+    _div_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, lambda value1, value2: int(value1 / value2)),
+        VariantType.Long: (VariantType.Long, lambda value1, value2: int(value1 / value2)),
+        VariantType.Float: (VariantType.Float, operator.truediv),
+        VariantType.Double: (VariantType.Double, operator.truediv),
+    }
+
+    _mod_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.mod),
+        VariantType.Long: (VariantType.Long, operator.mod),
+    }
+
+    _and_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, lambda value1, value2: value1 and value2),
+        VariantType.Long: (VariantType.Long, lambda value1, value2: value1 and value2),
+        VariantType.Boolean: (VariantType.Boolean, lambda value1, value2: value1 and value2),
+    }
+
+    _or_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, lambda value1, value2: value1 or value2),
+        VariantType.Long: (VariantType.Long, lambda value1, value2: value1 or value2),
+        VariantType.Boolean: (VariantType.Boolean, lambda value1, value2: value1 or value2),
+    }
+
+    _xor_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.xor),
+        VariantType.Long: (VariantType.Long, operator.xor),
+        VariantType.Boolean: (VariantType.Boolean, operator.xor),
+    }
+
+    _lsh_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.lshift),
+        VariantType.Long: (VariantType.Long, operator.lshift),
+    }
+
+    _rsh_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.rshift),
+        VariantType.Long: (VariantType.Long, operator.rshift),
+    }
+
+    _not_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.invert),
+        VariantType.Long: (VariantType.Long, operator.invert),
+        VariantType.Boolean: (VariantType.Boolean, operator.not_),
+    }
+
+    _negative_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.neg),
+        VariantType.Long: (VariantType.Long, operator.neg),
+        VariantType.Float: (VariantType.Float, operator.neg),
+        VariantType.Double: (VariantType.Double, operator.neg),
+    }
+
+    _equal_operations: Operations = {
+        VariantType.Integer: (VariantType.Boolean, operator.eq),
+        VariantType.Long: (VariantType.Boolean, operator.eq),
+        VariantType.Float: (VariantType.Boolean, operator.eq),
+        VariantType.Double: (VariantType.Boolean, operator.eq),
+        VariantType.String: (VariantType.Boolean,
+                             lambda value1, value2: str(value1).rstrip('.0') == str(value2).rstrip('.0')),
+        VariantType.TimeSpan: (VariantType.Boolean, operator.eq),
+        VariantType.DateTime: (VariantType.Boolean, operator.eq),
+        VariantType.Boolean: (VariantType.Boolean, operator.eq),
+        VariantType.Object: (VariantType.Boolean, operator.eq),
+    }
+
+    _not_equal_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.ne),
+        VariantType.Long: (VariantType.Long, operator.ne),
+        VariantType.Float: (VariantType.Float, operator.ne),
+        VariantType.Double: (VariantType.Double, operator.ne),
+        VariantType.String: (VariantType.String, lambda value1, value2: str(value1) != str(value2)),
+        VariantType.TimeSpan: (VariantType.TimeSpan, operator.ne),
+        VariantType.DateTime: (VariantType.DateTime, operator.ne),
+        VariantType.Boolean: (VariantType.Boolean, operator.ne),
+        VariantType.Object: (VariantType.Boolean, operator.ne),
+    }
+
+    _more_operations: Operations = {
+        VariantType.Integer: (VariantType.Boolean, operator.gt),
+        VariantType.Long: (VariantType.Boolean, operator.gt),
+        VariantType.Float: (VariantType.Boolean, operator.gt),
+        VariantType.Double: (VariantType.Boolean, operator.gt),
+        VariantType.String: (VariantType.Boolean, lambda value1, value2: str(value1) > str(value2)),
+        VariantType.TimeSpan: (VariantType.Boolean, operator.gt),
+        VariantType.DateTime: (VariantType.Boolean, lambda value1, value2: value1.timestamp() > value2.timestamp()),
+    }
+
+    _less_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.lt),
+        VariantType.Long: (VariantType.Long, operator.lt),
+        VariantType.Float: (VariantType.Float, operator.lt),
+        VariantType.Double: (VariantType.Double, operator.lt),
+        VariantType.String: (VariantType.String, lambda value1, value2: str(value1) < str(value2)),
+        VariantType.TimeSpan: (VariantType.TimeSpan, operator.lt),
+        VariantType.DateTime: (VariantType.DateTime, lambda value1, value2: value1.timestamp() < value2.timestamp()),
+    }
+
+    _more_equal_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.ge),
+        VariantType.Long: (VariantType.Long, operator.ge),
+        VariantType.Float: (VariantType.Float, operator.ge),
+        VariantType.Double: (VariantType.Double, operator.ge),
+        VariantType.String: (VariantType.String, lambda value1, value2: str(value1) >= str(value2)),
+        VariantType.TimeSpan: (VariantType.TimeSpan, operator.ge),
+        VariantType.DateTime: (VariantType.DateTime, lambda value1, value2: value1.timestamp() >= value2.timestamp()),
+    }
+
+    _less_equal_operations: Operations = {
+        VariantType.Integer: (VariantType.Integer, operator.le),
+        VariantType.Long: (VariantType.Long, operator.le),
+        VariantType.Float: (VariantType.Float, operator.le),
+        VariantType.Double: (VariantType.Double, operator.le),
+        VariantType.String: (VariantType.String, lambda value1, value2: str(value1) <= str(value2)),
+        VariantType.TimeSpan: (VariantType.TimeSpan, operator.le),
+        VariantType.DateTime: (VariantType.DateTime, lambda value1, value2: value1.timestamp() <= value2.timestamp()),
+    }
+
+    __type_names = {
+        VariantType.Null: 'Null',
+        VariantType.Integer: 'Integer',
+        VariantType.Long: 'Long',
+        VariantType.Float: 'Float',
+        VariantType.Double: 'Double',
+        VariantType.String: 'String',
+        VariantType.Boolean: 'Boolean',
+        VariantType.DateTime: 'DateTime',
+        VariantType.TimeSpan: 'TimeSpan',
+        VariantType.Object: 'Object',
+        VariantType.Array: 'Array'
+    }
+
     def _type_to_string(self, value: VariantType) -> str:
         """
         Convert variant type to string representation
@@ -19,23 +184,48 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value: a variant type to be converted.
         :return: a string representation of the type.
         """
-        types = {
-            VariantType.Null: 'Null',
-            VariantType.Integer: 'Integer',
-            VariantType.Long: 'Long',
-            VariantType.Float: 'Float',
-            VariantType.Double: 'Double',
-            VariantType.String: 'String',
-            VariantType.Boolean: 'Boolean',
-            VariantType.DateTime: 'DateTime',
-            VariantType.TimeSpan: 'TimeSpan',
-            VariantType.Object: 'Object',
-            VariantType.Array: 'Array'
-        }
-        try:
-            return types[value]
-        except KeyError as e:
-            return 'Unknown'
+        return AbstractVariantOperations.__type_names.get(value, 'Unknown')
+
+    def _perform_operation(self, operation_name: str, operations: Operations,
+                           value1: Variant, value2: Variant) -> Variant:
+        """
+        Performs binary operation for two not null variants using the table of operations.
+
+        :param operation_name: The name of the operation used in error messages.
+        :param operations: The table of operations by the type of the first operand.
+        :param value1: The first operand for this operation.
+        :param value2: The second operand for this operation.
+        :return: A result variant object.
+        """
+        value_type = value1.type
+
+        # Converts second operand to the type of the first operand.
+        if value2.type != value_type:
+            value2 = self.convert(value2, value_type)
+
+        # Performs operation.
+        operation = operations.get(value_type)
+        if operation is None:
+            raise Exception(f"Operation {operation_name} is not supported for type {self._type_to_string(value_type)}")
+
+        (result_type, calculate) = operation
+        return Variant.from_type(result_type, calculate(value1.as_object, value2.as_object))
+
+    def _perform_unary_operation(self, operation_name: str, operations: Operations, value: Variant) -> Variant:
+        """
+        Performs unary operation for a not null variant using the table of operations.
+
+        :param operation_name: The name of the operation used in error messages.
+        :param operations: The table of operations by the type of the operand.
+        :param value: The operand for this operation.
+        :return: A result variant object.
+        """
+        operation = operations.get(value.type)
+        if operation is None:
+            raise Exception(f"Operation {operation_name} is not supported for type {self._type_to_string(value.type)}")
+
+        (result_type, calculate) = operation
+        return Variant.from_type(result_type, calculate(value.as_object))
 
     @abstractmethod
     def convert(self, value: Variant, new_type: VariantType) -> Variant:
@@ -48,36 +238,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         """
 
     def add(self, value1: Variant, value2: Variant) -> Variant:
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
-
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer + value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long + value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_float = value1.as_float + value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_double = value1.as_double + value2.as_double
-            return result
-        elif value1.type == VariantType.String:
-            result.as_string = value1.as_string + value2.as_string
-            return result
-        elif value1.type == VariantType.TimeSpan:
-            result.as_time_span = value1.as_time_span + value2.as_time_span
-            return result
+            return Variant()
 
-        raise Exception(f"Operation '+' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'+'", self._add_operations, value1, value2)
 
     def sub(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -87,36 +252,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
+            return Variant()
 
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer - value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long - value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_float = value1.as_float - value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_double = value1.as_double - value2.as_double
-            return result
-        elif value1.type == VariantType.DateTime:
-            result.as_string = value1.as_datetime - value2.as_datetime
-            return result
-        elif value1.type == VariantType.TimeSpan:
-            result.as_time_span = value1.as_time_span - value2.as_time_span
-            return result
-
-        raise Exception(f"Operation '-' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'-'", self._sub_operations, value1, value2)
 
     def mul(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -126,30 +266,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
+            return Variant()
 
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer * value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long * value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_float = value1.as_float * value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_double = value1.as_double * value2.as_double
-            return result
-
-        raise Exception(f"Operation '*' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'*'", self._mul_operations, value1, value2)
 
     def div(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -159,30 +280,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
-
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = int(value1.as_integer / value2.as_integer)
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = int(value1.as_long / value2.as_long)
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_float = value1.as_float / value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_double = value1.as_double / value2.as_double
-            return result
+            return Variant()
 
-        raise Exception(f"Operation '/' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'/'", self._div_operations, value1, value2)
 
     def mod(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -192,24 +294,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
+            return Variant()
 
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer % value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long % value2.as_long
-            return result
-
-        raise Exception(f"Operation '%' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'%'", self._mod_operations, value1, value2)
 
     def pow(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -242,27 +331,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
+            return Variant()
 
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer and value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long and value2.as_long
-            return result
-        elif value1.type == VariantType.Boolean:
-            result.as_boolean = value1.as_boolean and value2.as_boolean
-            return result
-
-        raise Exception(f"Operation 'AND' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'AND'", self._and_operations, value1, value2)
 
     def or_(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -272,27 +345,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
-
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer or value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long or value2.as_long
-            return result
-        elif value1.type == VariantType.Boolean:
-            result.as_boolean = value1.as_boolean or value2.as_boolean
-            return result
+            return Variant()
 
-        raise Exception(f"Operation 'OR' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'OR'", self._or_operations, value1, value2)
 
     def xor(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -302,27 +359,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
+            return Variant()
 
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer ^ value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long ^ value2.as_long
-            return result
-        elif value1.type == VariantType.Boolean:
-            result.as_boolean = value1.as_boolean ^ value2.as_boolean
-            return result
-
-        raise Exception(f"Operation 'XOR' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'XOR'", self._xor_operations, value1, value2)
 
     def lsh(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -332,24 +373,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
+            return Variant()
 
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer << value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long << value2.as_long
-            return result
-
-        raise Exception(f"Operation '<<' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'<<'", self._lsh_operations, value1, value2)
 
     def rsh(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -359,24 +387,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            return result
-
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer >> value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long >> value2.as_long
-            return result
+            return Variant()
 
-        raise Exception(f"Operation '>>' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'>>'", self._rsh_operations, value1, value2)
 
     def not_(self, value: Variant) -> Variant:
         """
@@ -385,24 +400,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value: The operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value.type == VariantType.Null:
-            return result
+            return Variant()
 
-        # Performs operation.
-        if value.type == VariantType.Integer:
-            result.as_integer = ~value.as_integer
-            return result
-        elif value.type == VariantType.Long:
-            result.as_long = ~value.as_long
-            return result
-        elif value.type == VariantType.Boolean:
-            result.as_boolean = ~value.as_boolean
-            return result
-
-        raise Exception(f"Operation NOT is not supported for type {self._type_to_string(value.type)}")
+        return self._perform_unary_operation("NOT", self._not_operations, value)
 
     def negative(self, value: Variant) -> Variant:
         """
@@ -411,27 +413,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value: The operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value.type == VariantType.Null:
-            return result
+            return Variant()
 
-        # Performs operation.
-        if value.type == VariantType.Integer:
-            result.as_integer = -value.as_integer
-            return result
-        elif value.type == VariantType.Long:
-            result.as_long = -value.as_long
-            return result
-        elif value.type == VariantType.Float:
-            result.as_float = -value.as_float
-            return result
-        elif value.type == VariantType.Double:
-            result.as_double = -value.as_double
-            return result
-
-        raise Exception(f"Operation '-' is not supported for type {self._type_to_string(value.type)}")
+        return self._perform_unary_operation("'-'", self._negative_operations, value)
 
     def equal(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -441,50 +427,14 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null and value2.type == VariantType.Null:
-            result.as_boolean = True
-            return result
+            return Variant.from_boolean(True)
 
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            result.as_boolean = False
-            return result
-
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_boolean = value1.as_integer == value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_boolean = value1.as_long == value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_boolean = value1.as_float == value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_boolean = value1.as_double == value2.as_double
-            return result
-        elif value1.type == VariantType.String:
-            result.as_boolean = value1.as_string.rstrip('.0') == value2.as_string.rstrip('.0')
-            return result
-        elif value1.type == VariantType.TimeSpan:
-            result.as_boolean = value1.as_time_span == value2.as_time_span
-            return result
-        elif value1.type == VariantType.DateTime:
-            result.as_boolean = value1.as_datetime == value2.as_datetime
-            return result
-        elif value1.type == VariantType.Boolean:
-            result.as_boolean = value1.as_boolean == value2.as_boolean
-            return result
-        elif value1.type == VariantType.Object:
-            result.as_boolean = value1.as_object == value2.as_object
-            return result
+            return Variant.from_boolean(False)
 
-        raise Exception(f"Operation '==' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'=='", self._equal_operations, value1, value2)
 
     def not_equal(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -494,50 +444,14 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null and value2.type == VariantType.Null:
-            result.as_boolean = True
-            return result
+            return Variant.from_boolean(True)
 
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            result.as_boolean = False
-            return result
+            return Variant.from_boolean(False)
 
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer != value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long != value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_float = value1.as_float != value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_double = value1.as_double != value2.as_double
-            return result
-        elif value1.type == VariantType.String:
-            result.as_string = value1.as_string != value2.as_string
-            return result
-        elif value1.type == VariantType.TimeSpan:
-            result.as_time_span = value1.as_time_span != value2.as_time_span
-            return result
-        elif value1.type == VariantType.DateTime:
-            result.as_datetime = value1.as_datetime != value2.as_datetime
-            return result
-        elif value1.type == VariantType.Boolean:
-            result.as_boolean = value1.as_boolean != value2.as_boolean
-            return result
-        elif value1.type == VariantType.Object:
-            result.as_object = value1.as_object != value2.as_object
-            return result
-
-        raise Exception(f"Operation '<>' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'<>'", self._not_equal_operations, value1, value2)
 
     def more(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -547,40 +461,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            result.as_boolean = False
-            return result
-
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_boolean = value1.as_integer > value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_boolean = value1.as_long > value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_boolean = value1.as_float > value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_boolean = value1.as_double > value2.as_double
-            return result
-        elif value1.type == VariantType.String:
-            result.as_boolean = value1.as_string > value2.as_string
-            return result
-        elif value1.type == VariantType.TimeSpan:
-            result.as_boolean = value1.as_time_span > value2.as_time_span
-            return result
-        elif value1.type == VariantType.DateTime:
-            result.as_boolean = value1.as_datetime.timestamp() > value2.as_datetime.timestamp()
-            return result
+            return Variant.from_boolean(False)
 
-        raise Exception(f"Operation '>' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'>'", self._more_operations, value1, value2)
 
     def less(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -590,40 +475,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            result.as_boolean = False
-            return result
+            return Variant.from_boolean(False)
 
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer < value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long < value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_float = value1.as_float < value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_double = value1.as_double < value2.as_double
-            return result
-        elif value1.type == VariantType.String:
-            result.as_string = value1.as_string < value2.as_string
-            return result
-        elif value1.type == VariantType.TimeSpan:
-            result.as_time_span = value1.as_time_span < value2.as_time_span
-            return result
-        elif value1.type == VariantType.DateTime:
-            result.as_datetime = value1.as_datetime.timestamp() < value2.as_datetime.timestamp()
-            return result
-
-        raise Exception(f"Operation '<' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'<'", self._less_operations, value1, value2)
 
     def more_equal(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -633,40 +489,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            result.as_boolean = False
-            return result
-
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer >= value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long >= value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_float = value1.as_float >= value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_double = value1.as_double >= value2.as_double
-            return result
-        elif value1.type == VariantType.String:
-            result.as_string = value1.as_string >= value2.as_string
-            return result
-        elif value1.type == VariantType.TimeSpan:
-            result.as_time_span = value1.as_time_span >= value2.as_time_span
-            return result
-        elif value1.type == VariantType.DateTime:
-            result.as_datetime = value1.as_datetime.timestamp() >= value2.as_datetime.timestamp()
-            return result
+            return Variant.from_boolean(False)
 
-        raise Exception(f"Operation '>=' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'>='", self._more_equal_operations, value1, value2)
 
     def less_equal(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -676,40 +503,11 @@ class AbstractVariantOperations(IVariantOperations, ABC):
         :param value2: The second operand for this operation.
         :return: A result variant object.
         """
-        result = Variant()
-
         # Processes VariantType.Null values.
         if value1.type == VariantType.Null or value2.type == VariantType.Null:
-            result.as_boolean = False
-            return result
-
-        # Converts second operand to the type of the first operand.
-        value2 = self.convert(value2, value1.type)
-
-        # Performs operation.
-        if value1.type == VariantType.Integer:
-            result.as_integer = value1.as_integer <= value2.as_integer
-            return result
-        elif value1.type == VariantType.Long:
-            result.as_long = value1.as_long <= value2.as_long
-            return result
-        elif value1.type == VariantType.Float:
-            result.as_float = value1.as_float <= value2.as_float
-            return result
-        elif value1.type == VariantType.Double:
-            result.as_double = value1.as_double <= value2.as_double
-            return result
-        elif value1.type == VariantType.String:
-            result.as_string = value1.as_string <= value2.as_string
-            return result
-        elif value1.type == VariantType.TimeSpan:
-            result.as_time_span = value1.as_time_span <= value2.as_time_span
-            return result
-        elif value1.type == VariantType.DateTime:
-            result.as_datetime = value1.as_datetime.timestamp() <= value2.as_datetime.timestamp()
-            return result
+            return Variant.from_boolean(False)
 
-        raise Exception(f"Operation '<=' is not supported for type {self._type_to_string(value1.type)}")
+        return self._perform_operation("'<='", self._less_equal_operations, value1, value2)
 
     def in_(self, value1: Variant, value2: Variant) -> Variant:
         """
@@ -15,8 +15,22 @@ class Variant:
     Defines container for variant values.
     """
 
+    __slots__ = ('__type', '__value')
+
     __empty = None
 
+    # Variant types of values detected by exact type of the value
+    __value_types = {
+        type(None): VariantType.Null,
+        int: VariantType.Integer,
+        float: VariantType.Float,
+        Decimal: VariantType.Double,
+        bool: VariantType.Boolean,
+        datetime: VariantType.DateTime,
+        str: VariantType.String,
+        list: VariantType.Array,
+    }
+
     def __init__(self, value: Any = None):
         """
         Constructs this class and Assigns another variant value.
@@ -193,22 +207,11 @@ class Variant:
         :param value: a value to be set
         """
         self.__value = value
-        if value is None:
-            self.__type = VariantType.Null
-        elif type(value) == int:
-            self.__type = VariantType.Integer
-        elif type(value) == float:
-            self.__type = VariantType.Float
-        elif type(value) == Decimal:
-            self.__type = VariantType.Double
-        elif type(value) == bool:
-            self.__type = VariantType.Boolean
+        value_type = Variant.__value_types.get(type(value))
+        if value_type is not None:
+            self.__type = value_type
         elif issubclass(datetime, type(value)):
             self.__type = VariantType.DateTime
-        elif type(value) == str:
-            self.__type = VariantType.String
-        elif type(value) == list:
-            self.__type = VariantType.Array
         elif isinstance(value, Variant):
             self.__type = value.__type
             self.__value = value.__value
@@ -361,6 +364,20 @@ class Variant:
         """
         return Variant(copy.deepcopy(self))
 
+    @staticmethod
+    def from_type(value_type: VariantType, value: Any) -> 'Variant':
+        """
+        Creates a new variant of the specified type without detecting the type of the value.
+
+        :param value_type: a variant type.
+        :param value: a variant value.
+        :return: a created variant object.
+        """
+        result = Variant.__new__(Variant)
+        result.__type = value_type
+        result.__value = value
+        return result
+
     @staticmethod
     def from_integer(value: int):
         """
@@ -369,9 +386,7 @@ class Variant:
         :param value: a variant value.
         :return: a created variant object.
         """
-        result = Variant()
-        result.as_integer = value
-        return result
+        return Variant.from_type(VariantType.Integer, value)
 
     @staticmethod
     def from_long(value: int):
@@ -381,9 +396,7 @@ class Variant:
         :param value: a variant value.
         :return: a created variant object.
         """
-        result = Variant()
-        result.as_long = value
-        return result
+        return Variant.from_type(VariantType.Long, value)
 
     @staticmethod
     def from_boolean(value: bool):
@@ -393,9 +406,7 @@ class Variant:
         :param value: a variant value.
         :return: a created variant object.
         """
-        result = Variant()
-        result.as_boolean = value
-        return result
+        return Variant.from_type(VariantType.Boolean, value)
 
     @staticmethod
     def from_float(value: float):
@@ -405,9 +416,7 @@ class Variant:
         :param value: a variant value.
         :return: a created variant object.
         """
-        result = Variant()
-        result.as_float = value
-        return result
+        return Variant.from_type(VariantType.Float, value)
 
     @staticmethod
     def from_double(value: float):
@@ -417,9 +426,7 @@ class Variant:
         :param value: a variant value.
         :return: a created variant object.
         """
-        result = Variant()
-        result.as_double = value
-        return result
+        return Variant.from_type(VariantType.Double, value)
 
     @staticmethod
     def from_string(value: str):
@@ -429,9 +436,7 @@ class Variant:
         :param value: a variant value.
         :return: a created variant object.
         """
-        result = Variant()
-        result.as_string = value
-        return result
+        return Variant.from_type(VariantType.String, value)
 
     @staticmethod
     def from_datetime(value: datetime):
@@ -441,9 +446,7 @@ class Variant:
         :param value: a variant value.
         :return: a created variant object.
         """
-        result = Variant()
-        result.as_datetime = value
-        return result
+        return Variant.from_type(VariantType.DateTime, value)
 
     @staticmethod
     def from_time_span(value: int):
@@ -453,9 +456,7 @@ class Variant:
         :param value: a variant value.
         :return: a created variant object.
         """
-        result = Variant()
-        result.as_time_span = value
-        return result
+        return Variant.from_type(VariantType.TimeSpan, value)
 
     @staticmethod
     def from_object(value: Any):
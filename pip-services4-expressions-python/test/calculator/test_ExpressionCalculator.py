@@ -70,3 +70,95 @@ class TestExpressionCalculator:
         assert result is not None
         assert VariantType.Boolean == result.type
         assert result.as_boolean is True
+
+    def test_and_expression(self):
+        calculator = ExpressionCalculator()
+        calculator.expression = "TRUE AND FALSE"
+        result = calculator.evaluate()
+        assert VariantType.Boolean == result.type
+        assert result.as_boolean is False
+
+    def test_changed_result(self):
+        # Changing a result must not affect constants of other expressions
+        result = ExpressionCalculator('1').evaluate()
+        result.as_integer = 99
+        result = ExpressionCalculator('TRUE').evaluate()
+        result.as_boolean = False
+
+        assert 2 == ExpressionCalculator('1 + 1').evaluate().as_integer
+        assert ExpressionCalculator('TRUE').evaluate().as_boolean
+
+    def test_compiled_expression(self):
+        expressions = [
+            "2 + 2", "A + b / (3 - Max(-123, 1)*2)", "'abc'[1]", "1 > 2", "2 IN ARRAY(1,2,3)",
+            "5 NOT IN ARRAY(1,2,3)", "NOT (A > 1) OR b = 123", "-A * 2 % 5", "TRUE AND b > 100", "A IS NULL", "b IS NOT NULL"
+        ]
+
+        for expression in expressions:
+            calculator = ExpressionCalculator(expression)
+            if calculator.default_variables.find_by_name('a') is not None:
+                calculator.default_variables.find_by_name('a').value = Variant(3)
+            if calculator.default_variables.find_by_name('b') is not None:
+                calculator.default_variables.find_by_name('b').value = Variant(123)
+
+            expected = calculator.evaluate()
+            result = calculator.compile().evaluate(calculator.default_variables)
+            assert expected.type == result.type
+            assert expected.as_object == result.as_object
+
+    def test_evaluate_many(self):
+        calculator = ExpressionCalculator("A + b * 2")
+
+        expression = calculator.compile()
+        assert ['A', 'b'] == expression.variable_names
+
+        results = calculator.evaluate_many([{'a': 1, 'b': 2}, {'A': Variant(3), 'B': 4}])
+        assert 2 == len(results)
+        assert 5 == results[0].as_integer
+        assert 11 == results[1].as_integer
+
+        with pytest.raises(ExpressionException):
+            calculator.evaluate_many([{'a': 1}])
+
+        calculator.expression = "XXX(1)"
+        with pytest.raises(ExpressionException):
+            calculator.compile()
+
+    def test_evaluate_columns(self):
+        columns = {'a': [1, 5, 10], 'b': [4, 9, 16]}
+
+        calculator = ExpressionCalculator("(A > 1) AND NOT (B < 10)")
+        assert calculator.compile_columns().is_vectorized
+        assert [False, False, True] == list(calculator.evaluate_columns(columns))
+
+        calculator = ExpressionCalculator("If(A > 1, Sqrt(B), -1.5) + Max(A, B, 5) / 2")
+        assert [0.5, 7.0, 12.0] == list(calculator.evaluate_columns(columns))
+
+        calculator = ExpressionCalculator("a % 3 = 1")
+        assert [True, False, True] == list(calculator.evaluate_columns(columns))
+
+    def test_evaluate_columns_as_rows(self):
+        columns = {'a': [3, -5, 6, 10], 'b': [4, 2, 9, 16], 'x': [0.5, 1.5, -2.5, 4.0]}
+        rows = [{name: column[row] for (name, column) in columns.items()} for row in range(4)]
+
+        for expression in ["A * 1.5 > B", "Ceil(A / 4.0)", "Floor(-A / 2.0)", "Round(A / 2.0)",
+                           "A / 4", "A / 4.0", "(A - B) * 2 % 3", "Abs(A - B)", "Max(A, B) - Min(A, 5)",
+                           "X * 2 + 1", "X / 2 + A", "A + X", "A = 6.0", "Round(X * 3)", "Max(A, X)",
+                           "If(A > 5, X, 1)", "If(A > 5, A, B) / 2", "Sqrt(B) + A", "Pi() * A",
+                           "NOT (A > B)", "NOT (A > B) AND B > 3"]:
+            calculator = ExpressionCalculator(expression)
+            expected = [value.as_object for value in calculator.evaluate_many(rows)]
+            result = list(calculator.evaluate_columns(columns))
+            assert expected == result, expression
+            # Integer results stay integers
+            assert [type(value) for value in expected] == [type(value) for value in result], expression
+
+    def test_evaluate_columns_fallback(self):
+        calculator = ExpressionCalculator("A + 'x'")
+        assert calculator.compile_columns().is_vectorized is False
+        assert ['ax', 'bx'] == list(calculator.evaluate_columns({'a': ['a', 'b']}))
+
+        # Unsupported column types are evaluated row by row
+        calculator = ExpressionCalculator("A + 1")
+        assert calculator.compile_columns().is_vectorized
+        assert ['a1', 'b1'] == list(calculator.evaluate_columns({'a': ['a', 'b']}))
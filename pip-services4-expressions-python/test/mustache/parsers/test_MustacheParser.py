@@ -52,3 +52,15 @@ class TestMustacheParser:
         assert 2 == len(parser.variable_names)
         assert 'NAME' == parser.variable_names[0]
         assert "ESCLAMATION" == parser.variable_names[1]
+
+    def test_partials(self):
+        parser = MustacheParser()
+        parser.template = "{{> header}}Hello, {{NAME}}"
+
+        tokens = parser.result_tokens
+        assert 3 == len(tokens)
+        assert MustacheTokenType.Partial == tokens[0].type
+        assert "header" == tokens[0].value
+
+        assert 1 == len(parser.variable_names)
+        assert 'NAME' == parser.variable_names[0]
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+from pip_services4_expressions.mustache.MustacheException import MustacheException
 from pip_services4_expressions.mustache.MustacheTemplate import MustacheTemplate
+from pip_services4_expressions.mustache.MustacheTemplateRegistry import MustacheTemplateRegistry
 
 
 class TestMustacheTemplate:
@@ -20,3 +22,38 @@ class TestMustacheTemplate:
 
         result = template.evaluate()
         assert "Hello, Mike." == result
+
+    def test_compiled_template(self):
+        template = MustacheTemplate()
+        template.template = "Hello, {{{NAME}}}{{ #if ESCLAMATION }}!{{/if}}{{{^ESCLAMATION}}}.{{{/ESCLAMATION}}}"
+        compiled = template.compile()
+
+        variables = {'Name': 'Alex', 'esclamation': '1'}
+        assert "Hello, Alex!" == compiled.render(variables)
+        assert template.evaluate_tokens(template.result_tokens, variables) == compiled.render(variables)
+
+        assert "Hello, Mike." == compiled.render({'NAME': 'Mike'})
+        assert "Hello, a\\/b." == compiled.render({'NAME': 'a/b'})
+        assert "Hello, ." == compiled.render({})
+
+    def test_partials(self):
+        registry = MustacheTemplateRegistry()
+        registry.register("greeting", "Hello, {{name}}")
+        registry.register("Letter", "{{> greeting}}! Your order {{order}} is ready.")
+
+        assert "Hello, Alex! Your order 123 is ready." == registry.render("letter", {'NAME': 'Alex', 'ORDER': '123'})
+        assert registry.get("letter") is registry.get("LETTER")
+
+        template = MustacheTemplate("{{#if ORDER}}{{> letter}}{{/if}}")
+        template.partials = registry
+        assert "Hello, Mike! Your order 7 is ready." == template.evaluate_with_variables({'name': 'Mike', 'order': '7'})
+
+        registry.register("greeting", "Hi, {{name}}")
+        assert "Hi, Mike! Your order 7 is ready." == template.evaluate_with_variables({'name': 'Mike', 'order': '7'})
+
+        registry.unregister("greeting")
+        try:
+            template.evaluate_with_variables({'name': 'Mike', 'order': '7'})
+            assert False, 'Exception expected'
+        except MustacheException as err:
+            assert "PARTIAL_NOT_FOUND" == err.code
@@ -26,3 +26,22 @@ class TestTypeSafeVariantOperations:
         assert manager.in_(d, Variant("ccc")).as_boolean is True
         assert manager.in_(d, Variant("eee")).as_boolean is False
         assert "bbb" == manager.get_element(d, Variant(1)).as_string
+
+    def test_unsupported_operations(self):
+        manager = TypeSafeVariantOperations()
+
+        assert manager.add(Variant(None), Variant(1)).is_null()
+        assert manager.more(Variant(None), Variant(1)).as_boolean is False
+        assert manager.equal(Variant(None), Variant(None)).as_boolean is True
+
+        try:
+            manager.mul(Variant("aaa"), Variant("bbb"))
+            assert False, 'Exception expected'
+        except Exception as err:
+            assert "Operation '*' is not supported for type String" == str(err)
+
+        try:
+            manager.negative(Variant(True))
+            assert False, 'Exception expected'
+        except Exception as err:
+            assert "Operation '-' is not supported for type Boolean" == str(err)
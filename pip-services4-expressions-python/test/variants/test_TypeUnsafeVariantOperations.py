@@ -20,3 +20,5 @@ class TestTypeUnsafeVariantOperations:
         assert 125.0 == manager.add(b, c).as_float
         assert 121.0 == manager.sub(b, c).as_float
         assert manager.equal(a, b).as_boolean is True
+        assert manager.not_(Variant(True)).as_object is False
+        assert manager.not_(Variant(False)).as_object is True
@@ -16,3 +16,12 @@ class TestVariants:
         assert VariantType.String == b.type
         assert "xyz" == b.as_string
         assert "xyz" == b.as_object
+
+    def test_from_type(self):
+        a = Variant.from_type(VariantType.Long, 123)
+        assert VariantType.Long == a.type
+        assert 123 == a.as_long
+
+        b = a.clone()
+        assert VariantType.Long == b.type
+        assert 123 == b.as_long
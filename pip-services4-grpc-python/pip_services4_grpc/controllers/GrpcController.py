@@ -9,7 +9,7 @@ from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IUnreferenceable, IReferences, DependencyResolver
 from pip_services4_components.run import IOpenable
 from pip_services4_data.query import FilterParams, PagingParams
-from pip_services4_data.validate import Schema
+from pip_services4_data.validate import Schema, ValidationException
 from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
 from pip_services4_observability.trace import CompositeTracer
@@ -277,10 +277,13 @@ class GrpcController(IOpenable, IConfigurable, IReferenceable, IUnreferenceable,
 
     def _apply_validation(self, schema: Schema, action: Callable[[InvokeRequest, ServicerContext], Any]) -> Callable[
         [InvokeRequest, ServicerContext], Any]:
+        # Compile the schema once instead of interpreting it on every request
+        validate = schema.compile() if schema else None
+
         # Create an action function
         def action_wrapper(request: InvokeRequest, context: ServicerContext):
             # Validate object
-            if schema and request:
+            if validate is not None and request:
                 value = request
                 if hasattr(value, 'to_object') and callable(value.to_object):
                     value = value.to_object()
@@ -299,7 +302,7 @@ class GrpcController(IOpenable, IConfigurable, IReferenceable, IUnreferenceable,
 
                 # Perform validation
                 trace_id = value.trace_id
-                schema.validate_and_throw_exception(trace_id, validate_object or value, False)
+                ValidationException.throw_exception_if_needed(trace_id, validate(validate_object or value), False)
 
             return action(request, context)
 
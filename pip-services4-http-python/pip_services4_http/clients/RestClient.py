@@ -8,7 +8,7 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Optional, Any
+from typing import Optional, Any, List
 
 import requests
 from pip_services4_commons.errors import UnknownException, InvocationException, ErrorDescription, \
@@ -18,6 +18,7 @@ from pip_services4_components.config import IConfigurable, ConfigParams
 from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IReferences
 from pip_services4_components.run import IOpenable
+from pip_services4_config.connect import ConnectionBalancer
 from pip_services4_data.query import PagingParams
 from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
@@ -43,6 +44,10 @@ class RestClient(IOpenable, IConfigurable, IReferenceable):
             - retries:               number of retries (default: 3)
             - connect_timeout:       connection timeout in milliseconds (default: 10 sec)
             - timeout:               invocation timeout in milliseconds (default: 10 sec)
+        - balancing:                 (optional) spreads calls across all configured connections
+            - strategy:              balancing strategy: round_robin, least_requests or power_of_two
+            - max_failures:          number of consecutive failures to eject a connection (default: 3)
+            - ejection_timeout:      time in milliseconds an ejected connection is not used (default: 30 sec)
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages
@@ -89,7 +94,10 @@ class RestClient(IOpenable, IConfigurable, IReferenceable):
         # The HTTP client.
         self._client: Any = None
         # The remote service uri which is calculated on open.
+        # With balancing it is the uri of the first connection.
         self._uri: str = None
+        # The uris of all connections calls are balanced across.
+        self._uris: List[str] = []
         # The invocation timeout in milliseconds.
         self._timeout = 1000
         # The connection resolver.
@@ -110,6 +118,8 @@ class RestClient(IOpenable, IConfigurable, IReferenceable):
         self._headers: dict = {}
         # The connection timeout in milliseconds.
         self._connect_timeout = 1000
+        # The balancer of calls across connections. None when balancing is not configured.
+        self._balancer: Optional[ConnectionBalancer] = None
 
         self._trace_id_location: str = "query"
 
@@ -138,6 +148,10 @@ class RestClient(IOpenable, IConfigurable, IReferenceable):
         self._connect_timeout = config.get_as_integer_with_default("options.connect_timeout", self._connect_timeout)
         self._timeout = config.get_as_integer_with_default("options.timeout", self._timeout)
 
+        balancing = config.get_section("balancing")
+        if balancing.get_as_nullable_string("strategy") is not None:
+            self._balancer = ConnectionBalancer()
+            self._balancer.configure(balancing)
         self._base_route = config.get_as_string_with_default("base_route", self._base_route)
         self._trace_id_location = config.get_as_string_with_default("options.trace_id_place",
                                                                     self._trace_id_location)
@@ -195,13 +209,18 @@ class RestClient(IOpenable, IConfigurable, IReferenceable):
         if self.is_open():
             return
 
-        connection = self._connection_resolver.resolve(context)
-
-        self._uri = connection.get_as_string('uri')
+        if self._balancer is not None:
+            connections = self._connection_resolver.resolve_many(context)
+            self._balancer.set_connections(connections)
+            self._uris = [connection.get_as_string('uri') for connection in connections]
+        else:
+            connection = self._connection_resolver.resolve(context)
+            self._uris = [connection.get_as_string('uri')]
+        self._uri = self._uris[0]
 
         self._client = requests
 
-        self._logger.debug(context, "Connected via REST to " + self._uri)
+        self._logger.debug(context, "Connected via REST to " + ", ".join(self._uris))
 
     def close(self, context: Optional[IContext]):
         """
@@ -210,10 +229,11 @@ class RestClient(IOpenable, IConfigurable, IReferenceable):
         :param context: (optional) transaction id to trace execution through call chain.
         """
         if self._client is not None:
-            self._logger.debug(context, "Disconnected from " + self._uri)
+            self._logger.debug(context, "Disconnected from " + ", ".join(self._uris))
 
         self._client = None
         self._uri = None
+        self._uris = []
 
     def _to_json(self, obj):
         if obj is None:
@@ -249,10 +269,10 @@ class RestClient(IOpenable, IConfigurable, IReferenceable):
 
         return ''
 
-    def __create_request_route(self, route: str) -> str:
+    def __create_request_route(self, route: str, uri: Optional[str]) -> str:
         builder = ''
-        if self._uri is not None and len(self._uri) > 0:
-            builder = self._uri
+        if uri is not None and len(uri) > 0:
+            builder = uri
 
             builder += self.fix_route(self._base_route)
 
@@ -338,30 +358,44 @@ class RestClient(IOpenable, IConfigurable, IReferenceable):
             raise UnknownException(context, 'UNSUPPORTED_METHOD',
                                    'Method is not supported by REST client').with_details('verb', method)
 
-        route = self.__create_request_route(route)
-        trace_id = ContextResolver.get_trace_id(context)
-        params = self.add_trace_id(params=params, trace_id=trace_id)
         response = None
         result = None
-
-        if self._trace_id_location == 'query' or self._trace_id_location == 'both':
-            params = self.add_trace_id(params, trace_id)
-
-        if self._trace_id_location == 'headers' or self._trace_id_location == 'both':
-            self._headers['trace_id'] = trace_id
+        connection = None
+        succeeded = False
 
         try:
-            # Call the service
-            data = data if isinstance(data, str) else self._to_json(data)
-            response = requests.request(method, route,
-                                        headers=self._headers,
-                                        json=data,
-                                        params=params,
-                                        timeout=self._timeout)
-
-        except Exception as ex:
-            error = InvocationException(context, 'REST_ERROR', 'REST operation failed: ' + str(ex)).wrap(ex)
-            raise error
+            # The acquired connection is released whatever fails below
+            connection = self._balancer.acquire() if self._balancer is not None else None
+            uri = connection.get_as_string('uri') if connection is not None else self._uri
+
+            route = self.__create_request_route(route, uri)
+            trace_id = ContextResolver.get_trace_id(context)
+            params = self.add_trace_id(params=params, trace_id=trace_id)
+
+            if self._trace_id_location == 'query' or self._trace_id_location == 'both':
+                params = self.add_trace_id(params, trace_id)
+
+            if self._trace_id_location == 'headers' or self._trace_id_location == 'both':
+                self._headers['trace_id'] = trace_id
+
+            try:
+                # Call the service
+                data = data if isinstance(data, str) else self._to_json(data)
+                response = requests.request(method, route,
+                                            headers=self._headers,
+                                            json=data,
+                                            params=params,
+                                            timeout=self._timeout)
+
+            except Exception as ex:
+                error = InvocationException(context, 'REST_ERROR', 'REST operation failed: ' + str(ex)).wrap(ex)
+                raise error
+
+            # Server errors count as connection failures
+            succeeded = response.status_code < 500
+        finally:
+            if connection is not None:
+                self._balancer.release(connection, succeeded)
 
         if response.status_code == 204:
             return None
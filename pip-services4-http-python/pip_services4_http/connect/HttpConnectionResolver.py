@@ -186,6 +186,29 @@ class HttpConnectionResolver(IReferenceable, IConfigurable):
 
         return self.__compose_connection(connections, credential)
 
+    def resolve_many(self, context: Optional[IContext]) -> List[ConfigParams]:
+        """
+        Resolves all component connections and composes each of them separately,
+        unlike :func:`resolve_all` that merges them into a single connection.
+        It is used to balance calls across several connections.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :return: a list of resolved connections.
+        """
+        connections = self._connection_resolver.resolve_all(context) or []
+        credential = self._credential_resolver.lookup(context)
+
+        if len(connections) == 0:
+            self.__validate_connection(context, None, credential)
+
+        result = []
+        for connection in connections:
+            self.__validate_connection(context, connection, credential)
+            result.append(self.__compose_connection([connection], credential))
+
+        return result
+
     def register(self, context: Optional[IContext]):
         """
         Registers the given connection in all referenced discovery controller. This method can be used for dynamic service discovery.
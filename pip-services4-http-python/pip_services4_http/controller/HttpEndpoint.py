@@ -23,7 +23,7 @@ from pip_services4_components.config import IConfigurable, ConfigParams
 from pip_services4_components.context import IContext
 from pip_services4_components.refer import IReferenceable, IReferences
 from pip_services4_components.run import IOpenable
-from pip_services4_data.validate import Schema
+from pip_services4_data.validate import Schema, ValidationException
 from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
 
@@ -297,13 +297,16 @@ class HttpEndpoint(IOpenable, IConfigurable, IReferenceable):
 
         route = self.__fix_route(route)
 
+        # Compile the schema once instead of interpreting it on every request
+        validate = schema.compile() if isinstance(schema, Schema) else None
+
         def wrapper(*args, **kwargs):
             try:
-                if isinstance(schema, Schema):
+                if validate is not None:
                     params = self.__get_data() or {}
                     params.update(kwargs)
                     trace_id = None if not params else params.get('trace_id')
-                    schema.validate_and_throw_exception(trace_id, params, False)
+                    ValidationException.throw_exception_if_needed(trace_id, validate(params), False)
 
                 return handler(*args, **kwargs)
             except Exception as ex:
@@ -6,6 +6,7 @@
     :copyright: (c) Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
+from pip_services4_commons.errors import InvocationException
 from pip_services4_components.config import ConfigParams
 from pip_services4_components.refer import References, Descriptor
 
@@ -60,3 +61,38 @@ class TestDummyRestClient:
 
     def test_crud_operations(self):
         self.fixture.test_crud_operations()
+
+    def test_balancing(self):
+        client = DummyRestClient()
+        client.configure(ConfigParams.from_tuples(
+            "connections.1.protocol", "http",
+            "connections.1.host", "localhost",
+            "connections.1.port", 3000,
+            # Nothing listens on this port
+            "connections.2.protocol", "http",
+            "connections.2.host", "localhost",
+            "connections.2.port", 3099,
+            "balancing.strategy", "round_robin",
+            "balancing.max_failures", 1
+        ))
+        client.set_references(References())
+        client.open(None)
+
+        try:
+            assert "http://localhost:3000" == client._uri
+            assert ["http://localhost:3000", "http://localhost:3099"] == client._uris
+
+            # The broken connection fails once and is ejected after that
+            failures = 0
+            for _ in range(4):
+                try:
+                    client.get_page_by_filter(None, None, None)
+                except InvocationException:
+                    failures += 1
+            assert 1 == failures
+
+            # Connections are released after failed calls as well
+            for connection in client._balancer.get_connections():
+                assert 0 == client._balancer.get_outstanding(connection)
+        finally:
+            client.close(None)
@@ -13,6 +13,7 @@ from pip_services4_components.refer import Descriptor
 
 from .MemoryCache import MemoryCache
 from .NullCache import NullCache
+from .TieredCache import TieredCache
 
 
 class DefaultCacheFactory(Factory):
@@ -22,11 +23,13 @@ class DefaultCacheFactory(Factory):
     See :class:`Factory <pip_services4_logic.build.Factory.Factory>`,
     :class:`ICache <pip_services4_logic.cache.ICache.ICache>`,
     :class:`MemoryCache <pip_services4_logic.cache.MemoryCache.MemoryCache>`,
-    :class:`NullCache <pip_services4_logic.cache.NullCache.NullCache>`
+    :class:`NullCache <pip_services4_logic.cache.NullCache.NullCache>`,
+    :class:`TieredCache <pip_services4_logic.cache.TieredCache.TieredCache>`
     """
 
     NullCacheDescriptor = Descriptor("pip-services", "cache", "null", "*", "1.0")
     MemoryCacheDescriptor = Descriptor("pip-services", "cache", "memory", "*", "1.0")
+    TieredCacheDescriptor = Descriptor("pip-services", "cache", "tiered", "*", "1.0")
     descriptor = Descriptor("pip-services", "factory", "cache", "default", "1.0")
 
     def __init__(self):
@@ -36,3 +39,4 @@ class DefaultCacheFactory(Factory):
         super().__init__()
         self.register_as_type(DefaultCacheFactory.NullCacheDescriptor, NullCache)
         self.register_as_type(DefaultCacheFactory.MemoryCacheDescriptor, MemoryCache)
+        self.register_as_type(DefaultCacheFactory.TieredCacheDescriptor, TieredCache)
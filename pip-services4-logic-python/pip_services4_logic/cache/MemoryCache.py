@@ -10,6 +10,7 @@
 """
 
 import threading
+from collections import OrderedDict
 from typing import Any, Optional
 
 from pip_services4_components.config import IReconfigurable
@@ -25,6 +26,8 @@ class MemoryCache(ICache, IReconfigurable, ICleanable):
     """
     Cache that stores values in the process memory.
 
+    When the cache is full, the least recently used values are removed.
+
     Remember: This implementation is not suitable for synchronization of distributed processes.
 
     ### Configuration parameters ###
@@ -47,7 +50,8 @@ class MemoryCache(ICache, IReconfigurable, ICleanable):
         """
         Creates a new instance of the cache.
         """
-        self.__cache: dict = {}
+        # Entries in the order of use, the least recently used is the first
+        self.__cache: OrderedDict = OrderedDict()
         self.__count: int = 0
         self.__max_size: int = self.__default_max_size
         self.__timeout: int = self.__default_timeout
@@ -63,23 +67,9 @@ class MemoryCache(ICache, IReconfigurable, ICleanable):
         self.__max_size = config.get_as_long_with_default("options.max_size", self.__default_max_size)
 
     def __cleanup(self):
-        oldest = None
-        self.__count = 0
-
-        # Cleanup obsolete entries and find the oldest
-        for (key, entry) in self.__cache.items():
-            # Remove obsolete entry
-            if entry.is_expired():
-                self.__cache.pop(key, None)
-            # Count the remaining entry 
-            else:
-                self.__count += 1
-                if oldest is None or oldest.expiration > entry.expiration:
-                    oldest = entry
-
-        # Remove the oldest if cache size exceeded maximum
-        if self.__count > self.__max_size and not (oldest is None):
-            self.__cache.pop(oldest.key, None)
+        # Remove the least recently used entries if cache size exceeded maximum
+        while self.__count > self.__max_size:
+            self.__cache.popitem(last=False)
             self.__count -= 1
 
     def retrieve(self, context: Optional[IContext], key: str) -> Any:
@@ -108,7 +98,8 @@ class MemoryCache(ICache, IReconfigurable, ICleanable):
                 self.__count -= 1
                 return None
 
-            # Update access timeout
+            # Mark the entry as recently used
+            self.__cache.move_to_end(key)
             return entry.get_value()
         finally:
             self.__lock.release()
@@ -145,6 +136,7 @@ class MemoryCache(ICache, IReconfigurable, ICleanable):
             # Update the entry
             if not (entry is None):
                 entry.set_value(value, timeout)
+                self.__cache.move_to_end(key)
             # Or create a new entry 
             else:
                 entry = CacheEntry(key, value, timeout)
@@ -186,6 +178,7 @@ class MemoryCache(ICache, IReconfigurable, ICleanable):
         """
         self.__lock.acquire()
         try:
-            self.__cache = {}
+            self.__cache = OrderedDict()
+            self.__count = 0
         finally:
             self.__lock.release()
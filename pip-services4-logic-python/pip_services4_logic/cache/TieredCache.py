@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_logic.cache.TieredCache
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Two-tier cache component implementation
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import threading
+import uuid
+from typing import Any, Optional
+
+from pip_services4_components.config import ConfigParams, IReconfigurable
+from pip_services4_components.context import IContext
+from pip_services4_components.refer import DependencyResolver, IReferenceable, IReferences, IUnreferenceable
+from pip_services4_components.run import ICleanable, IOpenable
+from pip_services4_messaging.queues import IMessageQueue, IMessageReceiver, MessageEnvelope
+from pip_services4_observability.count import CompositeCounters
+
+from .ICache import ICache
+from .MemoryCache import MemoryCache
+
+
+class TieredCache(ICache, IMessageReceiver, IReconfigurable, IReferenceable, IUnreferenceable,
+                  IOpenable, ICleanable):
+    """
+    Cache that keeps recently used values in a local :class:`MemoryCache <pip_services4_logic.cache.MemoryCache.MemoryCache>`
+    in front of a remote cache, like Redis or Memcached.
+
+    Values found in the local cache are returned without a network round trip.
+    Values are written to both caches. Local values expire after a short timeout,
+    so changes made by other processes are seen after that timeout at the latest.
+    To see them sooner, caches can broadcast invalidations through a message queue
+    that delivers each message to all subscribers, like a MQTT topic.
+    Each cache removes changed keys from its local cache when it receives such messages.
+
+    Hits are sent to counters:
+        - <name>.local_hits:   number of values found in the local cache
+        - <name>.remote_hits:  number of values found in the remote cache
+        - <name>.misses:       number of values found in neither cache
+
+    ### Configuration parameters ###
+    options:
+        - name:                  prefix of counter names (default: tiered_cache)
+        - local_timeout:         caching timeout of the local cache in milliseconds (default: 5000)
+        - local_max_size:        maximum number of values stored in the local cache (default: 1000)
+        - remote_timeout:        caching timeout of the remote cache in milliseconds, 0 to use the timeout passed to store (default: 0)
+
+    ### References ###
+        - `*:cache:*:*:1.0`      :class:`ICache <pip_services4_logic.cache.ICache.ICache>` remote cache, set **dependencies.cache** to choose a specific one
+        - `*:queue:*:*:1.0`      (optional) :class:`IMessageQueue <pip_services4_messaging.queues.IMessageQueue.IMessageQueue>` to broadcast invalidations, set **dependencies.queue** to enable it
+        - `*:counters:*:*:1.0`   (optional) :class:`ICounters <pip_services4_observability.count.ICounters.ICounters>` components to pass collected measurements
+
+    Example:
+
+    .. code-block:: python
+
+        cache = TieredCache()
+        cache.configure(ConfigParams.from_tuples(
+            "options.local_timeout", 1000,
+            "dependencies.cache", "*:cache:redis:*:1.0"
+        ))
+        cache.set_references(References.from_tuples(
+            Descriptor("pip-services", "cache", "redis", "default", "1.0"), redis_cache
+        ))
+
+        cache.store(Context.from_trace_id("123"), "key1", "ABC", 60000)
+        cache.retrieve(Context.from_trace_id("123"), "key1")      # Result: "ABC" from the local cache
+    """
+
+    __default_config = ConfigParams.from_tuples(
+        "dependencies.cache", "*:cache:*:*:1.0"
+    )
+
+    __default_local_timeout: int = 5000
+    __default_local_max_size: int = 1000
+
+    # Type of messages with invalidated keys
+    InvalidateMessageType = "invalidate"
+
+    def __init__(self):
+        """
+        Creates a new instance of the cache.
+        """
+        self.__dependency_resolver: DependencyResolver = DependencyResolver(self.__default_config)
+        self.__counters: CompositeCounters = CompositeCounters()
+        self.__local: MemoryCache = MemoryCache()
+        self.__remote: ICache = None
+        self.__queue: IMessageQueue = None
+        self.__opened: bool = False
+        # Distinguishes own invalidations from invalidations of other caches
+        self.__source: str = uuid.uuid4().hex
+
+        self.__name: str = 'tiered_cache'
+        self.__local_timeout: int = self.__default_local_timeout
+        self.__remote_timeout: int = 0
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__local_hits: int = 0
+        self.__remote_hits: int = 0
+        self.__misses: int = 0
+
+    def configure(self, config: ConfigParams):
+        """
+        Configures component by passing configuration parameters.
+
+        :param config: configuration parameters to be set.
+        """
+        config = config.set_defaults(self.__default_config)
+        self.__dependency_resolver.configure(config)
+
+        self.__name = config.get_as_string_with_default("options.name", self.__name)
+        self.__local_timeout = config.get_as_integer_with_default("options.local_timeout",
+                                                                  self.__default_local_timeout)
+        self.__remote_timeout = config.get_as_integer_with_default("options.remote_timeout", 0)
+
+        self.__local.configure(ConfigParams.from_tuples(
+            "options.timeout", self.__local_timeout,
+            "options.max_size", config.get_as_integer_with_default("options.local_max_size",
+                                                                   self.__default_local_max_size)
+        ))
+
+    def set_references(self, references: IReferences):
+        """
+        Sets references to dependent components.
+
+        :param references: references to locate the component dependencies.
+        """
+        self.__counters.set_references(references)
+        self.__dependency_resolver.set_references(references)
+
+        # Take the first cache that is not this one
+        self.__remote = None
+        for cache in self.__dependency_resolver.get_optional('cache') or []:
+            if cache is not self:
+                self.__remote = cache
+                break
+
+        self.__queue = self.__dependency_resolver.get_one_optional('queue')
+
+    def unset_references(self):
+        """
+        Unsets (clears) previously set references to dependent components.
+        """
+        self.__remote = None
+        self.__queue = None
+
+    def is_open(self) -> bool:
+        """
+        Checks if the component is opened.
+
+        :return: true if the component has been opened and false otherwise.
+        """
+        return self.__opened
+
+    def open(self, context: Optional[IContext]):
+        """
+        Opens the component and starts listening for invalidations.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        """
+        if self.__opened:
+            return
+
+        if self.__queue is not None:
+            self.__queue.begin_listen(context, self)
+
+        self.__opened = True
+
+    def close(self, context: Optional[IContext]):
+        """
+        Closes component and stops listening for invalidations.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        """
+        if not self.__opened:
+            return
+
+        if self.__queue is not None:
+            self.__queue.end_listen(context)
+
+        self.__opened = False
+
+    def get_local_hits(self) -> int:
+        """
+        Gets the number of values found in the local cache.
+
+        :return: the number of local hits.
+        """
+        return self.__local_hits
+
+    def get_remote_hits(self) -> int:
+        """
+        Gets the number of values found in the remote cache.
+
+        :return: the number of remote hits.
+        """
+        return self.__remote_hits
+
+    def get_misses(self) -> int:
+        """
+        Gets the number of values found in neither cache.
+
+        :return: the number of misses.
+        """
+        return self.__misses
+
+    def __count(self, name: str):
+        self.__counters.increment_one(self.__name + '.' + name)
+
+    def retrieve(self, context: Optional[IContext], key: str) -> Any:
+        """
+        Retrieves cached value from the local cache or, if it is missing there, from the remote cache.
+        If value is missing in both caches or expired it returns None.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param key: a unique value key.
+
+        :return: a cached value or None if value wasn't found or timeout expired.
+        """
+        value = self.__local.retrieve(context, key)
+        if value is not None:
+            with self.__lock:
+                self.__local_hits += 1
+            self.__count('local_hits')
+            return value
+
+        value = self.__remote.retrieve(context, key) if self.__remote is not None else None
+        if value is not None:
+            self.__local.store(context, key, value, self.__local_timeout)
+            with self.__lock:
+                self.__remote_hits += 1
+            self.__count('remote_hits')
+        else:
+            with self.__lock:
+                self.__misses += 1
+            self.__count('misses')
+
+        return value
+
+    def store(self, context: Optional[IContext], key: str, value: Any, timeout: int) -> Any:
+        """
+        Stores value in both caches with expiration time.
+        Local value never outlives the remote one.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param key: a unique value key.
+
+        :param value: a value to store.
+
+        :param timeout: expiration timeout in milliseconds.
+
+        :return: a cached value stored in the cache.
+        """
+        if self.__remote is not None:
+            remote_timeout = self.__remote_timeout if self.__remote_timeout > 0 else timeout
+            self.__remote.store(context, key, value, remote_timeout)
+
+        local_timeout = min(self.__local_timeout, timeout) if timeout > 0 else self.__local_timeout
+        self.__local.store(context, key, value, local_timeout)
+
+        self.__invalidate_others(context, key)
+        return value
+
+    def remove(self, context: Optional[IContext], key: str):
+        """
+        Removes a value from both caches by its key.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param key: a unique value key.
+        """
+        if self.__remote is not None:
+            self.__remote.remove(context, key)
+
+        self.__local.remove(context, key)
+
+        self.__invalidate_others(context, key)
+
+    def invalidate(self, context: Optional[IContext], key: str):
+        """
+        Removes a value from the local cache only, so the next read takes it from the remote cache.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param key: a unique value key.
+        """
+        self.__local.remove(context, key)
+
+    def __invalidate_others(self, context: Optional[IContext], key: str):
+        if self.__queue is not None:
+            self.__queue.send_as_object(context, TieredCache.InvalidateMessageType,
+                                        {'key': key, 'source': self.__source})
+
+    def receive_message(self, message: MessageEnvelope, queue: IMessageQueue):
+        """
+        Receives invalidations from other caches and removes changed values from the local cache.
+
+        :param message: an incoming message
+        :param queue: a queue where the message comes from
+        """
+        if message.message_type == TieredCache.InvalidateMessageType:
+            data = message.get_message_as() or {}
+            if data.get('source') != self.__source:
+                self.invalidate(None, data.get('key'))
+
+        queue.complete(message)
+
+    def clear(self, context: Optional[IContext]):
+        """
+        Clears the local cache.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        """
+        self.__local.clear(context)
@@ -12,7 +12,7 @@
 
 __all__ = [
     'ICache', 'CacheEntry', 'NullCache',
-    'MemoryCache', 'DefaultCacheFactory'
+    'MemoryCache', 'TieredCache', 'DefaultCacheFactory'
 ]
 
 from .CacheEntry import CacheEntry
@@ -20,3 +20,4 @@ from .DefaultCacheFactory import DefaultCacheFactory
 from .ICache import ICache
 from .MemoryCache import MemoryCache
 from .NullCache import NullCache
+from .TieredCache import TieredCache
@@ -38,6 +38,8 @@ setup(
     install_requires=[
         'pip_services4_commons >= 0.0.1, < 1.0',
         'pip_services4_components >= 0.0.2, < 1.0',
+        'pip_services4_messaging >= 0.0.1, < 1.0',
+        'pip_services4_observability >= 0.0.1, < 1.0',
     ],
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -29,3 +29,15 @@ class TestMemoryCache:
 
     def test_read_after_timeout(self):
         self.fixture.test_read_after_timeout(1000)
+
+    def test_remove_least_recently_used(self):
+        self.cache.configure(ConfigParams.from_tuples("options.max_size", 2))
+
+        self.cache.store(None, "key1", 1, 0)
+        self.cache.store(None, "key2", 2, 0)
+        assert 1 == self.cache.retrieve(None, "key1")
+
+        self.cache.store(None, "key3", 3, 0)
+        assert 1 == self.cache.retrieve(None, "key1")
+        assert self.cache.retrieve(None, "key2") is None
+        assert 3 == self.cache.retrieve(None, "key3")
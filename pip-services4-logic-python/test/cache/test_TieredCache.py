@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.cache.test_TieredCache
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: (c) Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+from pip_services4_components.config import ConfigParams
+from pip_services4_components.refer import Descriptor, References
+from pip_services4_messaging.queues import MemoryMessageQueue
+
+from pip_services4_logic.cache import MemoryCache, TieredCache
+from .CacheFixture import CacheFixture
+
+
+class RemoteCache(MemoryCache):
+
+    def __init__(self):
+        super().__init__()
+        self.retrieves = 0
+
+    def retrieve(self, context, key):
+        self.retrieves += 1
+        return super().retrieve(context, key)
+
+
+class TestTieredCache:
+    remote = None
+    queue = None
+    cache = None
+    fixture = None
+
+    def setup_method(self, method):
+        self.remote = RemoteCache()
+        self.queue = MemoryMessageQueue()
+        self.cache = self.__create_cache()
+        self.fixture = CacheFixture(self.cache)
+
+    def __create_cache(self) -> TieredCache:
+        cache = TieredCache()
+        cache.configure(ConfigParams.from_tuples(
+            "options.local_timeout", 500,
+            "dependencies.queue", "*:queue:*:*:1.0"
+        ))
+        cache.set_references(References.from_tuples(
+            Descriptor("pip-services", "cache", "tiered", "default", "1.0"), cache,
+            Descriptor("pip-services", "cache", "memory", "default", "1.0"), self.remote,
+            Descriptor("pip-services", "queue", "memory", "default", "1.0"), self.queue
+        ))
+        return cache
+
+    def test_basic_operations(self):
+        self.fixture.test_basic_operations()
+
+    def test_read_after_timeout(self):
+        self.fixture.test_read_after_timeout(1000)
+
+    def test_local_and_remote_hits(self):
+        self.cache.store(None, "key1", "ABC", 60000)
+
+        assert "ABC" == self.cache.retrieve(None, "key1")
+        assert "ABC" == self.cache.retrieve(None, "key1")
+        assert 0 == self.remote.retrieves
+        assert 2 == self.cache.get_local_hits()
+
+        # Values missing in the local cache are taken from the remote one
+        self.cache.invalidate(None, "key1")
+        assert "ABC" == self.cache.retrieve(None, "key1")
+        assert "ABC" == self.cache.retrieve(None, "key1")
+        assert 1 == self.remote.retrieves
+        assert 1 == self.cache.get_remote_hits()
+
+        assert self.cache.retrieve(None, "key2") is None
+        assert 1 == self.cache.get_misses()
+
+    def test_invalidate_other_caches(self):
+        other = self.__create_cache()
+        other.store(None, "key1", "ABC", 60000)
+        self.queue.clear(None)
+
+        # Other cache keeps the old value until it receives the invalidation
+        self.cache.store(None, "key1", "XYZ", 60000)
+        assert "ABC" == other.retrieve(None, "key1")
+
+        message = self.queue.receive(None, 0)
+        assert TieredCache.InvalidateMessageType == message.message_type
+
+        # The cache ignores own invalidations
+        self.cache.receive_message(message, self.queue)
+        assert 0 == self.remote.retrieves
+
+        other.receive_message(message, self.queue)
+        assert "XYZ" == other.retrieve(None, "key1")
+        assert 1 == self.remote.retrieves
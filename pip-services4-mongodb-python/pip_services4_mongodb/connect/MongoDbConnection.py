@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional, Iterator
 
 import pymongo
 from pip_services4_commons.errors import ConnectionException
@@ -10,6 +12,7 @@ from pip_services4_components.run import IOpenable
 from pip_services4_observability.log import CompositeLogger
 
 from pymongo import database
+from pymongo.client_session import ClientSession
 
 from pip_services4_mongodb.connect.MongoDbConnectionResolver import MongoDbConnectionResolver
 
@@ -73,6 +76,8 @@ class MongoDbConnection(IReferenceable, IConfigurable, IOpenable):
         self._database_name: str = None
         # The MongoDb database object.
         self._db: database.Database = None
+        # The session of a transaction bound to the current execution context.
+        self.__session: ContextVar = ContextVar('mongodb.session', default=None)
 
     def configure(self, config: ConfigParams):
         """
@@ -193,3 +198,33 @@ class MongoDbConnection(IReferenceable, IConfigurable, IOpenable):
 
     def get_database_name(self) -> str:
         return self._database_name
+
+    def get_session(self) -> Optional[ClientSession]:
+        """
+        Gets a session of a transaction started in the current execution context.
+
+        :return: a session of the current transaction or None if there is no transaction.
+        """
+        return self.__session.get()
+
+    @contextmanager
+    def transaction(self) -> Iterator[ClientSession]:
+        """
+        Starts a session with a transaction and binds it to the current thread or asyncio task until the block ends.
+        The transaction is committed when the block succeeds and aborted when it raises an error.
+        A nested call joins the outer transaction. Transactions require a replica set or a sharded cluster.
+
+        :return: a session of the transaction.
+        """
+        session = self.__session.get()
+        if session is not None:
+            yield session
+            return
+
+        with self._connection.start_session() as session:
+            with session.start_transaction():
+                token = self.__session.set(session)
+                try:
+                    yield session
+                finally:
+                    self.__session.reset(token)
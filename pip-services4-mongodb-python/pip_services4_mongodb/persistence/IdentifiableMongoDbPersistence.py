@@ -9,13 +9,15 @@
     :license: MIT, see LICENSE for more details.
 """
 from copy import deepcopy
-from typing import Any, Optional, List, TypeVar
+from typing import Any, Callable, Optional, List, TypeVar
 
 import pymongo
 from pip_services4_commons.data import AnyValueMap
+from pip_services4_components.config import ConfigParams
 from pip_services4_components.context import IContext
 from pip_services4_data.data import IIdentifiable
 from pip_services4_data.keys import IdGenerator
+from pymongo import ReplaceOne
 
 from .MongoDbPersistence import MongoDbPersistence
 
@@ -59,6 +61,10 @@ class IdentifiableMongoDbPersistence(MongoDbPersistence):
             - ssl:                       (optional) enable SSL connection (default: false)
             - auth_source:               (optional) authentication source
             - debug:                     (optional) enable debug output (default: false).
+            - write_concern:             (optional) number of nodes that acknowledge writes or "majority", 0 for unacknowledged writes (default: server default)
+            - write_journal:             (optional) wait until writes are written to the journal (default: server default)
+            - write_timeout:             (optional) time in milliseconds to wait for write acknowledgement (default: server default)
+            - id_generator:              (optional) id generator mode: random, ordered or sequence (default: random)
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
@@ -100,6 +106,20 @@ class IdentifiableMongoDbPersistence(MongoDbPersistence):
         # Flag to turn on automated string ID generation
         self._auto_generate_id: bool = True
 
+        # Function to generate ids of new objects
+        self._id_generator: Callable[[], str] = IdGenerator.next_long
+
+    def configure(self, config: ConfigParams):
+        """
+        Configures component by passing configuration parameters.
+
+        :param config: configuration parameters to be set.
+        """
+        super().configure(config)
+
+        self._id_generator = IdGenerator.get_generator(
+            config.get_as_string_with_default("options.id_generator", IdGenerator.Random))
+
     def _convert_from_public_partial(self, value: Any) -> Any:
         """
         Converts the given object from the public partial format.
@@ -132,7 +152,7 @@ class IdentifiableMongoDbPersistence(MongoDbPersistence):
 
         :return: data item by id.
         """
-        item = self._collection.find_one({'_id': id})
+        item = self._collection.find_one({'_id': id}, session=self._get_session())
         if item:
             self._logger.trace(context, "Nothing found from %s with id = %s", self._collection_name, id)
         else:
@@ -159,10 +179,69 @@ class IdentifiableMongoDbPersistence(MongoDbPersistence):
 
         # Replace _id or generate a new one
         if new_item.get('_id') is None and self._auto_generate_id:
-            new_item['_id'] = IdGenerator.next_long()
+            new_item['_id'] = self._id_generator()
 
         return super().create(context, new_item)
 
+    def create_many(self, context: Optional[IContext], items: List[T], ordered: bool = True) -> List[T]:
+        """
+        Creates multiple data items in one batch.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param items: items to be created.
+
+        :param ordered: (optional) true to insert items one by one and stop on the first error,
+                        false to insert all items in any order and report errors at the end. Default: true
+
+        :return: created items
+        """
+        new_items = []
+        for item in items or []:
+            if item is None:
+                continue
+
+            new_item = self._convert_from_public(item)
+
+            # Replace _id or generate a new one
+            if new_item.get('_id') is None and self._auto_generate_id:
+                new_item['_id'] = self._id_generator()
+
+            new_items.append(new_item)
+
+        return super().create_many(context, new_items, ordered)
+
+    def set_many(self, context: Optional[IContext], items: List[T], ordered: bool = True) -> List[T]:
+        """
+        Sets multiple data items in one batch. Existing items are replaced, missing items are created.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param items: items to be set.
+
+        :param ordered: (optional) true to write items one by one and stop on the first error,
+                        false to write all items in any order and report errors at the end. Default: true
+
+        :return: set items
+        """
+        new_items = []
+        for item in items or []:
+            if item is None:
+                continue
+
+            new_item = self._convert_from_public(item)
+
+            # Replace _id or generate a new one
+            if new_item.get('_id') is None and self._auto_generate_id:
+                new_item['_id'] = self._id_generator()
+
+            new_items.append(new_item)
+
+        requests = [ReplaceOne({'_id': new_item['_id']}, new_item, upsert=True) for new_item in new_items]
+        self._bulk_write(context, requests, ordered)
+
+        return [self._convert_to_public(new_item) for new_item in new_items]
+
     def set(self, context: Optional[IContext], item: T) -> T:
         """
         Sets a data item. If the data item exists it updates it, otherwise it create a new data item.
@@ -181,14 +260,15 @@ class IdentifiableMongoDbPersistence(MongoDbPersistence):
 
         # Replace _id or generate a new one
         if new_item.get('_id') is None and self._auto_generate_id:
-            new_item['_id'] = IdGenerator.next_long()
+            new_item['_id'] = self._id_generator()
 
         new_item = self._convert_from_public(new_item)
 
         item = self._collection.find_one_and_replace(
             {'_id': new_item['_id']}, new_item,
             return_document=pymongo.ReturnDocument.AFTER,
-            upsert=True
+            upsert=True,
+            session=self._get_session()
         )
 
         item = self._convert_to_public(item)
@@ -216,7 +296,8 @@ class IdentifiableMongoDbPersistence(MongoDbPersistence):
 
         result = self._collection.find_one_and_update(
             {'_id': item.id}, {'$set': new_item},
-            return_document=pymongo.ReturnDocument.AFTER
+            return_document=pymongo.ReturnDocument.AFTER,
+            session=self._get_session()
         )
 
         new_item = self._convert_to_public(result)
@@ -245,7 +326,8 @@ class IdentifiableMongoDbPersistence(MongoDbPersistence):
 
         item = self._collection.find_one_and_update(
             {'_id': id}, {'$set': new_item},
-            return_document=pymongo.ReturnDocument.AFTER
+            return_document=pymongo.ReturnDocument.AFTER,
+            session=self._get_session()
         )
 
         self._logger.trace(context, "Updated partially in %s with id = %s", self._collection_name, id)
@@ -264,7 +346,7 @@ class IdentifiableMongoDbPersistence(MongoDbPersistence):
 
         :return: a deleted item.
         """
-        item = self._collection.find_one_and_delete({'_id': id})
+        item = self._collection.find_one_and_delete({'_id': id}, session=self._get_session())
 
         self._logger.trace(context, "Deleted from %s with id = %s", self._collection_name, id)
 
@@ -8,21 +8,26 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-import random
 import threading
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import List, Any, Optional, TypeVar, Generic
+from typing import List, Any, Optional, TypeVar, Generic, Iterator
 
 import pymongo
+from bson import json_util
 from pip_services4_commons.errors import InvalidStateException, ConnectionException
 from pip_services4_commons.reflect import PropertyReflector
 from pip_services4_components.config import IConfigurable, ConfigParams
 from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IUnreferenceable, DependencyResolver, IReferences
 from pip_services4_components.run import IOpenable, ICleanable
-from pip_services4_data.query import PagingParams, DataPage
+from pip_services4_data.query import PagingParams, DataPage, TokenizedPagingParams, TokenizedDataPage
 from pip_services4_observability.log import CompositeLogger
+from pip_services4_persistence.persistence import RecordConverter, KeysetToken
+from pymongo import InsertOne, WriteConcern
+from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
+from pymongo.results import BulkWriteResult
 
 from pip_services4_mongodb.connect.MongoDbConnection import MongoDbConnection
 from .MongoDbIndex import MongoDbIndex
@@ -62,6 +67,10 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
             - auto_reconnect:            (optional) enable auto reconnection (default: true)
             - reconnect_interval:        (optional) reconnection interval in milliseconds (default: 1000)
             - max_page_size:             (optional) maximum page size (default: 100)
+            - record_mode:               (optional) type of returned records: record, dict or class (default: record)
+            - write_concern:             (optional) number of nodes that acknowledge writes or "majority", 0 for unacknowledged writes (default: server default)
+            - write_journal:             (optional) wait until writes are written to the journal (default: server default)
+            - write_timeout:             (optional) time in milliseconds to wait for write acknowledgement (default: server default)
             - replica_set:               (optional) name of replica set
             - ssl:                       (optional) enable SSL connection (default: false)
             - auth_source:               (optional) authentication source
@@ -146,6 +155,7 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         self._connection: MongoDbConnection = None
 
         self._max_page_size = 100
+        self._record_converter: RecordConverter = RecordConverter()
 
         # The MongoDB colleciton object.
         self._collection_name: str = collection
@@ -155,6 +165,9 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         self.__opened = False
         self.__local_connection = False
         self.__indexes: List[MongoDbIndex] = []
+        self.__write_concern: Optional[str] = None
+        self.__write_journal: Optional[bool] = None
+        self.__write_timeout: Optional[int] = None
 
     def configure(self, config: ConfigParams):
         """
@@ -170,8 +183,14 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         self._dependency_resolver.configure(config)
 
         self._max_page_size = config.get_as_integer_with_default("options.max_page_size", self._max_page_size)
+        self._record_converter.set_mode(
+            config.get_as_string_with_default("options.record_mode", self._record_converter.get_mode()))
         self._collection_name = config.get_as_string_with_default('collection', self._collection_name)
 
+        self.__write_concern = config.get_as_nullable_string("options.write_concern")
+        self.__write_journal = config.get_as_nullable_boolean("options.write_journal")
+        self.__write_timeout = config.get_as_nullable_integer("options.write_timeout")
+
     def set_references(self, references: IReferences):
         """
         Sets references to dependent components.
@@ -243,7 +262,7 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
             value['id'] = value['_id']
             value.pop('_id', None)
 
-        return type('object', (object,), value)
+        return self._record_converter.to_public(value)
 
     def _convert_from_public(self, value: T) -> Any:
         """
@@ -302,7 +321,8 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         self._database_name = self._connection.get_database_name()
 
         try:
-            self._collection = self._db.get_collection(self._collection_name)
+            self._collection = self._db.get_collection(self._collection_name,
+                                                       write_concern=self.__compose_write_concern())
 
             # Define database schema
             self._define_schema()
@@ -325,6 +345,17 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
             raise ConnectionException(ContextResolver.get_trace_id(context), "CONNECT_FAILED",
                                       "Connection to mongodb failed").with_cause(ex)
 
+    def __compose_write_concern(self) -> Optional[WriteConcern]:
+        if self.__write_concern is None and self.__write_journal is None and self.__write_timeout is None:
+            # Use the default write concern of the database
+            return None
+
+        w = self.__write_concern
+        if w is not None and w.isdigit():
+            w = int(w)
+
+        return WriteConcern(w=w, wtimeout=self.__write_timeout, j=self.__write_journal)
+
     def __del_none_objects(self, settings):
         new_settings = {}
         for k in settings.keys():
@@ -362,6 +393,45 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
                                       'Disconnect from mongodb failed: ' + str(ex)) \
                 .with_cause(ex)
 
+    def _get_session(self) -> Optional[ClientSession]:
+        """
+        Gets a session of a transaction started in the current execution context.
+        Collection calls must pass it to take part in the transaction.
+
+        :return: a session of the current transaction or None if there is no transaction.
+        """
+        return self._connection.get_session() if self._connection is not None else None
+
+    @contextmanager
+    def transaction(self, context: Optional[IContext]) -> Iterator[None]:
+        """
+        Runs persistence calls inside the block in one MongoDB transaction.
+
+        The transaction session is bound to the current thread or asyncio task.
+        All persistences that share the same connection component run their operations in it,
+        and the transaction is committed once when the block ends or aborted when it raises an error.
+        Nested transactions join the outer one. Transactions require a replica set or a sharded cluster.
+
+        Example:
+
+        .. code-block:: python
+
+            with persistence.transaction(context):
+                persistence.update(context, account1)
+                persistence.update(context, account2)
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        """
+        if not self.is_open():
+            raise InvalidStateException(
+                ContextResolver.get_trace_id(context), "NOT_OPENED", "Persistence is not opened"
+            )
+
+        with self._connection.transaction():
+            yield
+
+        self._logger.trace(context, "Committed transaction in %s", self._collection_name)
+
     def clear(self, context: Optional[IContext]):
         """
         Clears component state.
@@ -371,7 +441,7 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         if self._collection_name is None:
             raise Exception("Collection name is not defined")
 
-        self._collection.delete_many({})
+        self._collection.delete_many({}, session=self._get_session())
 
     def create(self, context: Optional[IContext], item: T) -> T:
         """
@@ -388,12 +458,57 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
 
         new_item = self._convert_from_public(item)
 
-        result = self._collection.insert_one(new_item)
-        item = self._collection.find_one({'_id': result.inserted_id})
+        # The driver sets _id of the inserted document, so it is not read back
+        self._collection.insert_one(new_item, session=self._get_session())
+
+        self._logger.trace(context, "Created in %s with id = %s", self._collection_name, new_item['_id'])
 
-        item = self._convert_to_public(item)
+        item = self._convert_to_public(new_item)
         return item
 
+    def create_many(self, context: Optional[IContext], items: List[T], ordered: bool = True) -> List[T]:
+        """
+        Creates multiple data items in one batch.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param items: items to be created.
+
+        :param ordered: (optional) true to insert items one by one and stop on the first error,
+                        false to insert all items in any order and report errors at the end. Default: true
+
+        :return: created items
+        """
+        new_items = [self._convert_from_public(item) for item in items or [] if item is not None]
+
+        self._bulk_write(context, [InsertOne(new_item) for new_item in new_items], ordered)
+
+        return [self._convert_to_public(new_item) for new_item in new_items]
+
+    def _bulk_write(self, context: Optional[IContext], requests: List[Any],
+                    ordered: bool = True) -> Optional[BulkWriteResult]:
+        """
+        Sends a batch of write operations to the server in as few round trips as possible.
+        A failed batch raises :class:`BulkWriteError <pymongo.errors.BulkWriteError>` with details of written items.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+
+        :param requests: write operations like InsertOne, ReplaceOne, UpdateOne or DeleteOne.
+
+        :param ordered: (optional) true to run operations one by one and stop on the first error,
+                        false to run all operations in any order and report errors at the end. Default: true
+
+        :return: a result of the batch or None if there are no operations.
+        """
+        if not requests:
+            return None
+
+        result = self._collection.bulk_write(requests, ordered=ordered, session=self._get_session())
+
+        self._logger.trace(context, "Wrote %d items to %s", len(requests), self._collection_name)
+
+        return result
+
     def delete_by_filter(self, context: Optional[IContext], filter: Any):
         """
         Deletes data items that match to a given filter.
@@ -405,7 +520,7 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
 
         :param filter: (optional) a filter function to filter items.
         """
-        result = self._collection.delete_many(filter or {})
+        result = self._collection.delete_many(filter or {}, session=self._get_session())
         count = 0 if result is None else result.deleted_count
         self._logger.trace(context, "Deleted %d items from %s", count, self._collection_name)
 
@@ -420,11 +535,9 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
 
         :return: a random item.
         """
-        count = self._collection.count_documents(filter or {})
-
-        pos = random.randint(0, count)
-
-        statement = self._collection.find(filter).skip(pos if pos > 0 else 0).limit(1)
+        # $sample picks a random document without counting and skipping documents
+        statement = self._collection.aggregate([{'$match': filter or {}}, {'$sample': {'size': 1}}],
+                                               session=self._get_session())
 
         for item in statement:
             if item is None:
@@ -461,7 +574,7 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         filter = filter or {}
 
         # Configure statement
-        statement = self._collection.find(filter, projection=select or {})
+        statement = self._collection.find(filter, projection=select or {}, session=self._get_session())
 
         if skip >= 0:
             statement = statement.skip(skip)
@@ -481,10 +594,82 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         # Calculate total if needed
         total = None
         if paging_enabled:
-            total = self._collection.count_documents(filter)
+            total = self.__count_total(filter)
 
         return DataPage(items, total)
 
+    def get_page_by_token(self, context: Optional[IContext], filter: Any, paging: TokenizedPagingParams,
+                          keys: List[str] = None, descending: bool = False,
+                          select: Any = None) -> TokenizedDataPage:
+        """
+        Gets a page of data items retrieved by a given filter using keyset (seek) pagination.
+        Items are sorted by the key fields and each page starts right after the keys
+        of the last item from the previous page, encoded in the paging token.
+        Unlike :func:`get_page_by_filter` deep pages cost the same as the first one.
+        The total number of items is calculated only for the first page.
+
+        This method shall be called by a public get_page_by_token method from child class that
+        receives FilterParams and converts them into a filter function.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        :param filter: (optional) a filter JSON object
+        :param paging: (optional) tokenized paging parameters
+        :param keys: (optional) unique combination of fields to sort and seek by. Default: ['_id']
+        :param descending: (optional) true to sort items in descending order
+        :param select: (optional) projection JSON object, it must include the key fields
+        :return: a data page with a token to get the next page
+        """
+        paging = paging if paging is not None else TokenizedPagingParams()
+        keys = keys or ['_id']
+        take = paging.get_take(self._max_page_size)
+        # Keys are serialized as extended JSON, which restores dates and ObjectIds.
+        # Otherwise they would be compared with strings and never match
+        last_keys = KeysetToken.decode(paging.token, len(keys), json_util.loads)
+        filter = filter or {}
+
+        # (a, b) > (x, y) is expanded into (a > x) OR (a = x AND b > y)
+        query = filter
+        if last_keys is not None:
+            operator = '$lt' if descending else '$gt'
+            seeks = []
+            for index in range(len(keys)):
+                seek = {keys[i]: last_keys[i] for i in range(index)}
+                seek[keys[index]] = {operator: last_keys[index]}
+                seeks.append(seek)
+            query = {'$and': [filter, {'$or': seeks}]}
+
+        direction = pymongo.DESCENDING if descending else pymongo.ASCENDING
+
+        # One more item tells if there is the next page
+        statement = self._collection.find(query, projection=select or {}, session=self._get_session()) \
+            .sort([(key, direction) for key in keys]) \
+            .limit(take + 1)
+
+        items = list(statement)
+
+        token = None
+        if len(items) > take:
+            items = items[:take]
+            token = KeysetToken.encode([items[-1].get(key) for key in keys], json_util.dumps)
+
+        self._logger.trace(context, "Retrieved %d from %s", len(items), self._collection_name)
+
+        items = [self._convert_to_public(item) for item in items]
+
+        total = None
+        if paging.total and last_keys is None:
+            total = self.__count_total(filter)
+
+        return TokenizedDataPage(items, token, total)
+
+    def __count_total(self, filter: Any) -> int:
+        # Unfiltered totals are taken from collection metadata instead of scanning the collection.
+        # Transactions do not support it, so inside them documents are counted.
+        session = self._get_session()
+        if not filter and session is None:
+            return self._collection.estimated_document_count()
+        return self._collection.count_documents(filter, session=session)
+
     def get_list_by_filter(self, context: Optional[IContext], filter: Any,
                            sort: Any = None, select: Any = None) -> List[T]:
         """
@@ -505,7 +690,7 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         """
         # Configure statement
         filter = filter or {}
-        statement = self._collection.find(filter, projection=select or {})
+        statement = self._collection.find(filter, projection=select or {}, session=self._get_session())
 
         if sort is not None:
             statement = statement.sort(sort)
@@ -533,7 +718,7 @@ class MongoDbPersistence(Generic[T], IReferenceable, IUnreferenceable, IConfigur
         :return: a number of filtered items.
         """
         filter = filter or {}
-        count = self._collection.count_documents(filter)
+        count = self._collection.count_documents(filter, session=self._get_session())
 
         if count is not None:
             self._logger.trace(context, "Counted %d items in %s", count, self._collection_name)
@@ -12,7 +12,7 @@ from typing import Optional, List
 
 from pip_services4_commons.data import AnyValueMap
 from pip_services4_components.context import IContext
-from pip_services4_data.query import FilterParams, PagingParams, DataPage
+from pip_services4_data.query import FilterParams, PagingParams, DataPage, TokenizedPagingParams, TokenizedDataPage
 from pip_services4_persistence.read import IGetter
 from pip_services4_persistence.write import IWriter, IPartialUpdater
 
@@ -25,6 +25,10 @@ class IDummyPersistence(IGetter, IWriter, IPartialUpdater):
                            paging: Optional[PagingParams]) -> DataPage:
         raise NotImplementedError('Method from interface definition')
 
+    def get_page_by_token(self, context: Optional[IContext], filter: Optional[FilterParams],
+                          paging: Optional[TokenizedPagingParams]) -> TokenizedDataPage:
+        raise NotImplementedError('Method from interface definition')
+
     def get_count_by_filter(self, context: Optional[IContext], filter: Optional[FilterParams]) -> int:
         raise NotImplementedError('Method from interface definition')
 
@@ -8,10 +8,10 @@
     :copyright: Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Optional
+from typing import List, Optional
 
 from pip_services4_components.context import IContext
-from pip_services4_data.query import FilterParams, PagingParams, DataPage
+from pip_services4_data.query import FilterParams, PagingParams, DataPage, TokenizedPagingParams, TokenizedDataPage
 
 from pip_services4_mongodb.persistence import IdentifiableMongoDbPersistence
 from test.fixtures.IDummyPersistence import IDummyPersistence
@@ -44,3 +44,14 @@ class DummyMongoDbPersistence(IdentifiableMongoDbPersistence, IDummyPersistence)
             filter_condition['key'] = key
 
         return super().get_count_by_filter(context, filter)
+
+    def get_page_by_token(self, context: Optional[IContext], filter: FilterParams,
+                          paging: TokenizedPagingParams, keys: List[str] = None) -> TokenizedDataPage:
+        filter = filter or FilterParams()
+        key = filter.get_as_nullable_string('key')
+
+        filter_condition = {}
+        if key is not None:
+            filter_condition['key'] = key
+
+        return super().get_page_by_token(context, filter_condition, paging, keys or ['key'])
@@ -7,11 +7,15 @@
     :license: MIT, see LICENSE for more details.
 """
 
+import datetime
 import os
 
+from bson import ObjectId
 from pip_services4_components.config import ConfigParams
+from pip_services4_data.query import TokenizedPagingParams
 
 from .DummyMongoDbPersistence import DummyMongoDbPersistence
+from test.fixtures.Dummy import Dummy
 from test.fixtures.DummyPersistenceFixture import DummyPersistenceFixture
 
 
@@ -51,3 +55,39 @@ class TestDummyMongoDbPersistence:
 
     def test_batch_operations(self):
         self.fixture.test_batch_operations()
+
+    def test_paging_by_token(self):
+        self.fixture.test_paging_by_token()
+
+    def test_bulk_operations(self):
+        dummies = self.persistence.create_many(None, [Dummy(None, 'Key 1', 'Content 1'),
+                                                      Dummy(None, 'Key 2', 'Content 2')], False)
+        assert 2 == len(dummies)
+        assert dummies[0].id is not None
+        assert 'Key 1' == dummies[0].key
+
+        dummies[0].content = 'Updated Content 1'
+        dummies = self.persistence.set_many(None, [dummies[0], Dummy('3', 'Key 3', 'Content 3')])
+        assert 2 == len(dummies)
+
+        dummy = self.persistence.get_one_by_id(None, dummies[0].id)
+        assert 'Updated Content 1' == dummy.content
+
+        count = self.persistence.get_count_by_filter(None, None)
+        assert 3 == count
+
+    def test_paging_by_typed_keys(self):
+        # Dates and ObjectIds keep their types in tokens, otherwise they are never greater than stored values
+        for index in range(5):
+            dummy = Dummy(ObjectId(), 'Key ' + str(index), 'Content ' + str(index))
+            dummy.time = datetime.datetime(2023, 1, 1 + index // 2)
+            self.persistence.create(None, dummy)
+
+        for keys in [['_id'], ['time', '_id']]:
+            page = self.persistence.get_page_by_token(None, None, TokenizedPagingParams(None, 2), keys)
+            dummies = list(page.data)
+            while page.token is not None:
+                page = self.persistence.get_page_by_token(None, None, TokenizedPagingParams(page.token, 2), keys)
+                dummies += page.data
+
+            assert ['Key 0', 'Key 1', 'Key 2', 'Key 3', 'Key 4'] == [dummy.key for dummy in dummies]
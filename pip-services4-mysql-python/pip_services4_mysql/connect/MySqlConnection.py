@@ -8,7 +8,9 @@ from pip_services4_components.config import IConfigurable, ConfigParams
 from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IReferences
 from pip_services4_components.run import IOpenable
+from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
+from pip_services4_persistence.persistence import ConnectionPool
 
 from pip_services4_mysql.connect.MySqlConnectionResolver import MySqlConnectionResolver
 
@@ -33,10 +35,14 @@ class MySqlConnection(IReferenceable, IConfigurable, IOpenable):
         - options:
             - connect_timeout:      (optional) number of milliseconds to wait before timing out when connecting a new client (default: 0)
             - idle_timeout:         (optional) number of milliseconds a client must sit idle in the pool and not be checked out (default: 10000)
+            - min_pool_size:        (optional) minimum number of clients the pool keeps open (default: 0)
             - max_pool_size:        (optional) maximum number of clients the pool should contain (default: 10)
+            - wait_timeout:         (optional) number of milliseconds to wait for a free client when all clients are in use (default: 15000)
+            - validation_interval:  (optional) number of milliseconds a client sits idle before it is checked on borrow (default: 5000)
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
+        - `*:counters:*:*:1.0`         (optional) :class:`ICounters <pip_services4_observability.count.ICounters.ICounters>` components to pass pool statistics
         - `*:discovery:*:*:1.0`        (optional) :class:`IDiscovery <pip_services4_config.connect.IDiscovery.IDiscovery>` services
         - `*:credential-store:*:*:1.0` (optional) :class:`ICredentialStore <pip_services4_config.auth.ICredentialStore.ICredentialStore>` stores to resolve credentials
     """
@@ -45,11 +51,16 @@ class MySqlConnection(IReferenceable, IConfigurable, IOpenable):
         self.__default_config = ConfigParams.from_tuples(
             "options.connect_timeout", 0,
             "options.idle_timeout", 10000,
-            "options.max_pool_size", 3
+            "options.min_pool_size", 0,
+            "options.max_pool_size", 3,
+            "options.wait_timeout", 15000,
+            "options.validation_interval", 5000
         )
 
         # The logger.
         self._logger: CompositeLogger = CompositeLogger()
+        # The performance counters.
+        self._counters: CompositeCounters = CompositeCounters()
         # The connection resolver.
         self._connection_resolver: MySqlConnectionResolver = MySqlConnectionResolver()
         # The configuration options.
@@ -78,6 +89,7 @@ class MySqlConnection(IReferenceable, IConfigurable, IOpenable):
         :param references: references to locate the component dependencies.
         """
         self._logger.set_references(references)
+        self._counters.set_references(references)
         self._connection_resolver.set_references(references)
 
     def is_open(self) -> bool:
@@ -136,23 +148,35 @@ class MySqlConnection(IReferenceable, IConfigurable, IOpenable):
 
         try:
             config = self.__compose_uri_settings(uri)
-            pool = mysql.connector.pooling.MySQLConnectionPool(pool_size=config.pop('pool_size'),
-                                                               **config)
-            # Try to connect
-            connection_obj = pool.get_connection()
-
-            # set timeout
+            max_pool_size = config.pop('pool_size')
             idle_timeout_ms = self._options.get_as_nullable_integer('idle_timeout')
-            if idle_timeout_ms:
-                cursor = connection_obj.cursor()
-                cursor.execute(f"SET SESSION MAX_EXECUTION_TIME={idle_timeout_ms}")
-                connection_obj.commit()
-                cursor.close()
 
-            self._connection = pool
-            self._database_name = pool.pool_name.split('_')[-1]
+            def connect() -> Any:
+                conn = mysql.connector.connect(**config)
+                # set timeout
+                if idle_timeout_ms:
+                    cursor = conn.cursor()
+                    cursor.execute(f"SET SESSION MAX_EXECUTION_TIME={idle_timeout_ms}")
+                    conn.commit()
+                    cursor.close()
+                return conn
+
+            pool = ConnectionPool(
+                connect, lambda conn: conn.is_connected(),
+                min_size=self._options.get_as_integer_with_default("min_pool_size", 0),
+                max_size=max_pool_size,
+                idle_timeout=idle_timeout_ms or 10000,
+                wait_timeout=self._options.get_as_integer_with_default("wait_timeout", 15000),
+                validation_interval=self._options.get_as_integer_with_default("validation_interval", 5000),
+                counters=self._counters,
+                name='mysql.pool'
+            )
 
-            connection_obj.close()
+            # Try to connect
+            pool.putconn(pool.getconn())
+
+            self._connection = pool
+            self._database_name = config['database']
 
         except Exception as err:
             raise ConnectionException(ContextResolver.get_trace_id(context), "CONNECT_FAILED",
@@ -168,7 +192,7 @@ class MySqlConnection(IReferenceable, IConfigurable, IOpenable):
         if self._connection is None:
             return
         try:
-            self._connection._remove_connections()
+            self._connection.closeall()
             self._connection = None
             self._logger.debug(context, "Disconnected from mysql database %s", self._database_name)
         except Exception as err:
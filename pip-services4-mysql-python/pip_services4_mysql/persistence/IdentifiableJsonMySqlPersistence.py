@@ -146,8 +146,11 @@ class IdentifiableJsonMySqlPersistence(IdentifiableMySqlPersistence):
         if data is None or id is None:
             return
 
-        query = "UPDATE " + self._quoted_table_name() + " SET `data`=JSON_MERGE_PATCH(data,%s) WHERE id=%s"
-        query += "; SELECT * FROM " + self._quoted_table_name() + " WHERE id=%s"
+        query = self._statement_cache.get(
+            ('update_partially',),
+            lambda: "UPDATE " + self._quoted_table_name() + " SET `data`=JSON_MERGE_PATCH(data,%s) WHERE id=%s"
+                    + "; SELECT * FROM " + self._quoted_table_name() + " WHERE id=%s"
+        )
         values = [json.dumps(data), id, id]
 
         result = self._request(query, values)
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import random
-from typing import Any, Optional, List, TypeVar
+from contextlib import contextmanager
+from typing import Any, Optional, List, TypeVar, Iterator
 
+import mysql.connector
 from pip_services4_commons.convert import LongConverter
 from pip_services4_commons.errors import ConnectionException, InvalidStateException, ApplicationException
 from pip_services4_commons.reflect import PropertyReflector
@@ -9,8 +11,10 @@ from pip_services4_components.config import IConfigurable, ConfigParams
 from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IUnreferenceable, IReferences, DependencyResolver
 from pip_services4_components.run import IOpenable, ICleanable
-from pip_services4_data.query import PagingParams, DataPage
+from pip_services4_data.query import PagingParams, DataPage, TokenizedPagingParams, TokenizedDataPage
+from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
+from pip_services4_persistence.persistence import RecordConverter, KeysetToken, StatementCache
 
 from pip_services4_mysql.connect.MySqlConnection import MySqlConnection
 
@@ -42,11 +46,17 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
             - connect_timeout:      (optional) number of milliseconds to wait before timing out when connecting a new client (default: 0)
             - idle_timeout:         (optional) number of milliseconds a client must sit idle in the pool and not be checked out (default: 10000)
             - max_pool_size:        (optional) maximum number of clients the pool should contain (default: 10)
+            - record_mode:          (optional) type of returned records: record, dict or class (default: record)
+            - stream_batch_size:    (optional) number of rows fetched at once by streaming queries (default: 1000)
+            - statement_cache_size: (optional) maximum number of generated statements kept in cache, 0 to disable (default: 100)
+
+    Statement cache hits and misses are sent to counters mysql.statements.hits and mysql.statements.misses.
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
         - `*:discovery:*:*:1.0`        (optional) :class:`IDiscovery <pip_services4_config.connect.IDiscovery.IDiscovery>` services
         - `*:credential-store:*:*:1.0` (optional) :class:`ICredentialStore <pip_services4_config.auth.ICredentialStore.ICredentialStore>` stores to resolve credentials
+        - `*:counters:*:*:1.0`         (optional) :class:`ICounters <pip_services4_observability.count.ICounters.ICounters>` components to pass statement cache statistics
 
     Example:
 
@@ -110,6 +120,9 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
         self._dependency_resolver: DependencyResolver = DependencyResolver(self._default_config)
         # The logger.
         self._logger: CompositeLogger = CompositeLogger()
+
+        # The performance counters.
+        self._counters: CompositeCounters = CompositeCounters()
         # The MySQL connection component.
         self._connection: MySqlConnection = None
         # The MySQL connection pool object.
@@ -120,6 +133,9 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
         self._table_name: str = None
         # Max number of objects in data pages
         self._max_page_size: int = 100
+        self._record_converter: RecordConverter = RecordConverter()
+        self._stream_batch_size = 1000
+        self._statement_cache: StatementCache = StatementCache(counters=self._counters, name='mysql.statements')
 
         self._table_name = table_name
         self._schema_name = schema_name
@@ -139,6 +155,14 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
         self._table_name = config.get_as_string_with_default('table', self._table_name)
         self._schema_name = config.get_as_string_with_default('schema', self._schema_name)
         self._max_page_size = config.get_as_integer_with_default('options.max_page_size', self._max_page_size)
+        self._record_converter.set_mode(
+            config.get_as_string_with_default("options.record_mode", self._record_converter.get_mode()))
+        self._stream_batch_size = config.get_as_integer_with_default("options.stream_batch_size",
+                                                                     self._stream_batch_size)
+        self._statement_cache.set_max_size(
+            config.get_as_integer_with_default("options.statement_cache_size", self._statement_cache.get_max_size()))
+        # Cached statements keep the table name
+        self._statement_cache.clear()
 
     def set_references(self, references: IReferences):
         """
@@ -148,6 +172,7 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
         """
         self.__references = references
         self._logger.set_references(references)
+        self._counters.set_references(references)
 
         # Get connection
         self._dependency_resolver.set_references(references)
@@ -231,7 +256,7 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
         if value is None:
             return
 
-        return type('object', (object,), value)
+        return self._record_converter.to_public(value)
 
     def _convert_from_public(self, value: Any) -> Any:
         """
@@ -351,23 +376,119 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
                   'statement': None
                   }
 
-        conn = self._client.get_connection()
-        cursor = conn.cursor()
+        # Statements inside a transaction use its connection and are committed together
+        transaction = self._client.get_transaction()
+        conn = transaction if transaction is not None else self._client.getconn()
+        discard = False
+        try:
+            cursor = conn.cursor()
+
+            for response in cursor.execute(query, params=params, multi=True):
+                response = response.fetchall()
+                for val in response:
+                    result['items'].append(dict(zip(cursor.column_names, val)))
+
+            # affected rows
+            result.update({'rowcount': cursor.rowcount,
+                           'column_names': cursor.column_names,
+                           'statement': cursor.statement})
+
+            if transaction is None:
+                conn.commit()
+            cursor.close()
+        except BaseException:
+            if transaction is None:
+                discard = not self.__rollback(conn)
+            raise
+        finally:
+            if transaction is None:
+                self._client.putconn(conn, discard)
+        return result
+
+    def _request_stream(self, query: str, params: List[str] = None, batch_size: int = None) -> Iterator[dict]:
+        """
+        Performs a query to the database through an unbuffered cursor and yields rows one by one.
+        Rows are read from the server in batches, so only one batch is kept in memory at a time.
+        The connection is returned to the pool when the iteration ends or the generator is closed.
+
+        :param query: string with sql query to database
+        :param params: optional list of query parameters
+        :param batch_size: (optional) number of rows fetched at once
+        :return: a generator of rows
+        """
+        batch_size = batch_size or self._stream_batch_size
+
+        transaction = self._client.get_transaction()
+        conn = transaction if transaction is not None else self._client.getconn()
+        cursor = None
+        discard = False
+        try:
+            cursor = conn.cursor(buffered=False)
+            cursor.execute(query, params=params)
+
+            rows = cursor.fetchmany(batch_size)
+            while len(rows) > 0:
+                column_names = cursor.column_names
+                for row in rows:
+                    yield dict(zip(column_names, row))
+                rows = cursor.fetchmany(batch_size)
+
+            if transaction is None:
+                conn.commit()
+        except BaseException:
+            # Also rolls back when the generator is closed before the end
+            if transaction is None:
+                discard = not self.__rollback(conn)
+            elif cursor is not None:
+                # Unread rows must be consumed before the transaction runs other statements
+                conn.consume_results()
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+            if transaction is None:
+                self._client.putconn(conn, discard)
+
+    @staticmethod
+    def __rollback(conn: Any) -> bool:
+        # A connection that cannot be rolled back is broken and must not return to the pool
+        try:
+            # Unread rows must be consumed before the connection can be reused
+            conn.consume_results()
+            conn.rollback()
+            return True
+        except mysql.connector.Error:
+            return False
+
+    @contextmanager
+    def transaction(self, context: Optional[IContext]) -> Iterator[None]:
+        """
+        Runs persistence calls inside the block in one database transaction.
 
-        for response in cursor.execute(query, params=params, multi=True):
-            response = response.fetchall()
-            for val in response:
-                result['items'].append(dict(zip(cursor.column_names, val)))
+        The transaction borrows one connection and binds it to the current thread or asyncio task.
+        All persistences that share the same connection component run their statements on it,
+        and the transaction is committed once when the block ends or rolled back when it raises an error.
+        Nested transactions join the outer one.
 
-        # affected rows
-        result.update({'rowcount': cursor.rowcount,
-                       'column_names': cursor.column_names,
-                       'statement': cursor.statement})
+        Example:
 
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return result
+        .. code-block:: python
+
+            with persistence.transaction(context):
+                persistence.update(context, account1)
+                persistence.update(context, account2)
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        """
+        if not self.is_open():
+            raise InvalidStateException(
+                ContextResolver.get_trace_id(context), "NOT_OPENED", "Persistence is not opened"
+            )
+
+        with self._client.transaction():
+            yield
+
+        self._logger.trace(context, "Committed transaction in %s", self._table_name)
 
     def clear(self, context: Optional[IContext]):
         """
@@ -525,6 +646,68 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
         else:
             return DataPage(items)
 
+    def get_page_by_token(self, context: Optional[IContext], filter: Any, paging: TokenizedPagingParams,
+                          keys: List[str] = None, descending: bool = False, select: Any = None) -> TokenizedDataPage:
+        """
+        Gets a page of data items retrieved by a given filter using keyset (seek) pagination.
+        Items are sorted by the key columns and each page starts right after the keys
+        of the last item from the previous page, encoded in the paging token.
+        Unlike :func:`get_page_by_filter` deep pages cost the same as the first one.
+        The total number of items is calculated only for the first page.
+        This method shall be called by a public getPageByToken method from child class that
+        receives FilterParams and converts them into a filter function.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        :param filter: (optional) a filter JSON object
+        :param paging: (optional) tokenized paging parameters
+        :param keys: (optional) unique combination of columns to sort and seek by. Default: ['id']
+        :param descending: (optional) true to sort items in descending order
+        :param select: (optional) projection JSON object, it must include the key columns
+        :return: a data page with a token to get the next page
+        """
+        paging = paging or TokenizedPagingParams()
+        keys = keys or ['id']
+        take = paging.get_take(self._max_page_size)
+        last_keys = KeysetToken.decode(paging.token, len(keys))
+
+        select = select if select and len(select) > 0 else '*'
+        query = "SELECT " + select + " FROM " + self._quoted_table_name()
+
+        columns = ", ".join([self._quote_identifier(key) for key in keys])
+        conditions = []
+        if filter and filter != '':
+            # Percent signs in the filter must be escaped when the query has parameters
+            conditions.append("(" + (filter if last_keys is None else filter.replace('%', '%%')) + ")")
+        if last_keys is not None:
+            conditions.append("(" + columns + ") " + ("<" if descending else ">")
+                              + " (" + ", ".join(["%s"] * len(keys)) + ")")
+        if len(conditions) > 0:
+            query += " WHERE " + " AND ".join(conditions)
+
+        order = " DESC" if descending else ""
+        query += " ORDER BY " + ", ".join([self._quote_identifier(key) + order for key in keys])
+
+        # One more item tells if there is the next page
+        query += " LIMIT " + str(take + 1)
+
+        result = self._request(query, last_keys)
+        items = result['items']
+
+        token = None
+        if len(items) > take:
+            items = items[:take]
+            token = KeysetToken.encode([items[-1][key] for key in keys])
+
+        self._logger.trace(context, "Retrieved %d from %s", len(items), self._table_name)
+
+        items = list(map(self._convert_to_public, items))
+
+        total = None
+        if paging.total and last_keys is None:
+            total = self.get_count_by_filter(context, filter)
+
+        return TokenizedDataPage(items, token, total)
+
     def get_count_by_filter(self, context: Optional[IContext], filter: Any) -> int:
         """
         Gets a number of data items retrieved by a given filter.
@@ -579,6 +762,37 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
 
         return items
 
+    def stream_list_by_filter(self, context: Optional[IContext], filter: Any, sort: Any = None, select: Any = None,
+                              batch_size: int = None) -> Iterator[T]:
+        """
+        Gets a stream of data items retrieved by a given filter and sorted according to sort parameters.
+        Unlike :func:`get_list_by_filter` items are read through an unbuffered cursor in batches
+        and converted one by one, so large tables can be processed without loading them into memory.
+        This method shall be called by a public streamListByFilter method from child class that
+        receives FilterParams and converts them into a filter function.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        :param filter: (optional) a filter JSON object
+        :param sort: (optional) sorting JSON object
+        :param select: (optional) projection JSON object
+        :param batch_size: (optional) number of rows fetched at once
+        :return: a generator of data items
+        """
+        select = select if select and len(select) > 0 else '*'
+        query = "SELECT " + select + " FROM " + self._quoted_table_name()
+        if filter and filter != '':
+            query += " WHERE " + filter
+
+        if sort:
+            query += " ORDER BY " + sort
+
+        count = 0
+        for item in self._request_stream(query, None, batch_size):
+            count += 1
+            yield self._convert_to_public(item)
+
+        self._logger.trace(context, "Streamed %d from %s", count, self._table_name)
+
     def get_one_random(self, context: Optional[IContext], filter: Any) -> T:
         """
         Gets a random item from items that match to a given filter.
@@ -628,11 +842,13 @@ class MySqlPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpenabl
         if not item:
             return
         row = self._convert_from_public(item)
-        columns = self._generate_columns(row)
-        params = self._generate_parameters(row)
         values = self._generate_values(row)
 
-        query = "INSERT INTO " + self._quoted_table_name() + " (" + columns + ") VALUES (" + params + ")"
+        query = self._statement_cache.get(
+            ('create', tuple(row.keys())),
+            lambda: "INSERT INTO " + self._quoted_table_name() + " (" + self._generate_columns(row) + ") VALUES ("
+                    + self._generate_parameters(row) + ")"
+        )
         # query += "; SELECT * FROM " + self._quoted_table_name()
         self._request(query, values)
 
@@ -8,6 +8,7 @@
 """
 
 from pip_services4_commons.data import AnyValueMap
+from pip_services4_data.query import TokenizedPagingParams
 from test.fixtures.IDummyPersistence import IDummyPersistence
 
 from .Dummy import Dummy
@@ -95,3 +96,22 @@ class DummyPersistenceFixture:
         dummies = self._persistence.get_list_by_ids(None, [dummy1.id, dummy2.id])
         assert dummies is not None
         assert 0 == len(dummies)
+
+    def test_paging_by_token(self):
+        for index in range(5):
+            self._persistence.create(None, Dummy(None, 'Key ' + str(index), 'Content ' + str(index)))
+
+        # Walk through all pages with 2 items on each
+        page = self._persistence.get_page_by_token(None, None, TokenizedPagingParams(None, 2, True))
+        assert 5 == page.total
+        keys = [dummy.key for dummy in page.data]
+        pages = 1
+
+        while page.token is not None:
+            page = self._persistence.get_page_by_token(None, None, TokenizedPagingParams(page.token, 2))
+            assert page.total is None
+            keys += [dummy.key for dummy in page.data]
+            pages += 1
+
+        assert 3 == pages
+        assert ['Key 0', 'Key 1', 'Key 2', 'Key 3', 'Key 4'] == keys
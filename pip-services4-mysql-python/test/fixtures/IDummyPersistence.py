@@ -4,7 +4,7 @@ from typing import List, Union, Optional
 
 from pip_services4_commons.data import AnyValueMap
 from pip_services4_components.context import IContext
-from pip_services4_data.query import PagingParams, FilterParams, DataPage
+from pip_services4_data.query import PagingParams, FilterParams, DataPage, TokenizedPagingParams, TokenizedDataPage
 from pip_services4_persistence.read import IGetter
 from pip_services4_persistence.write import IWriter, IPartialUpdater
 
@@ -17,6 +17,10 @@ class IDummyPersistence(IGetter, IWriter, IPartialUpdater, ABC):
                            paging: Union[PagingParams, None]) -> DataPage:
         raise NotImplemented()
 
+    def get_page_by_token(self, context: Optional[IContext], filter: Optional[FilterParams],
+                          paging: Optional[TokenizedPagingParams]) -> TokenizedDataPage:
+        raise NotImplemented()
+
     def get_count_by_filter(self, context: Optional[IContext], filter: FilterParams) -> int:
         raise NotImplemented()
 
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+import mysql.connector
+import pytest
+from pip_services4_components.config import ConfigParams
+from pip_services4_components.refer import Descriptor, References
+from pip_services4_observability.count import NullCounters
+from pip_services4_persistence.persistence import ConnectionPool
+
+from test.persistence.DummyMySqlPersistence import DummyMySqlPersistence
+
+FILTER = "`key`<>''"
+ROWS = [('%d' % index, 'Key %d' % index, 'Content %d' % index) for index in range(1, 6)]
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.__connection = connection
+        self.__rows = []
+        self.column_names = None
+        self.statement = None
+        self.rowcount = -1
+
+    def execute(self, query, params=None, multi=False):
+        self.__connection.queries.append(query)
+        self.__rows = list(ROWS)
+        self.column_names = ('id', 'key', 'content')
+        self.statement = query
+        # Multi statements return results of each statement
+        return [self] if multi else None
+
+    def fetchmany(self, size):
+        self.__connection.fetches.append(size)
+        (rows, self.__rows) = (self.__rows[:size], self.__rows[size:])
+        return rows
+
+    def fetchall(self):
+        (rows, self.__rows) = (self.__rows, [])
+        return rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.queries = []
+        self.fetches = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.broken = False
+
+    def cursor(self, buffered=None):
+        if self.broken:
+            raise mysql.connector.Error('Lost connection to MySQL server')
+        return FakeCursor(self)
+
+    def consume_results(self):
+        pass
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        if self.broken:
+            raise mysql.connector.Error('Lost connection to MySQL server')
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+class DummyCounters(NullCounters):
+    def __init__(self):
+        self.values = {}
+
+    def increment_one(self, name):
+        self.values[name] = self.values.get(name, 0) + 1
+
+
+class TestMySqlPersistence:
+
+    def setup_method(self):
+        self.connections = []
+
+        def connect():
+            connection = FakeConnection()
+            self.connections.append(connection)
+            return connection
+
+        self.pool = ConnectionPool(connect)
+        self.persistence = DummyMySqlPersistence()
+        # Streams borrow connections from the pool set by the open call
+        self.persistence._client = self.pool
+
+    def test_stream_in_batches(self):
+        dummies = list(self.persistence.stream_list_by_filter(None, FILTER, None, None, 2))
+        assert ['Key 1', 'Key 2', 'Key 3', 'Key 4', 'Key 5'] == [dummy.key for dummy in dummies]
+
+        # Rows are fetched in batches until an empty batch
+        connection = self.connections[0]
+        assert [2, 2, 2, 2] == connection.fetches
+        assert FILTER in connection.queries[0]
+
+        # The connection returns to the pool after the last row
+        assert 1 == connection.commits
+        assert 0 == self.pool.get_in_use_count()
+        assert 1 == self.pool.get_idle_count()
+
+    def test_close_stream(self):
+        stream = self.persistence.stream_list_by_filter(None, None, None, None, 2)
+        assert 'Key 1' == next(stream).key
+        assert 1 == self.pool.get_in_use_count()
+
+        # Closed streams roll back and return the connection
+        stream.close()
+        connection = self.connections[0]
+        assert 0 == connection.commits
+        assert 1 == connection.rollbacks
+        assert 0 == self.pool.get_in_use_count()
+        assert 1 == self.pool.get_idle_count()
+
+    def test_stream_on_broken_connection(self):
+        self.pool.putconn(self.pool.getconn())
+        self.connections[0].broken = True
+
+        with pytest.raises(mysql.connector.Error):
+            list(self.persistence.stream_list_by_filter(None, None, None, None, 2))
+
+        # Broken connections are released and closed instead of holding a pool slot
+        assert 0 == self.pool.get_in_use_count()
+        assert 0 == self.pool.get_size()
+
+    def test_stream_in_transaction(self):
+        with self.pool.transaction() as connection:
+            assert 5 == len(list(self.persistence.stream_list_by_filter(None, None, None, None, 2)))
+
+            stream = self.persistence.stream_list_by_filter(None, None, None, None, 2)
+            next(stream)
+            stream.close()
+
+            # Streams neither commit nor release the connection of the transaction
+            assert 0 == connection.commits
+            assert 0 == connection.rollbacks
+            assert 1 == self.pool.get_in_use_count()
+
+        assert 1 == connection.commits
+        assert 1 == len(self.connections)
+        assert 0 == self.pool.get_in_use_count()
+
+    def test_statement_cache_size(self):
+        counters = DummyCounters()
+        self.persistence.configure(ConfigParams.from_tuples("options.statement_cache_size", 1))
+        self.persistence.set_references(References.from_tuples(
+            Descriptor("pip-services", "counters", "dummy", "default", "1.0"), counters
+        ))
+        self.persistence._client = self.pool
+
+        self.persistence.get_one_by_id(None, '1')
+        self.persistence.get_one_by_id(None, '1')
+        self.persistence.get_list_by_ids(None, ['1', '2'])
+        self.persistence.get_one_by_id(None, '1')
+
+        # Cached statements are reused and the least recently used one is removed
+        connection = self.connections[0]
+        assert connection.queries[0] is connection.queries[1]
+        assert connection.queries[0] is not connection.queries[3]
+        assert 1 == counters.values['mysql.statements.hits']
+        assert 3 == counters.values['mysql.statements.misses']
+
+        self.persistence.configure(ConfigParams.from_tuples("options.statement_cache_size", 0))
+        self.persistence.get_one_by_id(None, '1')
+        self.persistence.get_one_by_id(None, '1')
+        assert 1 == counters.values['mysql.statements.hits']
+        assert 5 == counters.values['mysql.statements.misses']
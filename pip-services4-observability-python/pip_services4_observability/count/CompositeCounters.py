@@ -44,7 +44,6 @@ class CompositeCounters(ICounters, ICounterTimingCallback, IReferenceable):
 
             timing.end_timing()
     """
-    _counters: List[ICounters] = []
 
     def __init__(self, references: IReferences = None):
         """
@@ -52,6 +51,7 @@ class CompositeCounters(ICounters, ICounterTimingCallback, IReferenceable):
 
         :param references: references to locate the component dependencies.
         """
+        self._counters: List[ICounters] = []
 
         if not (references is None):
             self.set_references(references)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.count.test_CompositeCounters
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: (c) Conceptual Vision Consulting LLC 2015-2016, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+from pip_services4_components.refer import References, Descriptor
+
+from pip_services4_observability.count import CompositeCounters, NullCounters
+
+
+class DummyCounters(NullCounters):
+
+    def __init__(self):
+        self.values = {}
+
+    def increment_one(self, name: str):
+        self.values[name] = self.values.get(name, 0) + 1
+
+
+class TestCompositeCounters:
+
+    def test_separate_counters(self):
+        counters = DummyCounters()
+        references = References.from_tuples(
+            Descriptor("pip-services", "counters", "dummy", "default", "1.0"), counters
+        )
+
+        composite1 = CompositeCounters(references)
+        composite2 = CompositeCounters()
+
+        # Instances do not share referenced counters
+        composite2.increment_one("Test.Increment")
+        assert 0 == len(counters.values)
+
+        composite1.increment_one("Test.Increment")
+        assert 1 == counters.values["Test.Increment"]
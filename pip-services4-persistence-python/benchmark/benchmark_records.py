@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+    benchmark.benchmark_records
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compares conversion modes of records returned by persistences.
+    Run with: python benchmark/benchmark_records.py
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import timeit
+
+from pip_services4_persistence.persistence import IdentifiableMemoryPersistence, RecordConverter
+
+COUNT = 100000
+
+
+def run(name: str, func, number: int):
+    elapsed = timeit.timeit(func, number=number)
+    print(f'{name:<45} {number:>8} ops  {elapsed * 1e3 / number:10.2f} ms/op')
+
+
+def make_rows():
+    return [{'id': str(index), 'key': 'key' + str(index), 'content': 'content' + str(index)} for index in range(COUNT)]
+
+
+if __name__ == '__main__':
+    for mode in [RecordConverter.Class, RecordConverter.Record, RecordConverter.Dictionary]:
+        converter = RecordConverter(mode)
+        run(f'to_public x {COUNT} ({mode})', lambda: list(map(converter.to_public, make_rows())), 5)
+    run(f'make rows x {COUNT} (baseline)', make_rows, 5)
+
+    persistence = IdentifiableMemoryPersistence()
+    for row in make_rows():
+        persistence.create(None, row)
+
+    run(f'memory get_list_by_filter({COUNT}) all', lambda: persistence.get_list_by_filter(None, None), 3)
+    run(f'memory get_list_by_filter({COUNT}) 1%',
+        lambda: persistence.get_list_by_filter(None, lambda item: item.id.endswith('00')), 3)
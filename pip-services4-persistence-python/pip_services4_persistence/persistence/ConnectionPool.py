@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_persistence.persistence.ConnectionPool
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Connection pool implementation
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, List, Tuple, Optional, Iterator
+
+from pip_services4_commons.errors import ConnectionException
+from pip_services4_observability.count import ICounters
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of database connections opened by a factory function.
+
+    Connections are created on demand up to the maximum pool size. When all connections are in use,
+    callers wait for a returned connection until the wait timeout expires. Connections that sit idle
+    longer than the idle timeout are closed, so the pool shrinks back to the minimum size when demand drops.
+    Connections that were idle longer than the validation interval are checked before they are borrowed.
+
+    A transaction binds one borrowed connection to the current thread or asyncio task.
+    Until the transaction ends, code running in the same execution context gets that connection
+    from :func:`get_transaction`, so several statements share one commit.
+
+    Pool statistics are sent to counters with the specified name prefix:
+        - <name>.created:      number of opened connections
+        - <name>.closed:       number of closed connections
+        - <name>.broken:       number of connections that failed the check
+        - <name>.timeouts:     number of borrow calls that timed out waiting for a free connection
+        - <name>.wait_time:    time in milliseconds spent to borrow a connection
+        - <name>.size:         number of connections kept by the pool
+        - <name>.in_use:       number of borrowed connections
+        - <name>.idle:         number of idle connections
+
+    Example:
+
+    .. code-block:: python
+
+        pool = ConnectionPool(lambda: psycopg2.connect(**config), max_size=10, name='postgres.pool')
+
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        finally:
+            pool.putconn(conn)
+
+        with pool.transaction() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("UPDATE accounts SET balance=balance-10 WHERE id='1'")
+                cursor.execute("UPDATE accounts SET balance=balance+10 WHERE id='2'")
+
+        pool.closeall()
+    """
+
+    def __init__(self, factory: Callable[[], Any], validator: Callable[[Any], bool] = None,
+                 min_size: int = 0, max_size: int = 10, idle_timeout: int = 30000, wait_timeout: int = 15000,
+                 validation_interval: int = 5000, counters: ICounters = None, name: str = 'connection.pool'):
+        """
+        Creates a new instance of the pool.
+
+        :param factory: a function to open a new connection.
+        :param validator: (optional) a function that checks if a connection is alive.
+        :param min_size: (optional) a minimum number of connections kept open. Default: 0
+        :param max_size: (optional) a maximum number of connections. Default: 10
+        :param idle_timeout: (optional) time in milliseconds an idle connection is kept open. Default: 30000
+        :param wait_timeout: (optional) time in milliseconds to wait for a free connection. Default: 15000
+        :param validation_interval: (optional) time in milliseconds a connection is idle before it is checked. Default: 5000
+        :param counters: (optional) counters to send pool statistics to.
+        :param name: (optional) a prefix of counter names. Default: connection.pool
+        """
+        self.__factory = factory
+        self.__validator = validator
+        self.__min_size = max(0, min_size)
+        self.__max_size = max(1, max_size)
+        self.__idle_timeout = idle_timeout
+        self.__wait_timeout = wait_timeout
+        self.__validation_interval = validation_interval
+        self.__counters = counters
+        self.__name = name
+
+        self.__condition = threading.Condition()
+        # Idle connections with times they were returned, the most recently used is the last
+        self.__idle: List[Tuple[Any, float]] = []
+        self.__size = 0
+        self.__in_use = 0
+        self.__closed = False
+        self.__transaction: ContextVar = ContextVar(name + '.transaction', default=None)
+
+    def get_size(self) -> int:
+        """
+        Gets the number of connections kept by the pool, both idle and borrowed.
+
+        :return: the number of connections.
+        """
+        return self.__size
+
+    def get_idle_count(self) -> int:
+        """
+        Gets the number of idle connections.
+
+        :return: the number of idle connections.
+        """
+        return len(self.__idle)
+
+    def get_in_use_count(self) -> int:
+        """
+        Gets the number of borrowed connections.
+
+        :return: the number of borrowed connections.
+        """
+        return self.__in_use
+
+    def __take_expired(self, now: float) -> List[Any]:
+        # The oldest connections are at the beginning of the list
+        expired = []
+        while len(self.__idle) > 0 and self.__size > self.__min_size \
+                and (now - self.__idle[0][1]) * 1000 > self.__idle_timeout:
+            expired.append(self.__idle.pop(0)[0])
+            self.__size -= 1
+        return expired
+
+    def __close(self, connections: List[Any]):
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            self.__increment('closed')
+
+    def __increment(self, name: str):
+        if self.__counters is not None:
+            self.__counters.increment_one(self.__name + '.' + name)
+
+    def __update_stats(self):
+        if self.__counters is not None:
+            self.__counters.last(self.__name + '.size', self.__size)
+            self.__counters.last(self.__name + '.in_use', self.__in_use)
+            self.__counters.last(self.__name + '.idle', len(self.__idle))
+
+    def __create(self) -> Any:
+        try:
+            conn = self.__factory()
+        except Exception:
+            with self.__condition:
+                self.__size -= 1
+                self.__in_use -= 1
+                self.__condition.notify()
+            raise
+        self.__increment('created')
+        return conn
+
+    def getconn(self) -> Any:
+        """
+        Borrows a connection from the pool. The connection must be returned by :func:`putconn`.
+
+        :return: a connection.
+        """
+        start = time.monotonic()
+        conn = None
+        idle_since = None
+
+        expired = []
+        try:
+            with self.__condition:
+                while True:
+                    if self.__closed:
+                        raise ConnectionException(None, "POOL_CLOSED", "Connection pool " + self.__name + " is closed")
+
+                    now = time.monotonic()
+                    expired += self.__take_expired(now)
+
+                    if len(self.__idle) > 0:
+                        (conn, idle_since) = self.__idle.pop()
+                        self.__in_use += 1
+                        break
+
+                    if self.__size < self.__max_size:
+                        self.__size += 1
+                        self.__in_use += 1
+                        break
+
+                    remaining = self.__wait_timeout / 1000 - (now - start)
+                    if remaining <= 0:
+                        self.__increment('timeouts')
+                        raise ConnectionException(
+                            None, "POOL_EXHAUSTED",
+                            "No connection in " + self.__name + " became free in " + str(self.__wait_timeout) + " ms"
+                        ).with_details("max_pool_size", self.__max_size)
+
+                    self.__condition.wait(remaining)
+        finally:
+            self.__close(expired)
+
+        # Check connections that were idle for a while before giving them away
+        if conn is not None and self.__validator is not None \
+                and (time.monotonic() - idle_since) * 1000 > self.__validation_interval:
+            valid = False
+            try:
+                valid = self.__validator(conn)
+            except Exception:
+                pass
+            if not valid:
+                self.__increment('broken')
+                self.__close([conn])
+                conn = None
+
+        if conn is None:
+            conn = self.__create()
+
+        if self.__counters is not None:
+            self.__counters.stats(self.__name + '.wait_time', (time.monotonic() - start) * 1000)
+        self.__update_stats()
+
+        return conn
+
+    def putconn(self, conn: Any, discard: bool = False):
+        """
+        Returns a borrowed connection to the pool.
+
+        :param conn: a connection to return.
+        :param discard: (optional) true to close the connection instead of keeping it, e.g. when it is broken.
+        """
+        with self.__condition:
+            self.__in_use -= 1
+            if self.__closed or discard:
+                self.__size -= 1
+            else:
+                self.__idle.append((conn, time.monotonic()))
+                conn = None
+            self.__condition.notify()
+
+        if conn is not None:
+            self.__close([conn])
+        self.__update_stats()
+
+    def closeall(self):
+        """
+        Closes all idle connections. Borrowed connections are closed when they are returned.
+        """
+        with self.__condition:
+            self.__closed = True
+            connections = [conn for (conn, _) in self.__idle]
+            self.__idle = []
+            self.__size -= len(connections)
+            self.__condition.notify_all()
+
+        self.__close(connections)
+        self.__update_stats()
+
+    def get_transaction(self) -> Optional[Any]:
+        """
+        Gets a connection bound to a transaction in the current execution context.
+
+        :return: a connection of the current transaction or None if there is no transaction.
+        """
+        return self.__transaction.get()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Any]:
+        """
+        Borrows a connection and binds it to the current execution context until the block ends.
+        The transaction is committed when the block succeeds and rolled back when it raises an error.
+        A nested call joins the outer transaction, which commits only once at the end.
+
+        :return: a connection of the transaction.
+        """
+        conn = self.__transaction.get()
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self.getconn()
+        token = self.__transaction.set(conn)
+        discard = False
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            # A connection that cannot be rolled back is broken and must not return to the pool
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+            raise
+        finally:
+            self.__transaction.reset(token)
+            self.putconn(conn, discard)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_persistence.persistence.DataRecord
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Data record implementation
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+from copy import deepcopy
+from typing import Any, Dict, Optional
+
+# Immutable values that are shared between copies of records
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class DataRecord:
+    """
+    Lightweight data object that keeps values of record fields as instance attributes.
+
+    Persistences return records of this type for rows and documents read from databases,
+    so the fields are accessed as attributes (``item.id``, ``item.name``)
+    without creating a new class for every record.
+
+    Example:
+
+    .. code-block:: python
+
+        record = DataRecord({'id': '1', 'name': 'ABC'})
+        record.name         # Result: 'ABC'
+        record.name = 'XYZ'
+    """
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None):
+        """
+        Creates a new record and copies field values into it.
+
+        :param values: (optional) a map with field values.
+        """
+        if values is not None:
+            self.__dict__.update(values)
+
+    @staticmethod
+    def wrap(values: Dict[str, Any]) -> 'DataRecord':
+        """
+        Creates a new record that uses the specified map to keep field values without copying it.
+        The map must not be used by the caller after that.
+
+        :param values: a map with field values.
+
+        :return: a created record.
+        """
+        record = DataRecord.__new__(DataRecord)
+        record.__dict__ = values
+        return record
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'DataRecord':
+        values = {}
+        for (name, value) in self.__dict__.items():
+            values[name] = value if type(value) in _IMMUTABLE_TYPES else deepcopy(value, memo)
+        return DataRecord.wrap(values)
+
+    def __repr__(self) -> str:
+        return 'DataRecord(' + repr(self.__dict__) + ')'
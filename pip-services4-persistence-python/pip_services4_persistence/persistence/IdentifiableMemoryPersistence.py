@@ -8,13 +8,15 @@
     :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
     :license: MIT, see LICENSE for more details.
 """
-from typing import Optional, Any, List, TypeVar
+from typing import Optional, Any, Callable, List, TypeVar
 
 from pip_services4_commons.data import AnyValueMap
+from pip_services4_components.config import ConfigParams
 from pip_services4_components.context import IContext
 from pip_services4_data.data import IIdentifiable
 from pip_services4_data.keys import IdGenerator
 
+from .DataRecord import DataRecord
 from .MemoryPersistence import MemoryPersistence
 from ..read import IGetter, ILoader
 from ..write import ISaver
@@ -46,6 +48,7 @@ class IdentifiableMemoryPersistence(MemoryPersistence, IWriter, IGetter, ISetter
     ### Configuration parameters ###
         - options:
             - max_page_size:       Maximum number of items returned in a single page (default: 100)
+            - id_generator:        (optional) id generator mode: random, ordered or sequence (default: random)
 
     ### References ###
         - `*:logger:*:*:1.0`       (optional) ILogger components to pass log messages
@@ -79,9 +82,23 @@ class IdentifiableMemoryPersistence(MemoryPersistence, IWriter, IGetter, ISetter
         """
         super(IdentifiableMemoryPersistence, self).__init__(loader, saver)
 
+        # Function to generate ids of new objects
+        self._id_generator: Callable[[], str] = IdGenerator.next_long
+
+    def configure(self, config: ConfigParams):
+        """
+        Configures component by passing configuration parameters.
+
+        :param config: configuration parameters to be set.
+        """
+        super().configure(config)
+
+        self._id_generator = IdGenerator.get_generator(
+            config.get_as_string_with_default("options.id_generator", IdGenerator.Random))
+
     def __convert_to_obj(self, item):
         if isinstance(item, dict):
-            item = type('object', (object,), item)
+            item = DataRecord(item)
 
         return item
 
@@ -140,7 +157,7 @@ class IdentifiableMemoryPersistence(MemoryPersistence, IWriter, IGetter, ISetter
         item = self.__convert_to_obj(item)
 
         if not hasattr(item, 'id') or item.id is None:
-            item.id = IdGenerator.next_long()
+            item.id = self._id_generator()
 
         return super().create(context, item)
 
@@ -157,7 +174,7 @@ class IdentifiableMemoryPersistence(MemoryPersistence, IWriter, IGetter, ISetter
         item = self.__convert_to_obj(item)
 
         if not hasattr(item, 'id') or item.id is None:
-            item.id = IdGenerator.next_long()
+            item.id = self._id_generator()
 
         with self._lock:
             old_item = self._find_one(item.id)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_persistence.persistence.KeysetToken
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Keyset paging token implementation
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any, Callable, List, Optional
+
+from pip_services4_commons.errors import BadRequestException, UnsupportedException
+
+
+class KeysetToken:
+    """
+    Encodes and decodes tokens for keyset (seek) pagination.
+
+    A token keeps values of the sort keys of the last item on a page.
+    The next page starts right after these values, so it is read using an index
+    without skipping previous items and deep pages cost the same as the first one.
+    Tokens are opaque url-safe strings that are passed in
+    :class:`TokenizedPagingParams <pip_services4_data.query.TokenizedPagingParams.TokenizedPagingParams>`
+    and returned in :class:`TokenizedDataPage <pip_services4_data.query.TokenizedDataPage.TokenizedDataPage>`.
+
+    Key values keep their types, because databases compare values of different types
+    in their own ways, e.g. a date never follows a string. Besides JSON values tokens support
+    datetimes, dates, times, decimals, UUIDs and bytes. Databases with other key types,
+    like MongoDB ObjectIds, pass their own functions to serialize values.
+
+    Example:
+
+    .. code-block:: python
+
+        token = KeysetToken.encode([datetime.date(2023, 1, 1), '123'])
+        KeysetToken.decode(token)       # Result: [datetime.date(2023, 1, 1), '123']
+    """
+
+    __decoders = {
+        '$datetime': datetime.datetime.fromisoformat,
+        '$date': datetime.date.fromisoformat,
+        '$time': datetime.time.fromisoformat,
+        '$decimal': decimal.Decimal,
+        '$uuid': uuid.UUID,
+        '$binary': base64.b64decode,
+    }
+
+    @staticmethod
+    def __encode_value(value: Any) -> Any:
+        # Datetimes are dates, so they are checked first
+        if isinstance(value, datetime.datetime):
+            return {'$datetime': value.isoformat()}
+        if isinstance(value, datetime.date):
+            return {'$date': value.isoformat()}
+        if isinstance(value, datetime.time):
+            return {'$time': value.isoformat()}
+        if isinstance(value, decimal.Decimal):
+            return {'$decimal': str(value)}
+        if isinstance(value, uuid.UUID):
+            return {'$uuid': str(value)}
+        if isinstance(value, (bytes, bytearray)):
+            return {'$binary': base64.b64encode(value).decode('ascii')}
+
+        raise UnsupportedException(
+            None, "UNSUPPORTED_KEY_TYPE", "Key values of type " + type(value).__name__ + " cannot be kept in paging token"
+        ).with_details("type", type(value).__name__)
+
+    @staticmethod
+    def __decode_value(value: dict) -> Any:
+        if len(value) == 1:
+            (name, data) = next(iter(value.items()))
+            decoder = KeysetToken.__decoders.get(name)
+            if decoder is not None:
+                return decoder(data)
+        return value
+
+    @staticmethod
+    def __dumps(values: List[Any]) -> str:
+        return json.dumps(values, default=KeysetToken.__encode_value, separators=(',', ':'))
+
+    @staticmethod
+    def __loads(data: str) -> Any:
+        return json.loads(data, object_hook=KeysetToken.__decode_value)
+
+    @staticmethod
+    def encode(values: List[Any], dumps: Callable[[Any], str] = None) -> str:
+        """
+        Encodes values of sort keys into a token.
+
+        :param values: a list of key values.
+        :param dumps: (optional) a function to serialize values with database specific types.
+        :return: an encoded token.
+        """
+        data = (dumps or KeysetToken.__dumps)(list(values))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def decode(token: Optional[str], key_count: int = None, loads: Callable[[str], Any] = None) -> Optional[List[Any]]:
+        """
+        Decodes values of sort keys from a token.
+
+        :param token: an encoded token or None for the first page.
+        :param key_count: (optional) an expected number of key values.
+        :param loads: (optional) a function to deserialize values serialized by the function passed to :func:`encode`.
+        :return: a list of key values or None if token is not set.
+        """
+        if token is None or token == '':
+            return None
+
+        try:
+            values = (loads or KeysetToken.__loads)(base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8'))
+        except (ValueError, TypeError, ArithmeticError):
+            values = None
+
+        if not isinstance(values, list) or (key_count is not None and len(values) != key_count):
+            raise BadRequestException(
+                None, "INVALID_PAGING_TOKEN", "Paging token " + token + " is invalid"
+            ).with_details("token", token)
+
+        return values
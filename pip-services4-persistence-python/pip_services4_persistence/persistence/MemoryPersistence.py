@@ -25,6 +25,7 @@ from pip_services4_data.query.DataPage import DataPage
 
 from pip_services4_persistence.read import ILoader
 from pip_services4_persistence.write.ISaver import ISaver
+from .DataRecord import DataRecord
 
 filtered = filter
 
@@ -168,7 +169,7 @@ class MemoryPersistence(IConfigurable, IReferenceable, IOpenable, ICleanable):
 
     def __convert_to_obj(self, item):
         if isinstance(item, dict):
-            item = type('object', (object,), item)
+            item = DataRecord(item)
 
         return item
 
@@ -212,12 +213,12 @@ class MemoryPersistence(IConfigurable, IReferenceable, IOpenable, ICleanable):
 
         :return: a data page of result by filter.
         """
+        # Filter before copying, so only matched items are copied
         with self._lock:
-            items = deepcopy(self._items)
+            items = self._items if filter is None else list(filtered(filter, self._items))
+            items = deepcopy(items)
 
-        # Filter and sort
-        if filter is not None:
-            items = list(filtered(filter, items))
+        # Sort
         if sort is not None:
             items = list(filtered(sort, items))
             # items = sorted(items, sort)
@@ -261,12 +262,12 @@ class MemoryPersistence(IConfigurable, IReferenceable, IOpenable, ICleanable):
 
         :return: a data list of results by filter.
         """
+        # Filter before copying, so only matched items are copied
         with self._lock:
-            items = deepcopy(self._items)
+            items = self._items if filter is None else list(filtered(filter, self._items))
+            items = deepcopy(items)
 
-        # Filter and sort
-        if not (filter is None):
-            items = list(filtered(filter, items))
+        # Sort
         if not (sort is None):
             items = list(sorted(items, key=sort))
 
@@ -289,12 +290,9 @@ class MemoryPersistence(IConfigurable, IReferenceable, IOpenable, ICleanable):
         :return:  a number of data items that satisfy the filter.
         """
 
+        # Items are only counted, so they are not copied
         with self._lock:
-            items = deepcopy(self._items)
-
-        # Filter and sort
-        if not (filter is None):
-            items = list(filtered(filter, items))
+            items = self._items if filter is None else list(filtered(filter, self._items))
 
         self._logger.trace(context, f"Retrieved {len(items)} items")
 
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_persistence.persistence.RecordConverter
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Record converter implementation
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+from typing import Any, Callable, Dict, Optional
+
+from pip_services4_commons.errors import ConfigException
+
+from .DataRecord import DataRecord
+
+
+class RecordConverter:
+    """
+    Converts rows and documents read from databases into objects returned by persistences.
+
+    Supported modes:
+        - record:   :class:`DataRecord <pip_services4_persistence.persistence.DataRecord.DataRecord>` objects with fields as attributes (default)
+        - dict:     plain dictionaries
+        - class:    a new class per record with fields as class attributes (legacy behavior)
+
+    When a record type is set, records are created by calling the type with fields as keyword arguments,
+    for instance, to return dataclass instances. The record type takes precedence over the mode.
+
+    Example:
+
+    .. code-block:: python
+
+        converter = RecordConverter(RecordConverter.Record)
+        converter.to_public({'id': '1', 'name': 'ABC'}).name       # Result: 'ABC'
+
+        converter.set_record_type(MyDataClass)
+        converter.to_public({'id': '1', 'name': 'ABC'})            # Result: MyDataClass(id='1', name='ABC')
+    """
+
+    Record = 'record'
+    Dictionary = 'dict'
+    Class = 'class'
+
+    __modes = (Record, Dictionary, Class)
+
+    def __init__(self, mode: str = Record, record_type: Optional[Callable[..., Any]] = None):
+        """
+        Creates a new instance of the converter.
+
+        :param mode: (optional) a conversion mode: record, dict or class. Default: record
+
+        :param record_type: (optional) a type to create records with.
+        """
+        self.__mode: str = RecordConverter.Record
+        self.__record_type: Optional[Callable[..., Any]] = record_type
+        self.set_mode(mode)
+
+    def get_mode(self) -> str:
+        """
+        Gets the conversion mode.
+
+        :return: the conversion mode.
+        """
+        return self.__mode
+
+    def set_mode(self, mode: str):
+        """
+        Sets the conversion mode.
+
+        :param mode: a conversion mode: record, dict or class.
+        """
+        mode = (mode or RecordConverter.Record).lower()
+        if mode not in RecordConverter.__modes:
+            raise ConfigException(
+                None, "WRONG_RECORD_MODE", "Record conversion mode " + mode + " is not supported"
+            ).with_details("mode", mode)
+        self.__mode = mode
+
+    def get_record_type(self) -> Optional[Callable[..., Any]]:
+        """
+        Gets the type used to create records.
+
+        :return: the record type or None if records are created according to the mode.
+        """
+        return self.__record_type
+
+    def set_record_type(self, record_type: Optional[Callable[..., Any]]):
+        """
+        Sets the type used to create records. The type is called with record fields as keyword arguments.
+
+        :param record_type: a record type or None to create records according to the mode.
+        """
+        self.__record_type = record_type
+
+    def to_public(self, value: Optional[Dict[str, Any]]) -> Any:
+        """
+        Converts a row or a document into a public object.
+        The converted map must not be used by the caller after that.
+
+        :param value: a map with field values.
+
+        :return: a converted object.
+        """
+        if value is None:
+            return None
+
+        if self.__record_type is not None:
+            return self.__record_type(**value)
+
+        if self.__mode == RecordConverter.Record:
+            return DataRecord.wrap(value) if type(value) == dict else DataRecord(value)
+
+        if self.__mode == RecordConverter.Dictionary:
+            return value
+
+        return type('object', (object,), value)
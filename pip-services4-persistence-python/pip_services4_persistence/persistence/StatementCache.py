@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+    pip_services4_persistence.persistence.StatementCache
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Statement cache implementation
+
+    :copyright: Conceptual Vision Consulting LLC 2018-2019, see AUTHORS for more details.
+    :license: MIT, see LICENSE for more details.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from pip_services4_observability.count import ICounters
+
+class StatementCache:
+    """
+    Keeps texts of generated database statements, so they are built only once
+    for each operation and set of columns.
+
+    Persistences build statements by concatenating quoted table and column names
+    and parameter placeholders. The cache returns the same text for the same key,
+    which also lets database servers reuse their plans for parameterized statements.
+    The least recently used statements are removed when the cache is full.
+
+    Cache statistics are sent to counters with the specified name prefix:
+        - <name>.hits:         number of statements taken from the cache
+        - <name>.misses:       number of statements built because they were not in the cache
+
+    Example:
+
+    .. code-block:: python
+
+        cache = StatementCache(100)
+        query = cache.get(('get_one_by_id',), lambda: 'SELECT * FROM "dummies" WHERE "id"=%s')
+
+        cache.get_hits()        # Result: 0
+        cache.get_misses()      # Result: 1
+    """
+
+    def __init__(self, max_size: int = 100, counters: ICounters = None, name: str = 'statement.cache'):
+        """
+        Creates a new instance of the cache.
+
+        :param max_size: (optional) a maximum number of kept statements. 0 disables caching. Default: 100
+        :param counters: (optional) counters to send cache statistics to.
+        :param name: (optional) a prefix of counter names. Default: statement.cache
+        """
+        self.__lock = threading.Lock()
+        self.__statements: OrderedDict = OrderedDict()
+        self.__max_size: int = max_size
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__counters = counters
+        self.__name = name
+
+    def get_max_size(self) -> int:
+        """
+        Gets the maximum number of kept statements.
+
+        :return: the maximum number of statements.
+        """
+        return self.__max_size
+
+    def set_max_size(self, max_size: int):
+        """
+        Sets the maximum number of kept statements and removes statements over the limit.
+
+        :param max_size: a maximum number of statements. 0 disables caching.
+        """
+        with self.__lock:
+            self.__max_size = max(0, max_size)
+            while len(self.__statements) > self.__max_size:
+                self.__statements.popitem(last=False)
+
+    def get(self, key: Any, build: Callable[[], str]) -> str:
+        """
+        Gets a statement by its key. The statement is built and kept on a cache miss.
+
+        :param key: a hashable key, usually a name of the operation and a tuple of column names.
+        :param build: a function to build the statement.
+        :return: the statement text.
+        """
+        with self.__lock:
+            statement = self.__statements.get(key)
+            if statement is not None:
+                self.__statements.move_to_end(key)
+                self.__hits += 1
+                hit = True
+            else:
+                self.__misses += 1
+                hit = False
+
+        if hit:
+            self.__increment('hits')
+            return statement
+        self.__increment('misses')
+
+        statement = build()
+
+        if self.__max_size > 0:
+            with self.__lock:
+                self.__statements[key] = statement
+                if len(self.__statements) > self.__max_size:
+                    self.__statements.popitem(last=False)
+
+        return statement
+
+    def __increment(self, name: str):
+        if self.__counters is not None:
+            self.__counters.increment_one(self.__name + '.' + name)
+
+    def get_hits(self) -> int:
+        """
+        Gets the number of statements taken from the cache.
+
+        :return: the number of cache hits.
+        """
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Gets the number of statements built because they were not in the cache.
+
+        :return: the number of cache misses.
+        """
+        return self.__misses
+
+    def get_size(self) -> int:
+        """
+        Gets the number of kept statements.
+
+        :return: the number of statements.
+        """
+        return len(self.__statements)
+
+    def clear(self):
+        """
+        Removes all kept statements and resets counters.
+        """
+        with self.__lock:
+            self.__statements = OrderedDict()
+            self.__hits = 0
+            self.__misses = 0
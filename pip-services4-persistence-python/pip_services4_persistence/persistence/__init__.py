@@ -22,10 +22,16 @@
 """
 
 __all__ = ['MemoryPersistence', 'IdentifiableMemoryPersistence',
-           'FilePersistence', 'IdentifiableFilePersistence', 'JsonFilePersister']
+           'FilePersistence', 'IdentifiableFilePersistence', 'JsonFilePersister',
+           'DataRecord', 'RecordConverter', 'KeysetToken', 'StatementCache', 'ConnectionPool']
 
 from .MemoryPersistence import MemoryPersistence
 from .IdentifiableMemoryPersistence import IdentifiableMemoryPersistence
 from .FilePersistence import FilePersistence
 from .IdentifiableFilePersistence import IdentifiableFilePersistence
-from .JsonFilePersister import JsonFilePersister
\ No newline at end of file
+from .JsonFilePersister import JsonFilePersister
+from .DataRecord import DataRecord
+from .RecordConverter import RecordConverter
+from .KeysetToken import KeysetToken
+from .StatementCache import StatementCache
+from .ConnectionPool import ConnectionPool
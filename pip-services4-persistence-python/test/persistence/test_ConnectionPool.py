@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+from pip_services4_commons.errors import ConnectionException
+from pip_services4_observability.count import NullCounters
+
+from pip_services4_persistence.persistence import ConnectionPool
+
+
+class DummyConnection:
+
+    def __init__(self):
+        self.closed = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class DummyCounters(NullCounters):
+
+    def __init__(self):
+        self.values = {}
+
+    def increment_one(self, name: str):
+        self.values[name] = self.values.get(name, 0) + 1
+
+    def last(self, name: str, value: float):
+        self.values[name] = value
+
+
+class TestConnectionPool:
+
+    def test_reuse_connections(self):
+        pool = ConnectionPool(DummyConnection, max_size=2)
+
+        conn1 = pool.getconn()
+        conn2 = pool.getconn()
+        assert conn1 is not conn2
+        assert 2 == pool.get_size()
+        assert 2 == pool.get_in_use_count()
+
+        pool.putconn(conn1)
+        assert 1 == pool.get_idle_count()
+        assert conn1 is pool.getconn()
+
+        pool.putconn(conn1)
+        pool.putconn(conn2, True)
+        assert conn2.closed
+        assert 1 == pool.get_size()
+
+        pool.closeall()
+        assert conn1.closed
+        assert 0 == pool.get_size()
+
+        with pytest.raises(ConnectionException):
+            pool.getconn()
+
+    def test_wait_timeout(self):
+        pool = ConnectionPool(DummyConnection, max_size=1, wait_timeout=50)
+
+        conn = pool.getconn()
+        with pytest.raises(ConnectionException):
+            pool.getconn()
+
+        # A returned connection is given to a waiting caller
+        timer = threading.Timer(0.01, lambda: pool.putconn(conn))
+        timer.start()
+        assert conn is pool.getconn()
+        timer.join()
+
+    def test_idle_timeout_and_validation(self):
+        pool = ConnectionPool(DummyConnection, lambda conn: False,
+                                       max_size=2, idle_timeout=10, validation_interval=0)
+
+        conn1 = pool.getconn()
+        pool.putconn(conn1)
+        time.sleep(0.02)
+
+        # Expired idle connections are closed
+        conn2 = pool.getconn()
+        assert conn1.closed
+        assert conn1 is not conn2
+        assert 1 == pool.get_size()
+
+        # Connections that fail the check are replaced
+        pool.putconn(conn2)
+        conn3 = pool.getconn()
+        assert conn2.closed
+        assert conn2 is not conn3
+        assert 1 == pool.get_size()
+
+    def test_counters(self):
+        counters = DummyCounters()
+        pool = ConnectionPool(DummyConnection, max_size=1, wait_timeout=0, counters=counters, name='dummy.pool')
+
+        conn = pool.getconn()
+        assert 1 == counters.values['dummy.pool.created']
+        assert 1 == counters.values['dummy.pool.in_use']
+        assert 0 == counters.values['dummy.pool.idle']
+
+        with pytest.raises(ConnectionException):
+            pool.getconn()
+        assert 1 == counters.values['dummy.pool.timeouts']
+
+        pool.putconn(conn)
+        assert 0 == counters.values['dummy.pool.in_use']
+        assert 1 == counters.values['dummy.pool.idle']
+
+    def test_transaction(self):
+        pool = ConnectionPool(DummyConnection, max_size=2)
+        assert pool.get_transaction() is None
+
+        with pool.transaction() as conn:
+            assert conn is pool.get_transaction()
+            assert 1 == pool.get_in_use_count()
+
+            # Nested transactions join the outer one
+            with pool.transaction() as nested:
+                assert conn is nested
+            assert 0 == conn.commits
+
+        assert pool.get_transaction() is None
+        assert 1 == conn.commits
+        assert 0 == pool.get_in_use_count()
+
+        with pytest.raises(ValueError):
+            with pool.transaction() as conn:
+                raise ValueError('Test error')
+
+        assert 1 == conn.rollbacks
+        assert 1 == pool.get_idle_count()
+        assert pool.get_transaction() is None
+
+    def test_transaction_per_thread(self):
+        pool = ConnectionPool(DummyConnection, max_size=2)
+        other = []
+
+        with pool.transaction() as conn:
+            thread = threading.Thread(target=lambda: other.append(pool.get_transaction()))
+            thread.start()
+            thread.join()
+
+        assert conn is not None
+        assert [None] == other
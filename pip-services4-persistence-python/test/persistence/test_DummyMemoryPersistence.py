@@ -9,8 +9,11 @@
     :license: MIT, see LICENSE for more details.
 """
 
+from pip_services4_components.config import ConfigParams
+
 from .DummyMemoryPersistence import DummyMemoryPersistence
 from .. import IDummyPersistence
+from ..Dummy import Dummy
 from ..DummyPersistenceFixture import DummyPersistenceFixture
 
 
@@ -30,3 +33,13 @@ class TestDummyMemoryPersistence:
 
     def test_batch_operations(self):
         self.fixture.test_batch_operations()
+
+    def test_ordered_ids(self):
+        persistence = DummyMemoryPersistence()
+        persistence.configure(ConfigParams.from_tuples("options.id_generator", "ordered"))
+
+        dummy1 = persistence.create(None, Dummy(None, 'Key 1', 'Content 1'))
+        dummy2 = persistence.create(None, Dummy(None, 'Key 2', 'Content 2'))
+
+        assert len(dummy1.id) == 32
+        assert dummy1.id < dummy2.id
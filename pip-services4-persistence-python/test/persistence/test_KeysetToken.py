@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import datetime
+import decimal
+import uuid
+
+import pytest
+from pip_services4_commons.errors import BadRequestException, UnsupportedException
+
+from pip_services4_persistence.persistence import KeysetToken
+
+
+class TestKeysetToken:
+
+    def test_encode_decode(self):
+        token = KeysetToken.encode(['Key 1', 123, None])
+        assert isinstance(token, str)
+        assert ['Key 1', 123, None] == KeysetToken.decode(token)
+        assert ['Key 1', 123, None] == KeysetToken.decode(token, 3)
+
+    def test_typed_values(self):
+        values = [datetime.datetime(2023, 1, 1, 10, 20, 30, 400000), datetime.date(2023, 1, 1),
+                  datetime.time(10, 20), decimal.Decimal('1.10'), uuid.uuid4(), b'\x00\xff', '2023-01-01']
+        result = KeysetToken.decode(KeysetToken.encode(values))
+        assert values == result
+        assert [type(value) for value in values] == [type(value) for value in result]
+
+        with pytest.raises(UnsupportedException):
+            KeysetToken.encode([object()])
+
+    def test_custom_serialization(self):
+        token = KeysetToken.encode([1, 2], dumps=lambda values: ','.join(map(str, values)))
+        assert [1, 2] == KeysetToken.decode(token, 2, loads=lambda data: list(map(int, data.split(','))))
+
+    def test_empty_token(self):
+        assert KeysetToken.decode(None) is None
+        assert KeysetToken.decode('') is None
+
+    def test_invalid_token(self):
+        with pytest.raises(BadRequestException):
+            KeysetToken.decode('not a token')
+
+        with pytest.raises(BadRequestException):
+            KeysetToken.decode(KeysetToken.encode(['1']), 2)
+
+        with pytest.raises(BadRequestException):
+            KeysetToken.decode(KeysetToken.encode([{'$date': 'not a date'}]))
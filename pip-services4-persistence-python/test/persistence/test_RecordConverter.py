@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from copy import deepcopy
+from dataclasses import dataclass
+
+from pip_services4_commons.errors import ConfigException
+from pip_services4_commons.reflect import PropertyReflector
+
+from pip_services4_persistence.persistence import DataRecord, RecordConverter
+
+
+@dataclass
+class DummyRecord:
+    id: str
+    key: str
+
+
+class TestRecordConverter:
+
+    def test_record_mode(self):
+        converter = RecordConverter()
+        assert RecordConverter.Record == converter.get_mode()
+
+        item = converter.to_public({'id': '1', 'key': 'Key 1'})
+        assert isinstance(item, DataRecord)
+        assert '1' == item.id
+        assert 'Key 1' == item.key
+        assert {'id': '1', 'key': 'Key 1'} == PropertyReflector.get_properties(item)
+
+        item.key = 'Key 2'
+        assert 'Key 2' == item.key
+
+        assert converter.to_public(None) is None
+
+    def test_other_modes(self):
+        converter = RecordConverter(RecordConverter.Dictionary)
+        assert {'id': '1'} == converter.to_public({'id': '1'})
+
+        converter.set_mode('CLASS')
+        assert '1' == converter.to_public({'id': '1'}).id
+
+        try:
+            converter.set_mode('unknown')
+            assert False, 'Exception expected'
+        except ConfigException as err:
+            assert 'WRONG_RECORD_MODE' == err.code
+
+    def test_record_type(self):
+        converter = RecordConverter()
+        converter.set_record_type(DummyRecord)
+
+        item = converter.to_public({'id': '1', 'key': 'Key 1'})
+        assert DummyRecord('1', 'Key 1') == item
+
+    def test_copy_record(self):
+        item = DataRecord({'id': '1', 'tags': ['a']})
+        copy = deepcopy(item)
+
+        copy.tags.append('b')
+        assert ['a'] == item.tags
+        assert '1' == copy.id
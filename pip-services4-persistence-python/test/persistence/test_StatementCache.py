@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from pip_services4_observability.count import NullCounters
+
+from pip_services4_persistence.persistence import StatementCache
+
+
+class DummyCounters(NullCounters):
+
+    def __init__(self):
+        self.values = {}
+
+    def increment_one(self, name: str):
+        self.values[name] = self.values.get(name, 0) + 1
+
+
+class TestStatementCache:
+
+    def test_get(self):
+        cache = StatementCache()
+        builds = []
+
+        def build():
+            builds.append(1)
+            return 'SELECT * FROM "dummies" WHERE "id"=%s'
+
+        statement = cache.get(('get_one_by_id',), build)
+        assert 'SELECT * FROM "dummies" WHERE "id"=%s' == statement
+
+        statement = cache.get(('get_one_by_id',), build)
+        assert 'SELECT * FROM "dummies" WHERE "id"=%s' == statement
+
+        assert 1 == len(builds)
+        assert 1 == cache.get_hits()
+        assert 1 == cache.get_misses()
+        assert 1 == cache.get_size()
+
+        cache.clear()
+        assert 0 == cache.get_hits()
+        assert 0 == cache.get_misses()
+        assert 0 == cache.get_size()
+
+    def test_max_size(self):
+        cache = StatementCache(2)
+        cache.get(('create', ('id', 'key')), lambda: 'A')
+        cache.get(('create', ('id', 'content')), lambda: 'B')
+        cache.get(('create', ('id', 'key')), lambda: 'A')
+        cache.get(('update', ('id', 'key')), lambda: 'C')
+
+        # The least recently used statement is removed
+        assert 2 == cache.get_size()
+        assert 'A' == cache.get(('create', ('id', 'key')), lambda: 'X')
+        assert 'X' == cache.get(('create', ('id', 'content')), lambda: 'X')
+
+        cache.set_max_size(0)
+        assert 0 == cache.get_size()
+        cache.get(('create', ('id', 'key')), lambda: 'A')
+        assert 0 == cache.get_size()
+
+    def test_counters(self):
+        counters = DummyCounters()
+        cache = StatementCache(counters=counters, name='dummy.statements')
+
+        cache.get(('get_one_by_id',), lambda: 'A')
+        cache.get(('get_one_by_id',), lambda: 'A')
+        cache.get(('delete_by_id',), lambda: 'B')
+
+        assert 1 == counters.values['dummy.statements.hits']
+        assert 2 == counters.values['dummy.statements.misses']
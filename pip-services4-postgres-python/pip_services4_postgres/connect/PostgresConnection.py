@@ -6,8 +6,10 @@ from pip_services4_components.config import IConfigurable, ConfigParams
 from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IReferences
 from pip_services4_components.run import IOpenable
+from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
-from psycopg2 import pool
+from pip_services4_persistence.persistence import ConnectionPool
+import psycopg2
 
 from pip_services4_postgres.connect.PostgresConnectionResolver import PostgresConnectionResolver
 
@@ -32,10 +34,14 @@ class PostgresConnection(IReferenceable, IConfigurable, IOpenable):
         - options:
             - connect_timeout:      (optional) number of milliseconds to wait before timing out when connecting a new client (default: 0)
             - idle_timeout:         (optional) number of milliseconds a client must sit idle in the pool and not be checked out (default: 10000)
+            - min_pool_size:        (optional) minimum number of clients the pool keeps open (default: 1)
             - max_pool_size:        (optional) maximum number of clients the pool should contain (default: 10)
+            - wait_timeout:         (optional) number of milliseconds to wait for a free client when all clients are in use (default: 15000)
+            - validation_interval:  (optional) number of milliseconds a client sits idle before it is checked on borrow (default: 5000)
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
+        - `*:counters:*:*:1.0`         (optional) :class:`ICounters <pip_services4_observability.count.ICounters.ICounters>` components to pass pool statistics
         - `*:discovery:*:*:1.0`        (optional) :class:`IDiscovery <pip_services4_config.connect.IDiscovery.IDiscovery>` services
         - `*:credential-store:*:*:1.0` (optional) :class:`ICredentialStore <pip_services4_config.auth.ICredentialStore.ICredentialStore>` stores to resolve credentials
 
@@ -49,12 +55,18 @@ class PostgresConnection(IReferenceable, IConfigurable, IOpenable):
 
             "options.connect_timeout", 0,
             "options.idle_timeout", 10000,
-            "options.max_pool_size", 3
+            "options.min_pool_size", 1,
+            "options.max_pool_size", 3,
+            "options.wait_timeout", 15000,
+            "options.validation_interval", 5000
         )
 
         # The logger.
         self._logger: CompositeLogger = CompositeLogger()
 
+        # The performance counters.
+        self._counters: CompositeCounters = CompositeCounters()
+
         # The connection resolver.
         self._connection_resolver: PostgresConnectionResolver = PostgresConnectionResolver()
 
@@ -86,6 +98,7 @@ class PostgresConnection(IReferenceable, IConfigurable, IOpenable):
         :param references: references to locate the component dependencies.
         """
         self._logger.set_references(references)
+        self._counters.set_references(references)
         self._connection_resolver.set_references(references)
 
     def is_open(self) -> bool:
@@ -125,19 +138,33 @@ class PostgresConnection(IReferenceable, IConfigurable, IOpenable):
                 config.update(self.__compose_settings())
 
                 idle_timeout_millis = config.pop('idle_timeout_millis')
+                max_pool_size = config.pop('maxConnection')
+
+                def connect() -> Any:
+                    conn = psycopg2.connect(**config)
+                    # set idle timeout
+                    if idle_timeout_millis:
+                        with conn.cursor() as cursor:
+                            cursor.execute(
+                                f"SET SESSION idle_in_transaction_session_timeout = '{idle_timeout_millis}';")
+                        conn.commit()
+                    return conn
+
+                connection = ConnectionPool(
+                    connect, PostgresConnection.__check_connection,
+                    min_size=self._options.get_as_integer_with_default("min_pool_size", 1),
+                    max_size=max_pool_size,
+                    idle_timeout=idle_timeout_millis or 10000,
+                    wait_timeout=self._options.get_as_integer_with_default("wait_timeout", 15000),
+                    validation_interval=self._options.get_as_integer_with_default("validation_interval", 5000),
+                    counters=self._counters,
+                    name='postgres.pool'
+                )
 
                 # Try to connect
-                self._connection = pool.ThreadedConnectionPool(1, config.pop('maxConnection'), **config)
-
-                # set idle timeout
-                if idle_timeout_millis:
-                    conn = self._connection.getconn()
-                    cursor = conn.cursor()
-                    cursor.execute(f"SET SESSION idle_in_transaction_session_timeout = '{idle_timeout_millis}';")
-                    conn.commit()
-                    cursor.close()
-                    self._connection.putconn(conn)
+                connection.putconn(connection.getconn())
 
+                self._connection = connection
                 self._database_name = config['dbname']
 
             except Exception as err:
@@ -167,6 +194,15 @@ class PostgresConnection(IReferenceable, IConfigurable, IOpenable):
             ConnectionException(ContextResolver.get_trace_id(context), 'DISCONNECT_FAILED',
                                 'Disconnect from postgres failed: ').with_cause(err)
 
+    @staticmethod
+    def __check_connection(conn: Any) -> bool:
+        if conn.closed:
+            return False
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        conn.rollback()
+        return True
+
     def get_connection(self) -> Any:
         return self._connection
 
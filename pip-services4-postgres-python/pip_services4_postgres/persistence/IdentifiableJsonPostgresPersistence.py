@@ -169,7 +169,10 @@ class IdentifiableJsonPostgresPersistence(IdentifiablePostgresPersistence):
         if data is None or id is None:
             return
 
-        query = "UPDATE " + self._quoted_table_name() + " SET \"data\"=\"data\"||%s WHERE \"id\"=%s RETURNING *"
+        query = self._statement_cache.get(
+            ('update_partially',),
+            lambda: "UPDATE " + self._quoted_table_name() + " SET \"data\"=\"data\"||%s WHERE \"id\"=%s RETURNING *"
+        )
 
         values = [json.dumps(data.get_as_object()), id]
 
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from copy import deepcopy
-from typing import Any, List, Optional, TypeVar
+from typing import Any, Callable, List, Optional, TypeVar
 
 from pip_services4_commons.data import AnyValueMap
+from pip_services4_components.config import ConfigParams
 from pip_services4_components.context import IContext
 from pip_services4_data.keys import IdGenerator
 
@@ -41,6 +42,7 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
             - connect_timeout:      (optional) number of milliseconds to wait before timing out when connecting a new client (default: 0)
             - idle_timeout:         (optional) number of milliseconds a client must sit idle in the pool and not be checked out (default: 10000)
             - max_pool_size:        (optional) maximum number of clients the pool should contain (default: 10)
+            - id_generator:         (optional) id generator mode: random, ordered or sequence (default: random)
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
@@ -98,6 +100,20 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
         # Flag to turn on automated string ID generation
         self._auto_generate_id: bool = True
 
+        # Function to generate ids of new objects
+        self._id_generator: Callable[[], str] = IdGenerator.next_long
+
+    def configure(self, config: ConfigParams):
+        """
+        Configures component by passing configuration parameters.
+
+        :param config: configuration parameters to be set.
+        """
+        super().configure(config)
+
+        self._id_generator = IdGenerator.get_generator(
+            config.get_as_string_with_default("options.id_generator", IdGenerator.Random))
+
     def _convert_from_public_partial(self, value: Any) -> Any:
         """
         Converts the given object from the public partial format.
@@ -115,8 +131,11 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
         :param ids: ids of data items to be retrieved
         :return: data list
         """
-        params = self._generate_parameters(ids)
-        query = "SELECT * FROM " + self._quoted_table_name() + " WHERE \"id\" IN(" + params + ")"
+        query = self._statement_cache.get(
+            ('get_list_by_ids', len(ids)),
+            lambda: "SELECT * FROM " + self._quoted_table_name()
+                    + " WHERE \"id\" IN(" + self._generate_parameters(ids) + ")"
+        )
         result = self._request(query, ids)
         items = result['items']
 
@@ -134,7 +153,10 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
         :param id: an id of data item to be retrieved.
         :return: data item
         """
-        query = "SELECT * FROM " + self._quoted_table_name() + " WHERE \"id\"=%s"
+        query = self._statement_cache.get(
+            ('get_one_by_id',),
+            lambda: "SELECT * FROM " + self._quoted_table_name() + " WHERE \"id\"=%s"
+        )
         params = [id]
 
         result = self._request(query, params)
@@ -162,7 +184,7 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
         new_item = item
         if new_item.id is None and self._auto_generate_id:
             new_item = deepcopy(new_item)
-            new_item.id = item.id or IdGenerator.next_long()
+            new_item.id = item.id or self._id_generator()
 
         return super().create(context, new_item)
 
@@ -181,18 +203,18 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
         # Assign unique id
         if item.id is None and self._auto_generate_id:
             item = deepcopy(item)
-            item.id = item.id or IdGenerator.next_long()
+            item.id = item.id or self._id_generator()
 
         row = self._convert_from_public(item)
-        columns = self._generate_columns(row)
-        params = self._generate_parameters(row)
-        set_params = self._generate_set_parameters(row)
         values = self._generate_values(row)
         values += deepcopy(values)
 
-        query = "INSERT INTO " + self._quoted_table_name() + " (" + columns + ")" \
-                + " VALUES (" + params + ")" \
-                + " ON CONFLICT (\"id\") DO UPDATE SET " + set_params + " RETURNING *"
+        query = self._statement_cache.get(
+            ('set', tuple(row.keys())),
+            lambda: "INSERT INTO " + self._quoted_table_name() + " (" + self._generate_columns(row) + ")"
+                    + " VALUES (" + self._generate_parameters(row) + ")"
+                    + " ON CONFLICT (\"id\") DO UPDATE SET " + self._generate_set_parameters(row) + " RETURNING *"
+        )
 
         result = self._request(query, values)
         self._logger.trace(context, "Set in %s with id = %s", self._quote_identifier(self._table_name),
@@ -215,12 +237,14 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
             return
 
         row = self._convert_from_public(item)
-        params = self._generate_set_parameters(row)
         values = self._generate_values(row)
         values.append(row['id'])
 
-        query = "UPDATE " + self._quoted_table_name() \
-                + " SET " + params + " WHERE \"id\"=%s RETURNING *"
+        query = self._statement_cache.get(
+            ('update', tuple(row.keys())),
+            lambda: "UPDATE " + self._quoted_table_name()
+                    + " SET " + self._generate_set_parameters(row) + " WHERE \"id\"=%s RETURNING *"
+        )
 
         result = self._request(query, values)
 
@@ -244,12 +268,14 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
             return
 
         row = self._convert_from_public_partial(data)
-        params = self._generate_set_parameters(row)
         values = self._generate_values(row)
         values.append(id)
 
-        query = "UPDATE " + self._quoted_table_name() \
-                + " SET " + params + " WHERE \"id\"=%s RETURNING *"
+        query = self._statement_cache.get(
+            ('update_partially', tuple(row.keys())),
+            lambda: "UPDATE " + self._quoted_table_name()
+                    + " SET " + self._generate_set_parameters(row) + " WHERE \"id\"=%s RETURNING *"
+        )
 
         result = self._request(query, values)
 
@@ -269,7 +295,10 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
         """
         values = [id]
 
-        query = "DELETE FROM " + self._quoted_table_name() + " WHERE \"id\"=%s RETURNING *"
+        query = self._statement_cache.get(
+            ('delete_by_id',),
+            lambda: "DELETE FROM " + self._quoted_table_name() + " WHERE \"id\"=%s RETURNING *"
+        )
 
         result = self._request(query, values)
 
@@ -286,8 +315,11 @@ class IdentifiablePostgresPersistence(PostgresPersistence):
         :param context: (optional) transaction id to trace execution through call chain.
         :param ids: ids of data items to be deleted.
         """
-        params = self._generate_parameters(ids)
-        query = "DELETE FROM " + self._quoted_table_name() + " WHERE \"id\" IN(" + params + ")"
+        query = self._statement_cache.get(
+            ('delete_by_ids', len(ids)),
+            lambda: "DELETE FROM " + self._quoted_table_name()
+                    + " WHERE \"id\" IN(" + self._generate_parameters(ids) + ")"
+        )
 
         result = self._request(query, ids)
         count = result['rowcount'] if result['rowcount'] else 0
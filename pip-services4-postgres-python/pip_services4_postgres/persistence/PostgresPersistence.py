@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import random
-from typing import List, Any, Optional, TypeVar
+from contextlib import contextmanager
+from typing import List, Any, Optional, TypeVar, Iterator
 
 from pip_services4_commons.convert import LongConverter
 from pip_services4_commons.errors import InvalidStateException, ConnectionException
@@ -10,11 +11,14 @@ from pip_services4_components.config import IConfigurable, ConfigParams
 from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IUnreferenceable, IReferences, DependencyResolver
 from pip_services4_components.run import IOpenable, ICleanable
-from pip_services4_data.query import PagingParams, DataPage
+from pip_services4_data.keys import IdGenerator
+from pip_services4_data.query import PagingParams, DataPage, TokenizedPagingParams, TokenizedDataPage
+from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
+from pip_services4_persistence.persistence import RecordConverter, KeysetToken, StatementCache
 
 from pip_services4_postgres.connect.PostgresConnection import PostgresConnection
-from psycopg2 import ProgrammingError
+from psycopg2 import Error, ProgrammingError
 
 T = TypeVar('T')  # Declare type variable
 
@@ -44,11 +48,17 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
             - connect_timeout:      (optional) number of milliseconds to wait before timing out when connecting a new client (default: 0)
             - idle_timeout:         (optional) number of milliseconds a client must sit idle in the pool and not be checked out (default: 10000)
             - max_pool_size:        (optional) maximum number of clients the pool should contain (default: 10)
+            - record_mode:          (optional) type of returned records: record, dict or class (default: record)
+            - stream_batch_size:    (optional) number of rows fetched at once by streaming queries (default: 1000)
+            - statement_cache_size: (optional) maximum number of generated statements kept in cache, 0 to disable (default: 100)
+
+    Statement cache hits and misses are sent to counters postgres.statements.hits and postgres.statements.misses.
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
         - `*:discovery:*:*:1.0`        (optional) :class:`IDiscovery <pip_services4_config.connect.IDiscovery.IDiscovery>` services
         - `*:credential-store:*:*:1.0` (optional) :class:`ICredentialStore <pip_services4_config.auth.ICredentialStore.ICredentialStore>` stores to resolve credentials
+        - `*:counters:*:*:1.0`         (optional) :class:`ICounters <pip_services4_observability.count.ICounters.ICounters>` components to pass statement cache statistics
 
     Example:
 
@@ -123,6 +133,9 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
         # The logger.
         self._logger: CompositeLogger = CompositeLogger()
 
+        # The performance counters.
+        self._counters: CompositeCounters = CompositeCounters()
+
         # The PostgreSQL connection component.
         self._connection: PostgresConnection = None
 
@@ -134,6 +147,9 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
 
         # Maximum number of objects in data pages
         self._max_page_size = 100
+        self._record_converter: RecordConverter = RecordConverter()
+        self._stream_batch_size = 1000
+        self._statement_cache: StatementCache = StatementCache(counters=self._counters, name='postgres.statements')
 
     def configure(self, config: ConfigParams):
         """
@@ -147,6 +163,14 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
         self._dependency_resolver.configure(config)
 
         self._max_page_size = config.get_as_integer_with_default("options.max_page_size", self._max_page_size)
+        self._record_converter.set_mode(
+            config.get_as_string_with_default("options.record_mode", self._record_converter.get_mode()))
+        self._stream_batch_size = config.get_as_integer_with_default("options.stream_batch_size",
+                                                                     self._stream_batch_size)
+        self._statement_cache.set_max_size(
+            config.get_as_integer_with_default("options.statement_cache_size", self._statement_cache.get_max_size()))
+        # Cached statements keep the table name
+        self._statement_cache.clear()
 
         self._table_name = config.get_as_string_with_default('collection', self._table_name)
         self._table_name = config.get_as_string_with_default('table', self._table_name)
@@ -159,6 +183,7 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
         """
         self.__references = references
         self._logger.set_references(references)
+        self._counters.set_references(references)
 
         # Get connection
         self._dependency_resolver.set_references(references)
@@ -264,7 +289,7 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
         if value is None:
             return
 
-        return type('object', (object,), value)
+        return self._record_converter.to_public(value)
 
     def _convert_from_public(self, value: Any) -> Any:
         """
@@ -416,35 +441,128 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
                   'statusmessage': None
                   }
 
-        with self._client.getconn() as conn:
+        # Statements inside a transaction use its connection and are committed together
+        transaction = self._client.get_transaction()
+        conn = transaction if transaction is not None else self._client.getconn()
+        discard = False
+        try:
             with conn.cursor() as cursor:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
                 try:
-                    if params:
-                        cursor.execute(query, params)
-                    else:
-                        cursor.execute(query)
+                    response = cursor.fetchall()
+                    column_names = [column.name for column in cursor.description]
+                    for obj in response:
+                        result['items'].append(dict(zip(column_names, obj)))
+                except ProgrammingError:
+                    pass
 
-                    try:
-                        response = cursor.fetchall()
-                        column_names = [column.name for column in cursor.description]
-                        for obj in response:
-                            result['items'].append(dict(zip(column_names, obj)))
-                    except ProgrammingError:
-                        pass
-
-                    try:
-                        result['rowcount'] = int(cursor.statusmessage.split(' ')[-1])
-                    except ValueError:
-                        result['rowcount'] = cursor.rowcount
-                    # affected rows
-                    result['statusmessage'] = cursor.statusmessage
-
-                    conn.commit()
-                finally:
-                    self._client.putconn(conn)
+                try:
+                    result['rowcount'] = int(cursor.statusmessage.split(' ')[-1])
+                except ValueError:
+                    result['rowcount'] = cursor.rowcount
+                # affected rows
+                result['statusmessage'] = cursor.statusmessage
+
+            if transaction is None:
+                conn.commit()
+        except BaseException:
+            if transaction is None:
+                discard = not self.__rollback(conn)
+            raise
+        finally:
+            if transaction is None:
+                self._client.putconn(conn, discard)
 
         return result
 
+    @staticmethod
+    def __rollback(conn: Any) -> bool:
+        # A connection that cannot be rolled back is broken and must not return to the pool
+        try:
+            conn.rollback()
+            return True
+        except Error:
+            return False
+
+    def _request_stream(self, query: str, params: List[str] = None, batch_size: int = None) -> Iterator[dict]:
+        """
+        Performs a query to the database through a server-side cursor and yields rows one by one.
+        Rows are fetched in batches, so only one batch is kept in memory at a time.
+        The connection is returned to the pool when the iteration ends or the generator is closed.
+
+        :param query: string with sql query to database
+        :param params: optional list of query parameters
+        :param batch_size: (optional) number of rows fetched at once
+        :return: a generator of rows
+        """
+        batch_size = batch_size or self._stream_batch_size
+
+        transaction = self._client.get_transaction()
+        conn = transaction if transaction is not None else self._client.getconn()
+        discard = False
+        try:
+            # Named cursors are declared on the server and keep the result set there
+            with conn.cursor(name='stream_' + IdGenerator.next_short()) as cursor:
+                cursor.itersize = batch_size
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                column_names = None
+                rows = cursor.fetchmany(batch_size)
+                while len(rows) > 0:
+                    if column_names is None:
+                        column_names = [column.name for column in cursor.description]
+                    for row in rows:
+                        yield dict(zip(column_names, row))
+                    rows = cursor.fetchmany(batch_size)
+
+            if transaction is None:
+                conn.commit()
+        except BaseException:
+            # Also rolls back when the generator is closed before the end
+            if transaction is None:
+                discard = not self.__rollback(conn)
+            raise
+        finally:
+            if transaction is None:
+                self._client.putconn(conn, discard)
+
+    @contextmanager
+    def transaction(self, context: Optional[IContext]) -> Iterator[None]:
+        """
+        Runs persistence calls inside the block in one database transaction.
+
+        The transaction borrows one connection and binds it to the current thread or asyncio task.
+        All persistences that share the same connection component run their statements on it,
+        and the transaction is committed once when the block ends or rolled back when it raises an error.
+        Nested transactions join the outer one.
+
+        Example:
+
+        .. code-block:: python
+
+            with persistence.transaction(context):
+                persistence.update(context, account1)
+                persistence.update(context, account2)
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        """
+        if not self.is_open():
+            raise InvalidStateException(
+                ContextResolver.get_trace_id(context), "NOT_OPENED", "Persistence is not opened"
+            )
+
+        with self._client.transaction():
+            yield
+
+        self._logger.trace(context, "Committed transaction in %s", self._table_name)
+
     def clear(self, context: Optional[IContext]):
         """
         Clears component state.
@@ -460,14 +578,7 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
         query = "DELETE FROM " + self._quoted_table_name()
 
         try:
-            # self._request(query)
-            with self._client.getconn() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    conn.commit()
-                    cursor.close()
-                    self._client.putconn(conn)
-
+            self._request(query)
         except Exception as err:
             raise ConnectionException(ContextResolver.get_trace_id(context), "CONNECT_FAILED",
                                       "Connection to postgres failed").with_cause(err)
@@ -617,6 +728,69 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
         else:
             return DataPage(items)
 
+    def get_page_by_token(self, context: Optional[IContext], filter: Any, paging: TokenizedPagingParams,
+                          keys: List[str] = None, descending: bool = False, select: Any = None) -> TokenizedDataPage:
+        """
+        Gets a page of data items retrieved by a given filter using keyset (seek) pagination.
+        Items are sorted by the key columns and each page starts right after the keys
+        of the last item from the previous page, encoded in the paging token.
+        Unlike :func:`get_page_by_filter` deep pages cost the same as the first one.
+        The total number of items is calculated only for the first page.
+
+        This method shall be called by a public getPageByToken method from child class that
+        receives FilterParams and converts them into a filter function.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        :param filter: (optional) a filter JSON object
+        :param paging: (optional) tokenized paging parameters
+        :param keys: (optional) unique combination of columns to sort and seek by. Default: ['id']
+        :param descending: (optional) true to sort items in descending order
+        :param select: (optional) projection JSON object, it must include the key columns
+        :return: a data page with a token to get the next page
+        """
+        paging = paging or TokenizedPagingParams()
+        keys = keys or ['id']
+        take = paging.get_take(self._max_page_size)
+        last_keys = KeysetToken.decode(paging.token, len(keys))
+
+        select = select if select and len(select) > 0 else '*'
+        query = "SELECT " + select + " FROM " + self._quoted_table_name()
+
+        columns = ", ".join([self._quote_identifier(key) for key in keys])
+        conditions = []
+        if filter and filter != '':
+            # Percent signs in the filter must be escaped when the query has parameters
+            conditions.append("(" + (filter if last_keys is None else filter.replace('%', '%%')) + ")")
+        if last_keys is not None:
+            conditions.append("(" + columns + ") " + ("<" if descending else ">")
+                              + " (" + ", ".join(["%s"] * len(keys)) + ")")
+        if len(conditions) > 0:
+            query += " WHERE " + " AND ".join(conditions)
+
+        order = " DESC" if descending else ""
+        query += " ORDER BY " + ", ".join([self._quote_identifier(key) + order for key in keys])
+
+        # One more item tells if there is the next page
+        query += " LIMIT " + str(take + 1)
+
+        result = self._request(query, last_keys)
+        items = result['items']
+
+        token = None
+        if len(items) > take:
+            items = items[:take]
+            token = KeysetToken.encode([items[-1][key] for key in keys])
+
+        self._logger.trace(context, "Retrieved %d from %s", len(items), self._table_name)
+
+        items = list(map(self._convert_to_public, items))
+
+        total = None
+        if paging.total and last_keys is None:
+            total = self.get_count_by_filter(context, filter)
+
+        return TokenizedDataPage(items, token, total)
+
     def get_count_by_filter(self, context: Optional[IContext], filter: Any) -> int:
         """
         Gets a number of data items retrieved by a given filter.
@@ -675,6 +849,39 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
 
         return items
 
+    def stream_list_by_filter(self, context: Optional[IContext], filter: Any, sort: Any = None, select: Any = None,
+                              batch_size: int = None) -> Iterator[T]:
+        """
+        Gets a stream of data items retrieved by a given filter and sorted according to sort parameters.
+        Unlike :func:`get_list_by_filter` items are read through a server-side cursor in batches
+        and converted one by one, so large tables can be processed without loading them into memory.
+
+        This method shall be called by a public streamListByFilter method from child class that
+        receives FilterParams and converts them into a filter function.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        :param filter: (optional) a filter JSON object
+        :param sort: (optional) sorting JSON object
+        :param select: (optional) projection JSON object
+        :param batch_size: (optional) number of rows fetched at once
+        :return: a generator of data items
+        """
+        select = select if select and len(select) > 0 else '*'
+        query = "SELECT " + select + " FROM " + self._quoted_table_name()
+
+        if filter and filter != '':
+            query += " WHERE " + filter
+
+        if sort:
+            query += " ORDER BY " + sort
+
+        count = 0
+        for item in self._request_stream(query, None, batch_size):
+            count += 1
+            yield self._convert_to_public(item)
+
+        self._logger.trace(context, "Streamed %d from %s", count, self._table_name)
+
     def get_one_random(self, context: Optional[IContext], filter: Any) -> T:
         """
         Gets a random item from items that match to a given filter.
@@ -685,27 +892,31 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
         :param filter: (optional) a filter JSON object
         :return: a random item
         """
-        query = 'SELECT COUNT(*) AS count FROM ' + self._quoted_table_name()
-        if filter and filter != '':
-            query += " WHERE " + filter
+        # Samples rarely contain items that match a filter, so filtered queries count them instead
+        item = self.__get_one_sampled() if not filter else None
 
-        result = self._request(query)
+        if item is None:
+            query = 'SELECT COUNT(*) AS count FROM ' + self._quoted_table_name()
+            if filter and filter != '':
+                query += " WHERE " + filter
 
-        query = "SELECT * FROM " + self._quoted_table_name()
+            result = self._request(query)
 
-        if filter and filter != '':
-            query += " WHERE " + filter
+            query = "SELECT * FROM " + self._quoted_table_name()
 
-        count = 0 if len(result['items']) == 0 else result['items'][0].get('count', 0)
-        count = 0 if count == 0 else count - 1
+            if filter and filter != '':
+                query += " WHERE " + filter
 
-        pos = random.randint(0, count)
-        query += f" OFFSET {pos} LIMIT 1"
+            count = 0 if len(result['items']) == 0 else result['items'][0].get('count', 0)
+            count = 0 if count == 0 else count - 1
 
-        result = self._request(query)
+            pos = random.randint(0, count)
+            query += f" OFFSET {pos} LIMIT 1"
 
-        items = result['items']
-        item = items[0] if items is not None and len(items) > 0 else None
+            result = self._request(query)
+
+            items = result['items']
+            item = items[0] if items is not None and len(items) > 0 else None
 
         if item is None:
             self._logger.trace(context, "Random item wasn't found from %s", self._table_name)
@@ -716,6 +927,23 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
 
         return item
 
+    def __get_one_sampled(self) -> Optional[dict]:
+        # Planner statistics give an estimated number of rows without counting them
+        result = self._request("SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = %s::regclass",
+                               [self._quoted_table_name()])
+        estimate = 0 if len(result['items']) == 0 else result['items'][0].get('estimate') or 0
+        if estimate <= 0:
+            return None
+
+        # Sample pages with about a hundred rows and pick a random row among sampled ones
+        percent = min(100.0, 100.0 * 100 / estimate)
+        query = "SELECT * FROM " + self._quoted_table_name() + " TABLESAMPLE SYSTEM (" + str(percent) + ")" \
+                + " ORDER BY random() LIMIT 1"
+
+        result = self._request(query)
+        items = result['items']
+        return items[0] if len(items) > 0 else None
+
     def create(self, context: Optional[IContext], item: T) -> Optional[T]:
         """
         Creates a data item.
@@ -728,11 +956,13 @@ class PostgresPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpen
             return
 
         row = self._convert_from_public(item)
-        columns = self._generate_columns(row)
-        params = self._generate_parameters(row)
         values = self._generate_values(row)
 
-        query = "INSERT INTO " + self._quoted_table_name() + " (" + columns + ") VALUES (" + params + ") RETURNING *"
+        query = self._statement_cache.get(
+            ('create', tuple(row.keys())),
+            lambda: "INSERT INTO " + self._quoted_table_name() + " (" + self._generate_columns(row) + ") VALUES ("
+                    + self._generate_parameters(row) + ") RETURNING *"
+        )
 
         result = self._request(query, values)
         self._logger.trace(context, "Created in %s with id = %s", self._table_name, row['id'])
@@ -25,6 +25,16 @@ class DummyPostgresPersistence(IdentifiablePostgresPersistence, IDummyPersistenc
 
         return super().get_page_by_filter(context, filter_condition, paging, None, None)
 
+    def get_page_by_token(self, context, filter, paging):
+        filter = filter or FilterParams()
+        key = filter.get_as_nullable_string('key')
+
+        filter_condition = ''
+        if key is not None:
+            filter_condition += "key='" + key + "'"
+
+        return super().get_page_by_token(context, filter_condition, paging, ['key'])
+
     def get_coumt_by_filter(self, correlation_id, filter):
         filter = filter or FilterParams()
         key = filter.get_as_nullable_string('key')
@@ -49,3 +49,6 @@ class TestDummyPostgresPersistence:
 
     def test_batch_operations(self):
         self.fixture.test_batch_operations()
+
+    def test_paging_by_token(self):
+        self.fixture.test_paging_by_token()
@@ -12,7 +12,7 @@ from typing import Callable, Any, List, Optional, Union
 
 from pip_services4_commons.errors import InvocationException
 from pip_services4_components.context import IContext, ContextResolver
-from pip_services4_data.validate import Schema, ValidationResult
+from pip_services4_data.validate import Schema, ValidationResult, ValidationException
 from pip_services4_components.exec import IExecutable, Parameters
 
 from pip_services4_rpc.commands import ICommand
@@ -62,6 +62,7 @@ class Command(ICommand):
         self.__name = name
         self.__schema = schema
         self.__function = function
+        self.__validator: Optional[Callable[[Any], List[ValidationResult]]] = None
 
     def get_name(self) -> str:
         """
@@ -87,7 +88,7 @@ class Command(ICommand):
         """
         # Validate arguments
         if self.__schema is not None:
-            self.__schema.validate_and_throw_exception(context, args)
+            ValidationException.throw_exception_if_needed(context, self.validate(args), False)
 
         # Call the function
         try:
@@ -110,7 +111,10 @@ class Command(ICommand):
         """
         # When schema is not defined, then skip validation
         if self.__schema is not None:
-            return self.__schema.validate(args)
+            # The schema is compiled on the first validation and reused afterwards
+            if self.__validator is None:
+                self.__validator = self.__schema.compile()
+            return self.__validator(args)
 
         # ToDo: Complete implementation
         return []
@@ -9,8 +9,10 @@ from pip_services4_components.config import IConfigurable, ConfigParams
 from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IReferences
 from pip_services4_components.run import IOpenable
+from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
 
+from pip_services4_sqlserver.connect.SqlServerConnectionPool import SqlServerConnectionPool
 from pip_services4_sqlserver.connect.SqlServerConnectionResolver import SqlServerConnectionResolver
 
 
@@ -34,10 +36,14 @@ class SqlServerConnection(IReferenceable, IConfigurable, IOpenable):
         - options:
             - connect_timeout:      (optional) number of milliseconds to wait before timing out when connecting a new client (default: 0)
             - idle_timeout:         (optional) number of milliseconds a client must sit idle in the pool and not be checked out (default: 10000)
+            - min_pool_size:        (optional) minimum number of clients the pool keeps open (default: 0)
             - max_pool_size:        (optional) maximum number of clients the pool should contain (default: 10)
+            - wait_timeout:         (optional) number of milliseconds to wait for a free client when all clients are in use (default: 15000)
+            - validation_interval:  (optional) number of milliseconds a client sits idle before it is checked on borrow (default: 5000)
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
+        - `*:counters:*:*:1.0`         (optional) :class:`ICounters <pip_services4_observability.count.ICounters.ICounters>` components to pass pool statistics
         - `*:discovery:*:*:1.0`        (optional) :class:`IDiscovery <pip_services4_config.connect.IDiscovery.IDiscovery>` services
         - `*:credential-store:*:*:1.0` (optional) :class:`ICredentialStore <pip_services4_config.auth.ICredentialStore.ICredentialStore>` stores to resolve credentials
     """
@@ -53,11 +59,16 @@ class SqlServerConnection(IReferenceable, IConfigurable, IOpenable):
             "options.connect_timeout", 15000,
             "options.request_timeout", 15000,
             "options.idle_timeout", 30000,
-            "options.max_pool_size", 3
+            "options.min_pool_size", 0,
+            "options.max_pool_size", 3,
+            "options.wait_timeout", 15000,
+            "options.validation_interval", 5000
         )
 
         # The logger.
         self._logger: CompositeLogger = CompositeLogger()
+        # The performance counters.
+        self._counters: CompositeCounters = CompositeCounters()
         # The connection resolver.
         self._connection_resolver: SqlServerConnectionResolver = SqlServerConnectionResolver()
         # The configuration options.
@@ -87,6 +98,7 @@ class SqlServerConnection(IReferenceable, IConfigurable, IOpenable):
         :param references: references to locate the component dependencies.
         """
         self._logger.set_references(references)
+        self._counters.set_references(references)
         self._connection_resolver.set_references(references)
 
     def is_open(self) -> bool:
@@ -140,10 +152,8 @@ class SqlServerConnection(IReferenceable, IConfigurable, IOpenable):
             try:
                 # config = self.__compose_uri_settings(uri)
 
-                max_pool_size = self._options.get_as_nullable_string("max_pool_size")
                 connect_timeout_MS = self._options.get_as_nullable_integer("connect_timeout") or 0
                 request_timeout_MS = self._options.get_as_nullable_integer("request_timeout") or 0
-                # idle_timeout_MS = self._options.get_as_nullable_integer("idle_timeout") or 0
 
                 parsed_url = urlparse.urlparse(uri)
 
@@ -160,17 +170,28 @@ class SqlServerConnection(IReferenceable, IConfigurable, IOpenable):
                 else:
                     connect_str += 'Trusted_Connection=yes;'
 
-                # Try to connect
-                if max_pool_size:
-                    pyodbc.SQL_MAX_DRIVER_CONNECTIONS = max_pool_size
+                def connect() -> Any:
+                    conn = pyodbc.connect(connect_str, timeout=int(connect_timeout_MS / 1000))
+                    conn.timeout = int(request_timeout_MS / 1000)
+                    with conn.cursor() as cursor:
+                        cursor.execute('SET ARITHABORT ON')
+                        cursor.commit()
+                    return conn
+
+                pool = SqlServerConnectionPool(
+                    connect, SqlServerConnection.__check_connection,
+                    min_size=self._options.get_as_integer_with_default("min_pool_size", 0),
+                    max_size=self._options.get_as_integer_with_default("max_pool_size", 3),
+                    idle_timeout=self._options.get_as_integer_with_default("idle_timeout", 30000),
+                    wait_timeout=self._options.get_as_integer_with_default("wait_timeout", 15000),
+                    validation_interval=self._options.get_as_integer_with_default("validation_interval", 5000),
+                    counters=self._counters
+                )
 
-                self._connection = pyodbc.connect(connect_str, timeout=int(connect_timeout_MS / 1000))
-                self._connection.timeout = int(request_timeout_MS / 1000)
-                with self._connection.cursor() as cursor:
-                    cursor.execute('SET ARITHABORT ON')
-                    cursor.commit()
-                    cursor.close()
+                # Try to connect
+                pool.putconn(pool.getconn())
 
+                self._connection = pool
                 self._database_name = parsed_url.path[1:]
 
             except Exception as err:
@@ -190,7 +211,7 @@ class SqlServerConnection(IReferenceable, IConfigurable, IOpenable):
         if self._connection is None:
             return
         try:
-            self._connection.close()
+            self._connection.closeall()
             self._connection = None
             self._logger.debug(
                 context, "Disconnected from sqlserver database %s", self._database_name)
@@ -201,10 +222,19 @@ class SqlServerConnection(IReferenceable, IConfigurable, IOpenable):
         self._connection = None
         self._database_name = None
 
+    @staticmethod
+    def __check_connection(conn: Any) -> bool:
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchall()
+        return True
+
     def get_connection(self) -> Any:
         """
-        TODO add description
-        :return:
+        Gets the connection pool. Connections are borrowed by
+        :func:`SqlServerConnectionPool.getconn` and returned by :func:`SqlServerConnectionPool.putconn`.
+
+        :return: the connection pool.
         """
         return self._connection
 
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Callable
+
+from pip_services4_observability.count import ICounters
+from pip_services4_persistence.persistence import ConnectionPool
+
+
+class SqlServerConnectionPool(ConnectionPool):
+    """
+    Thread-safe pool of SqlServer connections.
+
+    See :class:`ConnectionPool <pip_services4_persistence.persistence.ConnectionPool.ConnectionPool>`
+    for details on pool sizing, timeouts and collected statistics.
+
+    Example:
+
+    .. code-block:: python
+
+        pool = SqlServerConnectionPool(lambda: pyodbc.connect(connect_str), max_size=10)
+
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        finally:
+            pool.putconn(conn)
+
+        pool.closeall()
+    """
+
+    def __init__(self, factory: Callable[[], Any], validator: Callable[[Any], bool] = None,
+                 min_size: int = 0, max_size: int = 10, idle_timeout: int = 30000, wait_timeout: int = 15000,
+                 validation_interval: int = 5000, counters: ICounters = None, name: str = 'sqlserver.pool'):
+        """
+        Creates a new instance of the pool.
+
+        :param factory: a function to open a new connection.
+        :param validator: (optional) a function that checks if a connection is alive.
+        :param min_size: (optional) a minimum number of connections kept open. Default: 0
+        :param max_size: (optional) a maximum number of connections. Default: 10
+        :param idle_timeout: (optional) time in milliseconds an idle connection is kept open. Default: 30000
+        :param wait_timeout: (optional) time in milliseconds to wait for a free connection. Default: 15000
+        :param validation_interval: (optional) time in milliseconds a connection is idle before it is checked. Default: 5000
+        :param counters: (optional) counters to send pool statistics to.
+        :param name: (optional) a prefix of counter names. Default: sqlserver.pool
+        """
+        super().__init__(factory, validator, min_size, max_size, idle_timeout, wait_timeout,
+                         validation_interval, counters, name)
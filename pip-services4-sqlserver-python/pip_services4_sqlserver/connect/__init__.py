@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-__all__ = ['SqlServerConnection', 'SqlServerConnectionResolver']
+__all__ = ['SqlServerConnection', 'SqlServerConnectionResolver', 'SqlServerConnectionPool']
 
 from .SqlServerConnection import SqlServerConnection
 from .SqlServerConnectionResolver import SqlServerConnectionResolver
+from .SqlServerConnectionPool import SqlServerConnectionPool
@@ -163,13 +163,15 @@ class IdentifiableJsonSqlServerPersistence(IdentifiableSqlServerPersistence):
         columns = list(row.keys())
         values = list(row.values())
 
-        set = "[data]"
-        for column in columns:
-            set = "JSON_MODIFY(" + set + ",'$." + column + "',?)"
-
         values.append(id)
 
-        query = "UPDATE " + self._quoted_table_name() + " SET [data]=" + set + " OUTPUT INSERTED.* WHERE [id]=?"
+        def build() -> str:
+            set = "[data]"
+            for column in columns:
+                set = "JSON_MODIFY(" + set + ",'$." + column + "',?)"
+            return "UPDATE " + self._quoted_table_name() + " SET [data]=" + set + " OUTPUT INSERTED.* WHERE [id]=?"
+
+        query = self._statement_cache.get(('update_partially', tuple(columns)), build)
 
         result = self._request(query, values)
 
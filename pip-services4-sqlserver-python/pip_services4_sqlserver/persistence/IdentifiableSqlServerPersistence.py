@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from copy import deepcopy
-from typing import Any, Optional, List, TypeVar
+from typing import Any, Callable, Optional, List, TypeVar
 
 import pyodbc
 from pip_services4_commons.data import AnyValueMap
+from pip_services4_components.config import ConfigParams
 from pip_services4_components.context import IContext
 from pip_services4_data.keys import IdGenerator
 
@@ -42,6 +43,7 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
             - connect_timeout:      (optional) number of milliseconds to wait before timing out when connecting a new client (default: 0)
             - idle_timeout:         (optional) number of milliseconds a client must sit idle in the pool and not be checked out (default: 10000)
             - max_pool_size:        (optional) maximum number of clients the pool should contain (default: 10)
+            - id_generator:         (optional) id generator mode: random, ordered or sequence (default: random)
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
@@ -94,6 +96,20 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
         # Flag to turn on automated string ID generation
         self._auto_generate_id: bool = True
 
+        # Function to generate ids of new objects
+        self._id_generator: Callable[[], str] = IdGenerator.next_long
+
+    def configure(self, config: ConfigParams):
+        """
+        Configures component by passing configuration parameters.
+
+        :param config: configuration parameters to be set.
+        """
+        super().configure(config)
+
+        self._id_generator = IdGenerator.get_generator(
+            config.get_as_string_with_default("options.id_generator", IdGenerator.Random))
+
     def _convert_from_public_partial(self, value: Any) -> Any:
         """
         Converts the given object from the public partial format.
@@ -111,8 +127,11 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
         :param ids: ids of data items to be retrieved
         :return: a data list or raise error
         """
-        params = self._generate_parameters(ids)
-        query = "SELECT * FROM " + self._quoted_table_name() + " WHERE [id] IN(" + params + ")"
+        query = self._statement_cache.get(
+            ('get_list_by_ids', len(ids)),
+            lambda: "SELECT * FROM " + self._quoted_table_name()
+                    + " WHERE [id] IN(" + self._generate_parameters(ids) + ")"
+        )
 
         items = self._request(query, ids)
         if items is not None:
@@ -131,7 +150,10 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
         :return: data item
         """
 
-        query = "SELECT * FROM " + self._quoted_table_name() + " WHERE [id]=?"
+        query = self._statement_cache.get(
+            ('get_one_by_id',),
+            lambda: "SELECT * FROM " + self._quoted_table_name() + " WHERE [id]=?"
+        )
         params = [id]
 
         result = self._request(query, params)
@@ -160,7 +182,7 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
         new_item = item
         if new_item.id is None and self._auto_generate_id:
             new_item = deepcopy(new_item)
-            new_item.id = item.id or IdGenerator.next_long()
+            new_item.id = item.id or self._id_generator()
 
         return super().create(context, new_item)
 
@@ -178,16 +200,16 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
 
         # Assign unique id
         if item.get('id') is None and self._auto_generate_id:
-            item['id'] = item.get('id') or IdGenerator.next_long()
+            item['id'] = item.get('id') or self._id_generator()
 
         row = self._convert_from_public(item)
-        columns = self._generate_columns(row)
-        params = self._generate_parameters(row)
-        set_params = self._generate_set_parameters(row)
         values = self._generate_values(row)
 
-        query = "INSERT INTO " + self._quoted_table_name() \
-                + " (" + columns + ") OUTPUT INSERTED.* VALUES (" + params + ")"
+        query = self._statement_cache.get(
+            ('create', tuple(row.keys())),
+            lambda: "INSERT INTO " + self._quoted_table_name() + " (" + self._generate_columns(row)
+                    + ") OUTPUT INSERTED.* VALUES (" + self._generate_parameters(row) + ")"
+        )
 
         new_item = None
 
@@ -210,7 +232,11 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
             return new_item
 
         values.append(item['id'])
-        query = "UPDATE " + self._quoted_table_name() + " SET " + set_params + f" OUTPUT INSERTED.* WHERE [id]=?"
+        query = self._statement_cache.get(
+            ('update', tuple(row.keys())),
+            lambda: "UPDATE " + self._quoted_table_name() + " SET " + self._generate_set_parameters(row)
+                    + " OUTPUT INSERTED.* WHERE [id]=?"
+        )
 
         result = self._request(query, values)
         self._logger.trace(context, "Set in %s with id = %s", self._table_name, item['id'])
@@ -230,11 +256,14 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
             return
 
         row = self._convert_from_public(item)
-        params = self._generate_set_parameters(row)
         values = self._generate_values(row)
         values.append(item.id)
 
-        query = "UPDATE " + self._quoted_table_name() + " SET " + params + f" OUTPUT INSERTED.* WHERE [id]=?"
+        query = self._statement_cache.get(
+            ('update', tuple(row.keys())),
+            lambda: "UPDATE " + self._quoted_table_name() + " SET " + self._generate_set_parameters(row)
+                    + " OUTPUT INSERTED.* WHERE [id]=?"
+        )
         # params = self._create_params(values)
 
         result = self._request(query, values)
@@ -259,11 +288,14 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
             return
 
         row = self._convert_from_public_partial(data)
-        params = self._generate_set_parameters(row)
         values = self._generate_values(row)
         values.append(id)
 
-        query = "UPDATE " + self._quoted_table_name() + " SET " + params + f" OUTPUT INSERTED.* WHERE [id]=?"
+        query = self._statement_cache.get(
+            ('update', tuple(row.keys())),
+            lambda: "UPDATE " + self._quoted_table_name() + " SET " + self._generate_set_parameters(row)
+                    + " OUTPUT INSERTED.* WHERE [id]=?"
+        )
 
         # params = self._create_params(values)
         result = self._request(query, values)
@@ -282,7 +314,10 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
         :return: deleted item
         """
         values = [id]
-        query = "DELETE FROM " + self._quoted_table_name() + " OUTPUT DELETED.* WHERE [id]=?"
+        query = self._statement_cache.get(
+            ('delete_by_id',),
+            lambda: "DELETE FROM " + self._quoted_table_name() + " OUTPUT DELETED.* WHERE [id]=?"
+        )
 
         result = self._request(query, values)
         self._logger.trace(context, "Deleted from %s with id = %s", self._table_name, id)
@@ -299,8 +334,11 @@ class IdentifiableSqlServerPersistence(SqlServerPersistence):
         :param ids: ids of data items to be deleted.
         :return: None for success
         """
-        params = self._generate_parameters(ids)
-        query = "DELETE FROM " + self._quoted_table_name() + " WHERE \"id\" IN(" + params + ")"
+        query = self._statement_cache.get(
+            ('delete_by_ids', len(ids)),
+            lambda: "DELETE FROM " + self._quoted_table_name()
+                    + " WHERE \"id\" IN(" + self._generate_parameters(ids) + ")"
+        )
 
         count = self._request(query, ids)
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
+from contextlib import contextmanager
 from random import randint
-from typing import Any, Optional, List, TypeVar
+from typing import Any, Optional, List, TypeVar, Iterator
 
 import pyodbc
 from pip_services4_commons.convert import LongConverter
@@ -11,8 +12,10 @@ from pip_services4_components.context import IContext, ContextResolver
 from pip_services4_components.refer import IReferenceable, IUnreferenceable, DependencyResolver, IReferences
 from pip_services4_components.run import IOpenable, ICleanable
 from pip_services4_components.config import ConfigParams
-from pip_services4_data.query import PagingParams, DataPage
+from pip_services4_data.query import PagingParams, DataPage, TokenizedPagingParams, TokenizedDataPage
+from pip_services4_observability.count import CompositeCounters
 from pip_services4_observability.log import CompositeLogger
+from pip_services4_persistence.persistence import RecordConverter, KeysetToken, StatementCache
 
 from pip_services4_sqlserver.connect.SqlServerConnection import SqlServerConnection
 
@@ -44,11 +47,17 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
             - connect_timeout:      (optional) number of milliseconds to wait before timing out when connecting a new client (default: 0)
             - idle_timeout:         (optional) number of milliseconds a client must sit idle in the pool and not be checked out (default: 10000)
             - max_pool_size:        (optional) maximum number of clients the pool should contain (default: 10)
+            - record_mode:          (optional) type of returned records: record, dict or class (default: record)
+            - stream_batch_size:    (optional) number of rows fetched at once by streaming queries (default: 1000)
+            - statement_cache_size: (optional) maximum number of generated statements kept in cache, 0 to disable (default: 100)
+
+    Statement cache hits and misses are sent to counters sqlserver.statements.hits and sqlserver.statements.misses.
 
     ### References ###
         - `*:logger:*:*:1.0`           (optional) :class:`ILogger <pip_services4_observability.log.ILogger.ILogger>` components to pass log messages components to pass log messages
         - `*:discovery:*:*:1.0`        (optional) :class:`IDiscovery <pip_services4_config.connect.IDiscovery.IDiscovery>` services
         - `*:credential-store:*:*:1.0` (optional) :class:`ICredentialStore <pip_services4_config.auth.ICredentialStore.ICredentialStore>` stores to resolve credentials
+        - `*:counters:*:*:1.0`         (optional) :class:`ICounters <pip_services4_observability.count.ICounters.ICounters>` components to pass statement cache statistics
 
     Example:
 
@@ -110,6 +119,8 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
         self._dependency_resolver: DependencyResolver = DependencyResolver(self.__default_config)
         # The logger.
         self._logger: CompositeLogger = CompositeLogger()
+        # The performance counters.
+        self._counters: CompositeCounters = CompositeCounters()
         # The SQLServer connection component.
         self._connection: SqlServerConnection = None
         # The SQLServer connection pool object.
@@ -120,6 +131,9 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
 
         # The maximum number of objects in data pages
         self._max_page_size = 100
+        self._record_converter: RecordConverter = RecordConverter()
+        self._stream_batch_size = 1000
+        self._statement_cache: StatementCache = StatementCache(counters=self._counters, name='sqlserver.statements')
 
         self.__config: ConfigParams = None
         self.__references: IReferences = None
@@ -142,6 +156,14 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
         self._table_name = config.get_as_string_with_default('table', self._table_name)
         self._schema_name = config.get_as_string_with_default("schema", self._schema_name)
         self._max_page_size = config.get_as_integer_with_default('options.max_page_size', self._max_page_size)
+        self._record_converter.set_mode(
+            config.get_as_string_with_default("options.record_mode", self._record_converter.get_mode()))
+        self._stream_batch_size = config.get_as_integer_with_default("options.stream_batch_size",
+                                                                     self._stream_batch_size)
+        self._statement_cache.set_max_size(
+            config.get_as_integer_with_default("options.statement_cache_size", self._statement_cache.get_max_size()))
+        # Cached statements keep the table name
+        self._statement_cache.clear()
 
     def set_references(self, references: IReferences):
         """
@@ -151,6 +173,7 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
         """
         self.__references = references
         self._logger.set_references(references)
+        self._counters.set_references(references)
 
         # Get connection
         self._dependency_resolver.set_references(references)
@@ -246,12 +269,9 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
             return
 
         if isinstance(value, pyodbc.Row):
-            converted_val = {}
-            for i in range(len(value)):
-                converted_val[value.cursor_description[i][0]] = value[i]
-            value = converted_val
+            value = {column[0]: item for (column, item) in zip(value.cursor_description, value)}
 
-        return type('object', (object,), value)
+        return self._record_converter.to_public(value)
 
     def _convert_from_public(self, value: Any) -> Any:
         """
@@ -357,6 +377,36 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
         self.__opened = False
         self._client = None
 
+    @contextmanager
+    def transaction(self, context: Optional[IContext]) -> Iterator[None]:
+        """
+        Runs persistence calls inside the block in one database transaction.
+
+        The transaction borrows one connection and binds it to the current thread or asyncio task.
+        All persistences that share the same connection component run their statements on it,
+        and the transaction is committed once when the block ends or rolled back when it raises an error.
+        Nested transactions join the outer one.
+
+        Example:
+
+        .. code-block:: python
+
+            with persistence.transaction(context):
+                persistence.update(context, account1)
+                persistence.update(context, account2)
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        """
+        if not self.is_open():
+            raise InvalidStateException(
+                ContextResolver.get_trace_id(context), "NOT_OPENED", "Persistence is not opened"
+            )
+
+        with self._client.transaction():
+            yield
+
+        self._logger.trace(context, "Committed transaction in %s", self._table_name)
+
     def clear(self, context: Optional[IContext]):
         """
         Clears component state.
@@ -383,28 +433,96 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
         :param params: optional list of query parameters
         :return: result of the query
         """
-        conn = self._client
-        with conn.cursor() as cursor:
-            # if params:
-            #     rows = cursor.execute(query, params).fetchall()
-            # elif 'delete' in query.lower():
-            #     cursor.execute(query)
-            #     rows = cursor.rowcount  # affected rows
-            # else:
-            #     rows = cursor.execute(query).fetchall()
-
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+        # Statements inside a transaction use its connection and are committed together
+        transaction = self._client.get_transaction()
+        conn = transaction if transaction is not None else self._client.getconn()
+        discard = False
+        try:
+            # Cursor context managers in pyodbc commit on exit, so the cursor is closed explicitly
+            cursor = conn.cursor()
             try:
-                rows = cursor.fetchall()
-            except pyodbc.ProgrammingError:
-                rows = cursor.rowcount
-
-            conn.commit()
+                # if params:
+                #     rows = cursor.execute(query, params).fetchall()
+                # elif 'delete' in query.lower():
+                #     cursor.execute(query)
+                #     rows = cursor.rowcount  # affected rows
+                # else:
+                #     rows = cursor.execute(query).fetchall()
+
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                try:
+                    rows = cursor.fetchall()
+                except pyodbc.ProgrammingError:
+                    rows = cursor.rowcount
+            finally:
+                cursor.close()
+
+            if transaction is None:
+                conn.commit()
+        except BaseException:
+            if transaction is None:
+                discard = not self.__rollback(conn)
+            raise
+        finally:
+            if transaction is None:
+                self._client.putconn(conn, discard)
         return rows
 
+    @staticmethod
+    def __rollback(conn: Any) -> bool:
+        # A connection that cannot be rolled back is broken and must not return to the pool
+        try:
+            conn.rollback()
+            return True
+        except pyodbc.Error:
+            return False
+
+    def _request_stream(self, query: str, params: List[str] = None, batch_size: int = None) -> Iterator[Any]:
+        """
+        Performs a query to the database and yields rows one by one.
+        Rows are fetched in batches, so only one batch is kept in memory at a time.
+        The connection is returned to the pool when the iteration ends or the generator is closed.
+
+        :param query: string with sql query to database
+        :param params: optional list of query parameters
+        :param batch_size: (optional) number of rows fetched at once
+        :return: a generator of rows
+        """
+        batch_size = batch_size or self._stream_batch_size
+
+        transaction = self._client.get_transaction()
+        conn = transaction if transaction is not None else self._client.getconn()
+        discard = False
+        try:
+            cursor = conn.cursor()
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                rows = cursor.fetchmany(batch_size)
+                while len(rows) > 0:
+                    for row in rows:
+                        yield row
+                    rows = cursor.fetchmany(batch_size)
+            finally:
+                cursor.close()
+
+            if transaction is None:
+                conn.commit()
+        except BaseException:
+            # Also rolls back when the generator is closed before the end
+            if transaction is None:
+                discard = not self.__rollback(conn)
+            raise
+        finally:
+            if transaction is None:
+                self._client.putconn(conn, discard)
+
     def _create_schema(self, context: Optional[IContext]):
         """
         TODO add description
@@ -545,6 +663,72 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
         else:
             return DataPage(items)
 
+    def get_page_by_token(self, context: Optional[IContext], filter: Any, paging: TokenizedPagingParams,
+                          keys: List[str] = None, descending: bool = False, select: Any = None) -> TokenizedDataPage:
+        """
+        Gets a page of data items retrieved by a given filter using keyset (seek) pagination.
+        Items are sorted by the key columns and each page starts right after the keys
+        of the last item from the previous page, encoded in the paging token.
+        Unlike :func:`get_page_by_filter` deep pages cost the same as the first one.
+        The total number of items is calculated only for the first page.
+
+        This method shall be called by a public getPageByToken method from child class that
+        receives FilterParams and converts them into a filter function.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        :param filter: (optional) a filter JSON object
+        :param paging: (optional) tokenized paging parameters
+        :param keys: (optional) unique combination of columns to sort and seek by. Default: ['id']
+        :param descending: (optional) true to sort items in descending order
+        :param select: (optional) projection JSON object, it must include the key columns
+        :return: a data page with a token to get the next page
+        """
+        paging = paging or TokenizedPagingParams()
+        keys = keys or ['id']
+        take = paging.get_take(self._max_page_size)
+        last_keys = KeysetToken.decode(paging.token, len(keys))
+
+        select = select if select and len(select) > 0 else '*'
+        # One more item tells if there is the next page
+        query = "SELECT TOP " + str(take + 1) + " " + select + " FROM " + self._quoted_table_name()
+
+        conditions = []
+        params = []
+        if filter and filter != '':
+            conditions.append("(" + filter + ")")
+        if last_keys is not None:
+            # Row values are not supported, so (a, b) > (x, y) is expanded into (a > x) OR (a = x AND b > y)
+            operator = " < ?" if descending else " > ?"
+            seeks = []
+            for index in range(len(keys)):
+                seek = [self._quote_identifier(key) + " = ?" for key in keys[:index]]
+                seek.append(self._quote_identifier(keys[index]) + operator)
+                seeks.append("(" + " AND ".join(seek) + ")")
+                params.extend(last_keys[:index + 1])
+            conditions.append("(" + " OR ".join(seeks) + ")")
+        if len(conditions) > 0:
+            query += " WHERE " + " AND ".join(conditions)
+
+        order = " DESC" if descending else ""
+        query += " ORDER BY " + ", ".join([self._quote_identifier(key) + order for key in keys])
+
+        items = self._request(query, params)
+
+        token = None
+        if len(items) > take:
+            items = items[:take]
+            token = KeysetToken.encode([getattr(items[-1], key) for key in keys])
+
+        self._logger.trace(context, "Retrieved %d from %s", len(items), self._table_name)
+
+        items = list(map(self._convert_to_public, items))
+
+        total = None
+        if paging.total and last_keys is None:
+            total = self.get_count_by_filter(context, filter)
+
+        return TokenizedDataPage(items, token, total)
+
     def get_count_by_filter(self, context: Optional[IContext], filter: Any) -> int:
         """
         Gets a number of data items retrieved by a given filter.
@@ -601,6 +785,38 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
 
         return items
 
+    def stream_list_by_filter(self, context: Optional[IContext], filter: Any, sort: Any = None, select: Any = None,
+                              batch_size: int = None) -> Iterator[T]:
+        """
+        Gets a stream of data items retrieved by a given filter and sorted according to sort parameters.
+        Unlike :func:`get_list_by_filter` items are fetched in batches and converted one by one,
+        so large tables can be processed without loading them into memory.
+        This method shall be called by a public streamListByFilter method from child class that
+        receives FilterParams and converts them into a filter function.
+
+        :param context: (optional) transaction id to trace execution through call chain.
+        :param filter: (optional) a filter JSON object
+        :param sort: (optional) sorting JSON object
+        :param select: (optional) projection JSON object
+        :param batch_size: (optional) number of rows fetched at once
+        :return: a generator of data items
+        """
+        select = select if select and len(select) > 0 else '*'
+        query = "SELECT " + select + " FROM " + self._quoted_table_name()
+
+        if filter and filter != '':
+            query += " WHERE " + filter
+
+        if sort and len(sort) > 0:
+            query += " ORDER BY " + sort
+
+        count = 0
+        for item in self._request_stream(query, None, batch_size):
+            count += 1
+            yield self._convert_to_public(item)
+
+        self._logger.trace(context, "Streamed %d from %s", count, self._table_name)
+
     def get_one_random(self, context: Optional[IContext], filter: Any) -> T:
         """
         Gets a random item from items that match to a given filter.
@@ -658,11 +874,13 @@ class SqlServerPersistence(IReferenceable, IUnreferenceable, IConfigurable, IOpe
             return
 
         row = self._convert_from_public(item)
-        columns = self._generate_columns(row)
-        params = self._generate_parameters(row)
         values = self._generate_values(row)
 
-        query = "INSERT INTO " + self._quoted_table_name() + " (" + columns + ") OUTPUT INSERTED.* VALUES (" + params + ")"
+        query = self._statement_cache.get(
+            ('create', tuple(row.keys())),
+            lambda: "INSERT INTO " + self._quoted_table_name() + " (" + self._generate_columns(row)
+                    + ") OUTPUT INSERTED.* VALUES (" + self._generate_parameters(row) + ")"
+        )
 
         result = self._request(query, values)
 
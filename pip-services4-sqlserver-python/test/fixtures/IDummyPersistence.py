@@ -4,7 +4,7 @@ from typing import List, Union, Optional
 
 from pip_services4_commons.data import  AnyValueMap
 from pip_services4_components.context import IContext
-from pip_services4_data.query import FilterParams, PagingParams
+from pip_services4_data.query import FilterParams, PagingParams, TokenizedPagingParams
 from pip_services4_persistence.read import IGetter
 from pip_services4_persistence.write import IWriter, IPartialUpdater
 
@@ -17,6 +17,10 @@ class IDummyPersistence(IGetter, IWriter, IPartialUpdater, ABC):
                            paging: Optional[PagingParams]):
         raise NotImplemented()
 
+    def get_page_by_token(self, context: Optional[IContext], filter: Optional[FilterParams],
+                          paging: Optional[TokenizedPagingParams]):
+        raise NotImplemented()
+
     def get_count_by_filter(self, context: Optional[IContext], filter: Optional[FilterParams]):
         raise NotImplemented()
 
@@ -26,6 +26,16 @@ class DummySqlServerPersistence(IdentifiableSqlServerPersistence, IDummyPersiste
 
         return super().get_page_by_filter(context, filter_condition, paging, None, None)
 
+    def get_page_by_token(self, context, filter, paging):
+        filter = filter or FilterParams()
+        key = filter.get_as_nullable_string('key')
+
+        filter_condition = ''
+        if key is not None:
+            filter_condition += "[key]='" + key + "'"
+
+        return super().get_page_by_token(context, filter_condition, paging, ['key'])
+
     def get_count_by_filter(self, context, filter):
         filter = filter or FilterParams()
         key = filter.get_as_nullable_string('key')